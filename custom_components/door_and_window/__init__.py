@@ -1,23 +1,38 @@
 """Door and window device integration."""
 import logging
+from typing import List, Union
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME
 from homeassistant.helpers.device_registry import async_get_registry
 from homeassistant.helpers.typing import ConfigType, HomeAssistantType
 
-from .const import (CONF_AWNING_CLOSEST_TOP, CONF_AWNING_DISTANCE, CONF_AWNING_FARTHEST_TOP,
+from .const import (CONF_ANGLE_OF_INCIDENCE_DEAD_BAND, CONF_AWNING_CLOSEST_TOP,
+                    CONF_AWNING_DISTANCE, CONF_AWNING_FARTHEST_TOP,
                     CONF_AWNING_LEFT_DISTANCE, CONF_AWNING_MAX_DEPTH,
                     CONF_AWNING_MIN_DEPTH, CONF_AWNING_RIGHT_DISTANCE,
-                    CONF_AZIMUTH, CONF_FRAME_FACE_THICKNESS,
-                    CONF_FRAME_THICKNESS, CONF_HAS_AWNING, CONF_HEIGHT,
-                    CONF_HORIZON_PROFILE, CONF_INSIDE_DEPTH, CONF_MANUFACTURER,
+                    CONF_AZIMUTH, CONF_DIRECT_SUNLIGHT_HYSTERESIS,
+                    CONF_FACADE, CONF_FACADE_POSITION,
+                    CONF_FRAME_FACE_THICKNESS, CONF_FRAME_THICKNESS,
+                    CONF_HAS_AWNING, CONF_HEIGHT, CONF_HORIZON_ELEVATION_DEAD_BAND,
+                    CONF_HORIZON_ID, CONF_HORIZON_PROFILE, CONF_HORIZON_PROFILE_ENTITY,
+                    CONF_HORIZON_PROFILE_TYPE, CONF_INSIDE_DEPTH, CONF_MANUFACTURER,
                     CONF_MODEL, CONF_OUTSIDE_DEPTH, CONF_PARAPET_WALL_HEIGHT,
-                    CONF_TILT, CONF_TYPE, CONF_WIDTH, DOMAIN, TYPE_DOOR)
+                    CONF_SUN_POSITION_DEAD_BAND,
+                    CONF_SUNNY_GLAZING_AREA_DEAD_BAND,
+                    CONF_SUNNY_GLAZING_AREA_PERCENTAGE_DEAD_BAND, CONF_TILT,
+                    CONF_TYPE, CONF_WIDTH, DOMAIN, HORIZON_PROFILE_TYPE_DYNAMIC,
+                    HORIZON_PROFILE_TYPE_FILE, LIGHT_ENGINE_CLOSED_FORM, TYPE_DOOR)
 from .coordinator import Coordinator
 from .data_store import DataStore
+from .horizon_profile_store import (async_remove_unused_horizons,
+                                    get_horizon_profile_store)
 from .models.awning import Awning
 from .models.door_and_window import DoorAndWindow
+from .models.door_and_window_output_thresholds import \
+    DoorAndWindowOutputThresholds
+from .models.facade import Facade
+from .models.horizon_profile import HorizonProfile
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -37,7 +52,7 @@ async def async_setup(hass: HomeAssistantType, config: ConfigType) -> bool:
     Returns:
         The value indicates whether the setup of the integration was successful.
     """
-    hass.data[DOMAIN] = DataStore()
+    hass.data[DOMAIN] = DataStore(hass)
     return True
 
 
@@ -76,6 +91,11 @@ async def async_setup_entry(hass: HomeAssistantType, config_entry: ConfigEntry)
         else:
             awning = None
 
+        horizon_profile = await async_get_horizon_profile(hass, config_entry)
+        facade = get_facade(data_store, config_entry)
+        if facade is not None and get_horizon_profile_entity_id(config_entry) is None:
+            facade.horizon_profile = horizon_profile
+
         door_and_window = DoorAndWindow(
             config_entry.data[CONF_TYPE],
             config_entry.data[CONF_NAME],
@@ -90,13 +110,20 @@ async def async_setup_entry(hass: HomeAssistantType, config_entry: ConfigEntry)
             config_entry.data.get(CONF_PARAPET_WALL_HEIGHT, 0),
             config_entry.data[CONF_AZIMUTH],
             config_entry.data[CONF_TILT],
-            config_entry.data.get(CONF_HORIZON_PROFILE, [0, 0]),
-            awning
+            horizon_profile,
+            awning,
+            light_engine=LIGHT_ENGINE_CLOSED_FORM,
+            output_thresholds=get_output_thresholds(config_entry),
+            facade=facade,
+            facade_position=config_entry.data.get(CONF_FACADE_POSITION, 0)
         )
         data_store.set_coordinator(config_entry.entry_id, Coordinator(
             hass,
             door_and_window,
-            "sun.sun"
+            data_store.sun_tracker,
+            data_store.fleet,
+            sun_position_dead_band=config_entry.data.get(CONF_SUN_POSITION_DEAD_BAND, 0),
+            horizon_profile_entity_id=get_horizon_profile_entity_id(config_entry)
         ))
 
         device_registry = await async_get_registry(hass)
@@ -142,37 +169,54 @@ async def update_listener(hass: HomeAssistantType, config_entry: ConfigEntry):
     data_store: DataStore = hass.data[DOMAIN]
     coordinator: Coordinator = data_store.get_coordinator(config_entry.entry_id)
     door_and_window: DoorAndWindow = coordinator.door_and_window
-    door_and_window.model = config_entry.data.get(CONF_MODEL)
-    door_and_window.manufacturer = config_entry.data.get(CONF_MANUFACTURER)
-    door_and_window.type = config_entry.data[CONF_TYPE]
-    door_and_window.width = config_entry.data[CONF_WIDTH]
-    door_and_window.height = config_entry.data[CONF_HEIGHT]
-    door_and_window.inside_depth = config_entry.data[CONF_INSIDE_DEPTH]
-    door_and_window.outside_depth = config_entry.data[CONF_OUTSIDE_DEPTH]
-    door_and_window.frame_thickness = config_entry.data[CONF_FRAME_THICKNESS]
-    door_and_window.frame_face_thickness = config_entry.data[CONF_FRAME_FACE_THICKNESS]
-    door_and_window.parapet_wall_height = \
-        0 if door_and_window.type == TYPE_DOOR \
-        else config_entry.data.get(CONF_PARAPET_WALL_HEIGHT, 0)
-    door_and_window.azimuth = config_entry.data[CONF_AZIMUTH]
-    door_and_window.tilt = config_entry.data[CONF_TILT]
-    door_and_window.horizon_profile = config_entry.data.get(CONF_HORIZON_PROFILE, [0, 0])
-
-    if config_entry.data[CONF_HAS_AWNING]:
-        door_and_window.awning = Awning(
-            config_entry.data[CONF_AWNING_LEFT_DISTANCE] + \
-            config_entry.data[CONF_WIDTH] + config_entry.data[CONF_AWNING_RIGHT_DISTANCE],
-            config_entry.data[CONF_AWNING_MIN_DEPTH],
-            config_entry.data[CONF_AWNING_MAX_DEPTH],
-            -config_entry.data[CONF_WIDTH] / 2 + config_entry.data[CONF_AWNING_RIGHT_DISTANCE] - \
-            config_entry.data[CONF_AWNING_LEFT_DISTANCE],
-            config_entry.data[CONF_AWNING_CLOSEST_TOP],
-            config_entry.data[CONF_AWNING_FARTHEST_TOP],
-            config_entry.data[CONF_AWNING_DISTANCE],
-            100,
-        )
-    else:
-        door_and_window.awning = None
+    horizon_profile = await async_get_horizon_profile(hass, config_entry)
+
+    # The changes are published at once and the light state is recalculated only once.
+    with door_and_window.batch_update():
+        door_and_window.model = config_entry.data.get(CONF_MODEL)
+        door_and_window.manufacturer = config_entry.data.get(CONF_MANUFACTURER)
+        door_and_window.type = config_entry.data[CONF_TYPE]
+        door_and_window.width = config_entry.data[CONF_WIDTH]
+        door_and_window.height = config_entry.data[CONF_HEIGHT]
+        door_and_window.inside_depth = config_entry.data[CONF_INSIDE_DEPTH]
+        door_and_window.outside_depth = config_entry.data[CONF_OUTSIDE_DEPTH]
+        door_and_window.frame_thickness = config_entry.data[CONF_FRAME_THICKNESS]
+        door_and_window.frame_face_thickness = config_entry.data[CONF_FRAME_FACE_THICKNESS]
+        door_and_window.parapet_wall_height = \
+            0 if door_and_window.type == TYPE_DOOR \
+            else config_entry.data.get(CONF_PARAPET_WALL_HEIGHT, 0)
+        door_and_window.azimuth = config_entry.data[CONF_AZIMUTH]
+        door_and_window.tilt = config_entry.data[CONF_TILT]
+        door_and_window.facade = get_facade(data_store, config_entry)
+        door_and_window.facade_position = config_entry.data.get(CONF_FACADE_POSITION, 0)
+        # The dynamic horizon profile is set by the coordinator from its entity.
+        coordinator.horizon_profile_entity_id = get_horizon_profile_entity_id(config_entry)
+        if coordinator.horizon_profile_entity_id is None:
+            door_and_window.horizon_profile = horizon_profile
+            if door_and_window.facade is not None:
+                door_and_window.facade.horizon_profile = horizon_profile
+        door_and_window.output_thresholds = get_output_thresholds(config_entry)
+
+        if config_entry.data[CONF_HAS_AWNING]:
+            door_and_window.awning = Awning(
+                config_entry.data[CONF_AWNING_LEFT_DISTANCE] + \
+                config_entry.data[CONF_WIDTH] + config_entry.data[CONF_AWNING_RIGHT_DISTANCE],
+                config_entry.data[CONF_AWNING_MIN_DEPTH],
+                config_entry.data[CONF_AWNING_MAX_DEPTH],
+                -config_entry.data[CONF_WIDTH] / 2 + \
+                config_entry.data[CONF_AWNING_RIGHT_DISTANCE] - \
+                config_entry.data[CONF_AWNING_LEFT_DISTANCE],
+                config_entry.data[CONF_AWNING_CLOSEST_TOP],
+                config_entry.data[CONF_AWNING_FARTHEST_TOP],
+                config_entry.data[CONF_AWNING_DISTANCE],
+                100,
+            )
+        else:
+            door_and_window.awning = None
+
+    data_store.remove_unused_facades()
+    coordinator.sun_position_dead_band = config_entry.data.get(CONF_SUN_POSITION_DEAD_BAND, 0)
+    coordinator.refresh()
 
     device_registry = await async_get_registry(hass)
 
@@ -210,10 +254,24 @@ async def async_unload_entry(hass: HomeAssistantType, config_entry: ConfigEntry)
     coordinator.dispose()
 
     data_store.remove_coordinator(config_entry.entry_id)
+    data_store.remove_unused_facades()
 
     return True
 
 
+async def async_remove_entry(hass: HomeAssistantType, config_entry: ConfigEntry) -> None:
+    """
+    Removes the imported horizons which are not used by the remaining config entries.
+
+    Args:
+        hass:
+            The Home Assistant instance.
+        config_entry:
+            The removed config entry.
+    """
+    await async_remove_unused_horizons(hass, config_entry.entry_id)
+
+
 def get_software_version(width: float, height: float):
     """
     Gets the software version for the door and window device.
@@ -221,3 +279,65 @@ def get_software_version(width: float, height: float):
     The version is the size of the door and window.
     """
     return str(width / 1000) + ' x ' + str(height / 1000)
+
+
+def get_output_thresholds(config_entry: ConfigEntry) -> DoorAndWindowOutputThresholds:
+    """
+    Gets the minimum changes of the calculated door and window properties
+    to publish from the specified config entry.
+
+    The config entries created before the thresholds were introduced publish every change.
+    """
+    return DoorAndWindowOutputThresholds(
+        config_entry.data.get(CONF_HORIZON_ELEVATION_DEAD_BAND, 0),
+        config_entry.data.get(CONF_ANGLE_OF_INCIDENCE_DEAD_BAND, 0),
+        config_entry.data.get(CONF_SUNNY_GLAZING_AREA_DEAD_BAND, 0),
+        config_entry.data.get(CONF_SUNNY_GLAZING_AREA_PERCENTAGE_DEAD_BAND, 0),
+        config_entry.data.get(CONF_DIRECT_SUNLIGHT_HYSTERESIS, 0)
+    )
+
+
+async def async_get_horizon_profile(
+    hass: HomeAssistantType,
+    config_entry: ConfigEntry
+) -> Union[List[float], HorizonProfile]:
+    """
+    Gets the static or the imported horizon profile from the specified config entry.
+
+    The imported horizon is loaded from the storage and the part of it
+    in front of the door and window is taken with its own resolution.
+    If it is missing, the static horizon profile is used.
+    """
+    if config_entry.data.get(CONF_HORIZON_PROFILE_TYPE) == HORIZON_PROFILE_TYPE_FILE:
+        horizon = await get_horizon_profile_store(hass).async_get_horizon(
+            config_entry.data.get(CONF_HORIZON_ID))
+        if horizon is not None:
+            return HorizonProfile.from_horizon(horizon, config_entry.data[CONF_AZIMUTH])
+        _LOGGER.warning(
+            "The imported horizon of %s is missing, the static horizon profile is used.",
+            config_entry.data[CONF_NAME]
+        )
+    return config_entry.data.get(CONF_HORIZON_PROFILE, [0, 0])
+
+
+def get_facade(data_store: DataStore, config_entry: ConfigEntry) -> Union[Facade, None]:
+    """
+    Gets the facade of the door and window from the specified config entry,
+    None if the door and window is on its own.
+
+    The door and windows with the same facade name share the facade.
+    """
+    facade_name = config_entry.data.get(CONF_FACADE)
+    if facade_name:
+        return data_store.get_facade(facade_name)
+    return None
+
+
+def get_horizon_profile_entity_id(config_entry: ConfigEntry) -> Union[str, None]:
+    """
+    Gets the entity which provides the dynamic horizon profile from the specified config entry,
+    None if the horizon profile is static.
+    """
+    if config_entry.data.get(CONF_HORIZON_PROFILE_TYPE) == HORIZON_PROFILE_TYPE_DYNAMIC:
+        return config_entry.data.get(CONF_HORIZON_PROFILE_ENTITY)
+    return None
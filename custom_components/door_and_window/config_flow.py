@@ -1,29 +1,132 @@
 """ The configuration flow handler module for the Door and window integration. """
+# pylint: disable=too-many-lines
 import logging
+from typing import List, Union
 
+import numpy as np
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_NAME
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.entity_registry import async_get_registry
+from homeassistant.helpers.typing import HomeAssistantType
 
-from .const import (CONF_AWNING_CLOSEST_TOP, CONF_AWNING_COVER_ENTITY,
+from .const import (CONF_ANGLE_OF_INCIDENCE_DEAD_BAND,
+                    CONF_AWNING_CLOSEST_TOP, CONF_AWNING_COVER_ENTITY,
                     CONF_AWNING_DISTANCE, CONF_AWNING_FARTHEST_TOP,
                     CONF_AWNING_LEFT_DISTANCE, CONF_AWNING_MAX_DEPTH,
                     CONF_AWNING_MIN_DEPTH, CONF_AWNING_RIGHT_DISTANCE,
-                    CONF_AZIMUTH, CONF_FRAME_FACE_THICKNESS,
-                    CONF_FRAME_THICKNESS, CONF_HAS_AWNING, CONF_HEIGHT,
-                    CONF_HORIZON_PROFILE,
+                    CONF_AZIMUTH, CONF_DIRECT_SUNLIGHT_HYSTERESIS,
+                    CONF_FACADE, CONF_FACADE_POSITION,
+                    CONF_FRAME_FACE_THICKNESS, CONF_FRAME_THICKNESS,
+                    CONF_HAS_AWNING, CONF_HEIGHT,
+                    CONF_HORIZON_ELEVATION_DEAD_BAND, CONF_HORIZON_ID,
+                    CONF_HORIZON_PROFILE, CONF_HORIZON_PROFILE_ENTITY,
+                    CONF_HORIZON_PROFILE_FILE,
                     CONF_HORIZON_PROFILE_NUMBER_OF_MEASUREMENTS,
                     CONF_HORIZON_PROFILE_TYPE, CONF_INSIDE_DEPTH,
                     CONF_MANUFACTURER, CONF_MODEL, CONF_OUTSIDE_DEPTH,
-                    CONF_PARAPET_WALL_HEIGHT, CONF_TILT, CONF_TYPE, CONF_WIDTH,
-                    DOMAIN, HORIZON_PROFILE_TYPE_STATIC, TYPE_DOOR,
-                    TYPE_WINDOW)
+                    CONF_PARAPET_WALL_HEIGHT, CONF_SUN_POSITION_DEAD_BAND,
+                    CONF_SUNNY_GLAZING_AREA_DEAD_BAND,
+                    CONF_SUNNY_GLAZING_AREA_PERCENTAGE_DEAD_BAND, CONF_TILT,
+                    CONF_TYPE, CONF_WIDTH, DOMAIN,
+                    HORIZON_PROFILE_TYPE_DYNAMIC, HORIZON_PROFILE_TYPE_FILE,
+                    HORIZON_PROFILE_TYPE_STATIC, TYPE_DOOR, TYPE_WINDOW)
+from .converters.horizon_file_to_horizon_converter import \
+    HorizonFileToHorizonConverter
+from .horizon_profile_store import (async_remove_unused_horizons,
+                                    get_horizon_profile_store)
 
 _LOGGER = logging.getLogger(__name__)
 
+# The horizon profile settings, these are shared by the door and windows on a facade.
+FACADE_HORIZON_PROFILE_KEYS = (
+    CONF_HORIZON_PROFILE_TYPE,
+    CONF_HORIZON_PROFILE,
+    CONF_HORIZON_PROFILE_NUMBER_OF_MEASUREMENTS,
+    CONF_HORIZON_PROFILE_ENTITY,
+    CONF_HORIZON_PROFILE_FILE,
+    CONF_HORIZON_ID
+)
+
+
+def read_horizon_file(hass: HomeAssistantType, path: str) -> np.ndarray:
+    """
+    Reads the horizon from a PVGIS horizon file or a CSV file.
+    It does blocking I/O, so it runs in the executor.
+
+    Args:
+        hass:
+            The Home Assistant instance.
+        path:
+            The path of the file, absolute or relative to the configuration folder.
+            It must be in a folder of `allowlist_external_dirs`, e.g. in `www`.
+
+    Returns:
+        The horizon elevations in equal distances around, starting from north clockwise.
+
+    Raises:
+        OSError:
+            If the file cannot be read.
+        ValueError:
+            If the file is not allowed or it is not a horizon file.
+    """
+    path = hass.config.path(path)
+    if not hass.config.is_allowed_path(path):
+        raise ValueError(f"{path} is not allowed, see allowlist_external_dirs.")
+
+    with open(path, encoding='utf-8') as horizon_file:
+        return HorizonFileToHorizonConverter().convert(horizon_file.read())
+
+
+def get_facade_config_entries(
+    hass: HomeAssistantType,
+    facade: str,
+    config_entry_id: Union[str, None] = None
+) -> List[config_entries.ConfigEntry]:
+    """
+    Gets the config entries of the other door and windows on the specified facade.
+
+    Args:
+        hass:
+            The Home Assistant instance.
+        facade:
+            The name of the facade, empty if the door and window is on its own.
+        config_entry_id:
+            The config entry of the door and window itself, None for a new one.
+
+    Returns:
+        The config entries of the other door and windows on the facade.
+    """
+    if not facade:
+        return []
+    return [
+        entry for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.entry_id != config_entry_id and entry.data.get(CONF_FACADE) == facade
+    ]
+
+
+def replace_horizon_profile(data: dict[str, any], facade_data: dict[str, any]) -> dict[str, any]:
+    """
+    Replaces the horizon profile settings of a config entry data
+    by the ones of another door and window on the same facade.
+
+    Args:
+        data:
+            The config entry data to change.
+        facade_data:
+            The config entry data of another door and window on the facade.
+
+    Returns:
+        The config entry data with the horizon profile of the facade.
+    """
+    return {
+        key: value for (key, value) in data.items() if key not in FACADE_HORIZON_PROFILE_KEYS
+    } | {
+        key: value for (key, value) in facade_data.items() if key in FACADE_HORIZON_PROFILE_KEYS
+    }
+
 
 # pylint: disable=too-many-locals
 class WindowAndDoorDeviceOptionsFlow(config_entries.OptionsFlow):
@@ -194,6 +297,13 @@ class WindowAndDoorDeviceOptionsFlow(config_entries.OptionsFlow):
 
         - tilt
         - azimuth
+        - facade
+        - facade position
+
+        The door and windows on a facade share the horizon profile, so they must
+        face the same way. A door and window moved to a facade takes its horizon
+        profile, the horizon profile set for a door and window on a facade
+        is set for the others as well.
 
         Args:
             user_input:
@@ -202,9 +312,25 @@ class WindowAndDoorDeviceOptionsFlow(config_entries.OptionsFlow):
         Returns:
             The result of the options flow step.
         """
+        errors = {}
         if user_input is not None:
-            self.data = self.data | user_input
-            return await self.async_step_horizon_profile_number_of_measurements()
+            facade_config_entries = get_facade_config_entries(
+                self.hass,
+                user_input.get(CONF_FACADE),
+                self.config_entry.entry_id
+            )
+            if any(
+                entry.data[CONF_AZIMUTH] != user_input[CONF_AZIMUTH]
+                for entry in facade_config_entries
+            ):
+                errors["base"] = "facade_azimuth_conflict"
+            else:
+                self.data = self.data | user_input
+                if facade_config_entries \
+                        and user_input[CONF_FACADE] != self.config_entry.data.get(CONF_FACADE):
+                    self.data = replace_horizon_profile(self.data, facade_config_entries[0].data)
+                    return await self.async_step_has_awning()
+                return await self.async_step_horizon_profile_type()
 
         return self.async_show_form(
             step_id="facing",
@@ -213,9 +339,134 @@ class WindowAndDoorDeviceOptionsFlow(config_entries.OptionsFlow):
                     vol.All(vol.Coerce(int), vol.Range(min=0, max=90)),
                 vol.Required(CONF_AZIMUTH, default=self.config_entry.data[CONF_AZIMUTH]):
                     vol.All(vol.Coerce(int), vol.Range(min=0, max=359)),
+                vol.Optional(
+                    CONF_FACADE,
+                    default=self.config_entry.data.get(CONF_FACADE, '')
+                ): str,
+                vol.Optional(
+                    CONF_FACADE_POSITION,
+                    default=self.config_entry.data.get(CONF_FACADE_POSITION, 0)
+                ): vol.Coerce(int),
+            }),
+            errors=errors
+        )
+
+    async def async_step_horizon_profile_type(
+        self,
+        user_input: dict[str, any] = None
+    ) -> FlowResult:
+        """
+        Handles the step of choosing between the static and the dynamic horizon profile.
+
+        Args:
+            user_input:
+                The values entered by the user on the UI.
+
+        Returns:
+            The result of the options flow step.
+        """
+        if user_input is not None:
+            self.data = self.data | user_input
+            if user_input[CONF_HORIZON_PROFILE_TYPE] != HORIZON_PROFILE_TYPE_FILE:
+                # the imported horizon is not used anymore
+                self.data.pop(CONF_HORIZON_ID, None)
+            if user_input[CONF_HORIZON_PROFILE_TYPE] == HORIZON_PROFILE_TYPE_DYNAMIC:
+                return await self.async_step_horizon_profile_entity()
+            if user_input[CONF_HORIZON_PROFILE_TYPE] == HORIZON_PROFILE_TYPE_FILE:
+                return await self.async_step_horizon_profile_file()
+
+            return await self.async_step_horizon_profile_number_of_measurements()
+
+        return self.async_show_form(
+            step_id="horizon_profile_type",
+            data_schema=vol.Schema({
+                vol.Required(
+                    CONF_HORIZON_PROFILE_TYPE,
+                    default=self.config_entry.data.get(
+                        CONF_HORIZON_PROFILE_TYPE, HORIZON_PROFILE_TYPE_STATIC)
+                ): vol.In({
+                    HORIZON_PROFILE_TYPE_STATIC: 'Static',
+                    HORIZON_PROFILE_TYPE_DYNAMIC: 'Dynamic',
+                    HORIZON_PROFILE_TYPE_FILE: 'Import from file'
+                })
+            })
+        )
+
+    async def async_step_horizon_profile_entity(
+        self,
+        user_input: dict[str, any] = None
+    ) -> FlowResult:
+        """
+        Handles the step of setting the entity which provides the dynamic horizon profile.
+
+        Args:
+            user_input:
+                The values entered by the user on the UI.
+
+        Returns:
+            The result of the options flow step.
+        """
+        if user_input is not None:
+            self.data = self.data | user_input
+            return await self.async_step_has_awning()
+
+        entity_registry = await async_get_registry(self.hass)
+
+        return self.async_show_form(
+            step_id="horizon_profile_entity",
+            data_schema=vol.Schema({
+                vol.Required(
+                    CONF_HORIZON_PROFILE_ENTITY,
+                    default=self.config_entry.data.get(
+                        CONF_HORIZON_PROFILE_ENTITY, vol.UNDEFINED)
+                ): vol.In(
+                    [x for x in entity_registry.entities.keys() if x.startswith("sensor.")]
+                )
             })
         )
 
+    async def async_step_horizon_profile_file(
+        self,
+        user_input: dict[str, any] = None
+    ) -> FlowResult:
+        """
+        Handles the step of importing the horizon from a PVGIS horizon file or a CSV file.
+
+        The horizon is stored in the Home Assistant storage, the config entry
+        stores only its id.
+
+        Args:
+            user_input:
+                The values entered by the user on the UI.
+
+        Returns:
+            The result of the options flow step.
+        """
+        errors = {}
+        if user_input is not None:
+            try:
+                horizon = await self.hass.async_add_executor_job(
+                    read_horizon_file, self.hass, user_input[CONF_HORIZON_PROFILE_FILE])
+            except (OSError, ValueError) as error:
+                _LOGGER.warning("Cannot import the horizon file: %s", error)
+                errors["base"] = "invalid_horizon_file"
+            else:
+                self.data = self.data | user_input
+                self.data[CONF_HORIZON_ID] = \
+                    await get_horizon_profile_store(self.hass).async_add_horizon(horizon)
+                return await self.async_step_has_awning()
+
+        return self.async_show_form(
+            step_id="horizon_profile_file",
+            data_schema=vol.Schema({
+                vol.Required(
+                    CONF_HORIZON_PROFILE_FILE,
+                    default=self.config_entry.data.get(CONF_HORIZON_PROFILE_FILE, vol.UNDEFINED)
+                ): str
+            }),
+            errors=errors
+        )
+
     async def async_step_horizon_profile_number_of_measurements(
         self,
         user_input: dict[str, any] = None
@@ -232,7 +483,6 @@ class WindowAndDoorDeviceOptionsFlow(config_entries.OptionsFlow):
         """
         if user_input is not None:
             self.data = self.data | user_input
-            self.data[CONF_HORIZON_PROFILE_TYPE] = HORIZON_PROFILE_TYPE_STATIC
             return await self.async_step_horizon_profile_measurements()
 
         return self.async_show_form(
@@ -306,11 +556,7 @@ class WindowAndDoorDeviceOptionsFlow(config_entries.OptionsFlow):
             if self.data[CONF_HAS_AWNING]:
                 return await self.async_step_awning()
 
-            self.hass.config_entries.async_update_entry(
-                self.config_entry, data=self.data
-            )
-
-            return self.async_abort(reason="reconfigure_successful")
+            return await self.async_step_output_thresholds()
 
         return self.async_show_form(
             step_id="has_awning",
@@ -332,12 +578,7 @@ class WindowAndDoorDeviceOptionsFlow(config_entries.OptionsFlow):
         """
         if user_input is not None:
             self.data = self.data | user_input
-
-            self.hass.config_entries.async_update_entry(
-                self.config_entry, data=self.data
-            )
-
-            return self.async_abort(reason="reconfigure_successful")
+            return await self.async_step_output_thresholds()
 
         entity_registry = await async_get_registry(self.hass)
 
@@ -381,6 +622,72 @@ class WindowAndDoorDeviceOptionsFlow(config_entries.OptionsFlow):
             })
         )
 
+    async def async_step_output_thresholds(
+        self,
+        user_input: dict[str, any] = None
+    ) -> FlowResult:
+        """
+        Handles the step of setting the minimum changes of the calculated sensor values
+        which are written to the state machine.
+
+        Args:
+            user_input:
+                The values entered by the user on the UI.
+
+        Returns:
+            The result of the options flow step.
+        """
+        if user_input is not None:
+            self.data = self.data | user_input
+
+            self.hass.config_entries.async_update_entry(
+                self.config_entry, data=self.data
+            )
+            # the door and windows on the facade share the horizon profile
+            for entry in get_facade_config_entries(
+                self.hass,
+                self.data.get(CONF_FACADE),
+                self.config_entry.entry_id
+            ):
+                self.hass.config_entries.async_update_entry(
+                    entry, data=replace_horizon_profile(entry.data, self.data)
+                )
+            # the horizon replaced by a new import or another horizon profile type
+            await async_remove_unused_horizons(self.hass)
+
+            return self.async_abort(reason="reconfigure_successful")
+
+        return self.async_show_form(
+            step_id="output_thresholds",
+            data_schema=vol.Schema({
+                vol.Required(
+                    CONF_HORIZON_ELEVATION_DEAD_BAND,
+                    default=self.config_entry.data.get(CONF_HORIZON_ELEVATION_DEAD_BAND, 0)
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=90)),
+                vol.Required(
+                    CONF_ANGLE_OF_INCIDENCE_DEAD_BAND,
+                    default=self.config_entry.data.get(CONF_ANGLE_OF_INCIDENCE_DEAD_BAND, 0)
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=90)),
+                vol.Required(
+                    CONF_SUNNY_GLAZING_AREA_DEAD_BAND,
+                    default=self.config_entry.data.get(CONF_SUNNY_GLAZING_AREA_DEAD_BAND, 0)
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=10000000)),
+                vol.Required(
+                    CONF_SUNNY_GLAZING_AREA_PERCENTAGE_DEAD_BAND,
+                    default=self.config_entry.data.get(
+                        CONF_SUNNY_GLAZING_AREA_PERCENTAGE_DEAD_BAND, 0)
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+                vol.Required(
+                    CONF_DIRECT_SUNLIGHT_HYSTERESIS,
+                    default=self.config_entry.data.get(CONF_DIRECT_SUNLIGHT_HYSTERESIS, 0)
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=10000000)),
+                vol.Required(
+                    CONF_SUN_POSITION_DEAD_BAND,
+                    default=self.config_entry.data.get(CONF_SUN_POSITION_DEAD_BAND, 0)
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=10))
+            })
+        )
+
 
 @config_entries.HANDLERS.register(DOMAIN)
 class WindowAndDoorDeviceConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -505,6 +812,12 @@ class WindowAndDoorDeviceConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         - tilt
         - azimuth
+        - facade
+        - facade position
+
+        The door and windows on a facade share the horizon profile, so they must
+        face the same way, and the horizon profile steps are skipped
+        if the facade has other door and windows already.
 
         Args:
             user_input:
@@ -513,9 +826,21 @@ class WindowAndDoorDeviceConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         Returns:
             The result of the options flow step.
         """
+        errors = {}
         if user_input is not None:
-            self.data = self.data | user_input
-            return await self.async_step_horizon_profile_number_of_measurements()
+            facade_config_entries = get_facade_config_entries(
+                self.hass, user_input.get(CONF_FACADE))
+            if any(
+                entry.data[CONF_AZIMUTH] != user_input[CONF_AZIMUTH]
+                for entry in facade_config_entries
+            ):
+                errors["base"] = "facade_azimuth_conflict"
+            else:
+                self.data = self.data | user_input
+                if facade_config_entries:
+                    self.data = replace_horizon_profile(self.data, facade_config_entries[0].data)
+                    return await self.async_step_has_awning()
+                return await self.async_step_horizon_profile_type()
 
         return self.async_show_form(
             step_id="facing",
@@ -524,9 +849,117 @@ class WindowAndDoorDeviceConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     vol.All(vol.Coerce(int), vol.Range(min=0, max=90)),
                 vol.Required(CONF_AZIMUTH):
                     vol.All(vol.Coerce(int), vol.Range(min=0, max=359)),
+                vol.Optional(CONF_FACADE, default=''): str,
+                vol.Optional(CONF_FACADE_POSITION, default=0): vol.Coerce(int),
+            }),
+            errors=errors
+        )
+
+    async def async_step_horizon_profile_type(
+        self,
+        user_input: dict[str, any] = None
+    ) -> FlowResult:
+        """
+        Handles the step of choosing between the static and the dynamic horizon profile.
+
+        Args:
+            user_input:
+                The values entered by the user on the UI.
+
+        Returns:
+            The result of the config flow step.
+        """
+        if user_input is not None:
+            self.data = self.data | user_input
+            if user_input[CONF_HORIZON_PROFILE_TYPE] == HORIZON_PROFILE_TYPE_DYNAMIC:
+                return await self.async_step_horizon_profile_entity()
+            if user_input[CONF_HORIZON_PROFILE_TYPE] == HORIZON_PROFILE_TYPE_FILE:
+                return await self.async_step_horizon_profile_file()
+
+            return await self.async_step_horizon_profile_number_of_measurements()
+
+        return self.async_show_form(
+            step_id="horizon_profile_type",
+            data_schema=vol.Schema({
+                vol.Required(
+                    CONF_HORIZON_PROFILE_TYPE,
+                    default=HORIZON_PROFILE_TYPE_STATIC
+                ): vol.In({
+                    HORIZON_PROFILE_TYPE_STATIC: 'Static',
+                    HORIZON_PROFILE_TYPE_DYNAMIC: 'Dynamic',
+                    HORIZON_PROFILE_TYPE_FILE: 'Import from file'
+                })
+            })
+        )
+
+    async def async_step_horizon_profile_entity(
+        self,
+        user_input: dict[str, any] = None
+    ) -> FlowResult:
+        """
+        Handles the step of setting the entity which provides the dynamic horizon profile.
+
+        Args:
+            user_input:
+                The values entered by the user on the UI.
+
+        Returns:
+            The result of the config flow step.
+        """
+        if user_input is not None:
+            self.data = self.data | user_input
+            return await self.async_step_has_awning()
+
+        entity_registry = await async_get_registry(self.hass)
+
+        return self.async_show_form(
+            step_id="horizon_profile_entity",
+            data_schema=vol.Schema({
+                vol.Required(CONF_HORIZON_PROFILE_ENTITY): vol.In(
+                    [x for x in entity_registry.entities.keys() if x.startswith("sensor.")]
+                )
             })
         )
 
+    async def async_step_horizon_profile_file(
+        self,
+        user_input: dict[str, any] = None
+    ) -> FlowResult:
+        """
+        Handles the step of importing the horizon from a PVGIS horizon file or a CSV file.
+
+        The horizon is stored in the Home Assistant storage, the config entry
+        stores only its id.
+
+        Args:
+            user_input:
+                The values entered by the user on the UI.
+
+        Returns:
+            The result of the config flow step.
+        """
+        errors = {}
+        if user_input is not None:
+            try:
+                horizon = await self.hass.async_add_executor_job(
+                    read_horizon_file, self.hass, user_input[CONF_HORIZON_PROFILE_FILE])
+            except (OSError, ValueError) as error:
+                _LOGGER.warning("Cannot import the horizon file: %s", error)
+                errors["base"] = "invalid_horizon_file"
+            else:
+                self.data = self.data | user_input
+                self.data[CONF_HORIZON_ID] = \
+                    await get_horizon_profile_store(self.hass).async_add_horizon(horizon)
+                return await self.async_step_has_awning()
+
+        return self.async_show_form(
+            step_id="horizon_profile_file",
+            data_schema=vol.Schema({
+                vol.Required(CONF_HORIZON_PROFILE_FILE): str
+            }),
+            errors=errors
+        )
+
     async def async_step_horizon_profile_number_of_measurements(
         self,
         user_input: dict[str, any] = None
@@ -543,7 +976,6 @@ class WindowAndDoorDeviceConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """
         if user_input is not None:
             self.data = self.data | user_input
-            self.data[CONF_HORIZON_PROFILE_TYPE] = HORIZON_PROFILE_TYPE_STATIC
             return await self.async_step_horizon_profile_measurements()
 
         return self.async_show_form(
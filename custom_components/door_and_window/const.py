@@ -6,6 +6,7 @@ TYPE_WINDOW = 'window'
 
 HORIZON_PROFILE_TYPE_STATIC = 'static'
 HORIZON_PROFILE_TYPE_DYNAMIC = 'dynamic'
+HORIZON_PROFILE_TYPE_FILE = 'file'
 
 CONF_TYPE = "type"
 CONF_MANUFACTURER = "manufacturer"
@@ -23,12 +24,21 @@ CONF_PARAPET_WALL_HEIGHT = "parapet_wall_height"
 # facing
 CONF_TILT = "tilt"
 CONF_AZIMUTH = "azimuth"
+CONF_FACADE = "facade"
+CONF_FACADE_POSITION = "facade_position"
 
 # horizon profile
 CONF_HORIZON_PROFILE = "horizon_profile"
 CONF_HORIZON_PROFILE_TYPE = "horizon_profile_type"
 CONF_HORIZON_PROFILE_NUMBER_OF_MEASUREMENTS = "horizon_profile_number_of_measurements"
 CONF_HORIZON_PROFILE_ENTITY = "horizon_profile_entity"
+CONF_HORIZON_PROFILE_FILE = "horizon_profile_file"
+CONF_HORIZON_ID = "horizon_id"
+
+# dynamic horizon profile: the attribute of the horizon profile entity
+# and the minimum seconds between two applied changes of it
+HORIZON_PROFILE_ENTITY_ATTRIBUTE = "horizon_profile"
+HORIZON_PROFILE_ENTITY_COOLDOWN = 60
 
 # awning
 CONF_HAS_AWNING = "has_awning"
@@ -40,3 +50,22 @@ CONF_AWNING_CLOSEST_TOP = "awning_closest_top"
 CONF_AWNING_FARTHEST_TOP = "awning_farthest_top"
 CONF_AWNING_DISTANCE = "awning_distance"
 CONF_AWNING_COVER_ENTITY = "awning_cover_entity"
+
+# output thresholds
+CONF_HORIZON_ELEVATION_DEAD_BAND = "horizon_elevation_dead_band"
+CONF_ANGLE_OF_INCIDENCE_DEAD_BAND = "angle_of_incidence_dead_band"
+CONF_SUNNY_GLAZING_AREA_DEAD_BAND = "sunny_glazing_area_dead_band"
+CONF_SUNNY_GLAZING_AREA_PERCENTAGE_DEAD_BAND = "sunny_glazing_area_percentage_dead_band"
+CONF_DIRECT_SUNLIGHT_HYSTERESIS = "direct_sunlight_hysteresis"
+CONF_SUN_POSITION_DEAD_BAND = "sun_position_dead_band"
+
+# light calculation engines
+LIGHT_ENGINE_SHAPELY = "shapely"
+LIGHT_ENGINE_CONVEX_CLIPPING = "convex_clipping"
+LIGHT_ENGINE_CLOSED_FORM = "closed_form"
+LIGHT_ENGINE_TABLE = "table"
+
+# shading table defaults (degrees and sunny glazing area percentage points)
+DEFAULT_SHADING_TABLE_RESOLUTION = 1.0
+DEFAULT_SHADING_TABLE_ERROR_BOUND = 0.5
+MIN_SHADING_TABLE_RESOLUTION = 0.25
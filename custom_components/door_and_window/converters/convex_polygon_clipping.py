@@ -0,0 +1,261 @@
+""" The module for clipping and subtracting convex polygons. """
+from typing import List, Sequence, Tuple, Union
+
+import numpy as np
+
+Point = Tuple[float, float]
+ConvexPolygon = List[Point]
+
+# The area below which a polygon is considered to be degenerate.
+_DEGENERATE_AREA = 1e-9
+
+
+def get_signed_area(polygon: Sequence[Point]) -> float:
+    """
+    Gets the signed area of the specified polygon by the shoelace formula.
+
+    Args:
+        polygon:
+            The vertices of the polygon.
+
+    Returns:
+        The signed area of the polygon. It is positive if the vertices
+        are in counter-clockwise order, negative otherwise.
+    """
+    area = 0.0
+    (previous_x, previous_y) = polygon[-1]
+    for (x, y) in polygon:  # pylint: disable=invalid-name
+        area += previous_x * y - x * previous_y
+        (previous_x, previous_y) = (x, y)
+    return area / 2
+
+
+def get_area(polygons: Sequence[Sequence[Point]]) -> float:
+    """
+    Gets the total area of the specified non-overlapping polygons.
+
+    Args:
+        polygons:
+            The polygons to sum the area of.
+
+    Returns:
+        The total area of the polygons.
+    """
+    return sum(abs(get_signed_area(polygon)) for polygon in polygons)
+
+
+def to_counter_clockwise(polygon: Sequence[Point]) -> ConvexPolygon:
+    """
+    Gets the vertices of the specified convex polygon in counter-clockwise order.
+
+    Args:
+        polygon:
+            The vertices of the convex polygon.
+
+    Returns:
+        The vertices in counter-clockwise order or an empty list
+        if the polygon is degenerate (it has no area).
+    """
+    area = get_signed_area(polygon)
+    if abs(area) <= _DEGENERATE_AREA:
+        return []
+    return list(polygon) if area > 0 else list(reversed(polygon))
+
+
+def get_convex_hull(points: Sequence[Point]) -> ConvexPolygon:
+    """
+    Gets the convex hull of the specified points by the monotone chain algorithm.
+
+    Args:
+        points:
+            The points to get the convex hull of, in any order.
+
+    Returns:
+        The vertices of the convex hull in counter-clockwise order
+        or an empty list if the hull is degenerate (it has no area).
+    """
+    points = sorted(set(points))
+    if len(points) < 3:
+        return []
+
+    def build_chain(chain_points: Sequence[Point]) -> ConvexPolygon:
+        chain: ConvexPolygon = []
+        for (x, y) in chain_points:  # pylint: disable=invalid-name
+            while len(chain) > 1 and (
+                (chain[-1][0] - chain[-2][0]) * (y - chain[-2][1])
+                - (chain[-1][1] - chain[-2][1]) * (x - chain[-2][0])
+            ) <= 0:
+                chain.pop()
+            chain.append((x, y))
+        return chain
+
+    hull = build_chain(points)[:-1] + build_chain(points[::-1])[:-1]
+    if len(hull) < 3 or get_signed_area(hull) <= _DEGENERATE_AREA:
+        return []
+    return hull
+
+
+# pylint: disable=too-many-locals
+def split_convex_polygon(
+    polygon: Sequence[Point],
+    line_start: Point,
+    line_end: Point
+) -> Tuple[ConvexPolygon, ConvexPolygon]:
+    """
+    Splits the specified convex polygon by the line going through the specified points.
+
+    Args:
+        polygon:
+            The vertices of the convex polygon to split.
+        line_start:
+            The first point of the line.
+        line_end:
+            The second point of the line.
+
+    Returns:
+        The tuple of the part on the left and the part on the right
+        side of the line (as seen from `line_start` towards `line_end`).
+    """
+    (start_x, start_y) = line_start
+    direction_x = line_end[0] - start_x
+    direction_y = line_end[1] - start_y
+
+    left: ConvexPolygon = []
+    right: ConvexPolygon = []
+
+    (previous_x, previous_y) = polygon[-1]
+    previous_side = direction_x * (previous_y - start_y) - direction_y * (previous_x - start_x)
+    for (x, y) in polygon:  # pylint: disable=invalid-name
+        side = direction_x * (y - start_y) - direction_y * (x - start_x)
+        if (previous_side < 0 < side) or (side < 0 < previous_side):
+            ratio = previous_side / (previous_side - side)
+            intersection = (
+                previous_x + (x - previous_x) * ratio,
+                previous_y + (y - previous_y) * ratio
+            )
+            left.append(intersection)
+            right.append(intersection)
+        if side >= 0:
+            left.append((x, y))
+        if side <= 0:
+            right.append((x, y))
+        (previous_x, previous_y, previous_side) = (x, y, side)
+
+    return (left, right)
+
+
+def subtract_convex_polygon(
+    polygons: List[ConvexPolygon],
+    subtrahend: Sequence[Point]
+) -> List[ConvexPolygon]:
+    """
+    Subtracts the specified convex polygon from each of the specified convex polygons.
+
+    Every polygon is split along the edges of the subtrahend. The parts outside
+    of the subtrahend are kept, so the result is a list of non-overlapping convex polygons.
+
+    Args:
+        polygons:
+            The non-overlapping convex polygons to subtract from.
+        subtrahend:
+            The vertices of the convex polygon to subtract.
+
+    Returns:
+        The non-overlapping convex polygons which cover the difference.
+    """
+    subtrahend = to_counter_clockwise(subtrahend)
+    if not subtrahend:
+        return polygons
+
+    result: List[ConvexPolygon] = []
+    for polygon in polygons:
+        remaining = polygon
+        previous_vertex = subtrahend[-1]
+        for vertex in subtrahend:
+            (remaining, outside) = split_convex_polygon(remaining, previous_vertex, vertex)
+            if len(outside) > 2 and abs(get_signed_area(outside)) > _DEGENERATE_AREA:
+                result.append(outside)
+            if len(remaining) < 3:
+                break
+            previous_vertex = vertex
+    return result
+
+
+def get_areas(polygons: np.ndarray) -> np.ndarray:
+    """
+    Gets the area of each of the specified polygons by the shoelace formula.
+
+    Args:
+        polygons:
+            The (n, m, 2) array of the vertices of n polygons.
+            A vertex may be repeated, it does not change the area.
+
+    Returns:
+        The array of the n areas.
+    """
+    x = polygons[..., 0]  # pylint: disable=invalid-name
+    y = polygons[..., 1]  # pylint: disable=invalid-name
+    return np.abs(np.sum(
+        x * np.roll(y, -1, axis=-1) - np.roll(x, -1, axis=-1) * y,
+        axis=-1
+    )) / 2
+
+
+def clip_convex_polygons(
+    polygons: np.ndarray,
+    normal: Tuple[float, float],
+    offset: Union[float, np.ndarray]
+) -> np.ndarray:
+    """
+    Clips each of the specified convex polygons to the half-plane
+    `normal[0] * x + normal[1] * y <= offset`.
+
+    A convex polygon clipped by a half-plane gets at most one more vertex,
+    so the clipped polygons have one more vertex than the specified ones.
+    The missing vertices are filled by repeating the last vertex, the polygons
+    completely outside of the half-plane collapse to the origin.
+
+    Args:
+        polygons:
+            The (n, m, 2) array of the vertices of n convex polygons.
+        normal:
+            The outward normal of the half-plane.
+        offset:
+            The offset of the half-plane, a scalar or an array of n values.
+
+    Returns:
+        The (n, m + 1, 2) array of the vertices of the clipped polygons.
+    """
+    (count, vertex_count, _) = polygons.shape
+    inside_distance = np.reshape(offset, (-1, 1)) - \
+        (polygons[..., 0] * normal[0] + polygons[..., 1] * normal[1])
+    next_vertices = np.roll(polygons, -1, axis=1)
+    next_inside_distance = np.roll(inside_distance, -1, axis=1)
+
+    inside = inside_distance >= 0
+    crossing = inside != (next_inside_distance >= 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.where(
+            crossing, inside_distance / (inside_distance - next_inside_distance), 0)
+    intersections = polygons + (next_vertices - polygons) * ratio[..., np.newaxis]
+
+    # Every edge results its start vertex if it is inside or the intersection
+    # if the edge enters the half-plane, then the intersection if the edge leaves it.
+    clipped = np.stack([
+        np.where(inside[..., np.newaxis], polygons, intersections),
+        intersections
+    ], axis=2).reshape(count, vertex_count * 2, 2)
+    valid = np.stack([inside | crossing, inside & crossing], axis=2) \
+        .reshape(count, vertex_count * 2)
+
+    # Moving the valid vertices to the front (keeping their order)
+    # and repeating the last one to fill the missing vertices.
+    order = np.argsort(~valid, axis=1, kind='stable')[:, :vertex_count + 1]
+    valid_counts = np.count_nonzero(valid, axis=1)[:, np.newaxis]
+    order = np.take_along_axis(
+        order,
+        np.minimum(np.arange(vertex_count + 1), np.maximum(valid_counts - 1, 0)),
+        axis=1
+    )
+    clipped = np.take_along_axis(clipped, order[..., np.newaxis], axis=1)
+    return np.where((valid_counts > 0)[..., np.newaxis], clipped, 0.0)
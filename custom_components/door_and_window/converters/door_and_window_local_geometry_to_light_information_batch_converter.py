@@ -0,0 +1,129 @@
+""" Module for DoorAndWindowLocalGeometryToLightInformationBatchConverter class. """
+from typing import Union
+
+import numpy as np
+
+from ..converters.convex_polygon_clipping import clip_convex_polygons, get_areas
+from ..models.door_and_window_light_information_batch import \
+    DoorAndWindowLightInformationBatch
+from ..models.door_and_window_local_geometry import DoorAndWindowLocalGeometry
+from ..models.door_and_window_local_geometry_stack import \
+    DoorAndWindowLocalGeometryStack
+
+
+# pylint: disable=too-few-public-methods
+class DoorAndWindowLocalGeometryToLightInformationBatchConverter():
+    """
+    Responsible for converting door and window local geometry to light information
+    at many sun positions or for many door and windows at once.
+
+    It is the vectorised version of `DoorAndWindowLocalGeometryToLightInformationConverter`,
+    every calculation is done on arrays. The door and window geometries and the sun
+    positions are broadcast against each other, so either one door and window can be
+    evaluated at many sun positions or many door and windows at one sun position.
+    """
+
+    # pylint: disable=too-many-locals
+    @classmethod
+    def convert(
+        cls,
+        local_geometry: Union[DoorAndWindowLocalGeometry, DoorAndWindowLocalGeometryStack],
+        horizon_elevation_at_sun_azimuth: np.ndarray,
+        solar_azimuth: Union[float, np.ndarray],
+        solar_elevation: Union[float, np.ndarray]
+    ) -> DoorAndWindowLightInformationBatch:
+        """
+        Converts the specified door and window local geometry to light information.
+
+        Args:
+            local_geometry:
+                The local geometry of a door and window or the stacked local geometries
+                of many door and windows.
+            horizon_elevation_at_sun_azimuth:
+                The horizon elevations at sun azimuth.
+                NaN values are ignored (the sun is behind the door and window).
+            solar_azimuth:
+                The sun's azimuths.
+            solar_elevation:
+                The sun's elevations.
+
+        Returns:
+            The door and window light information batch instance
+            which describes the light states.
+        """
+        if isinstance(local_geometry, DoorAndWindowLocalGeometry):
+            local_geometry = DoorAndWindowLocalGeometryStack([local_geometry])
+
+        solar_elevation = np.asarray(solar_elevation, dtype=float)
+        solar_azimuth_radians = np.radians(np.asarray(solar_azimuth, dtype=float))
+        solar_elevation_radians = np.radians(solar_elevation)
+        (sin_azimuth, cos_azimuth) = \
+            (np.sin(solar_azimuth_radians), np.cos(solar_azimuth_radians))
+        (sin_elevation, cos_elevation) = \
+            (np.sin(solar_elevation_radians), np.cos(solar_elevation_radians))
+
+        (normal_x, normal_y, normal_z) = local_geometry.normal.T
+        cos_angle_of_incidence = \
+            normal_x * cos_elevation * cos_azimuth + \
+            normal_y * cos_elevation * sin_azimuth + \
+            normal_z * sin_elevation
+        angle_of_incidence = np.round(
+            np.degrees(np.arccos(np.clip(cos_angle_of_incidence, -1.0, 1.0))), 2)
+
+        # the direction of the sun rays in the door and window coordinate system
+        (ray_x, ray_y, ray_z) = np.matmul(
+            local_geometry.world_to_local,
+            np.stack(
+                np.broadcast_arrays(
+                    cos_elevation * sin_azimuth,
+                    -sin_elevation,
+                    cos_elevation * cos_azimuth
+                ),
+                axis=-1
+            )[..., np.newaxis]
+        )[..., 0].T
+
+        is_lit = (angle_of_incidence < 90) & \
+            ~(horizon_elevation_at_sun_azimuth > solar_elevation) & \
+            (np.abs(ray_z) >= 1e-12)
+        ray_z = np.where(is_lit, ray_z, 1.0)
+        shift_x = ray_x / ray_z
+        shift_y = ray_y / ray_z
+
+        # The glazing inside the wall opening shifted by the shadow offset
+        # (see `DoorAndWindowLocalGeometryToLightInformationConverter`).
+        (glazing_left, glazing_bottom, glazing_right, glazing_top) = local_geometry.glazing.T
+        (opening_left, opening_bottom, opening_right, opening_top) = local_geometry.opening.T
+        outside_depth = local_geometry.outside_depth
+        left = np.maximum(glazing_left, opening_left + outside_depth * shift_x)
+        right = np.minimum(glazing_right, opening_right + outside_depth * shift_x)
+        bottom = np.maximum(glazing_bottom, opening_bottom + outside_depth * shift_y)
+        top = np.minimum(glazing_top, opening_top + outside_depth * shift_y)
+        sunny_area = np.maximum(right - left, 0) * np.maximum(top - bottom, 0)
+
+        if local_geometry.has_awning:
+            # The awnings projected along the sun rays to the glazing plane
+            # and clipped to the sunny rectangles. Missing awnings are zeros,
+            # their projection has no area.
+            awning = local_geometry.awning
+            shadow = np.stack([
+                awning[..., 0] - shift_x[:, np.newaxis] * awning[..., 2],
+                awning[..., 1] - shift_y[:, np.newaxis] * awning[..., 2]
+            ], axis=-1)
+            shadow = clip_convex_polygons(shadow, (-1, 0), -left)
+            shadow = clip_convex_polygons(shadow, (1, 0), right)
+            shadow = clip_convex_polygons(shadow, (0, -1), -bottom)
+            shadow = clip_convex_polygons(shadow, (0, 1), top)
+            sunny_area = np.maximum(sunny_area - get_areas(shadow), 0)
+
+        # The area as seen from the sun, on the plane perpendicular to the sun rays.
+        sunny_glazing_area = np.round(np.where(is_lit, sunny_area * np.abs(ray_z), 0), 2)
+        glazing_area = (glazing_right - glazing_left) * (glazing_top - glazing_bottom)
+
+        return DoorAndWindowLightInformationBatch(
+            angle_of_incidence,
+            horizon_elevation_at_sun_azimuth,
+            sunny_glazing_area,
+            np.round(sunny_glazing_area / glazing_area * 100, 2),
+            sunny_glazing_area > 0.01
+        )
@@ -0,0 +1,174 @@
+""" Module for DoorAndWindowLocalGeometryToLightInformationConverter class. """
+import math
+from typing import Union
+
+from ..converters.convex_polygon_clipping import subtract_convex_polygon
+from ..converters.shadow_caster_culling import cull_shadow_casters
+from ..models.door_and_window_light_information import \
+    DoorAndWindowLightInformation
+from ..models.door_and_window_local_geometry import (
+    DoorAndWindowLocalGeometry, Vector)
+from ..transformers.coordinate_transformations import CoordinateTransformations
+
+
+# pylint: disable=too-few-public-methods
+class DoorAndWindowLocalGeometryToLightInformationConverter():
+    """
+    Responsible for converting door and window local geometry to light information.
+
+    The glazing and the wall opening are fixed in the door and window coordinate system,
+    so only the sun direction has to be transformed. The shadows of the jamb walls,
+    the head jamb wall and the stool are closed-form offsets of the wall opening
+    and only the awning has to be clipped from the sunny glazing area.
+    """
+
+    # pylint: disable=too-many-locals
+    @classmethod
+    def convert(
+        cls,
+        local_geometry: DoorAndWindowLocalGeometry,
+        horizon_elevation_at_sun_azimuth: Union[float, None],
+        solar_azimuth: float,
+        solar_elevation: float
+    ) -> DoorAndWindowLightInformation:
+        """
+        Converts the specified door and window local geometry to light information.
+
+        The result is the same as the result of
+        `DoorAndWindowRectanglesToLightInformationConverter`.
+
+        Args:
+            local_geometry:
+                The door and window local geometry to convert.
+            horizon_elevation_at_sun_azimuth:
+                The horizon elevation at sun azimuth.
+                None if the sun is behind the door and window.
+            solar_azimuth:
+                The sun's azimuth.
+            solar_elevation:
+                The sun's elevation.
+
+        Returns:
+            The door and window light information instance
+            which describes the light state of the door and window.
+        """
+        angle_of_incidence = cls.get_angle_of_incidence(
+            local_geometry, solar_azimuth, solar_elevation)
+
+        if angle_of_incidence >= 90:
+            # the sun is behind the door and window
+            return DoorAndWindowLightInformation(angle_of_incidence)
+
+        if horizon_elevation_at_sun_azimuth is not None \
+                and horizon_elevation_at_sun_azimuth > solar_elevation:
+            # the sun is below the horizon
+            return DoorAndWindowLightInformation(angle_of_incidence)
+
+        (sin_azimuth, cos_azimuth) = CoordinateTransformations.get_sin_cos(solar_azimuth)
+        (sin_elevation, cos_elevation) = CoordinateTransformations.get_sin_cos(solar_elevation)
+
+        # The axes of the plane perpendicular to the sun rays (the same as the
+        # rotation used by `DoorAndWindowRectanglesSeenFromSunTransformer`)
+        # and the direction of the sun rays in the door and window coordinate system.
+        view_x = cls._to_local(local_geometry, (cos_azimuth, 0.0, -sin_azimuth))
+        view_y = cls._to_local(
+            local_geometry,
+            (sin_elevation * sin_azimuth, cos_elevation, sin_elevation * cos_azimuth)
+        )
+        (ray_x, ray_y, ray_z) = cls._to_local(
+            local_geometry,
+            (cos_elevation * sin_azimuth, -sin_elevation, cos_elevation * cos_azimuth)
+        )
+
+        if abs(ray_z) < 1e-12:
+            # the sun rays are parallel to the glazing
+            return DoorAndWindowLightInformation(angle_of_incidence)
+
+        # The wall opening's outer edge casts its shadow to the glazing plane
+        # shifted by this offset. Only the glazing inside the shifted opening is sunny.
+        offset_x = local_geometry.outside_depth * ray_x / ray_z
+        offset_y = local_geometry.outside_depth * ray_y / ray_z
+
+        (glazing_left, glazing_bottom, glazing_right, glazing_top) = local_geometry.glazing
+        (opening_left, opening_bottom, opening_right, opening_top) = local_geometry.opening
+
+        left = max(glazing_left, opening_left + offset_x)
+        right = min(glazing_right, opening_right + offset_x)
+        bottom = max(glazing_bottom, opening_bottom + offset_y)
+        top = min(glazing_top, opening_top + offset_y)
+
+        if left >= right or bottom >= top:
+            return DoorAndWindowLightInformation(angle_of_incidence)
+
+        sunny_glazing_area_convex_polygons = [
+            [(left, bottom), (right, bottom), (right, top), (left, top)]
+        ]
+
+        if local_geometry.awning is not None:
+            # projecting the awning along the sun rays to the glazing plane
+            awning = [
+                (x - z * ray_x / ray_z, y - z * ray_y / ray_z)
+                for (x, y, z) in local_geometry.awning  # pylint: disable=invalid-name
+            ]
+            overlapping_shadow_caster_indices = cull_shadow_casters(
+                sunny_glazing_area_convex_polygons[0], [awning])
+            if overlapping_shadow_caster_indices is None:
+                # the awning shades the whole sunny part of the glazing
+                return DoorAndWindowLightInformation(angle_of_incidence)
+            if overlapping_shadow_caster_indices:
+                sunny_glazing_area_convex_polygons = subtract_convex_polygon(
+                    sunny_glazing_area_convex_polygons, awning)
+
+        # Projecting the sunny polygons to the plane perpendicular
+        # to the sun rays, as seen from the sun.
+        return DoorAndWindowLightInformation(
+            angle_of_incidence,
+            sunny_glazing_area_convex_polygons=[
+                [
+                    (view_x[0] * x + view_x[1] * y, view_y[0] * x + view_y[1] * y)
+                    for (x, y) in polygon  # pylint: disable=invalid-name
+                ]
+                for polygon in sunny_glazing_area_convex_polygons
+            ]
+        )
+
+    @classmethod
+    def get_angle_of_incidence(
+        cls,
+        local_geometry: DoorAndWindowLocalGeometry,
+        solar_azimuth: float,
+        solar_elevation: float
+    ) -> float:
+        """
+        Gets the angle of incidence rounded to 2 decimals.
+
+        Args:
+            local_geometry:
+                The door and window local geometry.
+            solar_azimuth:
+                The sun's azimuth.
+            solar_elevation:
+                The sun's elevation.
+
+        Returns:
+            The angle between the sun rays and the normal of the door and window face.
+        """
+        (sin_azimuth, cos_azimuth) = CoordinateTransformations.get_sin_cos(solar_azimuth)
+        (sin_elevation, cos_elevation) = CoordinateTransformations.get_sin_cos(solar_elevation)
+
+        (normal_x, normal_y, normal_z) = local_geometry.normal
+        cos_angle_of_incidence = \
+            normal_x * cos_elevation * cos_azimuth + \
+            normal_y * cos_elevation * sin_azimuth + \
+            normal_z * sin_elevation
+        return round(
+            math.degrees(math.acos(max(-1.0, min(1.0, cos_angle_of_incidence)))), 2)
+
+    @classmethod
+    def _to_local(cls, local_geometry: DoorAndWindowLocalGeometry, vector: Vector) -> Vector:
+        (row_1, row_2, row_3) = local_geometry.world_to_local
+        return (
+            row_1[0] * vector[0] + row_1[1] * vector[1] + row_1[2] * vector[2],
+            row_2[0] * vector[0] + row_2[1] * vector[1] + row_2[2] * vector[2],
+            row_3[0] * vector[0] + row_3[1] * vector[1] + row_3[2] * vector[2]
+        )
@@ -0,0 +1,121 @@
+""" Module for DoorAndWindowLocalGeometryToShadingTableConverter class. """
+import math
+
+import numpy as np
+
+from ..const import MIN_SHADING_TABLE_RESOLUTION
+from ..converters.door_and_window_local_geometry_to_light_information_batch_converter import \
+    DoorAndWindowLocalGeometryToLightInformationBatchConverter
+from ..models.door_and_window_local_geometry import DoorAndWindowLocalGeometry
+from ..models.door_and_window_shading_table import DoorAndWindowShadingTable
+
+# The number of sun positions evaluated at once, it limits the memory usage.
+_CHUNK_SIZE = 65536
+
+
+# pylint: disable=too-few-public-methods
+class DoorAndWindowLocalGeometryToShadingTableConverter():
+    """
+    Responsible for converting door and window local geometry to a shading table.
+    """
+
+    # pylint: disable=too-many-arguments, too-many-locals
+    @classmethod
+    def convert(
+        cls,
+        local_geometry: DoorAndWindowLocalGeometry,
+        azimuth: float,
+        tilt: float,
+        resolution: float,
+        error_bound: float,
+        *,
+        min_resolution: float = MIN_SHADING_TABLE_RESOLUTION
+    ) -> DoorAndWindowShadingTable:
+        """
+        Converts the specified door and window local geometry to a shading table.
+
+        The grid covers the sun positions in front of the door and window above
+        the horizontal plane. The resolution is halved until the interpolation error
+        measured at the middle of the grid cells is not more than `error_bound`,
+        or `min_resolution` is reached. In the latter case the `error` of the table
+        is more than `error_bound`, so the table should not be used.
+
+        Args:
+            local_geometry:
+                The door and window local geometry to convert.
+            azimuth:
+                The door and window azimuth.
+            tilt:
+                The door and window tilt.
+            resolution:
+                The initial distance of the grid points in degrees.
+            error_bound:
+                The allowed interpolation error in percentage of the glazing area.
+            min_resolution:
+                The smallest distance of the grid points in degrees.
+
+        Returns:
+            The shading table of the door and window.
+        """
+        # A vertical door and window can be lit only from the front,
+        # a tilted one also from behind when the sun is high enough.
+        first_azimuth = -90 if tilt >= 90 else -180
+        (glazing_left, glazing_bottom, glazing_right, glazing_top) = local_geometry.glazing
+        glazing_area = (glazing_right - glazing_left) * (glazing_top - glazing_bottom)
+
+        while True:
+            # the grid must fit to the 0 and 90 degrees elevation
+            resolution = 90 / math.ceil(90 / resolution)
+            azimuths = first_azimuth + np.arange(round(-2 * first_azimuth / resolution) + 1) * \
+                resolution
+            elevations = np.arange(round(90 / resolution) + 1) * resolution
+
+            sunny_glazing_areas = cls._get_sunny_glazing_areas(
+                local_geometry, azimuth + azimuths, elevations)
+
+            # The bilinear interpolation is the average of the corners in the middle of a cell.
+            interpolated = (
+                sunny_glazing_areas[:-1, :-1] + sunny_glazing_areas[1:, :-1] +
+                sunny_glazing_areas[:-1, 1:] + sunny_glazing_areas[1:, 1:]
+            ) / 4
+            expected = cls._get_sunny_glazing_areas(
+                local_geometry,
+                azimuth + azimuths[:-1] + resolution / 2,
+                elevations[:-1] + resolution / 2
+            )
+            error = float(np.max(np.abs(interpolated - expected))) / glazing_area * 100
+
+            if error <= error_bound or resolution <= min_resolution:
+                return DoorAndWindowShadingTable(
+                    local_geometry,
+                    first_azimuth,
+                    resolution,
+                    sunny_glazing_areas.astype(np.float32),
+                    error
+                )
+
+            resolution = max(resolution / 2, min_resolution)
+
+    @classmethod
+    def _get_sunny_glazing_areas(
+        cls,
+        local_geometry: DoorAndWindowLocalGeometry,
+        azimuths: np.ndarray,
+        elevations: np.ndarray
+    ) -> np.ndarray:
+        (grid_azimuths, grid_elevations) = np.meshgrid(azimuths, elevations, indexing='ij')
+        grid_azimuths = grid_azimuths.ravel()
+        grid_elevations = grid_elevations.ravel()
+
+        converter = DoorAndWindowLocalGeometryToLightInformationBatchConverter()
+        sunny_glazing_areas = np.empty(grid_azimuths.size)
+        for start in range(0, grid_azimuths.size, _CHUNK_SIZE):
+            end = start + _CHUNK_SIZE
+            sunny_glazing_areas[start:end] = converter.convert(
+                local_geometry,
+                np.full(grid_azimuths[start:end].size, np.nan),
+                grid_azimuths[start:end],
+                grid_elevations[start:end]
+            ).sunny_glazing_area
+
+        return sunny_glazing_areas.reshape(len(azimuths), len(elevations))
@@ -1,9 +1,15 @@
 """ Module for DoorAndWindowRectanglesToLightInformationConverter class. """
+from typing import Union
+
 from shapely.geometry import Polygon
 
+from ..const import LIGHT_ENGINE_CONVEX_CLIPPING, LIGHT_ENGINE_SHAPELY
 from ..converters.angle_of_incidence import get_angle_of_incidence
+from ..converters.convex_polygon_clipping import (subtract_convex_polygon,
+                                                  to_counter_clockwise)
 from ..converters.door_and_window_rectangles_to_polygons_converter import \
     DoorAndWindowRectanglesToPolygonsConverter
+from ..converters.shadow_caster_culling import cull_shadow_casters
 from ..models.door_and_window_light_information import \
     DoorAndWindowLightInformation
 from ..models.door_and_window_rectangles import DoorAndWindowRectangles
@@ -15,26 +21,33 @@ from ..transformers.door_and_window_seen_from_sun_transformer import \
 class DoorAndWindowRectanglesToLightInformationConverter():
     """ Responsible for converting door and window rectangles to light information. """
 
-    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-arguments, too-many-locals
     @classmethod
     def convert(
         cls,
         door_and_window_rectangles: DoorAndWindowRectangles,
-        horizon_elevation_at_sun_azimuth: float,
+        horizon_elevation_at_sun_azimuth: Union[float, None],
         door_and_window_azimuth: float,
         door_and_window_tilt: float,
         solar_azimuth: float,
-        solar_elevation: float
+        solar_elevation: float,
+        *,
+        engine: str = LIGHT_ENGINE_SHAPELY,
+        out: Union[DoorAndWindowRectangles, None] = None
     ) -> DoorAndWindowLightInformation:
         """
         Converts the specified door and window 3D rectangles
         to light information
 
+        The obstacles of the rectangles which may shade the glazing from the sun position
+        are projected and subtracted like the outside jamb walls and the awning.
+
         Args:
             door_and_window_rectangles:
                 The door and window rectangles to convert.
             horizon_elevation_at_sun_azimuth:
                 The horizon elevation at sun azimuth.
+                None if the sun is behind the door and window.
             door_and_window_azimuth:
                 The door and window's azimuth.
             door_and_window_tilt:
@@ -43,6 +56,14 @@ class DoorAndWindowRectanglesToLightInformationConverter():
                 The sun's azimuth.
             solar_elevation:
                 The sun's elevation.
+            engine:
+                The engine to use for calculating the sunny glazing area.
+                `LIGHT_ENGINE_SHAPELY` subtracts shapely polygons,
+                `LIGHT_ENGINE_CONVEX_CLIPPING` clips the projected convex
+                quadrilaterals without creating any shapely object.
+            out:
+                The DoorAndWindowRectangles instance to overwrite with the rectangles
+                seen from the sun instead of allocating a new one. None to allocate.
 
         Returns:
             The door and window light information instance
@@ -60,30 +81,83 @@ class DoorAndWindowRectanglesToLightInformationConverter():
             # the sun is behind the door and window
             return DoorAndWindowLightInformation(angle_of_incidence, Polygon())
 
-        if horizon_elevation_at_sun_azimuth > solar_elevation:
+        if horizon_elevation_at_sun_azimuth is not None \
+                and horizon_elevation_at_sun_azimuth > solar_elevation:
             # the sun is below the horizon
             return DoorAndWindowLightInformation(angle_of_incidence, Polygon())
 
         door_and_window_transformer = DoorAndWindowRectanglesSeenFromSunTransformer()
-
-        door_and_window_rectangles_to_polygons_converter = \
-            DoorAndWindowRectanglesToPolygonsConverter()
+        obstacles = door_and_window_rectangles.obstacles
 
         door_and_window_rectangles_seen_from_sun = door_and_window_transformer.transform(
             door_and_window_rectangles,
             solar_azimuth,
-            solar_elevation
+            solar_elevation,
+            out
         )
 
+        # Projecting all the corners to the (x, y) plane at once.
+        # The 1st rectangle is the glazing, the next 4 ones are the outside shadow casters.
+        # The last one is the awning.
+        projected_rectangles = door_and_window_rectangles_seen_from_sun.corners[:, :, :2].tolist()
+
+        glazing = to_counter_clockwise([tuple(corner) for corner in projected_rectangles[0]])
+        if not glazing:
+            # the glazing is seen edge-on
+            return DoorAndWindowLightInformation(angle_of_incidence, Polygon())
+
+        shadow_caster_count = 5 if door_and_window_rectangles_seen_from_sun.has_awning else 4
+        shadow_casters = [
+            [tuple(corner) for corner in projected_rectangle]
+            for projected_rectangle in projected_rectangles[1:1 + shadow_caster_count]
+        ]
+        if obstacles is not None:
+            # The rectangles and the obstacles are seen from the same sun position.
+            shadow_casters.extend(obstacles.get_shadow_casters(
+                solar_azimuth,
+                solar_elevation,
+                door_and_window_transformer.get_sun_view_matrix(solar_azimuth, solar_elevation)
+            ))
+
+        overlapping_shadow_caster_indices = cull_shadow_casters(glazing, shadow_casters)
+        if overlapping_shadow_caster_indices is None:
+            # a shadow caster covers the whole glazing
+            return DoorAndWindowLightInformation(angle_of_incidence, Polygon())
+
+        if engine == LIGHT_ENGINE_CONVEX_CLIPPING:
+            sunny_glazing_area_convex_polygons = [glazing]
+            for index in overlapping_shadow_caster_indices:
+                if not sunny_glazing_area_convex_polygons:
+                    break
+                sunny_glazing_area_convex_polygons = subtract_convex_polygon(
+                    sunny_glazing_area_convex_polygons,
+                    shadow_casters[index]
+                )
+            return DoorAndWindowLightInformation(
+                angle_of_incidence,
+                sunny_glazing_area_convex_polygons=sunny_glazing_area_convex_polygons
+            )
+
+        door_and_window_rectangles_to_polygons_converter = \
+            DoorAndWindowRectanglesToPolygonsConverter()
+
         door_and_window_polygons = door_and_window_rectangles_to_polygons_converter.convert(
             door_and_window_rectangles_seen_from_sun
         )
+        shadow_caster_polygons = [
+            door_and_window_polygons.outside_left_jamb_wall,
+            door_and_window_polygons.outside_right_jamb_wall,
+            door_and_window_polygons.outside_head_jamb_wall,
+            door_and_window_polygons.outside_stool,
+            door_and_window_polygons.awning
+        ]
 
-        sunny_glazing_area_polygon = door_and_window_polygons.glazing \
-            .difference(door_and_window_polygons.outside_left_jamb_wall) \
-            .difference(door_and_window_polygons.outside_right_jamb_wall) \
-            .difference(door_and_window_polygons.outside_head_jamb_wall) \
-            .difference(door_and_window_polygons.outside_stool) \
-            .difference(door_and_window_polygons.awning)
+        sunny_glazing_area_polygon = door_and_window_polygons.glazing
+        for index in overlapping_shadow_caster_indices:
+            sunny_glazing_area_polygon = sunny_glazing_area_polygon.difference(
+                shadow_caster_polygons[index] if index < shadow_caster_count
+                # the obstacles are created only if they overlap the glazing
+                else Polygon(shadow_casters[index])
+            )
 
         return DoorAndWindowLightInformation(angle_of_incidence, sunny_glazing_area_polygon)
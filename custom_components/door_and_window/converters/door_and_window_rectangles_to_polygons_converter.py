@@ -25,6 +25,20 @@ class DoorAndWindowRectanglesToPolygonsConverter():
             The DoorAndWindowPolygons which represents the
             door and window rectangles in the (x, y) plane.
         """
+        # The inside polygons are not required for the sunny glazing area calculation,
+        # so these are created only on demand.
+        def get_inside_polygons():
+            return (
+                self._convert_rectangle_to_polygon(
+                    door_and_window_rectangles.inside_left_jamb_wall),
+                self._convert_rectangle_to_polygon(
+                    door_and_window_rectangles.inside_right_jamb_wall),
+                self._convert_rectangle_to_polygon(
+                    door_and_window_rectangles.inside_head_jamb_wall),
+                self._convert_rectangle_to_polygon(
+                    door_and_window_rectangles.inside_stool)
+            )
+
         return DoorAndWindowPolygons(
             glazing=self._convert_rectangle_to_polygon(door_and_window_rectangles.glazing),
             outside_left_jamb_wall=self._convert_rectangle_to_polygon(
@@ -35,23 +49,15 @@ class DoorAndWindowRectanglesToPolygonsConverter():
                 door_and_window_rectangles.outside_head_jamb_wall),
             outside_stool=self._convert_rectangle_to_polygon(
                 door_and_window_rectangles.outside_stool),
-            inside_left_jamb_wall=self._convert_rectangle_to_polygon(
-                door_and_window_rectangles.inside_left_jamb_wall),
-            inside_right_jamb_wall=self._convert_rectangle_to_polygon(
-                door_and_window_rectangles.inside_right_jamb_wall),
-            inside_head_jamb_wall=self._convert_rectangle_to_polygon(
-                door_and_window_rectangles.inside_head_jamb_wall),
-            inside_stool=self._convert_rectangle_to_polygon(
-                door_and_window_rectangles.inside_stool),
+            inside_left_jamb_wall=None,
+            inside_right_jamb_wall=None,
+            inside_head_jamb_wall=None,
+            inside_stool=None,
             awning=self._convert_rectangle_to_polygon(
-                door_and_window_rectangles.awning)
+                door_and_window_rectangles.awning),
+            get_inside_polygons=get_inside_polygons
         )
 
     @classmethod
     def _convert_rectangle_to_polygon(cls, rectangle: Union[Quadrilateral, None]) -> Polygon:
-        return Polygon() if rectangle is None else Polygon([
-            rectangle.corner_1[0:2],
-            rectangle.corner_2[0:2],
-            rectangle.corner_3[0:2],
-            rectangle.corner_4[0:2]
-        ])
+        return Polygon() if rectangle is None else Polygon(rectangle.corners[:, 0:2])
@@ -0,0 +1,168 @@
+""" Module for door and window to local geometry converter. """
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, AbstractSet, List, Union
+
+import numpy as np
+
+from ..converters.awning_to_rectangle_converter import \
+    AwningToRectangleConverter
+from ..models.door_and_window_local_geometry import (
+    Bounds, DoorAndWindowLocalGeometry, Vector)
+from ..transformers.awning_rectangle_transformer import \
+    AwningRectangleTransformer
+from ..transformers.coordinate_transformations import CoordinateTransformations
+from .door_and_window_to_rectangles_converter import (AWNING_PARAMETERS,
+                                                      ROTATION_PARAMETERS)
+
+if TYPE_CHECKING:
+    from ..models.door_and_window import DoorAndWindow
+
+# The parameters of the door and window its local geometry depends on.
+# The inside parts of the door and window do not shade the glazing.
+LOCAL_GEOMETRY_PARAMETERS = frozenset({
+    'width',
+    'height',
+    'parapet_wall_height',
+    'frame_face_thickness',
+    'outside_depth',
+    'azimuth',
+    'tilt',
+    'awning'
+})
+
+# pylint: disable=too-few-public-methods
+
+
+class DoorAndWindowToLocalGeometryConverter():
+    """
+    Responsible for converting `DoorAndWindow` instance to
+    `DoorAndWindowLocalGeometry` instance.
+    """
+
+    def __init__(self):
+        self._transformations = CoordinateTransformations()
+
+    def convert(self, door_and_window: DoorAndWindow) -> DoorAndWindowLocalGeometry:
+        """
+        Converts the specified DoorAndWindow instance to the geometry
+        which describes the DoorAndWindow instance in its own coordinate system.
+
+        The coordinate system is the same as the one used by
+        `DoorAndWindowToRectanglesConverter` before rotating to azimuth and tilt.
+
+        Args:
+            door_and_window
+                The DoorAndWindow instance to convert.
+
+        Returns:
+            The geometry of the door and window in its own coordinate system.
+        """
+        world_to_local = self._get_world_to_local(door_and_window)
+
+        return DoorAndWindowLocalGeometry(
+            world_to_local=tuple(tuple(row) for row in world_to_local.tolist()),
+            normal=self._get_normal(door_and_window),
+            glazing=self._get_glazing(door_and_window),
+            opening=self._get_opening(door_and_window),
+            outside_depth=door_and_window.outside_depth,
+            awning=self._get_awning(door_and_window, world_to_local)
+        )
+
+    def update(
+        self,
+        door_and_window: DoorAndWindow,
+        local_geometry: DoorAndWindowLocalGeometry,
+        changed_parameters: AbstractSet[str]
+    ) -> DoorAndWindowLocalGeometry:
+        """
+        Converts the specified DoorAndWindow instance to its local geometry
+        by recalculating only the parts of the specified earlier local geometry
+        which depend on the changed parameters.
+
+        Args:
+            door_and_window
+                The DoorAndWindow instance to convert.
+            local_geometry
+                The local geometry converted from the DoorAndWindow instance
+                before its parameters changed.
+            changed_parameters
+                The names of the DoorAndWindow properties changed since then.
+                A change of the awning depth is an `awning` change.
+
+        Returns:
+            The earlier local geometry if none of the changed parameters affects it,
+            otherwise the new geometry of the door and window in its own coordinate system.
+        """
+        if changed_parameters & ROTATION_PARAMETERS:
+            return self.convert(door_and_window)
+        if not changed_parameters & LOCAL_GEOMETRY_PARAMETERS:
+            return local_geometry
+
+        awning = local_geometry.awning
+        if changed_parameters & AWNING_PARAMETERS:
+            awning = self._get_awning(
+                door_and_window,
+                np.array(local_geometry.world_to_local, dtype=float)
+            )
+
+        return DoorAndWindowLocalGeometry(
+            world_to_local=local_geometry.world_to_local,
+            normal=local_geometry.normal,
+            glazing=self._get_glazing(door_and_window),
+            opening=self._get_opening(door_and_window),
+            outside_depth=door_and_window.outside_depth,
+            awning=awning
+        )
+
+    def _get_world_to_local(self, door_and_window: DoorAndWindow) -> np.ndarray:
+        local_to_world = self._transformations.get_rotation_matrix_y(door_and_window.azimuth)
+        local_to_world = local_to_world.dot(
+            self._transformations.get_rotation_matrix_x(90 - door_and_window.tilt)
+        )
+        # The inverse of a rotation matrix is its transpose.
+        return local_to_world[:3, :3].T
+
+    def _get_normal(self, door_and_window: DoorAndWindow) -> Vector:
+        return self._transformations.convert_polar_coordinates_to_rectanglar(
+            door_and_window.azimuth,
+            90 - door_and_window.tilt
+        )
+
+    @classmethod
+    def _get_awning(
+        cls,
+        door_and_window: DoorAndWindow,
+        world_to_local: np.ndarray
+    ) -> Union[List[Vector], None]:
+        if not door_and_window.awning:
+            return None
+
+        awning_rectangle = AwningRectangleTransformer().transform(
+            AwningToRectangleConverter().convert(door_and_window.awning),
+            door_and_window
+        )
+        return [
+            tuple(corner)
+            for corner in np.matmul(awning_rectangle.corners[:, :3], world_to_local.T).tolist()
+        ]
+
+    @classmethod
+    def _get_glazing(cls, door_and_window: DoorAndWindow) -> Bounds:
+        (left, bottom, right, top) = cls._get_opening(door_and_window)
+        frame_face_thickness = door_and_window.frame_face_thickness
+        return (
+            left + frame_face_thickness,
+            bottom + frame_face_thickness,
+            right - frame_face_thickness,
+            top - frame_face_thickness
+        )
+
+    @classmethod
+    def _get_opening(cls, door_and_window: DoorAndWindow) -> Bounds:
+        return (
+            -door_and_window.width / 2,
+            door_and_window.parapet_wall_height,
+            door_and_window.width / 2,
+            door_and_window.parapet_wall_height + door_and_window.height
+        )
@@ -1,10 +1,13 @@
 """ Module for door and window to rectangles converter. """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, AbstractSet, Callable, List, Union
+
+import numpy as np
 
 from ..converters.awning_to_rectangle_converter import \
     AwningToRectangleConverter
+from ..models.door_and_window_obstacles import DoorAndWindowObstacles
 from ..models.door_and_window_rectangles import DoorAndWindowRectangles
 from ..models.quadrilateral import Quadrilateral
 from ..transformers.awning_rectangle_transformer import \
@@ -14,6 +17,18 @@ from ..transformers.coordinate_transformations import CoordinateTransformations
 if TYPE_CHECKING:
     from ..models.door_and_window import DoorAndWindow
 
+# The parameters of the door and window each part of the rectangles depends on.
+# The azimuth and the tilt rotate every part.
+ROTATION_PARAMETERS = frozenset({'azimuth', 'tilt'})
+GLAZING_PARAMETERS = frozenset({'width', 'height', 'parapet_wall_height', 'frame_face_thickness'})
+OUTSIDE_PARAMETERS = frozenset({'width', 'height', 'parapet_wall_height', 'outside_depth'})
+AWNING_PARAMETERS = frozenset({'awning', 'height', 'parapet_wall_height', 'outside_depth'})
+# The obstacles are indexed by the directions from the glazing.
+OBSTACLE_PARAMETERS = frozenset({'obstacles', 'facade', 'facade_position'}) | GLAZING_PARAMETERS
+# The obstacles of the facade are relative to the wall face,
+# so they are moved to the door and window by the outside depth too.
+FACADE_OBSTACLE_PARAMETERS = frozenset({'outside_depth'}) | OBSTACLE_PARAMETERS
+
 # pylint: disable=too-few-public-methods
 
 
@@ -30,6 +45,7 @@ class DoorAndWindowToRectanglesConverter():
         """
         Converts the specified DoorAndWindow instance to rectangles
         which represent the DoorAndWindow instance in the 3D space.
+        The obstacles of the door and window and its facade are transformed to the same space.
 
         The origin is:
             - the outer surface of the glazing on Z axis
@@ -47,229 +63,283 @@ class DoorAndWindowToRectanglesConverter():
         Returns:
             Rectangles represents the door and window in the 3D space.
         """
+        transformation_matrix = self._get_transformation_matrix(door_and_window)
+
+        # The last rectangle is the awning, it is left zero if there is no awning.
+        corners = np.zeros((6, 4, 4))
+        np.matmul(
+            self._to_homogeneous(self._get_outside_corners(door_and_window)),
+            transformation_matrix.T,
+            out=corners[:5]
+        )
+        has_awning = self._set_awning_corners(door_and_window, corners)
+
+        return DoorAndWindowRectangles.from_corners(
+            corners,
+            has_awning,
+            self._create_get_inside_corners(door_and_window, transformation_matrix),
+            self._get_obstacles(door_and_window, transformation_matrix, corners)
+        )
+
+    def update(
+        self,
+        door_and_window: DoorAndWindow,
+        rectangles: DoorAndWindowRectangles,
+        changed_parameters: AbstractSet[str]
+    ) -> DoorAndWindowRectangles:
+        """
+        Converts the specified DoorAndWindow instance to rectangles
+        by recalculating only the parts of the specified earlier rectangles
+        which depend on the changed parameters. The earlier rectangles are not modified.
+
+        Args:
+            door_and_window
+                The DoorAndWindow instance to convert.
+            rectangles
+                The rectangles converted from the DoorAndWindow instance
+                before its parameters changed.
+            changed_parameters
+                The names of the DoorAndWindow properties changed since then.
+                A change of the awning depth is an `awning` change.
+
+        Returns:
+            Rectangles represents the door and window in the 3D space.
+        """
+        if changed_parameters & ROTATION_PARAMETERS:
+            return self.convert(door_and_window)
+
+        transformation_matrix = self._get_transformation_matrix(door_and_window)
+
+        corners = rectangles.corners.copy()
+        if changed_parameters & GLAZING_PARAMETERS:
+            np.matmul(
+                self._to_homogeneous(self._get_glazing_corners(door_and_window)),
+                transformation_matrix.T,
+                out=corners[:1]
+            )
+        if changed_parameters & OUTSIDE_PARAMETERS:
+            np.matmul(
+                self._to_homogeneous(self._get_outside_wall_corners(door_and_window)),
+                transformation_matrix.T,
+                out=corners[1:5]
+            )
+        has_awning = rectangles.has_awning
+        if changed_parameters & AWNING_PARAMETERS:
+            corners[5] = 0
+            has_awning = self._set_awning_corners(door_and_window, corners)
+        obstacles = rectangles.obstacles
+        if changed_parameters & (
+            FACADE_OBSTACLE_PARAMETERS
+            if door_and_window.facade is not None and door_and_window.facade.obstacles
+            else OBSTACLE_PARAMETERS
+        ):
+            obstacles = self._get_obstacles(door_and_window, transformation_matrix, corners)
+
+        # The inside parts are calculated only on demand, so their calculation
+        # is always replaced by the one from the current dimensions.
+        return DoorAndWindowRectangles.from_corners(
+            corners,
+            has_awning,
+            self._create_get_inside_corners(door_and_window, transformation_matrix),
+            obstacles
+        )
+
+    def _get_transformation_matrix(self, door_and_window: DoorAndWindow) -> np.ndarray:
         transformation_matrix = self._transformations.get_rotation_matrix_y(door_and_window.azimuth)
-        transformation_matrix = transformation_matrix.dot(
+        return transformation_matrix.dot(
             self._transformations.get_rotation_matrix_x(90 - door_and_window.tilt)
         )
 
-        awning_rectangle: Union[Quadrilateral, None] = None
-        if door_and_window.awning:
-            awning_to_rectangle_converter = AwningToRectangleConverter()
-            awning_rectangle_transformer = AwningRectangleTransformer()
-            awning_rectangle = awning_rectangle_transformer.transform(
-                awning_to_rectangle_converter.convert(door_and_window.awning),
-                door_and_window
-            )
+    @classmethod
+    def _set_awning_corners(cls, door_and_window: DoorAndWindow, corners: np.ndarray) -> bool:
+        """
+        Sets the awning corners as the last rectangle of the specified corners.
 
-        return DoorAndWindowRectangles(
-            glazing=Quadrilateral(
-                [
-                    door_and_window.frame_face_thickness - door_and_window.width / 2,
-                    door_and_window.parapet_wall_height + door_and_window.frame_face_thickness,
-                    0.0
-                ],
-                [
-                    door_and_window.width / 2 - door_and_window.frame_face_thickness,
-                    door_and_window.parapet_wall_height + door_and_window.frame_face_thickness,
-                    0.0
-                ],
-                [
-                    door_and_window.width / 2 - door_and_window.frame_face_thickness,
-                    door_and_window.parapet_wall_height + door_and_window.height -
-                    door_and_window.frame_face_thickness,
-                    0.0
-                ],
-                [
-                    door_and_window.frame_face_thickness - door_and_window.width / 2,
-                    door_and_window.parapet_wall_height + door_and_window.height -
-                    door_and_window.frame_face_thickness,
-                    0.0
-                ]
-            ).apply_matrix(transformation_matrix),
-
-            outside_left_jamb_wall=Quadrilateral(
-                [
-                    -door_and_window.width / 2,
-                    door_and_window.parapet_wall_height,
-                    0.0
-                ],
-                [
-                    -door_and_window.width / 2,
-                    door_and_window.parapet_wall_height,
-                    -door_and_window.outside_depth
-                ],
-                [
-                    -door_and_window.width / 2,
-                    door_and_window.parapet_wall_height + door_and_window.height,
-                    -door_and_window.outside_depth
-                ],
-                [
-                    -door_and_window.width / 2,
-                    door_and_window.parapet_wall_height + door_and_window.height,
-                    0.0
-                ],
-            ).apply_matrix(transformation_matrix),
-
-            outside_right_jamb_wall=Quadrilateral(
-                [
-                    door_and_window.width / 2,
-                    door_and_window.parapet_wall_height,
-                    0.0
-                ],
-                [
-                    door_and_window.width / 2,
-                    door_and_window.parapet_wall_height,
-                    -door_and_window.outside_depth],
-                [
-                    door_and_window.width / 2,
-                    door_and_window.parapet_wall_height +
-                    door_and_window.height,
-                    -door_and_window.outside_depth
-                ],
-                [
-                    door_and_window.width / 2,
-                    door_and_window.parapet_wall_height + door_and_window.height,
-                    0
-                ],
-            ).apply_matrix(transformation_matrix),
-
-            outside_head_jamb_wall=Quadrilateral(
-                [
-                    -door_and_window.width / 2,
-                    door_and_window.parapet_wall_height + door_and_window.height,
-                    0.0
-                ],
-                [
-                    -door_and_window.width / 2,
-                    door_and_window.parapet_wall_height + door_and_window.height,
-                    -door_and_window.outside_depth
-                ],
-                [
-                    door_and_window.width / 2,
-                    door_and_window.parapet_wall_height + door_and_window.height,
-                    -door_and_window.outside_depth
-                ],
-                [
-                    door_and_window.width / 2,
-                    door_and_window.parapet_wall_height + door_and_window.height,
-                    0.0
-                ],
-            ).apply_matrix(transformation_matrix),
-
-            outside_stool=Quadrilateral(
-                [
-                    -door_and_window.width / 2,
-                    door_and_window.parapet_wall_height,
-                    0.0
-                ],
-                [
-                    -door_and_window.width / 2,
-                    door_and_window.parapet_wall_height,
+        Returns:
+            The value indicates whether the door and window has an awning.
+        """
+        if not door_and_window.awning:
+            return False
+
+        awning_rectangle: Quadrilateral = AwningRectangleTransformer().transform(
+            AwningToRectangleConverter().convert(door_and_window.awning),
+            door_and_window
+        )
+        corners[5] = awning_rectangle.corners
+        return True
+
+    @classmethod
+    def _get_obstacles(
+        cls,
+        door_and_window: DoorAndWindow,
+        transformation_matrix: np.ndarray,
+        corners: np.ndarray
+    ) -> Union[DoorAndWindowObstacles, None]:
+        if not door_and_window.has_obstacles:
+            return None
+
+        obstacles = list(door_and_window.obstacles)
+        if door_and_window.facade is not None:
+            # from the coordinate system of the facade to the one of the door and window
+            obstacles.extend(
+                obstacle.translate(
+                    -door_and_window.facade_position,
+                    0,
                     -door_and_window.outside_depth
-                ],
-                [
-                    door_and_window.width / 2,
-                    door_and_window.parapet_wall_height,
-                    -door_and_window.outside_depth],
-                [
-                    door_and_window.width / 2,
-                    door_and_window.parapet_wall_height,
-                    0.0
-                ]
-            ).apply_matrix(transformation_matrix),
-
-            inside_left_jamb_wall=Quadrilateral(
-                [
-                    -door_and_window.width / 2,
-                    door_and_window.parapet_wall_height,
-                    door_and_window.frame_thickness
-                ],
-                [
-                    -door_and_window.width / 2,
-                    door_and_window.parapet_wall_height,
-                    door_and_window.inside_depth + door_and_window.frame_thickness
-                ],
-                [
-                    -door_and_window.width / 2,
-                    door_and_window.parapet_wall_height + door_and_window.height,
-                    door_and_window.inside_depth + door_and_window.frame_thickness
-                ],
-                [
-                    -door_and_window.width / 2,
-                    door_and_window.parapet_wall_height + door_and_window.height,
-                    door_and_window.frame_thickness
-                ],
-            ).apply_matrix(transformation_matrix),
-
-            inside_right_jamb_wall=Quadrilateral(
-                [
-                    door_and_window.width / 2,
-                    door_and_window.parapet_wall_height,
-                    door_and_window.frame_thickness
-                ],
-                [
-                    door_and_window.width / 2,
-                    door_and_window.parapet_wall_height,
-                    door_and_window.inside_depth + door_and_window.frame_thickness
-                ],
-                [
-                    door_and_window.width / 2,
-                    door_and_window.parapet_wall_height + door_and_window.height,
-                    door_and_window.inside_depth + door_and_window.frame_thickness
-                ],
-                [
-                    door_and_window.width / 2,
-                    door_and_window.parapet_wall_height + door_and_window.height,
-                    door_and_window.frame_thickness
-                ],
-            ).apply_matrix(transformation_matrix),
-
-            inside_head_jamb_wall=Quadrilateral(
-                [
-                    -door_and_window.width / 2,
-                    door_and_window.parapet_wall_height + door_and_window.height,
-                    door_and_window.frame_thickness
-                ],
-                [
-                    -door_and_window.width / 2,
-                    door_and_window.parapet_wall_height +
-                    door_and_window.height,
-                    door_and_window.inside_depth + door_and_window.frame_thickness
-                ],
-                [
-                    door_and_window.width / 2,
-                    door_and_window.parapet_wall_height + door_and_window.height,
-                    door_and_window.inside_depth + door_and_window.frame_thickness
-                ],
-                [
-                    door_and_window.width / 2,
-                    door_and_window.parapet_wall_height + door_and_window.height,
-                    door_and_window.frame_thickness
-                ],
-            ).apply_matrix(transformation_matrix),
-
-            inside_stool=Quadrilateral(
-                [
-                    -door_and_window.width / 2,
-                    door_and_window.parapet_wall_height,
-                    door_and_window.frame_thickness
-                ],
-                [
-                    -door_and_window.width / 2,
-                    door_and_window.parapet_wall_height,
-                    door_and_window.inside_depth + door_and_window.frame_thickness
-                ],
-                [
-                    door_and_window.width / 2,
-                    door_and_window.parapet_wall_height,
-                    door_and_window.inside_depth + door_and_window.frame_thickness
-                ],
-                [
-                    door_and_window.width / 2,
-                    door_and_window.parapet_wall_height,
-                    door_and_window.frame_thickness
-                ]
-            ).apply_matrix(transformation_matrix),
-
-            awning=awning_rectangle
+                )
+                for obstacle in door_and_window.facade.obstacles
+            )
+        return DoorAndWindowObstacles(obstacles, transformation_matrix, corners[0])
+
+    def _create_get_inside_corners(
+        self,
+        door_and_window: DoorAndWindow,
+        transformation_matrix: np.ndarray
+    ) -> Callable[[], np.ndarray]:
+        # The inside parts are not required for the sunny glazing area calculation,
+        # so these are calculated only on demand from the current dimensions.
+        inside_dimensions = (
+            door_and_window.width,
+            door_and_window.height,
+            door_and_window.parapet_wall_height,
+            door_and_window.frame_thickness,
+            door_and_window.inside_depth
         )
+
+        def get_inside_corners() -> np.ndarray:
+            return np.matmul(
+                self._to_homogeneous(self._get_inside_corners(*inside_dimensions)),
+                transformation_matrix.T
+            )
+
+        return get_inside_corners
+
+    @classmethod
+    def _to_homogeneous(cls, corners: List[List[List[float]]]) -> np.ndarray:
+        corners = np.array(corners, dtype=float)
+        return np.concatenate((corners, np.ones(corners.shape[:-1] + (1,))), axis=-1)
+
+    @classmethod
+    def _get_outside_corners(cls, door_and_window: DoorAndWindow) -> List[List[List[float]]]:
+        """
+        Gets the corners of the glazing, the outside left, right and head jamb walls
+        and the outside stool in the coordinate system of the door and window.
+        """
+        return cls._get_glazing_corners(door_and_window) + \
+            cls._get_outside_wall_corners(door_and_window)
+
+    @classmethod
+    def _get_glazing_corners(cls, door_and_window: DoorAndWindow) -> List[List[List[float]]]:
+        """ Gets the corners of the glazing in the coordinate system of the door and window. """
+        left = -door_and_window.width / 2
+        right = door_and_window.width / 2
+        bottom = door_and_window.parapet_wall_height
+        top = door_and_window.parapet_wall_height + door_and_window.height
+        frame_face_thickness = door_and_window.frame_face_thickness
+
+        return [
+            [
+                [left + frame_face_thickness, bottom + frame_face_thickness, 0.0],
+                [right - frame_face_thickness, bottom + frame_face_thickness, 0.0],
+                [right - frame_face_thickness, top - frame_face_thickness, 0.0],
+                [left + frame_face_thickness, top - frame_face_thickness, 0.0]
+            ]
+        ]
+
+    @classmethod
+    def _get_outside_wall_corners(
+        cls,
+        door_and_window: DoorAndWindow
+    ) -> List[List[List[float]]]:
+        """
+        Gets the corners of the outside left, right and head jamb walls
+        and the outside stool in the coordinate system of the door and window.
+        """
+        left = -door_and_window.width / 2
+        right = door_and_window.width / 2
+        bottom = door_and_window.parapet_wall_height
+        top = door_and_window.parapet_wall_height + door_and_window.height
+        outside = -door_and_window.outside_depth
+
+        return [
+            # outside left jamb wall
+            [
+                [left, bottom, 0.0],
+                [left, bottom, outside],
+                [left, top, outside],
+                [left, top, 0.0]
+            ],
+            # outside right jamb wall
+            [
+                [right, bottom, 0.0],
+                [right, bottom, outside],
+                [right, top, outside],
+                [right, top, 0.0]
+            ],
+            # outside head jamb wall
+            [
+                [left, top, 0.0],
+                [left, top, outside],
+                [right, top, outside],
+                [right, top, 0.0]
+            ],
+            # outside stool
+            [
+                [left, bottom, 0.0],
+                [left, bottom, outside],
+                [right, bottom, outside],
+                [right, bottom, 0.0]
+            ]
+        ]
+
+    # pylint: disable=too-many-arguments
+    @classmethod
+    def _get_inside_corners(
+        cls,
+        width: float,
+        height: float,
+        parapet_wall_height: float,
+        frame_thickness: float,
+        inside_depth: float
+    ) -> List[List[List[float]]]:
+        """
+        Gets the corners of the inside left, right and head jamb walls
+        and the inside stool in the coordinate system of the door and window.
+        """
+        left = -width / 2
+        right = width / 2
+        bottom = parapet_wall_height
+        top = parapet_wall_height + height
+        frame = frame_thickness
+        inside = inside_depth + frame_thickness
+
+        return [
+            # inside left jamb wall
+            [
+                [left, bottom, frame],
+                [left, bottom, inside],
+                [left, top, inside],
+                [left, top, frame]
+            ],
+            # inside right jamb wall
+            [
+                [right, bottom, frame],
+                [right, bottom, inside],
+                [right, top, inside],
+                [right, top, frame]
+            ],
+            # inside head jamb wall
+            [
+                [left, top, frame],
+                [left, top, inside],
+                [right, top, inside],
+                [right, top, frame]
+            ],
+            # inside stool
+            [
+                [left, bottom, frame],
+                [left, bottom, inside],
+                [right, bottom, inside],
+                [right, bottom, frame]
+            ]
+        ]
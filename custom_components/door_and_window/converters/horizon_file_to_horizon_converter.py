@@ -0,0 +1,94 @@
+""" Module for horizon file to horizon converter. """
+import re
+from typing import List
+
+import numpy as np
+
+# The finest resolution of an imported horizon in degrees.
+MIN_HORIZON_RESOLUTION = 0.1
+
+# The header of the horizon table in the horizon output of PVGIS.
+_PVGIS_HEADER = ['A', 'H_hor']
+
+_SEPARATOR = re.compile(r'[,;\s]+')
+
+# pylint: disable=too-few-public-methods
+
+
+class HorizonFileToHorizonConverter():
+    """
+    Responsible for converting the content of a horizon file to the horizon elevations
+    in equal distances around, starting from north (0) clockwise.
+
+    The supported formats are:
+
+    - The horizon output of PVGIS: the rows after the `A H_hor` header, where the azimuth
+      is measured from south (0) to west (90) and to east (-90).
+    - CSV of azimuth and elevation rows, where the azimuth is measured from north clockwise.
+    - The elevations in equal distances starting from north clockwise, one or more in a line,
+      e.g. a PVGIS user horizon file.
+
+    The lines which are not numbers, e.g. headers and notes, are skipped.
+    """
+
+    def convert(self, content: str) -> np.ndarray:
+        """
+        Converts the content of a horizon file to the horizon elevations.
+
+        Args:
+            content:
+                The content of the horizon file.
+
+        Returns:
+            The `float32` array of the horizon elevations in equal distances around,
+            starting from north clockwise.
+
+        Raises:
+            ValueError:
+                If the content is not a horizon.
+        """
+        is_pvgis = False
+        rows: List[List[float]] = []
+        for line in content.splitlines():
+            fields = [field for field in _SEPARATOR.split(line) if field]
+            if not fields:
+                continue
+            try:
+                rows.append([float(field) for field in fields])
+            except ValueError:
+                if fields[:2] == _PVGIS_HEADER:
+                    is_pvgis = True
+                    rows = []
+                elif is_pvgis and rows:
+                    # the notes after the horizon table
+                    break
+
+        if is_pvgis or (len(rows) > 1 and all(len(row) == 2 for row in rows)):
+            points = np.array([row[:2] for row in rows], dtype=float).reshape((-1, 2))
+            azimuths = points[:, 0] + 180 if is_pvgis else points[:, 0]
+            horizon = self._resample(azimuths, points[:, 1])
+        else:
+            horizon = np.array([value for row in rows for value in row], dtype=float)
+
+        if len(horizon) < 2 or len(horizon) > round(360 / MIN_HORIZON_RESOLUTION):
+            raise ValueError(
+                f"The horizon must have 2 to {round(360 / MIN_HORIZON_RESOLUTION)} elevations.")
+        if not np.all(np.isfinite(horizon)) or np.any(np.abs(horizon) > 90):
+            raise ValueError("The horizon elevations must be between -90 and 90 degrees.")
+
+        return horizon.astype(np.float32)
+
+    @classmethod
+    def _resample(cls, azimuths: np.ndarray, elevations: np.ndarray) -> np.ndarray:
+        # The horizon is resampled to equal distances by the finest distance
+        # between the measurements. The measurements at the same azimuth
+        # (e.g. -180 and 180) are taken once.
+        azimuths = np.round(azimuths % 360, 6)
+        (azimuths, indices) = np.unique(azimuths, return_index=True)
+        elevations = elevations[indices]
+        if len(azimuths) < 2:
+            return elevations
+
+        distances = np.diff(np.append(azimuths, azimuths[0] + 360))
+        count = round(360 / max(distances.min(), MIN_HORIZON_RESOLUTION))
+        return np.interp(np.arange(count) * (360 / count), azimuths, elevations, period=360)
@@ -0,0 +1,113 @@
+""" The module for dropping the shadow casters which cannot shade the glazing. """
+from typing import List, NamedTuple, Sequence, Union
+
+from ..converters.convex_polygon_clipping import Point, to_counter_clockwise
+
+
+class ShadowCasterCullingStatistics(NamedTuple):
+    """
+    The statistics of the shadow caster culling.
+
+    Attributes:
+        fully_sunny:
+            The number of calculations where no shadow caster overlaps the glazing.
+        fully_shaded:
+            The number of calculations where a shadow caster covers the whole glazing.
+        clipped:
+            The number of calculations which required polygon operations.
+        culled:
+            The number of shadow casters dropped without any polygon operation.
+    """
+    fully_sunny: int
+    fully_shaded: int
+    clipped: int
+    culled: int
+
+
+_statistics = {field: 0 for field in ShadowCasterCullingStatistics._fields}
+
+
+def cull_shadow_casters(
+    glazing: Sequence[Point],
+    shadow_casters: Sequence[Sequence[Point]]
+) -> Union[List[int], None]:
+    """
+    Gets the shadow casters which may shade the specified glazing.
+
+    A shadow caster is dropped if it has no area or its bounding box does not overlap
+    the bounding box of the glazing. If a shadow caster contains all the vertices
+    of the glazing, the glazing is fully shaded.
+
+    Args:
+        glazing:
+            The vertices of the convex glazing polygon.
+        shadow_casters:
+            The vertices of the convex shadow caster polygons.
+
+    Returns:
+        The indices of the shadow casters which overlap the glazing,
+        an empty list if the glazing is fully sunny
+        or None if the glazing is fully shaded.
+    """
+    glazing_xs = [x for (x, _) in glazing]
+    glazing_ys = [y for (_, y) in glazing]
+    glazing_left = min(glazing_xs)
+    glazing_right = max(glazing_xs)
+    glazing_bottom = min(glazing_ys)
+    glazing_top = max(glazing_ys)
+
+    overlapping: List[int] = []
+    for (index, shadow_caster) in enumerate(shadow_casters):
+        shadow_caster_xs = [x for (x, _) in shadow_caster]
+        shadow_caster_ys = [y for (_, y) in shadow_caster]
+        if min(shadow_caster_xs) >= glazing_right or max(shadow_caster_xs) <= glazing_left \
+                or min(shadow_caster_ys) >= glazing_top or max(shadow_caster_ys) <= glazing_bottom:
+            continue
+
+        shadow_caster = to_counter_clockwise(shadow_caster)
+        if not shadow_caster:
+            # the shadow caster is seen edge-on
+            continue
+
+        if _contains(shadow_caster, glazing):
+            _statistics['fully_shaded'] += 1
+            _statistics['culled'] += len(shadow_casters) - 1
+            return None
+
+        overlapping.append(index)
+
+    _statistics['fully_sunny' if not overlapping else 'clipped'] += 1
+    _statistics['culled'] += len(shadow_casters) - len(overlapping)
+    return overlapping
+
+
+def get_shadow_caster_culling_statistics() -> ShadowCasterCullingStatistics:
+    """
+    Gets the statistics of the shadow caster culling.
+
+    Returns:
+        The number of times each path of `cull_shadow_casters` was taken.
+    """
+    return ShadowCasterCullingStatistics(**_statistics)
+
+
+def reset_shadow_caster_culling_statistics() -> None:
+    """ Resets the statistics of the shadow caster culling. """
+    for field in _statistics:
+        _statistics[field] = 0
+
+
+def _contains(convex_polygon: Sequence[Point], points: Sequence[Point]) -> bool:
+    """
+    Gets whether all the specified points are inside
+    the specified counter-clockwise convex polygon.
+    """
+    (previous_x, previous_y) = convex_polygon[-1]
+    for (x, y) in convex_polygon:  # pylint: disable=invalid-name
+        direction_x = x - previous_x
+        direction_y = y - previous_y
+        for (point_x, point_y) in points:
+            if direction_x * (point_y - previous_y) - direction_y * (point_x - previous_x) < 0:
+                return False
+        (previous_x, previous_y) = (x, y)
+    return True
@@ -1,22 +1,56 @@
 """ The module for coordinator. """
-from homeassistant.core import State
-from homeassistant.helpers.event import async_track_state_change
+import logging
+import math
+from datetime import datetime
+from typing import Any, Callable, List, Tuple, Union
+
+from homeassistant.core import State, callback
+from homeassistant.helpers.event import (async_call_later,
+                                         async_track_state_change)
 from homeassistant.helpers.typing import HomeAssistantType
 
+from .const import (HORIZON_PROFILE_ENTITY_ATTRIBUTE,
+                    HORIZON_PROFILE_ENTITY_COOLDOWN)
 from .models.door_and_window import DoorAndWindow
+from .models.door_and_window_fleet import DoorAndWindowFleet
+from .models.door_and_window_shading_table import DoorAndWindowShadingTable
+from .sun_tracker import SunTracker
+from .utils import get_angular_distance
+
+_LOGGER = logging.getLogger(__name__)
 
 
+# pylint: disable=too-many-instance-attributes
 class Coordinator():
     """
     Responsible for reporting required sensor values to `DoorAndWindow` instance.
+
+    The sun position is received from the `SunTracker` shared by all coordinators,
+    which parses it once for all of them.
+
+    While the sun cannot shine to the door and window (see `DoorAndWindow.is_sun_in_view`),
+    e.g. at night or when the sun is behind the facade, the door and window is updated
+    only once, when the sun leaves its view, and the sun changes are ignored
+    until the sun returns to its view. With a fleet, the fleet does it for all
+    the door and windows in its vectorised pass.
+
+    With a dynamic horizon profile, the horizon profile of the door and window (or of its
+    facade) is read from the `horizon_profile` attribute of an entity. It is parsed only when
+    the attribute changes and at most once in `HORIZON_PROFILE_ENTITY_COOLDOWN` seconds,
+    the changes in between are applied together at the end of the cooldown.
     """
     # pylint: disable=unused-argument
 
+    # pylint: disable=too-many-arguments
     def __init__(
         self,
         hass: HomeAssistantType,
         door_and_window: DoorAndWindow,
-        sun_entity_id: str
+        sun_tracker: SunTracker,
+        fleet: Union[DoorAndWindowFleet, None] = None,
+        *,
+        sun_position_dead_band: float = 0,
+        horizon_profile_entity_id: Union[str, None] = None
     ):
         """
         Initialize a new instance of `Coordinator` class.
@@ -26,38 +60,249 @@ class Coordinator():
                 The Home Assistant instance.
             door_and_window:
                 The door and window to update based on the sensor values.
-            sun_entity_id:
-                The entity id of the sun entity.
+            sun_tracker:
+                The tracker of the sun position.
+            fleet:
+                The fleet which updates all the door and windows together.
+                If it is None, the door and window is updated on its own.
+            sun_position_dead_band:
+                The minimum angle (in degrees) the sun has to move
+                since the previous update to update the door and window again.
+            horizon_profile_entity_id:
+                The entity which provides the dynamic horizon profile
+                or None if the horizon profile of the door and window is static.
         """
         self._door_and_window = door_and_window
         self._hass = hass
+        self._sun_tracker = sun_tracker
+        self._fleet = fleet
+        self._sun_position_dead_band = sun_position_dead_band
+        # The latest sun position the door and window was updated with.
+        self._sun_position: Union[Tuple[float, float], None] = None
+        # The value indicates whether the sun is out of view of the door and window
+        # and its light state has been updated to no sunlight.
+        self._suspended = False
+        # The tracking of the dynamic horizon profile, the latest raw attribute value
+        # and the value indicates whether it is waiting for the end of the cooldown.
+        self._horizon_profile_entity_id: Union[str, None] = None
+        self._track_horizon_profile_entity_dispose: Union[Callable[[], None], None] = None
+        self._horizon_profile_attribute: Any = None
+        self._horizon_profile_pending = False
+        self._cancel_horizon_profile_cooldown: Union[Callable[[], None], None] = None
 
-        # initialize sun tracking
-        self._track_sun_entity_dispose = async_track_state_change(
-            hass,
-            sun_entity_id,
-            self._sun_entity_changed
-        )
+        if fleet:
+            fleet.add(door_and_window, sun_position_dead_band=sun_position_dead_band)
 
-        sun_state = hass.states.get(sun_entity_id)
-        if sun_state:
-            self._sun_entity_changed(sun_entity_id, None, sun_state)
+        # the shading table is built in the background
+        door_and_window.on_shading_table_rebuild_requested(self._shading_table_rebuild_requested)
+
+        self.horizon_profile_entity_id = horizon_profile_entity_id
+
+        # initialize sun tracking
+        self._stop_listening_to_sun = sun_tracker.add_listener(self._sun_position_changed)
+        if sun_tracker.sun_position is not None:
+            self._sun_position_changed(*sun_tracker.sun_position)
 
     @property
     def door_and_window(self):
         """The `DoorAndWindow` instance associated to the controller."""
         return self._door_and_window
 
+    @property
+    def sun_position_dead_band(self) -> float:
+        """
+        Gets or sets the minimum angle (in degrees) the sun has to move since the previous
+        update to update the door and window again. 0 means every move updates it.
+        With a fleet, the fleet applies it to the door and window.
+        """
+        return self._sun_position_dead_band
+
+    @sun_position_dead_band.setter
+    def sun_position_dead_band(self, value: float) -> None:
+        self._sun_position_dead_band = value
+        if self._fleet:
+            self._fleet.add(self._door_and_window, sun_position_dead_band=value)
+
+    @property
+    def horizon_profile_entity_id(self) -> Union[str, None]:
+        """
+        Gets or sets the entity which provides the dynamic horizon profile
+        of the door and window, None if the horizon profile is static.
+        Setting an entity applies its current horizon profile at once.
+        """
+        return self._horizon_profile_entity_id
+
+    @horizon_profile_entity_id.setter
+    def horizon_profile_entity_id(self, value: Union[str, None]) -> None:
+        if value == self._horizon_profile_entity_id:
+            return
+
+        self._stop_tracking_horizon_profile_entity()
+        self._horizon_profile_entity_id = value
+        if value is None:
+            return
+
+        self._track_horizon_profile_entity_dispose = async_track_state_change(
+            self._hass,
+            value,
+            self._horizon_profile_entity_changed
+        )
+
+        horizon_profile_state = self._hass.states.get(value)
+        if horizon_profile_state:
+            self._horizon_profile_attribute = \
+                horizon_profile_state.attributes.get(HORIZON_PROFILE_ENTITY_ATTRIBUTE)
+            self._apply_horizon_profile()
+
+    def _stop_tracking_horizon_profile_entity(self) -> None:
+        if self._track_horizon_profile_entity_dispose:
+            self._track_horizon_profile_entity_dispose()
+            self._track_horizon_profile_entity_dispose = None
+        if self._cancel_horizon_profile_cooldown:
+            self._cancel_horizon_profile_cooldown()
+            self._cancel_horizon_profile_cooldown = None
+        self._horizon_profile_attribute = None
+        self._horizon_profile_pending = False
+
+    # The handlers run in the event loop, like the sun changes, so the horizon profile
+    # is never changed during an update of the door and window or the fleet.
     # pylint: disable=unused-argument
-    def _sun_entity_changed(self, entity_id: str, old_state: State, new_state: State):
-        self._door_and_window.update(
-            float(new_state.attributes['azimuth']),
-            float(new_state.attributes['elevation'])
+    @callback
+    def _horizon_profile_entity_changed(
+        self,
+        entity_id: str,
+        old_state: State,
+        new_state: State
+    ):
+        if new_state is None:
+            return
+
+        # The entity changes also when only its state or other attributes change,
+        # the horizon profile is parsed only when its attribute has changed.
+        horizon_profile_attribute = new_state.attributes.get(HORIZON_PROFILE_ENTITY_ATTRIBUTE)
+        if horizon_profile_attribute == self._horizon_profile_attribute:
+            return
+        self._horizon_profile_attribute = horizon_profile_attribute
+
+        if self._cancel_horizon_profile_cooldown:
+            self._horizon_profile_pending = True
+        else:
+            self._apply_horizon_profile()
+
+    @callback
+    def _horizon_profile_cooldown_finished(self, now: datetime) -> None:
+        self._cancel_horizon_profile_cooldown = None
+        if self._horizon_profile_pending:
+            self._horizon_profile_pending = False
+            self._apply_horizon_profile()
+
+    def _apply_horizon_profile(self) -> None:
+        self._cancel_horizon_profile_cooldown = async_call_later(
+            self._hass,
+            HORIZON_PROFILE_ENTITY_COOLDOWN,
+            self._horizon_profile_cooldown_finished
         )
 
+        horizon_profile = _parse_horizon_profile(self._horizon_profile_attribute)
+        if horizon_profile is None:
+            _LOGGER.warning(
+                "The %s attribute of %s is not a valid horizon profile: %s",
+                HORIZON_PROFILE_ENTITY_ATTRIBUTE,
+                self._horizon_profile_entity_id,
+                self._horizon_profile_attribute
+            )
+            return
+
+        # The door and windows on a facade share the horizon profile of the facade.
+        # The compiled horizon profile is kept if the profile is the same.
+        target = self._door_and_window.facade or self._door_and_window
+        if horizon_profile != target.horizon_profile:
+            target.horizon_profile = horizon_profile
+            if self._sun_position is not None:
+                self.refresh()
+
+    def _sun_position_changed(self, sun_azimuth: float, sun_elevation: float):
+        sun_position = (sun_azimuth, sun_elevation)
+        if self._fleet:
+            # The fleet updates the door and windows of all coordinators at once,
+            # skips the repeated calls for the same sun position and applies
+            # the dead band and the view of each door and window.
+            self._sun_position = sun_position
+            self._fleet.update(*sun_position)
+            return
+
+        if not self._door_and_window.is_sun_in_view(*sun_position):
+            if not self._suspended:
+                # the last update sets the light state to no sunlight
+                self._suspended = True
+                self._sun_position = sun_position
+                self._door_and_window.update(*sun_position)
+            return
+
+        if self._suspended:
+            self._suspended = False
+        elif self._sun_position is not None and get_angular_distance(
+            *self._sun_position,
+            *sun_position
+        ) < self.sun_position_dead_band:
+            return
+        self._sun_position = sun_position
+        self._door_and_window.update(*sun_position)
+
+    def refresh(self) -> None:
+        """
+        Updates the door and window at the current sun position,
+        e.g. after its configuration has changed.
+
+        The door and window is updated on its own, because the fleet skips
+        the repeated updates for the same sun position.
+        """
+        sun_position = self._sun_tracker.sun_position
+        if sun_position is not None:
+            self._door_and_window.update(*sun_position)
+
+    def _shading_table_rebuild_requested(
+        self,
+        build_shading_table: Callable[[], DoorAndWindowShadingTable]
+    ):
+        async def rebuild_shading_table():
+            shading_table = await self._hass.async_add_executor_job(build_shading_table)
+            if shading_table.error > self._door_and_window.shading_table_error_bound:
+                _LOGGER.warning(
+                    "The shading table of %s has %.2f%% error, more than the %.2f%% error bound, "
+                    "the closed form is used instead.",
+                    self._door_and_window.name,
+                    shading_table.error,
+                    self._door_and_window.shading_table_error_bound
+                )
+            self._door_and_window.shading_table = shading_table
+
+        # It is thread-safe, the update requesting the table may run anywhere.
+        self._hass.add_job(rebuild_shading_table())
+
     def dispose(self):
         """
         Removes all change tracking.
         """
+        if self._fleet:
+            self._fleet.remove(self._door_and_window)
+        self._stop_tracking_horizon_profile_entity()
         self._door_and_window.dispose()
-        self._track_sun_entity_dispose()
+        self._stop_listening_to_sun()
+
+
+def _parse_horizon_profile(value: Any) -> Union[List[float], None]:
+    """
+    Parses the horizon profile from an entity attribute, which is a list of the elevations
+    or a string of the comma separated elevations. Returns None if it is invalid.
+    """
+    if isinstance(value, str):
+        value = value.split(',')
+    try:
+        horizon_profile = [float(elevation) for elevation in value]
+    except (TypeError, ValueError):
+        return None
+
+    if len(horizon_profile) < 2 or not all(map(math.isfinite, horizon_profile)):
+        return None
+    return horizon_profile
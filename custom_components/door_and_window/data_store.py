@@ -1,5 +1,10 @@
 """ The Data store module. """
+from homeassistant.helpers.typing import HomeAssistantType
+
 from .coordinator import Coordinator
+from .models.door_and_window_fleet import DoorAndWindowFleet
+from .models.facade import Facade
+from .sun_tracker import SunTracker
 
 
 class DataStore():
@@ -7,11 +12,33 @@ class DataStore():
     Class is responsible for storing data in Home Assistant instance.
     """
 
-    def __init__(self):
+    def __init__(self, hass: HomeAssistantType):
         """
         Initialize a new instance of `DataStore` class.
+
+        Args:
+            hass:
+                The Home Assistant instance.
         """
         self._store: dict[str, Coordinator] = {}
+        self._fleet = DoorAndWindowFleet()
+        self._sun_tracker = SunTracker(hass, "sun.sun")
+        self._facades: dict[str, Facade] = {}
+
+    @property
+    def fleet(self) -> DoorAndWindowFleet:
+        """
+        The fleet which updates the door and windows of all coordinators together.
+        """
+        return self._fleet
+
+    @property
+    def sun_tracker(self) -> SunTracker:
+        """
+        The tracker of the sun position shared by all coordinators. The sun entity
+        is tracked from the first coordinator until the last one is disposed.
+        """
+        return self._sun_tracker
 
     def is_coordinator_registered(self, config_entry_id: str) -> bool:
         """
@@ -74,3 +101,33 @@ class DataStore():
                 The config entry identifier.
         """
         return self._store.pop(config_entry_id, None)
+
+    def get_facade(self, name: str) -> Facade:
+        """
+        Gets the facade with the specified name, it is created on first use.
+
+        Args:
+            name:
+                The name of the facade.
+
+        Returns:
+            The facade shared by the door and windows on it.
+        """
+        facade = self._facades.get(name)
+        if facade is None:
+            facade = self._facades[name] = Facade(name)
+        return facade
+
+    def remove_unused_facades(self) -> None:
+        """
+        Removes the facades which have no door and windows of the coordinators on them.
+        """
+        used_facade_names = {
+            coordinator.door_and_window.facade.name
+            for coordinator in self._store.values()
+            if coordinator.door_and_window.facade is not None
+        }
+        self._facades = {
+            name: facade for (name, facade) in self._facades.items()
+            if name in used_facade_names
+        }
@@ -0,0 +1,152 @@
+""" The module of the storage of the imported horizons. """
+import base64
+import hashlib
+from typing import Any, Dict, Iterable, Union
+
+import numpy as np
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import HomeAssistantType
+
+from .const import CONF_HORIZON_ID, DOMAIN
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.horizons"
+
+# The key of the horizon profile store in `hass.data`.
+_DATA_KEY = f"{DOMAIN}_horizon_profile_store"
+
+# The horizons are stored as little-endian float32 values.
+_DTYPE = np.dtype('<f4')
+
+
+class HorizonProfileStore():
+    """
+    Stores the imported horizons in the Home Assistant storage
+    instead of the config entries.
+
+    The horizons are stored in a compact binary form (base64 encoded `float32` values)
+    identified by the hash of their content, so the same horizon imported
+    for many door and windows is stored once. The storage file is read
+    by the first request, a horizon is decoded when it is requested first.
+    """
+
+    def __init__(self, hass: HomeAssistantType):
+        """
+        Initialize a new instance of `HorizonProfileStore` class.
+
+        Args:
+            hass:
+                The Home Assistant instance.
+        """
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        # The encoded horizons by their id, None until the storage file is read.
+        self._encoded_horizons: Union[Dict[str, str], None] = None
+        self._horizons: Dict[str, np.ndarray] = {}
+
+    async def _async_get_encoded_horizons(self) -> Dict[str, str]:
+        if self._encoded_horizons is None:
+            data: Union[Dict[str, Any], None] = await self._store.async_load()
+            self._encoded_horizons = dict((data or {}).get('horizons', {}))
+        return self._encoded_horizons
+
+    async def async_get_horizon(self, horizon_id: str) -> Union[np.ndarray, None]:
+        """
+        Gets the specified horizon.
+
+        Args:
+            horizon_id:
+                The id of the horizon returned by `async_add_horizon`.
+
+        Returns:
+            The read-only `float32` array of the horizon elevations in equal distances around,
+            starting from north clockwise. None if the horizon is not stored.
+        """
+        horizon = self._horizons.get(horizon_id)
+        if horizon is None:
+            encoded_horizon = (await self._async_get_encoded_horizons()).get(horizon_id)
+            if encoded_horizon is None:
+                return None
+            # The array uses the decoded bytes without copying.
+            horizon = np.frombuffer(base64.b64decode(encoded_horizon), dtype=_DTYPE)
+            self._horizons[horizon_id] = horizon
+        return horizon
+
+    async def async_add_horizon(self, horizon: np.ndarray) -> str:
+        """
+        Stores the specified horizon.
+
+        Args:
+            horizon:
+                The horizon elevations in equal distances around,
+                starting from north clockwise.
+
+        Returns:
+            The id of the stored horizon.
+        """
+        content = np.asarray(horizon, dtype=_DTYPE).tobytes()
+        horizon_id = hashlib.sha1(content).hexdigest()
+
+        encoded_horizons = await self._async_get_encoded_horizons()
+        if horizon_id not in encoded_horizons:
+            encoded_horizons[horizon_id] = base64.b64encode(content).decode('ascii')
+            await self._async_save()
+        return horizon_id
+
+    async def async_remove_unused_horizons(self, used_horizon_ids: Iterable[str]) -> None:
+        """
+        Removes the horizons which are not used anymore.
+
+        Args:
+            used_horizon_ids:
+                The ids of the horizons which are still used.
+        """
+        encoded_horizons = await self._async_get_encoded_horizons()
+        unused_horizon_ids = set(encoded_horizons) - set(used_horizon_ids)
+        if unused_horizon_ids:
+            for horizon_id in unused_horizon_ids:
+                del encoded_horizons[horizon_id]
+                self._horizons.pop(horizon_id, None)
+            await self._async_save()
+
+    async def _async_save(self) -> None:
+        await self._store.async_save({'horizons': self._encoded_horizons})
+
+
+def get_horizon_profile_store(hass: HomeAssistantType) -> HorizonProfileStore:
+    """
+    Gets the horizon profile store of the Home Assistant instance.
+    It is created by the first call, e.g. in the config flow
+    before the integration is set up.
+
+    Args:
+        hass:
+            The Home Assistant instance.
+
+    Returns:
+        The horizon profile store.
+    """
+    horizon_profile_store = hass.data.get(_DATA_KEY)
+    if horizon_profile_store is None:
+        horizon_profile_store = hass.data[_DATA_KEY] = HorizonProfileStore(hass)
+    return horizon_profile_store
+
+
+async def async_remove_unused_horizons(
+    hass: HomeAssistantType,
+    removed_config_entry_id: Union[str, None] = None
+) -> None:
+    """
+    Removes the imported horizons which are not used by the config entries,
+    e.g. after a horizon has been imported again or the config entry is removed.
+
+    Args:
+        hass:
+            The Home Assistant instance.
+        removed_config_entry_id:
+            The id of the config entry being removed, its horizon is not used anymore.
+    """
+    await get_horizon_profile_store(hass).async_remove_unused_horizons(
+        entry.data[CONF_HORIZON_ID]
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.entry_id != removed_config_entry_id and CONF_HORIZON_ID in entry.data
+    )
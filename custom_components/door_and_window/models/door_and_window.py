@@ -1,17 +1,71 @@
 """ The module contains the DoorAndWindow class. """
-
-
-import math
-from typing import Callable, List, Union
-
+# pylint: disable=too-many-lines
+
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Sequence, Set, Tuple, Union
+
+import numpy as np
+
+from ..const import (DEFAULT_SHADING_TABLE_ERROR_BOUND,
+                     DEFAULT_SHADING_TABLE_RESOLUTION, LIGHT_ENGINE_CLOSED_FORM,
+                     LIGHT_ENGINE_CONVEX_CLIPPING, LIGHT_ENGINE_TABLE)
+from ..converters.door_and_window_local_geometry_to_light_information_batch_converter import \
+    DoorAndWindowLocalGeometryToLightInformationBatchConverter
+from ..converters.door_and_window_local_geometry_to_light_information_converter import \
+    DoorAndWindowLocalGeometryToLightInformationConverter
+from ..converters.door_and_window_local_geometry_to_shading_table_converter import \
+    DoorAndWindowLocalGeometryToShadingTableConverter
 from ..converters.door_and_window_rectangles_to_light_information_converter import \
     DoorAndWindowRectanglesToLightInformationConverter
+from ..converters.door_and_window_to_local_geometry_converter import \
+    DoorAndWindowToLocalGeometryConverter
 from ..converters.door_and_window_to_rectangles_converter import \
     DoorAndWindowToRectanglesConverter
-from ..utils import normalize_angle
+from ..utils import normalize_angle, normalize_angles
 from .awning import Awning
+from .door_and_window_light_information_batch import \
+    DoorAndWindowLightInformationBatch
+from .door_and_window_light_state import DoorAndWindowLightState
+from .door_and_window_local_geometry import DoorAndWindowLocalGeometry
+from .door_and_window_output_thresholds import DoorAndWindowOutputThresholds
 from .door_and_window_rectangles import DoorAndWindowRectangles
-from .event_handler import EventHandler
+from .door_and_window_shading_table import DoorAndWindowShadingTable
+from .facade import Facade
+from .horizon_profile import HorizonProfile, normalize_horizon_profile
+from .obstacle import Obstacle
+from .observable_property import (ObservableProperty, defer_events,
+                                  dispose_events, fire_event, listen_to_event)
+
+# The sunny glazing area above which the glazing has direct sunlight.
+_DIRECT_SUNLIGHT_THRESHOLD = 0.01
+
+# The boundaries of the calculated properties, crossing them is always published.
+# A value is on the upper side of a boundary if it is greater than the boundary,
+# like the sunny glazing area of the glazing with direct sunlight.
+_ANGLE_OF_INCIDENCE_BOUNDARIES = (90,)
+_SUNNY_GLAZING_AREA_BOUNDARIES = (_DIRECT_SUNLIGHT_THRESHOLD,)
+# The sunny and the fully sunny glazing, the percentage is rounded to 2 decimals.
+_SUNNY_GLAZING_AREA_PERCENTAGE_BOUNDARIES = (0, 99.99)
+
+
+def _is_published(
+    published: Union[float, None],
+    value: Union[float, None],
+    dead_band: float,
+    boundaries: Tuple[float, ...] = ()
+) -> bool:
+    """
+    Gets whether the specified new value of a calculated property differs enough
+    from the published one to be published.
+    """
+    if published == value:
+        return False
+    if published is None or value is None or dead_band <= 0:
+        return True
+    return abs(value - published) >= dead_band or any(
+        (published > boundary) != (value > boundary) for boundary in boundaries
+    )
+
 
 # pylint: disable=too-many-instance-attributes, too-many-public-methods
 
@@ -29,6 +83,15 @@ class DoorAndWindow():
             The manufacturer of the door and window.
         model:
             The model of the door and window.
+        light_engine:
+            The engine to use for calculating the sunny glazing area.
+        shading_table_resolution:
+            The initial grid resolution (in degrees) of the shading table.
+        shading_table_error_bound:
+            The allowed interpolation error of the shading table
+            in percentage of the glazing area.
+        output_thresholds:
+            The minimum changes of the calculated properties which are published.
     """
     # pylint: disable=too-many-arguments, too-many-locals
 
@@ -48,8 +111,16 @@ class DoorAndWindow():
         parapet_wall_height: float,
         azimuth: float,
         tilt: float,
-        horizon_profile: List[float],
-        awning: Union[Awning, None]
+        horizon_profile: Union[List[float], HorizonProfile],
+        awning: Union[Awning, None],
+        *,
+        light_engine: str = LIGHT_ENGINE_CONVEX_CLIPPING,
+        shading_table_resolution: float = DEFAULT_SHADING_TABLE_RESOLUTION,
+        shading_table_error_bound: float = DEFAULT_SHADING_TABLE_ERROR_BOUND,
+        output_thresholds: DoorAndWindowOutputThresholds = DoorAndWindowOutputThresholds(),
+        obstacles: Sequence[Obstacle] = (),
+        facade: Union[Facade, None] = None,
+        facade_position: float = 0
     ):
         """
         Initialize a new instance of DoorAndWindow class
@@ -89,81 +160,142 @@ class DoorAndWindow():
                 then it should be 90° degree.
                 For roof tilted windows this value should be the roof tilt angle.
             horizon_profile:
-                The elevation values of horizon as seen from the door and window.
+                The elevation values of horizon as seen from the door and window,
+                or the compiled horizon profile, e.g. an imported one.
             awning:
                 The awning of for door and window.
+            light_engine:
+                The engine to use for calculating the sunny glazing area.
+                `LIGHT_ENGINE_CLOSED_FORM` uses
+                `DoorAndWindowLocalGeometryToLightInformationConverter`,
+                `LIGHT_ENGINE_TABLE` interpolates the shading table (and uses
+                the closed form until the table is built), the others
+                are passed to `DoorAndWindowRectanglesToLightInformationConverter.convert`.
+            shading_table_resolution:
+                The initial grid resolution (in degrees) of the shading table.
+            shading_table_error_bound:
+                The allowed interpolation error of the shading table
+                in percentage of the glazing area.
+            output_thresholds:
+                The minimum changes of the calculated properties which are published
+                by an update. By default every change is published.
+            obstacles:
+                The obstacles outside the door and window which may shade the glazing.
+            facade:
+                The facade the door and window is on. Its horizon profile replaces
+                the one of the door and window, its obstacles are added to the obstacles
+                of the door and window.
+            facade_position:
+                The distance of the center of the door and window
+                from the origin of the facade.
         """
         self.type = type
         self.name = name
         self.manufacturer = manufacturer
         self.model = model
+        self.light_engine = light_engine
+        self.shading_table_resolution = shading_table_resolution
+        self.shading_table_error_bound = shading_table_error_bound
+        self.output_thresholds = output_thresholds
+        # The change events are allocated by their first listeners (see `ObservableProperty`).
         self._width = width
-        self._width_changed = EventHandler()
         self._height = height
-        self._height_changed = EventHandler()
         self._frame_face_thickness = frame_face_thickness
-        self._frame_face_thickness_changed = EventHandler()
         self._frame_thickness = frame_thickness
-        self._frame_thickness_changed = EventHandler()
         self._outside_depth = outside_depth
-        self._outside_depth_changed = EventHandler()
         self._inside_depth = inside_depth
-        self._inside_depth_changed = EventHandler()
         self._parapet_wall_height = parapet_wall_height
-        self._parapet_wall_height_changed = EventHandler()
         self._azimuth = azimuth
-        self._azimuth_changed = EventHandler()
         self._tilt = tilt
-        self._tilt_changed = EventHandler()
-        self._horizon_profile = horizon_profile
-        self._horizon_profile_changed = EventHandler()
-        self._awning = awning
-        self._awning_changed = EventHandler()
+        self._horizon_profile = normalize_horizon_profile(horizon_profile)
+        # The horizon profile compiled on demand, it is dropped when the profile changes.
+        self._compiled_horizon_profile: Union[HorizonProfile, None] = None
+        self._awning: Union[Awning, None] = None
+        self._obstacles: Tuple[Obstacle, ...] = tuple(obstacles)
+        self._facade: Union[Facade, None] = None
+        self._facade_position = facade_position
+        self._stop_listening_to_facade: List[Callable[[], None]] = []
         self._horizon_elevation_at_sun_azimuth = None
-        self._horizon_elevation_at_sun_azimuth_changed = EventHandler()
         self._angle_of_incidence = None
-        self._angle_of_incidence_changed = EventHandler()
         self._sunny_glazing_area: Union[float, None] = None
-        self._sunny_glazing_area_changed = EventHandler()
         self._sunny_glazing_area_percentage: Union[float, None] = None
-        self._sunny_glazing_area_percentage_changed = EventHandler()
         self._glazing_has_direct_sunlight: Union[bool, None] = None
-        self._glazing_has_direct_sunlight_changed = EventHandler()
         self._rectangles: DoorAndWindowRectangles = None
-        self._rectangles_spoiled: bool = True
+        # The rectangles seen from the sun are overwritten by every update.
+        self._rectangles_seen_from_sun: Union[DoorAndWindowRectangles, None] = None
+        self._local_geometry: Union[DoorAndWindowLocalGeometry, None] = None
+        self._shading_table: Union[DoorAndWindowShadingTable, None] = None
+        self._shading_table_requested_for: Union[DoorAndWindowLocalGeometry, None] = None
+        # The names of the parameters changed since the rectangles
+        # and the local geometry were calculated.
+        self._rectangles_changes: Set[str] = set()
+        self._local_geometry_changes: Set[str] = set()
+        self._geometry_version = 0
+        # The inputs of the latest update, it is repeated only if any of them changes.
+        self._update_inputs: Union[Tuple, None] = None
+        self._skipped_update_count = 0
+        # The awning setter listens to the depth changes of the awning,
+        # the facade setter listens to the changes of the facade.
+        self.awning = awning
+        self.facade = facade
+
+    def _invalidate_geometry(self, parameter: str) -> None:
+        # The cached geometry is recalculated on demand
+        # only where it depends on the changed parameter.
+        self._rectangles_changes.add(parameter)
+        self._local_geometry_changes.add(parameter)
+        self._geometry_version += 1
+
+    def _invalidate_horizon_profile(self, parameter: str) -> None:
+        # pylint: disable=unused-argument
+        self._compiled_horizon_profile = None
+        self._geometry_version += 1
 
     @property
-    def horizon_profile(self) -> List[float]:
+    def geometry_version(self) -> int:
         """
-        The elevation of horizon as seen from the door and window.
-        The values are the measured horizon elevation from left to
-        right in equal distances. There are at least two measurement for the most left
-        and the most right place.
+        The number which changes whenever the dimensions, the facing, the awning,
+        the obstacles, the facade or the horizon profile of the door and window change.
         """
-        return self._horizon_profile
-
-    @horizon_profile.setter
-    def horizon_profile(self, value: List[float]) -> None:
-        if value != self._horizon_profile:
-            self._horizon_profile = value or [0, 0]
-            self._horizon_profile_changed.fire(value)
+        return self._geometry_version
 
-    def on_horizon_profile_changed(
-        self,
-        callback: Callable[[List[float]], None]
-    ) -> Callable[[], None]:
+    @property
+    def skipped_update_count(self) -> int:
         """
-        Calls the specified function whenever the horizon_profile property has changed.
-
-        Args:
-            callback:
-                The function to call when horizon_profile property has changed.
+        The number of updates which returned immediately, because their inputs
+        were the same as the ones of the previous update.
+        """
+        return self._skipped_update_count
 
-        Returns:
-            A function to stop calling the callback function
-            when horizon_profile property has changed.
+    horizon_profile = ObservableProperty(
         """
-        return self._horizon_profile_changed.listen(callback)
+        The elevation of horizon as seen from the door and window.
+        The values are the measured horizon elevation from left to
+        right in equal distances. There are at least two measurement for the most left
+        and the most right place. It is either the list of the values
+        or the compiled `HorizonProfile`, e.g. an imported one.
+        """,
+        _invalidate_horizon_profile,
+        normalize=normalize_horizon_profile
+    )
+    on_horizon_profile_changed = horizon_profile.listener_method()
+
+    @property
+    def compiled_horizon_profile(self) -> HorizonProfile:
+        """
+        The horizon profile compiled for the horizon elevation lookups.
+        It is compiled on demand after the horizon profile has changed,
+        a `HorizonProfile` set to `horizon_profile` is used as it is.
+        The door and windows on a facade share the one of the facade.
+        """
+        if self._facade is not None:
+            return self._facade.compiled_horizon_profile
+        if self._compiled_horizon_profile is None:
+            horizon_profile = self.horizon_profile
+            self._compiled_horizon_profile = horizon_profile \
+                if isinstance(horizon_profile, HorizonProfile) \
+                else HorizonProfile(horizon_profile)
+        return self._compiled_horizon_profile
 
     @property
     def awning(self) -> Union[Awning, None]:
@@ -181,19 +313,20 @@ class DoorAndWindow():
                 self._awning.dispose()
 
             self._awning = value
-            self._awning_changed.fire(value)
+            fire_event(self, 'awning', value)
 
             if self._awning:
                 # pylint: disable=unused-argument
                 def on_awning_depth_change(depth: float):
-                    self._rectangles_spoiled = True
+                    self._invalidate_geometry('awning')
 
                 self._awning.on_current_depth_changed(on_awning_depth_change)
-            self._rectangles_spoiled = True
+            self._invalidate_geometry('awning')
 
     def on_awning_changed(
         self,
-        callback: Callable[[List[float]], None]
+        callback: Callable[[Union[Awning, None]], None],
+        weak: bool = False
     ) -> Callable[[], None]:
         """
         Calls the specified function whenever the awning property has changed.
@@ -201,523 +334,668 @@ class DoorAndWindow():
         Args:
             callback:
                 The function to call when awning property has changed.
+            weak:
+                The value indicates whether only a weak reference is kept to the callback.
 
         Returns:
             A function to stop calling the callback function
             when awning property has changed.
         """
-        return self._awning_changed.listen(callback)
+        return listen_to_event(self, 'awning', callback, weak)
 
     @property
-    def width(self) -> float:
-        """ The width of door and window. """
-        return self._width
-
-    @width.setter
-    def width(self, value: float) -> None:
-        if value != self._width:
-            self._width = value
-            self._width_changed.fire(value)
-            self._rectangles_spoiled = True
-
-    def on_width_changed(
-        self,
-        callback: Callable[[float], None]
-    ) -> Callable[[], None]:
-        """
-        Calls the specified function whenever the width property has changed.
-
-        Args:
-            callback:
-                The function to call when width property has changed.
-
-        Returns:
-            A function to stop calling the callback function when width property has changed.
+    def facade(self) -> Union[Facade, None]:
         """
-        return self._width_changed.listen(callback)
-
-    @property
-    def height(self) -> float:
-        """ The height of door and window. """
-        return self._height
-
-    @height.setter
-    def height(self, value: float) -> None:
-        if value != self._height:
-            self._height = value
-            self._height_changed.fire(value)
-            self._rectangles_spoiled = True
-
-    def on_height_changed(
-        self,
-        callback: Callable[[float], None]
-    ) -> Callable[[], None]:
+        Gets or sets the facade the door and window is on, None if it is on its own.
+        The horizon profile of the facade replaces the one of the door and window,
+        the obstacles of the facade are added to the obstacles of the door and window.
         """
-        Calls the specified function whenever the height property has changed.
+        return self._facade
 
-        Args:
-            callback:
-                The function to call when height property has changed.
+    @facade.setter
+    def facade(self, value: Union[Facade, None]) -> None:
+        if value is self._facade:
+            return
 
-        Returns:
-            A function to stop calling the callback function when height property has changed.
-        """
-        return self._height_changed.listen(callback)
+        for stop_listening in self._stop_listening_to_facade:
+            stop_listening()
+        self._stop_listening_to_facade = []
 
-    @property
-    def frame_face_thickness(self) -> float:
-        """ The thickness of door and window frame face. """
-        return self._frame_face_thickness
-
-    @frame_face_thickness.setter
-    def frame_face_thickness(self, value: float) -> None:
-        if value != self._frame_face_thickness:
-            self._frame_face_thickness = value
-            self._frame_face_thickness_changed.fire(value)
-            self._rectangles_spoiled = True
-
-    def on_frame_face_thickness_changed(
-        self,
-        callback: Callable[[float], None]
-    ) -> Callable[[], None]:
-        """
-        Calls the specified function whenever the frame_face_thickness property has changed.
+        self._facade = value
+        fire_event(self, 'facade', value)
 
-        Args:
-            callback:
-                The function to call when frame_face_thickness property has changed.
+        if value is not None:
+            # pylint: disable=unused-argument
+            def on_facade_obstacles_changed(obstacles: Tuple[Obstacle, ...]):
+                self._invalidate_geometry('facade')
 
-        Returns:
-            A function to stop calling the callback function when
-            frame_face_thickness property has changed.
-        """
-        return self._frame_face_thickness_changed.listen(callback)
+            self._stop_listening_to_facade = [
+                value.on_horizon_profile_changed(self._invalidate_horizon_profile),
+                value.on_obstacles_changed(on_facade_obstacles_changed)
+            ]
+        self._invalidate_horizon_profile('facade')
+        self._invalidate_geometry('facade')
 
-    @property
-    def frame_thickness(self) -> float:
-        """ The thickness of door and window frame. """
-        return self._frame_thickness
-
-    @frame_thickness.setter
-    def frame_thickness(self, value: float) -> None:
-        if value != self._frame_thickness:
-            self._frame_thickness = value
-            self._frame_thickness_changed.fire(value)
-            self._rectangles_spoiled = True
-
-    def on_frame_thickness_changed(
+    def on_facade_changed(
         self,
-        callback: Callable[[float], None]
+        callback: Callable[[Union[Facade, None]], None],
+        weak: bool = False
     ) -> Callable[[], None]:
         """
-        Calls the specified function whenever the frame_thickness property has changed.
+        Calls the specified function whenever the facade property has changed.
 
         Args:
             callback:
-                The function to call when frame_thickness property has changed.
+                The function to call when facade property has changed.
+            weak:
+                The value indicates whether only a weak reference is kept to the callback.
 
         Returns:
             A function to stop calling the callback function
-            when frame_thickness property has changed.
+            when facade property has changed.
         """
-        return self._frame_thickness_changed.listen(callback)
+        return listen_to_event(self, 'facade', callback, weak)
 
-    @property
-    def outside_depth(self) -> float:
-        """
-        The distance between the outside wall face and
-        the outside door and window frame face.
+    facade_position = ObservableProperty(
         """
-        return self._outside_depth
+        The distance of the center of the door and window from the origin of the facade,
+        positive to right as seen from outside. The obstacles of the facade are moved
+        to the door and window by it.
+        """,
+        _invalidate_geometry
+    )
+    on_facade_position_changed = facade_position.listener_method()
 
-    @outside_depth.setter
-    def outside_depth(self, value: float) -> None:
-        if value != self._outside_depth:
-            self._outside_depth = value
-            self._outside_depth_changed.fire(value)
-            self._rectangles_spoiled = True
+    @property
+    def has_obstacles(self) -> bool:
+        """ The value indicates whether the door and window or its facade has obstacles. """
+        return bool(self._obstacles) or (self._facade is not None and bool(self._facade.obstacles))
 
-    def on_outside_depth_changed(
-        self,
-        callback: Callable[[float], None]
-    ) -> Callable[[], None]:
-        """
-        Calls the specified function whenever the outside_depth property has changed.
+    width = ObservableProperty(""" The width of door and window. """, _invalidate_geometry)
+    on_width_changed = width.listener_method()
 
-        Args:
-            callback:
-                The function to call when outside_depth property has changed.
+    height = ObservableProperty(""" The height of door and window. """, _invalidate_geometry)
+    on_height_changed = height.listener_method()
 
-        Returns:
-            A function to stop calling the callback function when
-            outside_depth property has changed.
-        """
-        return self._outside_depth_changed.listen(callback)
+    frame_face_thickness = ObservableProperty(
+        """ The thickness of door and window frame face. """,
+        _invalidate_geometry
+    )
+    on_frame_face_thickness_changed = frame_face_thickness.listener_method()
 
-    @property
-    def inside_depth(self) -> float:
-        """
-        The distance between the inside wall face and
-        the inside door and window frame face.
-        """
-        return self._inside_depth
+    frame_thickness = ObservableProperty(
+        """ The thickness of door and window frame. """,
+        _invalidate_geometry
+    )
+    on_frame_thickness_changed = frame_thickness.listener_method()
 
-    @inside_depth.setter
-    def inside_depth(self, value: float) -> None:
-        if value != self._inside_depth:
-            self._inside_depth = value
-            self._inside_depth_changed.fire(value)
-            self._rectangles_spoiled = True
-
-    def on_inside_depth_changed(
-        self,
-        callback: Callable[[float], None]
-    ) -> Callable[[], None]:
+    outside_depth = ObservableProperty(
         """
-        Calls the specified function whenever the inside_depth property has changed.
-
-        Args:
-            callback:
-                The function to call when inside_depth property has changed.
+        The distance between the outside wall face and
+        the outside door and window frame face.
+        """,
+        _invalidate_geometry
+    )
+    on_outside_depth_changed = outside_depth.listener_method()
 
-        Returns:
-            A function to stop calling the callback function when inside_depth property has changed.
+    inside_depth = ObservableProperty(
         """
-        return self._inside_depth_changed.listen(callback)
+        The distance between the inside wall face and
+        the inside door and window frame face.
+        """,
+        _invalidate_geometry
+    )
+    on_inside_depth_changed = inside_depth.listener_method()
 
-    @property
-    def parapet_wall_height(self) -> float:
+    parapet_wall_height = ObservableProperty(
         """
         The height of the parapet wall. This is the distance between the floor and
         the bottom of a window. For doors it should be 0.
-        """
-        return self._parapet_wall_height
-
-    @parapet_wall_height.setter
-    def parapet_wall_height(self, value: float) -> None:
-        if value != self._parapet_wall_height:
-            self._parapet_wall_height = value
-            self._parapet_wall_height_changed.fire(value)
-            self._rectangles_spoiled = True
+        """,
+        _invalidate_geometry
+    )
+    on_parapet_wall_height_changed = parapet_wall_height.listener_method()
 
-    def on_parapet_wall_height_changed(
-        self,
-        callback: Callable[[float], None]
-    ) -> Callable[[], None]:
-        """
-        Calls the specified function whenever the parapet_wall_height property has changed.
-
-        Args:
-            callback:
-                The function to call when parapet_wall_height property has changed.
-
-        Returns:
-            A function to stop calling the callback function
-            when parapet_wall_height property has changed.
-        """
-        return self._parapet_wall_height_changed.listen(callback)
-
-    @property
-    def azimuth(self) -> float:
+    azimuth = ObservableProperty(
         """
         The azimuth of the door and window outside face.
         For north heading door and window it is 0° for east heading
         this value is 90°, and so on.
-        """
-        return self._azimuth
-
-    @azimuth.setter
-    def azimuth(self, value: float) -> None:
-        if value != self._azimuth:
-            self._azimuth = value
-            self._azimuth_changed.fire(value)
-            self._rectangles_spoiled = True
+        """,
+        _invalidate_geometry
+    )
+    on_azimuth_changed = azimuth.listener_method()
 
-    def on_azimuth_changed(
-        self,
-        callback: Callable[[float], None]
-    ) -> Callable[[], None]:
+    tilt = ObservableProperty(
         """
-        Calls the specified function whenever the azimuth property has changed.
+        The tilt of the door and window. If the window is perpendicular to the floor
+        then it should be 90° degree.
+        For roof tilted windows this value should be the roof tilt angle.
+        """,
+        _invalidate_geometry
+    )
+    on_tilt_changed = tilt.listener_method()
 
-        Args:
-            callback:
-                The function to call when azimuth property has changed.
+    obstacles = ObservableProperty(
+        """
+        The obstacles outside the door and window which may shade the glazing,
+        e.g. the neighbouring buildings. Only the rectangles engines calculate with them,
+        so the closed form and the shading table are replaced by
+        `LIGHT_ENGINE_CONVEX_CLIPPING` while there are obstacles.
+        """,
+        _invalidate_geometry,
+        normalize=lambda value: tuple(value or ())
+    )
+    on_obstacles_changed = obstacles.listener_method()
 
-        Returns:
-            A function to stop calling the callback function when azimuth property has changed.
+    horizon_elevation_at_sun_azimuth = ObservableProperty(
         """
-        return self._azimuth_changed.listen(callback)
+        The horizon elevation towards the sun.
+
+        If the sun is behind the door and window the value is None.
+        """,
+        read_only=True
+    )
+    on_horizon_elevation_at_sun_azimuth_changed = \
+        horizon_elevation_at_sun_azimuth.listener_method()
+
+    angle_of_incidence = ObservableProperty(""" The angle of incidence. """, read_only=True)
+    on_angle_of_incidence_changed = angle_of_incidence.listener_method()
+
+    sunny_glazing_area = ObservableProperty(""" The sunny glazing area. """, read_only=True)
+    on_sunny_glazing_area_changed = sunny_glazing_area.listener_method()
+
+    sunny_glazing_area_percentage = ObservableProperty(
+        """ The sunny glazing area percentage. """,
+        read_only=True
+    )
+    on_sunny_glazing_area_percentage_changed = sunny_glazing_area_percentage.listener_method()
+
+    glazing_has_direct_sunlight = ObservableProperty(
+        """ The value indicates whether the glazing has direct sunlight. """,
+        read_only=True
+    )
+    on_glazing_has_direct_sunlight_changed = glazing_has_direct_sunlight.listener_method()
 
     @property
-    def tilt(self) -> float:
+    def light_state(self) -> DoorAndWindowLightState:
         """
-        The tilt of the door and window. If the window is perpendicular to the floor
-        then it should be 90° degree.
-        For roof tilted windows this value should be the roof tilt angle.
+        The immutable snapshot of the properties calculated by the latest update.
+        Its `changed` attribute is empty.
         """
-        return self._tilt
-
-    @tilt.setter
-    def tilt(self, value: float) -> None:
-        if value != self._tilt:
-            self._tilt = value
-            self._tilt_changed.fire(value)
-            self._rectangles_spoiled = True
+        return DoorAndWindowLightState(
+            self._horizon_elevation_at_sun_azimuth,
+            self._angle_of_incidence,
+            self._sunny_glazing_area,
+            self._sunny_glazing_area_percentage,
+            self._glazing_has_direct_sunlight,
+            frozenset()
+        )
 
-    def on_tilt_changed(
+    def on_update_completed(
         self,
-        callback: Callable[[float], None]
+        callback: Callable[[DoorAndWindowLightState], None],
+        weak: bool = False
     ) -> Callable[[], None]:
         """
-        Calls the specified function whenever the tilt property has changed.
+        Calls the specified function once after every update
+        which changed any of the calculated properties.
+
+        The individual change events of the properties are fired before.
 
         Args:
             callback:
-                The function to call when tilt property has changed.
+                The function to call with the snapshot of the light state
+                which lists the changed properties.
+            weak:
+                The value indicates whether only a weak reference is kept to the callback,
+                so a listening entity can be garbage collected without stopping listening.
 
         Returns:
-            A function to stop calling the callback function when tilt property has changed.
+            A function to stop calling the callback function after updates.
         """
-        return self._tilt_changed.listen(callback)
+        return listen_to_event(self, 'update_completed', callback, weak)
 
-    @property
-    def horizon_elevation_at_sun_azimuth(self) -> Union[float, None]:
+    @contextmanager
+    def batch_update(self) -> Iterator[None]:
         """
-        The horizon elevation towards the sun.
+        Applies the property changes made in the context at once.
 
-        If the sun is behind the door and window the value is None.
+        The change event of each changed property is fired only once when the context exits,
+        with the latest value of the property. The geometry is recalculated only once,
+        by the next `update`.
+
+        Example:
+            with door_and_window.batch_update():
+                door_and_window.width = 1200
+                door_and_window.height = 1500
         """
-        return self._horizon_elevation_at_sun_azimuth
+        with defer_events(self):
+            yield
 
-    def on_horizon_elevation_at_sun_azimuth_changed(
-        self,
-        callback: Callable[[float], None]
-    ) -> Callable[[], None]:
+    def is_sun_in_view(self, sun_azimuth: float, sun_elevation: float) -> bool:
         """
-        Calls the specified function whenever the horizon_elevation_at_sun_azimuth
-        property has changed.
+        Gets whether the sun may shine to the door and window from the specified position.
+
+        It is a cheap test without the horizon interpolation and the shading calculation:
+        False means that `update` would find no sunny glazing area for sure,
+        because the sun is behind the door and window, or the sun is in front of it
+        but lower than the lowest horizon profile value.
 
         Args:
-            callback:
-                The function to call when horizon_elevation_at_sun_azimuth property has changed.
+            sun_azimuth:
+                The azimuth of the sun.
+            sun_elevation:
+                The elevation of the sun.
 
         Returns:
-            A function to stop calling the callback function when
-            horizon_elevation_at_sun_azimuth property has changed.
+            False if the door and window cannot receive direct sunlight, True otherwise.
         """
-        return self._horizon_elevation_at_sun_azimuth_changed.listen(callback)
+        if DoorAndWindowLocalGeometryToLightInformationConverter.get_angle_of_incidence(
+            self.local_geometry,
+            sun_azimuth,
+            sun_elevation
+        ) >= 90:
+            return False
 
-    @property
-    def angle_of_incidence(self) -> Union[float, None]:
-        """
-        The angle of incidence.
-        """
-        return self._angle_of_incidence
+        # The horizon profile is applied only to the sun in front of the door and window.
+        return abs(normalize_angle(sun_azimuth - self.azimuth)) > 90 \
+            or sun_elevation >= self.compiled_horizon_profile.min_elevation
 
-    def on_angle_of_incidence_changed(
-        self,
-        callback: Callable[[float], None]
-    ) -> Callable[[], None]:
+    def update(self, sun_azimuth: float, sun_elevation: float):
         """
-        Calls the specified function whenever the angle_of_incidence
-        property has changed.
+        Updates the instance based on the sun position.
 
-        Args:
-            callback:
-                The function to call when angle_of_incidence property has changed.
+        It returns immediately if the sun position, the geometry version, the light engine
+        and the output thresholds are the same as at the previous update,
+        e.g. when only another attribute of the sun entity has changed.
 
-        Returns:
-            A function to stop calling the callback function when
-            angle_of_incidence property has changed.
+        Args:
+            sun_azimuth:
+                The azimuth of the sun.
+            sun_elevation:
+                The elevation of the sun.
         """
-        return self._angle_of_incidence_changed.listen(callback)
+        update_inputs = (
+            sun_azimuth % 360,
+            sun_elevation,
+            self._geometry_version,
+            self.light_engine,
+            self.output_thresholds
+        )
+        if update_inputs == self._update_inputs:
+            self._skipped_update_count += 1
+            return
 
-    @property
-    def sunny_glazing_area(self) -> Union[float, None]:
-        """
-        The sunny glazing area.
-        """
-        return self._sunny_glazing_area
+        # recalculate horizon elevation at sun azimuth,
+        # it is None if the sun is behind the door and window
+        horizon_elevation_at_sun_azimuth = self._get_horizon_elevation_at_sun_azimuth(sun_azimuth)
+
+        light_engine = self.light_engine
+        if self.has_obstacles and light_engine in (LIGHT_ENGINE_CLOSED_FORM, LIGHT_ENGINE_TABLE):
+            # the local geometry does not contain the obstacles
+            light_engine = LIGHT_ENGINE_CONVEX_CLIPPING
+
+        light_state = self._get_light_state_from_shading_table(
+            horizon_elevation_at_sun_azimuth,
+            sun_azimuth,
+            sun_elevation
+        ) if light_engine == LIGHT_ENGINE_TABLE else None
+
+        if light_state is None:
+            if light_engine in (LIGHT_ENGINE_CLOSED_FORM, LIGHT_ENGINE_TABLE):
+                light_information = \
+                    DoorAndWindowLocalGeometryToLightInformationConverter().convert(
+                        self.local_geometry,
+                        horizon_elevation_at_sun_azimuth,
+                        sun_azimuth,
+                        sun_elevation
+                    )
+            else:
+                light_information = DoorAndWindowRectanglesToLightInformationConverter().convert(
+                    self._get_rectangles(),
+                    horizon_elevation_at_sun_azimuth,
+                    self.azimuth,
+                    self.tilt,
+                    sun_azimuth,
+                    sun_elevation,
+                    engine=light_engine,
+                    out=self._get_rectangles_seen_from_sun()
+                )
+            light_state = (light_information.angle_of_incidence,
+                           light_information.sunny_glazing_area)
+
+        self.set_light_information(horizon_elevation_at_sun_azimuth, *light_state)
+        self._update_inputs = update_inputs
+
+    def _get_horizon_elevation_at_sun_azimuth(self, sun_azimuth: float) -> Union[float, None]:
+        azimuth = normalize_angle(sun_azimuth - self.azimuth)
+        if self._facade is not None:
+            # calculated once for all the door and windows on the facade
+            return self._facade.get_horizon_elevation_at(azimuth)
 
-    def on_sunny_glazing_area_changed(
+        horizon_elevation_at_sun_azimuth = self.compiled_horizon_profile.elevation_at(azimuth)
+        if horizon_elevation_at_sun_azimuth is not None:
+            horizon_elevation_at_sun_azimuth = round(horizon_elevation_at_sun_azimuth, 2)
+        return horizon_elevation_at_sun_azimuth
+
+    def set_light_information(
         self,
-        callback: Callable[[float], None]
-    ) -> Callable[[], None]:
+        horizon_elevation_at_sun_azimuth: Union[float, None],
+        angle_of_incidence: float,
+        sunny_glazing_area: float
+    ) -> None:
         """
-        Calls the specified function whenever the sunny_glazing_area
-        property has changed.
+        Sets the light state of the door and window calculated for a sun position
+        and sends the change events of the changed properties.
+        The changes smaller than `output_thresholds` are not published.
 
-        Args:
-            callback:
-                The function to call when sunny_glazing_area property has changed.
+        It is called by `update`, or by the one which calculates the light state
+        of many door and windows at once (see `DoorAndWindowFleet`).
 
-        Returns:
-            A function to stop calling the callback function when
-            sunny_glazing_area property has changed.
+        Args:
+            horizon_elevation_at_sun_azimuth:
+                The horizon elevation towards the sun
+                or None if the sun is behind the door and window.
+            angle_of_incidence:
+                The angle of incidence.
+            sunny_glazing_area:
+                The sunny glazing area.
         """
-        return self._sunny_glazing_area_changed.listen(callback)
+        # The light state may not belong to the inputs of the latest update anymore.
+        self._update_inputs = None
 
-    @property
-    def sunny_glazing_area_percentage(self) -> Union[float, None]:
-        """
-        The sunny glazing area percentage.
-        """
-        return self._sunny_glazing_area_percentage
+        changed: List[str] = []
+        thresholds = self.output_thresholds
 
-    def on_sunny_glazing_area_percentage_changed(
-        self,
-        callback: Callable[[float], None]
-    ) -> Callable[[], None]:
-        """
-        Calls the specified function whenever the sunny_glazing_area_percentage
-        property has changed.
+        if _is_published(
+            self._horizon_elevation_at_sun_azimuth,
+            horizon_elevation_at_sun_azimuth,
+            thresholds.horizon_elevation_at_sun_azimuth
+        ):
+            self._horizon_elevation_at_sun_azimuth = horizon_elevation_at_sun_azimuth
+            fire_event(self, 'horizon_elevation_at_sun_azimuth', horizon_elevation_at_sun_azimuth)
+            changed.append('horizon_elevation_at_sun_azimuth')
 
-        Args:
-            callback:
-                The function to call when sunny_glazing_area_percentage property has changed.
+        # If angle of incidence has changed than we send a change event
+        if _is_published(
+            self._angle_of_incidence,
+            angle_of_incidence,
+            thresholds.angle_of_incidence,
+            _ANGLE_OF_INCIDENCE_BOUNDARIES
+        ):
+            self._angle_of_incidence = angle_of_incidence
+            fire_event(self, 'angle_of_incidence', self._angle_of_incidence)
+            changed.append('angle_of_incidence')
 
-        Returns:
-            A function to stop calling the callback function when
-            sunny_glazing_area_percentage property has changed.
-        """
-        return self._sunny_glazing_area_percentage_changed.listen(callback)
+        # If sunny glazing area has changed than we send a change event
+        rounded_sunny_glazing_area = round(sunny_glazing_area, 2)
+        if _is_published(
+            self._sunny_glazing_area,
+            rounded_sunny_glazing_area,
+            thresholds.sunny_glazing_area,
+            _SUNNY_GLAZING_AREA_BOUNDARIES
+        ):
+            self._sunny_glazing_area = rounded_sunny_glazing_area
+            fire_event(self, 'sunny_glazing_area', self._sunny_glazing_area)
+            changed.append('sunny_glazing_area')
+
+        # Calculate sunny glazing area percentage and send a change event if has changed
+        glazing_area = (self.width - self.frame_face_thickness * 2) * \
+            (self.height - self.frame_face_thickness * 2)
+        sunny_glazing_area_percentage = round(
+            rounded_sunny_glazing_area / glazing_area * 100, 2)
+        if _is_published(
+            self._sunny_glazing_area_percentage,
+            sunny_glazing_area_percentage,
+            thresholds.sunny_glazing_area_percentage,
+            _SUNNY_GLAZING_AREA_PERCENTAGE_BOUNDARIES
+        ):
+            self._sunny_glazing_area_percentage = sunny_glazing_area_percentage
+            fire_event(self, 'sunny_glazing_area_percentage', self._sunny_glazing_area_percentage)
+            changed.append('sunny_glazing_area_percentage')
+
+        # Switching the direct sunlight on requires the hysteresis above the threshold
+        # in order not to flicker when the sunny glazing area is around the threshold.
+        glazing_has_direct_sunlight: bool = rounded_sunny_glazing_area > \
+            _DIRECT_SUNLIGHT_THRESHOLD + (
+                0 if self._glazing_has_direct_sunlight
+                else thresholds.glazing_has_direct_sunlight_hysteresis
+            )
+        if self._glazing_has_direct_sunlight != glazing_has_direct_sunlight:
+            self._glazing_has_direct_sunlight = glazing_has_direct_sunlight
+            fire_event(self, 'glazing_has_direct_sunlight', self._glazing_has_direct_sunlight)
+            changed.append('glazing_has_direct_sunlight')
+
+        # A single event for all the changes of the update
+        if changed:
+            fire_event(
+                self,
+                'update_completed',
+                self.light_state._replace(changed=frozenset(changed))
+            )
 
     @property
-    def glazing_has_direct_sunlight(self) -> Union[bool, None]:
+    def local_geometry(self) -> DoorAndWindowLocalGeometry:
+        """
+        The shading relevant geometry of the door and window in its own coordinate system.
+        It is recalculated on demand after the size or faceing has changed.
+        """
+        if self._local_geometry is None:
+            self._local_geometry = DoorAndWindowToLocalGeometryConverter().convert(self)
+        elif self._local_geometry_changes:
+            local_geometry = DoorAndWindowToLocalGeometryConverter().update(
+                self,
+                self._local_geometry,
+                self._local_geometry_changes
+            )
+            if local_geometry is not self._local_geometry:
+                # The shading table is calculated for the local geometry.
+                self._local_geometry = local_geometry
+                self._shading_table = None
+        self._local_geometry_changes.clear()
+        return self._local_geometry
+
+    @property
+    def shading_table(self) -> Union[DoorAndWindowShadingTable, None]:
         """
-        The value indicates whether the glazing has direct sunlight.
+        Gets or sets the shading table used by `LIGHT_ENGINE_TABLE`.
+
+        The table is dropped when the geometry changes. A table calculated
+        for an outdated geometry is not accepted, a new one is requested
+        by the next `update` instead. A table with a larger error than
+        `shading_table_error_bound` is not used, the closed form is used instead.
         """
-        return self._glazing_has_direct_sunlight
+        return self._shading_table
+
+    @shading_table.setter
+    def shading_table(self, value: Union[DoorAndWindowShadingTable, None]) -> None:
+        if value is None or value.local_geometry is self.local_geometry:
+            self._shading_table = value
+            # The next update uses the table even at the same sun position.
+            self._update_inputs = None
 
-    def on_glazing_has_direct_sunlight_changed(
+    def on_shading_table_rebuild_requested(
         self,
-        callback: Callable[[bool], None]
+        callback: Callable[[Callable[[], DoorAndWindowShadingTable]], None]
     ) -> Callable[[], None]:
         """
-        Calls the specified function whenever the glazing_has_direct_sunlight
-        property has changed.
+        Calls the specified function whenever the shading table has to be rebuilt.
+
+        The callback receives a function which builds the shading table. The build
+        takes long, so it should run in the background and its result should be
+        set to the `shading_table` property.
 
         Args:
             callback:
-                The function to call when glazing_has_direct_sunlight property has changed.
+                The function to call when the shading table has to be rebuilt.
 
         Returns:
-            A function to stop calling the callback function when
-            glazing_has_direct_sunlight property has changed.
+            A function to stop calling the callback function
+            when the shading table has to be rebuilt.
         """
-        return self._glazing_has_direct_sunlight_changed.listen(callback)
+        return listen_to_event(self, 'shading_table_rebuild_requested', callback)
 
-    def update(self, sun_azimuth: float, sun_elevation: float):
-        """
-        Updates the instance based on the sun position.
+    def _get_light_state_from_shading_table(
+        self,
+        horizon_elevation_at_sun_azimuth: Union[float, None],
+        sun_azimuth: float,
+        sun_elevation: float
+    ) -> Union[Tuple[float, float], None]:
+        local_geometry = self.local_geometry
+        shading_table = self._shading_table
+        if shading_table is None or shading_table.local_geometry is not local_geometry:
+            self._request_shading_table(local_geometry)
+            return None
+        if shading_table.error > self.shading_table_error_bound:
+            # the error bound cannot be reached by the smallest resolution
+            return None
+
+        angle_of_incidence = \
+            DoorAndWindowLocalGeometryToLightInformationConverter.get_angle_of_incidence(
+                local_geometry,
+                sun_azimuth,
+                sun_elevation
+            )
+        if angle_of_incidence >= 90 or (
+            horizon_elevation_at_sun_azimuth is not None
+            and horizon_elevation_at_sun_azimuth > sun_elevation
+        ):
+            # the sun is behind the door and window or below the horizon
+            return (angle_of_incidence, 0.0)
+
+        sunny_glazing_area = shading_table.get_sunny_glazing_area(
+            (sun_azimuth - self.azimuth + 180) % 360 - 180,
+            sun_elevation
+        )
+        if sunny_glazing_area is None:
+            return None
 
-        Args:
-            sun_azimuth:
-                The azimuth of the sun.
-            sun_elevation:
-                The elevation of the sun.
-        """
-        # recalculate horizon elevation at sun azimuth
-        horizon_elevation_at_sun_azimuth = None
-        azimuth = normalize_angle(sun_azimuth - self.azimuth)
+        return (angle_of_incidence, sunny_glazing_area)
 
-        sun_position = azimuth + 90
-        if 0 <= sun_position <= 180:
-            # Sun is in front of the door and window
+    def _request_shading_table(self, local_geometry: DoorAndWindowLocalGeometry) -> None:
+        if self._shading_table_requested_for is local_geometry:
+            return
+        self._shading_table_requested_for = local_geometry
 
-            # We calculate the degrees between each horizon profile points
-            # this will be the horizon profile resolution
-            horizon_profile_resolution = 180 / (len(self.horizon_profile) - 1)
+        # The builder must not read the instance, it may run on another thread.
+        arguments = (
+            local_geometry,
+            self.azimuth,
+            self.tilt,
+            self.shading_table_resolution,
+            self.shading_table_error_bound
+        )
 
-            # We calculate the lower index at horizon profile array
-            # of the position belongs to the sun's azimuth.
-            horizon_profile_index = math.floor(sun_position / horizon_profile_resolution)
+        def build_shading_table() -> DoorAndWindowShadingTable:
+            return DoorAndWindowLocalGeometryToShadingTableConverter().convert(*arguments)
 
-            if len(self.horizon_profile) - 1 == horizon_profile_index:
-                # If the calculated horizon profile index is the last one
-                # than the sun is barely visible (a moment later it won't be),
-                # In that case we must use the last horizon profile elevation value
-                horizon_elevation_at_sun_azimuth = self.horizon_profile[-1]
-            else:
-                # We calculate a weight which will tell us
-                # the rate of the higher index elevation value
-                # must be used for calculating the actual horizon elevation
-                weight = (sun_position - horizon_profile_resolution *
-                          horizon_profile_index) / horizon_profile_resolution
-
-                # This is simple linear regression between the lower and
-                # the higher index elevation value.
-                horizon_elevation_at_sun_azimuth = \
-                    self.horizon_profile[horizon_profile_index] * (1 - weight) + \
-                    self.horizon_profile[horizon_profile_index + 1] * weight
+        fire_event(self, 'shading_table_rebuild_requested', build_shading_table)
 
-            horizon_elevation_at_sun_azimuth = round(horizon_elevation_at_sun_azimuth, 2)
-        else:
-            # sun is behind the door and window
-            horizon_elevation_at_sun_azimuth = None
+    def _get_rectangles(self) -> DoorAndWindowRectangles:
+        if self._rectangles is None:
+            self._rectangles = DoorAndWindowToRectanglesConverter().convert(self)
+        elif self._rectangles_changes:
+            self._rectangles = DoorAndWindowToRectanglesConverter().update(
+                self,
+                self._rectangles,
+                self._rectangles_changes
+            )
+        self._rectangles_changes.clear()
+        return self._rectangles
+
+    def _get_rectangles_seen_from_sun(self) -> DoorAndWindowRectangles:
+        if self._rectangles_seen_from_sun is None:
+            self._rectangles_seen_from_sun = DoorAndWindowRectangles.from_corners(
+                np.empty((6, 4, 4)),
+                False,
+                lambda: np.empty((4, 4, 4))
+            )
+        return self._rectangles_seen_from_sun
+
+    def get_light_information_batch(
+        self,
+        sun_azimuths: np.ndarray,
+        sun_elevations: np.ndarray
+    ) -> DoorAndWindowLightInformationBatch:
+        """
+        Calculates the light information of the door and window at many sun positions
+        at once, without changing the light state of the instance and without firing events.
 
-        if self._horizon_elevation_at_sun_azimuth != horizon_elevation_at_sun_azimuth:
-            self._horizon_elevation_at_sun_azimuth = horizon_elevation_at_sun_azimuth
-            self._horizon_elevation_at_sun_azimuth_changed.fire(horizon_elevation_at_sun_azimuth)
+        The values are the same as the ones `update` would set for each sun position.
 
-        # If the size or faceing of the door and window change
-        # we must update the associated rectangles.
-        if self._rectangles_spoiled:
-            self._rectangles = DoorAndWindowToRectanglesConverter().convert(self)
-            self._rectangles_spoiled = False
+        Args:
+            sun_azimuths:
+                The azimuths of the sun.
+            sun_elevations:
+                The elevations of the sun.
 
-        light_information = DoorAndWindowRectanglesToLightInformationConverter().convert(
-            self._rectangles,
-            self._horizon_elevation_at_sun_azimuth,
-            self.azimuth,
-            self.tilt,
-            sun_azimuth,
-            sun_elevation
-        )
+        Returns:
+            The light information with one value for each sun position.
+        """
+        sun_azimuths = np.asarray(sun_azimuths, dtype=float)
+        sun_elevations = np.asarray(sun_elevations, dtype=float)
 
-        # If angle of incidence has changed than we send a change event
-        if self._angle_of_incidence != light_information.angle_of_incidence:
-            self._angle_of_incidence = light_information.angle_of_incidence
-            self._angle_of_incidence_changed.fire(self._angle_of_incidence)
+        # NaN where the sun is behind the door and window.
+        horizon_elevation_at_sun_azimuth = np.round(
+            self.compiled_horizon_profile.elevation_at(
+                normalize_angles(sun_azimuths - self.azimuth)),
+            2
+        )
 
-        # If sunny glazing area has changed than we send a change event
-        sunny_glazing_area: float = round(light_information.sunny_glazing_area_polygon.area, 2)
-        if self._sunny_glazing_area != sunny_glazing_area:
-            self._sunny_glazing_area = sunny_glazing_area
-            self._sunny_glazing_area_changed.fire(self._sunny_glazing_area)
+        light_information_batch = \
+            DoorAndWindowLocalGeometryToLightInformationBatchConverter().convert(
+                self.local_geometry,
+                horizon_elevation_at_sun_azimuth,
+                sun_azimuths,
+                sun_elevations
+            )
+        if self.has_obstacles:
+            light_information_batch = self._apply_obstacles(
+                light_information_batch,
+                *np.broadcast_arrays(sun_azimuths, sun_elevations)
+            )
+        return light_information_batch
+
+    def _apply_obstacles(
+        self,
+        light_information_batch: DoorAndWindowLightInformationBatch,
+        sun_azimuths: np.ndarray,
+        sun_elevations: np.ndarray
+    ) -> DoorAndWindowLightInformationBatch:
+        # The obstacles may shade the glazing only at the sun positions
+        # where the closed form finds sunny glazing area. These are recalculated
+        # one by one with the obstacles, as `update` does.
+        sunny_glazing_area = light_information_batch.sunny_glazing_area.copy()
+        rectangles = self._get_rectangles()
+        for index in np.flatnonzero(sunny_glazing_area > 0).tolist():
+            sunny_glazing_area.flat[index] = round(
+                DoorAndWindowRectanglesToLightInformationConverter().convert(
+                    rectangles,
+                    None,
+                    self.azimuth,
+                    self.tilt,
+                    sun_azimuths.flat[index],
+                    sun_elevations.flat[index],
+                    engine=LIGHT_ENGINE_CONVEX_CLIPPING,
+                    out=self._get_rectangles_seen_from_sun()
+                ).sunny_glazing_area,
+                2
+            )
 
-        # Calculate sunny glazing area percentage and send a change event if has changed
         glazing_area = (self.width - self.frame_face_thickness * 2) * \
             (self.height - self.frame_face_thickness * 2)
-        sunny_glazing_area_percentage = round(sunny_glazing_area / glazing_area * 100, 2)
-        if self._sunny_glazing_area_percentage != sunny_glazing_area_percentage:
-            self._sunny_glazing_area_percentage = sunny_glazing_area_percentage
-            self._sunny_glazing_area_percentage_changed.fire(self._sunny_glazing_area_percentage)
-
-        # If sunny glazing area has changed than we send a change event
-        glazing_has_direct_sunlight: bool = sunny_glazing_area > 0.01
-        if self._glazing_has_direct_sunlight != glazing_has_direct_sunlight:
-            self._glazing_has_direct_sunlight = glazing_has_direct_sunlight
-            self._glazing_has_direct_sunlight_changed.fire(self._glazing_has_direct_sunlight)
+        return DoorAndWindowLightInformationBatch(
+            light_information_batch.angle_of_incidence,
+            light_information_batch.horizon_elevation_at_sun_azimuth,
+            sunny_glazing_area,
+            np.round(sunny_glazing_area / glazing_area * 100, 2),
+            sunny_glazing_area > _DIRECT_SUNLIGHT_THRESHOLD
+        )
 
     def dispose(self):
         """
         Destroys the current instance.
         """
-        self._width_changed.dispose()
-        self._height_changed.dispose()
-        self._frame_face_thickness_changed.dispose()
-        self._frame_thickness_changed.dispose()
-        self._outside_depth_changed.dispose()
-        self._inside_depth_changed.dispose()
-        self._parapet_wall_height_changed.dispose()
-        self._azimuth_changed.dispose()
-        self._tilt_changed.dispose()
-        self._horizon_profile_changed.dispose()
-        self._horizon_elevation_at_sun_azimuth_changed.dispose()
-        self._angle_of_incidence_changed.dispose()
-        self._sunny_glazing_area_changed.dispose()
-        self._sunny_glazing_area_percentage_changed.dispose()
-        self._glazing_has_direct_sunlight_changed.dispose()
-        self._awning_changed.dispose()
+        self.facade = None
+        dispose_events(self)
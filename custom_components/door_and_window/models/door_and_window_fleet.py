@@ -0,0 +1,303 @@
+""" The module contains the DoorAndWindowFleet class. """
+from typing import Dict, List, Set, Tuple, Union
+
+import numpy as np
+
+from ..const import LIGHT_ENGINE_CLOSED_FORM
+from ..converters.door_and_window_local_geometry_to_light_information_batch_converter import \
+    DoorAndWindowLocalGeometryToLightInformationBatchConverter
+from ..utils import get_angular_distance, normalize_angles
+from .door_and_window import DoorAndWindow
+from .door_and_window_local_geometry import DoorAndWindowLocalGeometry
+from .door_and_window_local_geometry_stack import DoorAndWindowLocalGeometryStack
+from .horizon_profile import HorizonProfile
+
+
+# pylint: disable=too-many-instance-attributes
+class DoorAndWindowFleet():
+    """
+    Calculates the light state of all the registered door and windows
+    in one vectorised pass for a sun position.
+
+    The geometry of the door and windows is stacked into arrays which are only
+    rebuilt when a door and window is added, removed or its geometry has changed.
+    The results are dispatched to the door and windows, which send
+    their usual change events.
+
+    Only the door and windows using `LIGHT_ENGINE_CLOSED_FORM` without obstacles
+    are stacked, because the vectorised pass is the closed-form calculation without
+    the obstacles. The others are updated one by one with their own light engine.
+
+    Each door and window has its own sun position dead band: it is updated again
+    only when the sun has moved at least that much since its previous update,
+    regardless of which caller updates the fleet.
+
+    While the sun cannot shine to a door and window (see `DoorAndWindow.is_sun_in_view`),
+    it is updated only once, when the sun leaves its view, and it is skipped
+    until the sun returns to its view. The vectorised pass finds these door and windows
+    by the angles of incidence and the horizon profiles of the stack.
+    """
+
+    def __init__(self):
+        """
+        Initialize a new instance of `DoorAndWindowFleet` class.
+        """
+        self._door_and_windows: List[DoorAndWindow] = []
+        # The door and windows calculated by the vectorised pass, these are in the stack.
+        self._stacked_door_and_windows: List[DoorAndWindow] = []
+        self._local_geometries: List[DoorAndWindowLocalGeometry] = []
+        self._horizon_profiles: List[HorizonProfile] = []
+        self._local_geometry_stack: Union[DoorAndWindowLocalGeometryStack, None] = None
+        self._horizon_profile_table: Union[np.ndarray, None] = None
+        self._horizon_profile_rows: Union[np.ndarray, None] = None
+        self._horizon_profile_lengths: Union[np.ndarray, None] = None
+        self._horizon_profile_resolutions: Union[np.ndarray, None] = None
+        self._horizon_profile_min_elevations: Union[np.ndarray, None] = None
+        self._sun_position: Union[Tuple[float, float], None] = None
+        # The sun position dead band of each door and window
+        # and the latest sun position each one was updated with.
+        self._sun_position_dead_bands: Dict[DoorAndWindow, float] = {}
+        self._sun_positions: Dict[DoorAndWindow, Tuple[float, float]] = {}
+        # The door and windows added since the latest update.
+        self._added_door_and_windows: List[DoorAndWindow] = []
+        # The door and windows updated when the sun has left their view.
+        self._suspended_door_and_windows: Set[DoorAndWindow] = set()
+
+    @property
+    def door_and_windows(self) -> List[DoorAndWindow]:
+        """ The registered door and windows. """
+        return list(self._door_and_windows)
+
+    def add(self, door_and_window: DoorAndWindow, *, sun_position_dead_band: float = 0) -> None:
+        """
+        Registers the specified door and window. Its light state is calculated
+        by the next `update` call. If that is for the same sun position as the previous
+        one, only the added door and window is updated, on its own.
+
+        Adding a registered door and window again only changes its dead band.
+
+        Args:
+            door_and_window:
+                The door and window to register.
+            sun_position_dead_band:
+                The minimum angle (in degrees) the sun has to move since the previous
+                update of the door and window to update it again.
+                0 means every move updates it.
+        """
+        self._sun_position_dead_bands[door_and_window] = sun_position_dead_band
+        if door_and_window not in self._door_and_windows:
+            self._door_and_windows.append(door_and_window)
+            self._added_door_and_windows.append(door_and_window)
+            self._local_geometry_stack = None
+
+    def remove(self, door_and_window: DoorAndWindow) -> None:
+        """
+        Unregisters the specified door and window.
+
+        Args:
+            door_and_window:
+                The door and window to unregister.
+        """
+        if door_and_window in self._door_and_windows:
+            self._door_and_windows.remove(door_and_window)
+            self._local_geometry_stack = None
+        if door_and_window in self._added_door_and_windows:
+            self._added_door_and_windows.remove(door_and_window)
+        self._sun_position_dead_bands.pop(door_and_window, None)
+        self._sun_positions.pop(door_and_window, None)
+        self._suspended_door_and_windows.discard(door_and_window)
+
+    def update(self, sun_azimuth: float, sun_elevation: float) -> None:
+        """
+        Updates all the registered door and windows based on the sun position.
+
+        Calling it again for the same sun position updates only the door and windows
+        added since the previous call, one by one, so every `Coordinator` can forward
+        the same sun change. The door and windows are skipped while the sun is
+        within their dead band since their previous update or out of their view.
+
+        Args:
+            sun_azimuth:
+                The azimuth of the sun.
+            sun_elevation:
+                The elevation of the sun.
+        """
+        added_door_and_windows = self._added_door_and_windows
+        self._added_door_and_windows = []
+        if self._sun_position == (sun_azimuth, sun_elevation):
+            # The others are up to date, the stack is rebuilt by the next sun position.
+            for door_and_window in added_door_and_windows:
+                self._sun_positions[door_and_window] = self._sun_position
+                door_and_window.update(sun_azimuth, sun_elevation)
+            return
+        self._sun_position = (sun_azimuth, sun_elevation)
+
+        if not self._door_and_windows:
+            return
+
+        # The cheap test saves the calculation of the others while the sun is out of view.
+        for door_and_window in self._door_and_windows:
+            if not _is_stackable(door_and_window) and self._is_update_due(
+                door_and_window,
+                door_and_window.is_sun_in_view(sun_azimuth, sun_elevation),
+                sun_azimuth,
+                sun_elevation
+            ):
+                door_and_window.update(sun_azimuth, sun_elevation)
+
+        self._update_stack()
+        if not self._stacked_door_and_windows:
+            return
+
+        horizon_elevation_at_sun_azimuth = self._get_horizon_elevation_at_sun_azimuth(
+            sun_azimuth)
+
+        light_information = DoorAndWindowLocalGeometryToLightInformationBatchConverter().convert(
+            self._local_geometry_stack,
+            horizon_elevation_at_sun_azimuth,
+            sun_azimuth,
+            sun_elevation
+        )
+
+        # The same test as `DoorAndWindow.is_sun_in_view` for all the door and windows:
+        # the sun is in front of the glazing and it is not lower than the lowest
+        # horizon profile value, if the horizon profile is applied (the elevation is not NaN).
+        is_sun_in_view = (light_information.angle_of_incidence < 90) & (
+            np.isnan(horizon_elevation_at_sun_azimuth)
+            | (sun_elevation >= self._horizon_profile_min_elevations)
+        )
+
+        # Converting the arrays to lists at once is much faster than
+        # reading the numpy scalars one by one.
+        for (
+            door_and_window,
+            in_view,
+            horizon_elevation,
+            angle_of_incidence,
+            sunny_glazing_area
+        ) in zip(
+            self._stacked_door_and_windows,
+            is_sun_in_view.tolist(),
+            np.where(
+                np.isnan(horizon_elevation_at_sun_azimuth),
+                None,
+                horizon_elevation_at_sun_azimuth
+            ).tolist(),
+            light_information.angle_of_incidence.tolist(),
+            light_information.sunny_glazing_area.tolist()
+        ):
+            if not self._is_update_due(door_and_window, in_view, sun_azimuth, sun_elevation):
+                continue
+            door_and_window.set_light_information(
+                horizon_elevation,
+                angle_of_incidence,
+                sunny_glazing_area
+            )
+
+    def _is_update_due(
+        self,
+        door_and_window: DoorAndWindow,
+        is_sun_in_view: bool,
+        sun_azimuth: float,
+        sun_elevation: float
+    ) -> bool:
+        # Records the sun position as the latest one of the door and window if it is due.
+        # The sun leaving or entering the view is due regardless of the dead band.
+        suspended = door_and_window in self._suspended_door_and_windows
+        if not is_sun_in_view:
+            if suspended:
+                return False
+            self._suspended_door_and_windows.add(door_and_window)
+        elif suspended:
+            self._suspended_door_and_windows.discard(door_and_window)
+        else:
+            sun_position = self._sun_positions.get(door_and_window)
+            if sun_position is not None and get_angular_distance(
+                *sun_position,
+                sun_azimuth,
+                sun_elevation
+            ) < self._sun_position_dead_bands.get(door_and_window, 0):
+                return False
+        self._sun_positions[door_and_window] = (sun_azimuth, sun_elevation)
+        return True
+
+    def _update_stack(self) -> None:
+        # The door and windows cache their local geometry and compiled horizon profile
+        # until they change, so comparing the identities reveals the changes.
+        stacked_door_and_windows = [
+            door_and_window for door_and_window in self._door_and_windows
+            if _is_stackable(door_and_window)
+        ]
+        local_geometries = [
+            door_and_window.local_geometry for door_and_window in stacked_door_and_windows
+        ]
+        horizon_profiles = [
+            door_and_window.compiled_horizon_profile
+            for door_and_window in stacked_door_and_windows
+        ]
+
+        if self._local_geometry_stack is not None \
+                and len(local_geometries) == len(self._local_geometries) \
+                and all(map(lambda a, b: a is b, local_geometries, self._local_geometries)) \
+                and all(map(lambda a, b: a is b, horizon_profiles, self._horizon_profiles)):
+            return
+
+        self._stacked_door_and_windows = stacked_door_and_windows
+        self._local_geometries = local_geometries
+        self._horizon_profiles = horizon_profiles
+        if not stacked_door_and_windows:
+            return
+        self._local_geometry_stack = DoorAndWindowLocalGeometryStack(local_geometries)
+
+        # The horizon profiles padded by their last value to the same length.
+        # The door and windows sharing a compiled horizon profile (e.g. the ones
+        # on the same facade) share its row.
+        unique_horizon_profiles = list(
+            {id(profile): profile for profile in horizon_profiles}.values())
+        rows = {id(profile): row for (row, profile) in enumerate(unique_horizon_profiles)}
+        self._horizon_profile_rows = np.array([rows[id(profile)] for profile in horizon_profiles])
+        lengths = np.array([len(profile) for profile in unique_horizon_profiles])
+        self._horizon_profile_lengths = lengths[self._horizon_profile_rows]
+        self._horizon_profile_resolutions = np.array(
+            [profile.resolution for profile in unique_horizon_profiles]
+        )[self._horizon_profile_rows]
+        self._horizon_profile_min_elevations = np.array(
+            [profile.min_elevation for profile in unique_horizon_profiles]
+        )[self._horizon_profile_rows]
+        self._horizon_profile_table = np.array([
+            np.pad(profile.elevations, (0, lengths.max() - len(profile)), mode='edge')
+            for profile in unique_horizon_profiles
+        ])
+
+    def _get_horizon_elevation_at_sun_azimuth(self, sun_azimuth: float) -> np.ndarray:
+        # The same linear interpolation as `HorizonProfile.elevation_at` does
+        # with each horizon profile, NaN if the sun is behind the door and window.
+        azimuths = np.array(
+            [door_and_window.azimuth for door_and_window in self._stacked_door_and_windows],
+            dtype=float
+        )
+        sun_positions = normalize_angles(sun_azimuth - azimuths) + 90
+        resolutions = self._horizon_profile_resolutions
+        indices = np.clip(
+            np.floor(sun_positions / resolutions).astype(int),
+            0,
+            self._horizon_profile_lengths - 2
+        )
+        weights = (sun_positions - resolutions * indices) / resolutions
+        lower = self._horizon_profile_table[self._horizon_profile_rows, indices]
+        upper = self._horizon_profile_table[self._horizon_profile_rows, indices + 1]
+
+        return np.where(
+            (sun_positions >= 0) & (sun_positions <= 180),
+            np.round(lower * (1 - weights) + upper * weights, 2),
+            np.nan
+        )
+
+
+def _is_stackable(door_and_window: DoorAndWindow) -> bool:
+    """
+    Gets whether the vectorised pass calculates the same light state
+    as the update of the door and window would do.
+    """
+    return door_and_window.light_engine == LIGHT_ENGINE_CLOSED_FORM \
+        and not door_and_window.has_obstacles
@@ -1,5 +1,9 @@
 """ The module contains the DoorAndWindowLightInformation class. """
-from shapely.geometry.polygon import Polygon
+from typing import List, Tuple, Union
+
+from shapely.geometry import MultiPolygon, Polygon
+
+from ..converters.convex_polygon_clipping import get_area
 
 
 class DoorAndWindowLightInformation:
@@ -10,7 +14,8 @@ class DoorAndWindowLightInformation:
     def __init__(
         self,
         angle_of_incidence: float,
-        sunny_glazing_area_polygon: Polygon,
+        sunny_glazing_area_polygon: Union[Polygon, None] = None,
+        sunny_glazing_area_convex_polygons: Union[List[List[Tuple[float, float]]], None] = None
     ):
         """
         Initialize a new instance of LightInformation class.
@@ -22,17 +27,39 @@ class DoorAndWindowLightInformation:
                 Otherwise the sun is behind the door and window.
             sunny_glazing_area_polygon:
                 The glazing sunny area polygon.
+            sunny_glazing_area_convex_polygons:
+                The non-overlapping convex polygons which cover the glazing sunny area.
+                Used when the sunny area is not calculated as a shapely polygon.
         """
         self._angle_of_incidence = angle_of_incidence
         self._sunny_glazing_area_polygon = sunny_glazing_area_polygon
+        self._sunny_glazing_area_convex_polygons = sunny_glazing_area_convex_polygons or []
+        self._sunny_glazing_area: Union[float, None] = None
 
     @property
     def sunny_glazing_area_polygon(self) -> Polygon:
         """
         Gets the glazing sunny area polygon.
         """
+        if self._sunny_glazing_area_polygon is None:
+            # Merging the touching convex polygons by buffer(0) is more robust
+            # than unary_union for shared vertices differing by rounding errors.
+            self._sunny_glazing_area_polygon = MultiPolygon([
+                Polygon(polygon) for polygon in self._sunny_glazing_area_convex_polygons
+            ]).buffer(0) if self._sunny_glazing_area_convex_polygons else Polygon()
         return self._sunny_glazing_area_polygon
 
+    @property
+    def sunny_glazing_area(self) -> float:
+        """
+        Gets the glazing sunny area.
+        """
+        if self._sunny_glazing_area is None:
+            self._sunny_glazing_area = self._sunny_glazing_area_polygon.area \
+                if self._sunny_glazing_area_polygon is not None \
+                else get_area(self._sunny_glazing_area_convex_polygons)
+        return self._sunny_glazing_area
+
     @property
     def angle_of_incidence(self) -> float:
         """
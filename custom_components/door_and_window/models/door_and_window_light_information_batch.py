@@ -0,0 +1,58 @@
+""" The module contains the DoorAndWindowLightInformationBatch class. """
+from typing import Final
+
+import numpy as np
+
+
+# pylint: disable=too-few-public-methods
+class DoorAndWindowLightInformationBatch:
+    """
+    Contains information about sun light received by a door and window
+    at many sun positions. Every attribute is an array which has
+    one value for each sun position.
+
+    Attributes:
+        angle_of_incidence:
+            The angles of incidence.
+        horizon_elevation_at_sun_azimuth:
+            The horizon elevations towards the sun.
+            The value is NaN if the sun is behind the door and window.
+        sunny_glazing_area:
+            The sunny glazing areas.
+        sunny_glazing_area_percentage:
+            The sunny glazing area percentages.
+        glazing_has_direct_sunlight:
+            The values indicate whether the glazing has direct sunlight.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        angle_of_incidence: np.ndarray,
+        horizon_elevation_at_sun_azimuth: np.ndarray,
+        sunny_glazing_area: np.ndarray,
+        sunny_glazing_area_percentage: np.ndarray,
+        glazing_has_direct_sunlight: np.ndarray
+    ):
+        """
+        Initialize a new instance of DoorAndWindowLightInformationBatch class.
+
+        Args:
+            angle_of_incidence:
+                The angles of incidence.
+            horizon_elevation_at_sun_azimuth:
+                The horizon elevations towards the sun.
+                The value is NaN if the sun is behind the door and window.
+            sunny_glazing_area:
+                The sunny glazing areas.
+            sunny_glazing_area_percentage:
+                The sunny glazing area percentages.
+            glazing_has_direct_sunlight:
+                The values indicate whether the glazing has direct sunlight.
+        """
+        self.angle_of_incidence: Final[np.ndarray] = angle_of_incidence
+        self.horizon_elevation_at_sun_azimuth: Final[np.ndarray] = \
+            horizon_elevation_at_sun_azimuth
+        self.sunny_glazing_area: Final[np.ndarray] = sunny_glazing_area
+        self.sunny_glazing_area_percentage: Final[np.ndarray] = sunny_glazing_area_percentage
+        self.glazing_has_direct_sunlight: Final[np.ndarray] = glazing_has_direct_sunlight
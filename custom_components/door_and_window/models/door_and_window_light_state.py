@@ -0,0 +1,38 @@
+""" The module contains the DoorAndWindowLightState class. """
+from typing import FrozenSet, NamedTuple, Union
+
+# The names of the door and window properties which are calculated by an update.
+LIGHT_STATE_PROPERTIES = (
+    'horizon_elevation_at_sun_azimuth',
+    'angle_of_incidence',
+    'sunny_glazing_area',
+    'sunny_glazing_area_percentage',
+    'glazing_has_direct_sunlight'
+)
+
+
+class DoorAndWindowLightState(NamedTuple):
+    """
+    An immutable snapshot of the light state of a door and window after an update.
+
+    Attributes:
+        horizon_elevation_at_sun_azimuth:
+            The horizon elevation towards the sun
+            or None if the sun is behind the door and window.
+        angle_of_incidence:
+            The angle of incidence.
+        sunny_glazing_area:
+            The sunny glazing area.
+        sunny_glazing_area_percentage:
+            The sunny glazing area percentage.
+        glazing_has_direct_sunlight:
+            The value indicates whether the glazing has direct sunlight.
+        changed:
+            The names of the properties changed by the update.
+    """
+    horizon_elevation_at_sun_azimuth: Union[float, None]
+    angle_of_incidence: Union[float, None]
+    sunny_glazing_area: Union[float, None]
+    sunny_glazing_area_percentage: Union[float, None]
+    glazing_has_direct_sunlight: Union[bool, None]
+    changed: FrozenSet[str]
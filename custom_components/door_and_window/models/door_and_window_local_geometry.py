@@ -0,0 +1,76 @@
+""" The module contains DoorAndWindowLocalGeometry class. """
+from typing import Final, List, Tuple, Union
+
+Vector = Tuple[float, float, float]
+Bounds = Tuple[float, float, float, float]
+
+
+# pylint: disable=too-many-instance-attributes, too-few-public-methods
+class DoorAndWindowLocalGeometry:
+    """
+    Represents the shading relevant geometry of a door and window
+    in its own coordinate system.
+
+    The origin is:
+        - the outer surface of the glazing on Z axis
+        - the center of the glazing on X axis
+        - the ground level on Y axis
+
+    The Y axis is positive to up.
+    The X axis is positive to right as seen from outside.
+    The Z axis is positive to inside.
+
+    Attributes:
+        world_to_local:
+            The rows of the 3x3 rotation matrix which transforms a vector
+            from the world coordinate system to the door and window coordinate system.
+        normal:
+            The unit vector of the door and window face in the coordinate system
+            used by the angle of incidence calculation.
+        glazing:
+            The (left, bottom, right, top) bounds of the glazing.
+        opening:
+            The (left, bottom, right, top) bounds of the wall opening.
+            The jamb walls, the head jamb wall and the stool are its sides.
+        outside_depth:
+            The depth of the wall opening in front of the glazing.
+        awning:
+            The corners of the awning or None if there is no awning.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        *,
+        world_to_local: Tuple[Vector, Vector, Vector],
+        normal: Vector,
+        glazing: Bounds,
+        opening: Bounds,
+        outside_depth: float,
+        awning: Union[List[Vector], None]
+    ):
+        """
+        Initialize a new instance of DoorAndWindowLocalGeometry class.
+
+        Args:
+            world_to_local:
+                The rows of the 3x3 rotation matrix which transforms a vector
+                from the world coordinate system to the door and window coordinate system.
+            normal:
+                The unit vector of the door and window face in the coordinate system
+                used by the angle of incidence calculation.
+            glazing:
+                The (left, bottom, right, top) bounds of the glazing.
+            opening:
+                The (left, bottom, right, top) bounds of the wall opening.
+            outside_depth:
+                The depth of the wall opening in front of the glazing.
+            awning:
+                The corners of the awning or None if there is no awning.
+        """
+        self.world_to_local: Final[Tuple[Vector, Vector, Vector]] = world_to_local
+        self.normal: Final[Vector] = normal
+        self.glazing: Final[Bounds] = glazing
+        self.opening: Final[Bounds] = opening
+        self.outside_depth: Final[float] = outside_depth
+        self.awning: Final[Union[List[Vector], None]] = awning
@@ -0,0 +1,68 @@
+""" The module contains DoorAndWindowLocalGeometryStack class. """
+from typing import Final, Sequence
+
+import numpy as np
+
+from .door_and_window_local_geometry import DoorAndWindowLocalGeometry
+
+
+# pylint: disable=too-many-instance-attributes, too-few-public-methods
+class DoorAndWindowLocalGeometryStack:
+    """
+    Represents the local geometry of many door and windows stacked into arrays,
+    so they can be evaluated together. The first axis of every array
+    is the index of the door and window.
+
+    Attributes:
+        world_to_local:
+            The (n, 3, 3) array of the rotation matrices which transform a vector
+            from the world coordinate system to the door and window coordinate system.
+        normal:
+            The (n, 3) array of the unit vectors of the door and window faces.
+        glazing:
+            The (n, 4) array of the (left, bottom, right, top) bounds of the glazings.
+        opening:
+            The (n, 4) array of the (left, bottom, right, top) bounds of the wall openings.
+        outside_depth:
+            The (n,) array of the depths of the wall openings in front of the glazings.
+        awning:
+            The (n, 4, 3) array of the corners of the awnings.
+            The corners are zeros if the door and window has no awning.
+        has_awning:
+            The value indicates whether any of the door and windows has an awning.
+    """
+
+    def __init__(self, local_geometries: Sequence[DoorAndWindowLocalGeometry]):
+        """
+        Initialize a new instance of DoorAndWindowLocalGeometryStack class.
+
+        Args:
+            local_geometries:
+                The local geometries of the door and windows to stack.
+        """
+        self.world_to_local: Final[np.ndarray] = np.reshape(
+            [local_geometry.world_to_local for local_geometry in local_geometries],
+            (-1, 3, 3)
+        ).astype(float)
+        self.normal: Final[np.ndarray] = np.reshape(
+            [local_geometry.normal for local_geometry in local_geometries], (-1, 3)
+        ).astype(float)
+        self.glazing: Final[np.ndarray] = np.reshape(
+            [local_geometry.glazing for local_geometry in local_geometries], (-1, 4)
+        ).astype(float)
+        self.opening: Final[np.ndarray] = np.reshape(
+            [local_geometry.opening for local_geometry in local_geometries], (-1, 4)
+        ).astype(float)
+        self.outside_depth: Final[np.ndarray] = np.array(
+            [local_geometry.outside_depth for local_geometry in local_geometries], dtype=float
+        )
+        self.awning: Final[np.ndarray] = np.reshape(
+            [
+                local_geometry.awning if local_geometry.awning is not None else np.zeros((4, 3))
+                for local_geometry in local_geometries
+            ],
+            (-1, 4, 3)
+        ).astype(float)
+        self.has_awning: Final[bool] = any(
+            local_geometry.awning is not None for local_geometry in local_geometries
+        )
@@ -0,0 +1,234 @@
+""" The module contains the DoorAndWindowObstacles class. """
+from typing import List, Sequence, Union
+
+import numpy as np
+
+from ..converters.convex_polygon_clipping import ConvexPolygon, get_convex_hull
+from .obstacle import Obstacle
+
+# The size (in degrees) of the sun position cells of the spatial index.
+INDEX_CELL_SIZE = 5
+
+_AZIMUTH_CELL_COUNT = 360 // INDEX_CELL_SIZE
+_ELEVATION_CELL_COUNT = 90 // INDEX_CELL_SIZE
+
+
+def get_sun_directions(
+    solar_azimuths: Union[float, np.ndarray],
+    solar_elevations: Union[float, np.ndarray]
+) -> np.ndarray:
+    """
+    Gets the unit vectors pointing to the sun in the 3D space of the door and window rectangles.
+
+    Args:
+        solar_azimuths:
+            The sun azimuth or an array of them.
+        solar_elevations:
+            The sun elevation or an array of them.
+
+    Returns:
+        The (..., 3) array of the directions.
+    """
+    azimuths = np.radians(solar_azimuths)
+    elevations = np.radians(solar_elevations)
+    return np.stack(np.broadcast_arrays(
+        -np.sin(azimuths) * np.cos(elevations),
+        np.sin(elevations),
+        -np.cos(azimuths) * np.cos(elevations)
+    ), axis=-1)
+
+
+class DoorAndWindowObstacles:
+    """
+    Represents the obstacles of a door and window in the 3D space
+    of the door and window rectangles, with a spatial index which finds
+    the obstacles that may shade the glazing from a sun position.
+
+    Every obstacle is bounded by the cone of the directions from the glazing to it:
+    the sun can be hidden by the obstacle only from a direction inside the cone.
+    The index is a grid of the sun positions by `INDEX_CELL_SIZE` degrees, each cell
+    lists the obstacles whose cone overlaps the cell, so a query tests
+    only the obstacles around the sun. The index is built by the first query.
+    """
+
+    __slots__ = (
+        '_vertices',
+        '_vertex_counts',
+        '_axes',
+        '_cos_half_angles',
+        '_cell_offsets',
+        '_cell_indices'
+    )
+
+    def __init__(
+        self,
+        obstacles: Sequence[Obstacle],
+        transformation_matrix: np.ndarray,
+        glazing_corners: np.ndarray
+    ):
+        """
+        Initialize a new instance of `DoorAndWindowObstacles` class.
+
+        Args:
+            obstacles:
+                The obstacles in the coordinate system of the door and window.
+                There is at least one.
+            transformation_matrix:
+                The 4x4 matrix which transforms the coordinate system of the door and window
+                to the 3D space of the door and window rectangles.
+            glazing_corners:
+                The (4, 4) array of the homogeneous corner coordinates of the glazing
+                in the 3D space of the door and window rectangles.
+        """
+        local_vertices = np.concatenate([obstacle.vertices for obstacle in obstacles])
+        self._vertices: np.ndarray = np.matmul(
+            np.concatenate((local_vertices, np.ones((len(local_vertices), 1))), axis=1),
+            transformation_matrix.T
+        )
+        self._vertex_counts = np.array([len(obstacle.vertices) for obstacle in obstacles])
+
+        # The directions from the glazing corners to the vertices of the obstacles.
+        # The directions from the glazing to an obstacle are inside the cone
+        # around their mean which contains all of these, if it is narrower than 90°.
+        directions = self._vertices[:, np.newaxis, :3] - glazing_corners[np.newaxis, :, :3]
+        lengths = np.linalg.norm(directions, axis=-1)
+        directions /= np.maximum(lengths, 1e-12)[..., np.newaxis]
+
+        starts = np.concatenate(([0], np.cumsum(self._vertex_counts)[:-1]))
+        axes = np.add.reduceat(directions.sum(axis=1), starts)
+        axes /= np.maximum(np.linalg.norm(axes, axis=-1), 1e-12)[:, np.newaxis]
+
+        cos_angles = np.einsum(
+            'vcd,vd->vc',
+            directions,
+            np.repeat(axes, self._vertex_counts, axis=0)
+        )
+        # An obstacle touching the glazing is never culled.
+        cos_angles[lengths <= 1e-12] = -1.0
+        cos_half_angles = np.minimum.reduceat(cos_angles.min(axis=1), starts)
+
+        self._axes: np.ndarray = axes
+        # A cone of 90° or wider is not convex, its obstacle is never culled.
+        self._cos_half_angles: np.ndarray = np.where(cos_half_angles > 0, cos_half_angles, -1.0)
+        self._cell_offsets: Union[np.ndarray, None] = None
+        self._cell_indices: Union[np.ndarray, None] = None
+
+    def __len__(self) -> int:
+        return len(self._vertex_counts)
+
+    @property
+    def vertices(self) -> np.ndarray:
+        """
+        The (n, 4) array of the homogeneous coordinates of the vertices
+        of all the obstacles, in the order of the obstacles.
+        """
+        return self._vertices
+
+    def get_candidate_indices(self, solar_azimuth: float, solar_elevation: float) -> np.ndarray:
+        """
+        Gets the obstacles which may shade the glazing from the specified sun position.
+
+        Args:
+            solar_azimuth:
+                The sun azimuth.
+            solar_elevation:
+                The sun elevation.
+
+        Returns:
+            The indices of the obstacles in increasing order.
+        """
+        if solar_elevation < 0:
+            # the index covers the sun above the horizon only
+            indices = np.arange(len(self))
+        else:
+            if self._cell_offsets is None:
+                self._build_index()
+            cell = int(solar_azimuth % 360 // INDEX_CELL_SIZE) * _ELEVATION_CELL_COUNT + \
+                min(int(solar_elevation // INDEX_CELL_SIZE), _ELEVATION_CELL_COUNT - 1)
+            indices = self._cell_indices[self._cell_offsets[cell]:self._cell_offsets[cell + 1]]
+            if indices.size == 0:
+                return indices
+
+        sun_direction = get_sun_directions(solar_azimuth, solar_elevation)
+        return indices[
+            np.matmul(self._axes[indices], sun_direction) >= self._cos_half_angles[indices]
+        ]
+
+    def get_shadow_casters(
+        self,
+        solar_azimuth: float,
+        solar_elevation: float,
+        sun_view_matrix: np.ndarray
+    ) -> List[ConvexPolygon]:
+        """
+        Gets the obstacles which may shade the glazing from the specified sun position
+        as seen from the sun.
+
+        Args:
+            solar_azimuth:
+                The sun azimuth.
+            solar_elevation:
+                The sun elevation.
+            sun_view_matrix:
+                The matrix which transforms the 3D space of the door and window rectangles
+                as it would be seen from the sun position
+                (see `DoorAndWindowRectanglesSeenFromSunTransformer`).
+
+        Returns:
+            The convex hulls of the obstacles projected to the (x, y) plane,
+            in counter-clockwise order.
+        """
+        indices = self.get_candidate_indices(solar_azimuth, solar_elevation)
+        if indices.size == 0:
+            return []
+
+        # Projecting the vertices of all the candidates at once.
+        is_candidate = np.zeros(len(self), dtype=bool)
+        is_candidate[indices] = True
+        projected_vertices = np.matmul(
+            self._vertices[np.repeat(is_candidate, self._vertex_counts)],
+            sun_view_matrix[:2].T
+        ).tolist()
+
+        shadow_casters: List[ConvexPolygon] = []
+        start = 0
+        for count in self._vertex_counts[indices].tolist():
+            shadow_caster = get_convex_hull(
+                [tuple(vertex) for vertex in projected_vertices[start:start + count]])
+            if shadow_caster:
+                shadow_casters.append(shadow_caster)
+            start += count
+        return shadow_casters
+
+    def _build_index(self) -> None:
+        # The cells by azimuth, then by elevation. A cell is bounded by the cone
+        # around its center direction which reaches its farthest corner.
+        (azimuths, elevations) = np.meshgrid(
+            np.arange(_AZIMUTH_CELL_COUNT) * INDEX_CELL_SIZE,
+            np.arange(_ELEVATION_CELL_COUNT) * INDEX_CELL_SIZE,
+            indexing='ij'
+        )
+        azimuths = azimuths.ravel()
+        elevations = elevations.ravel()
+        centers = get_sun_directions(
+            azimuths + INDEX_CELL_SIZE / 2, elevations + INDEX_CELL_SIZE / 2)
+        cell_radii = np.max([
+            np.arccos(np.clip(np.sum(
+                centers * get_sun_directions(
+                    azimuths + azimuth_offset, elevations + elevation_offset),
+                axis=-1
+            ), -1.0, 1.0))
+            for azimuth_offset in (0, INDEX_CELL_SIZE)
+            for elevation_offset in (0, INDEX_CELL_SIZE)
+        ], axis=0)
+
+        # The cones overlap if the angle between their axes is at most
+        # the sum of their half angles.
+        half_angles = np.arccos(self._cos_half_angles)
+        is_overlapping = np.matmul(centers, self._axes.T) >= np.cos(np.minimum(
+            cell_radii[:, np.newaxis] + half_angles[np.newaxis, :] + 1e-9,
+            np.pi
+        ))
+
+        self._cell_offsets = np.concatenate(([0], np.cumsum(is_overlapping.sum(axis=1))))
+        self._cell_indices = np.nonzero(is_overlapping)[1]
@@ -0,0 +1,33 @@
+""" The module contains the DoorAndWindowOutputThresholds class. """
+from typing import NamedTuple
+
+
+class DoorAndWindowOutputThresholds(NamedTuple):
+    """
+    The minimum changes of the calculated door and window properties
+    which are published by an update.
+
+    A smaller change is kept back, so it does not fire change events
+    and does not write a new state. Becoming known or unknown, the sun getting
+    in front of or behind the door and window and the glazing getting fully shaded
+    are always published. The default zero thresholds publish every change.
+
+    Attributes:
+        horizon_elevation_at_sun_azimuth:
+            The dead-band of the horizon elevation towards the sun in degrees.
+        angle_of_incidence:
+            The dead-band of the angle of incidence in degrees.
+        sunny_glazing_area:
+            The dead-band of the sunny glazing area in mm².
+        sunny_glazing_area_percentage:
+            The dead-band of the sunny glazing area percentage in percentage points.
+        glazing_has_direct_sunlight_hysteresis:
+            The sunny glazing area in mm² above the direct sunlight threshold
+            required to switch the direct sunlight on. It is switched off
+            only when the sunny glazing area falls below the threshold itself.
+    """
+    horizon_elevation_at_sun_azimuth: float = 0.0
+    angle_of_incidence: float = 0.0
+    sunny_glazing_area: float = 0.0
+    sunny_glazing_area_percentage: float = 0.0
+    glazing_has_direct_sunlight_hysteresis: float = 0.0
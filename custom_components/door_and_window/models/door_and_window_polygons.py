@@ -1,5 +1,6 @@
 """ Module contains DoorAndWindowPolygons class. """
-from typing import Final
+from typing import Callable, Final, Tuple, Union
+
 from shapely.geometry import Polygon
 
 # pylint: disable=too-many-instance-attributes, too-few-public-methods
@@ -7,6 +8,8 @@ class DoorAndWindowPolygons:
     """
     Represents a door and window parts as polygons in 2D space.
 
+    The inside polygons could be created on demand when any of them is accessed.
+
     Attributes:
         glazing:
             The polygon represents the glazing.
@@ -38,11 +41,15 @@ class DoorAndWindowPolygons:
         outside_right_jamb_wall: Polygon,
         outside_head_jamb_wall: Polygon,
         outside_stool: Polygon,
-        inside_left_jamb_wall: Polygon,
-        inside_right_jamb_wall: Polygon,
-        inside_head_jamb_wall: Polygon,
-        inside_stool: Polygon,
-        awning: Polygon
+        inside_left_jamb_wall: Union[Polygon, None],
+        inside_right_jamb_wall: Union[Polygon, None],
+        inside_head_jamb_wall: Union[Polygon, None],
+        inside_stool: Union[Polygon, None],
+        awning: Polygon,
+        *,
+        get_inside_polygons: Union[
+            Callable[[], Tuple[Polygon, Polygon, Polygon, Polygon]], None
+        ] = None
     ):
         """
         Initialize a new instance of DoorAndWindowRectangles class.
@@ -68,14 +75,48 @@ class DoorAndWindowPolygons:
                 The polygon represents inside stool.
             awning:
                 The polygon represents the awning. If no awning then polygon is empty.
+            get_inside_polygons:
+                The function which returns the inside left, right and head jamb wall and
+                the inside stool polygons. If set, the inside polygon arguments are ignored
+                and the function is called only once when any of them is accessed.
         """
         self.glazing: Final[Polygon] = glazing
         self.outside_left_jamb_wall: Final[Polygon] = outside_left_jamb_wall
         self.outside_right_jamb_wall: Final[Polygon] = outside_right_jamb_wall
         self.outside_head_jamb_wall: Final[Polygon] = outside_head_jamb_wall
         self.outside_stool: Final[Polygon] = outside_stool
-        self.inside_left_jamb_wall: Final[Polygon] = inside_left_jamb_wall
-        self.inside_right_jamb_wall: Final[Polygon] = inside_right_jamb_wall
-        self.inside_head_jamb_wall: Final[Polygon] = inside_head_jamb_wall
-        self.inside_stool: Final[Polygon] = inside_stool
         self.awning: Final[Polygon] = awning
+        self._inside_polygons: Union[Tuple[Polygon, Polygon, Polygon, Polygon], None] = \
+            None if get_inside_polygons else (
+                inside_left_jamb_wall,
+                inside_right_jamb_wall,
+                inside_head_jamb_wall,
+                inside_stool
+            )
+        self._get_inside_polygons = get_inside_polygons
+
+    def _get_inside_polygon(self, index: int) -> Polygon:
+        if self._inside_polygons is None:
+            self._inside_polygons = self._get_inside_polygons()
+            self._get_inside_polygons = None
+        return self._inside_polygons[index]
+
+    @property
+    def inside_left_jamb_wall(self) -> Polygon:
+        """ The polygon represents the left inside jamb wall. """
+        return self._get_inside_polygon(0)
+
+    @property
+    def inside_right_jamb_wall(self) -> Polygon:
+        """ The polygon represents the right inside jamb wall. """
+        return self._get_inside_polygon(1)
+
+    @property
+    def inside_head_jamb_wall(self) -> Polygon:
+        """ The polygon represents the head inside jamb wall. """
+        return self._get_inside_polygon(2)
+
+    @property
+    def inside_stool(self) -> Polygon:
+        """ The polygon represents inside stool. """
+        return self._get_inside_polygon(3)
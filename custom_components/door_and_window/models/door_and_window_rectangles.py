@@ -1,15 +1,50 @@
 """ The module contains DoorAndWindowRectangles class. """
-from typing import Final, Union
+from __future__ import annotations
+
+from typing import Callable, Union
 
 import numpy as np
 
+from ..models.door_and_window_obstacles import DoorAndWindowObstacles
 from ..models.quadrilateral import Quadrilateral
 
+# The indices of the rectangles in the corners array.
+_GLAZING = 0
+_OUTSIDE_LEFT_JAMB_WALL = 1
+_OUTSIDE_RIGHT_JAMB_WALL = 2
+_OUTSIDE_HEAD_JAMB_WALL = 3
+_OUTSIDE_STOOL = 4
+_AWNING = 5
+
+# The indices of the rectangles in the inside corners array.
+_INSIDE_LEFT_JAMB_WALL = 0
+_INSIDE_RIGHT_JAMB_WALL = 1
+_INSIDE_HEAD_JAMB_WALL = 2
+_INSIDE_STOOL = 3
+
+
+def _stack_quadrilaterals(*quadrilaterals: Union[Quadrilateral, None]) -> np.ndarray:
+    corners = np.zeros((len(quadrilaterals), 4, 4))
+    for index, quadrilateral in enumerate(quadrilaterals):
+        if quadrilateral is not None:
+            corners[index] = quadrilateral.corners
+    return corners
+
+
 # pylint: disable=too-many-instance-attributes, too-few-public-methods
 class DoorAndWindowRectangles:
     """
     Represents a door and window parts as rectangles in the 3D space.
 
+    The corners of the glazing, the outside jamb walls, the outside stool and the awning
+    are stored in a single (6, 4, 4) array of homogeneous coordinates. These are the parts
+    required for the sunny glazing area calculation.
+
+    The corners of the inside jamb walls and the inside stool are stored in
+    a separate (4, 4, 4) array which is calculated only when any of them is accessed.
+
+    The attributes are views of these arrays.
+
     Attributes:
         glazing:
             The rectangle represents the glazing.
@@ -29,7 +64,20 @@ class DoorAndWindowRectangles:
             The rectangle represents the head inside jamb wall.
         inside_stool:
             The rectangle represents inside stool.
+        awning:
+            The rectangle represents the awning. None if no awning defined.
+        obstacles:
+            The obstacles around the door and window. None if no obstacles defined.
     """
+
+    __slots__ = (
+        '_corners',
+        '_has_awning',
+        '_inside_corners',
+        '_get_inside_corners',
+        '_obstacles'
+    )
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -69,22 +117,156 @@ class DoorAndWindowRectangles:
             awning:
                 The rectangle represents the awning. None if no awning defined.
         """
-        self.glazing: Final[Quadrilateral] = glazing
-        self.outside_left_jamb_wall: Final[Quadrilateral] = outside_left_jamb_wall
-        self.outside_right_jamb_wall: Final[Quadrilateral] = outside_right_jamb_wall
-        self.outside_head_jamb_wall: Final[Quadrilateral] = outside_head_jamb_wall
-        self.outside_stool: Final[Quadrilateral] = outside_stool
-        self.inside_left_jamb_wall: Final[Quadrilateral] = inside_left_jamb_wall
-        self.inside_right_jamb_wall: Final[Quadrilateral] = inside_right_jamb_wall
-        self.inside_head_jamb_wall: Final[Quadrilateral] = inside_head_jamb_wall
-        self.inside_stool: Final[Quadrilateral] = inside_stool
-        self.awning: Final[Union[Quadrilateral, None]] = awning
+        self._corners: np.ndarray = _stack_quadrilaterals(
+            glazing,
+            outside_left_jamb_wall,
+            outside_right_jamb_wall,
+            outside_head_jamb_wall,
+            outside_stool,
+            awning
+        )
+        self._has_awning: bool = awning is not None
+        self._inside_corners: Union[np.ndarray, None] = _stack_quadrilaterals(
+            inside_left_jamb_wall,
+            inside_right_jamb_wall,
+            inside_head_jamb_wall,
+            inside_stool
+        )
+        self._get_inside_corners: Union[Callable[[], np.ndarray], None] = None
+        self._obstacles: Union[DoorAndWindowObstacles, None] = None
+
+    @classmethod
+    def from_corners(
+        cls,
+        corners: np.ndarray,
+        has_awning: bool,
+        get_inside_corners: Callable[[], np.ndarray],
+        obstacles: Union[DoorAndWindowObstacles, None] = None
+    ) -> DoorAndWindowRectangles:
+        """
+        Creates a `DoorAndWindowRectangles` instance backed by the specified array.
+        The array is not copied.
+
+        Args:
+            corners:
+                The (6, 4, 4) array of the homogeneous corner coordinates of the glazing,
+                the outside left, right and head jamb walls, the outside stool and the awning.
+            has_awning:
+                The value indicates whether the last rectangle represents an awning.
+            get_inside_corners:
+                The function which returns the (4, 4, 4) array of the homogeneous corner
+                coordinates of the inside left, right and head jamb walls and the inside stool.
+                It is called only once when any of the inside rectangles is accessed.
+            obstacles:
+                The obstacles around the door and window in the same 3D space.
+                None if no obstacles defined.
+
+        Returns:
+            The door and window rectangles backed by the specified array.
+        """
+        door_and_window_rectangles = cls.__new__(cls)
+        # pylint: disable=protected-access
+        door_and_window_rectangles._corners = corners
+        door_and_window_rectangles._has_awning = has_awning
+        door_and_window_rectangles._inside_corners = None
+        door_and_window_rectangles._get_inside_corners = get_inside_corners
+        door_and_window_rectangles._obstacles = obstacles
+        return door_and_window_rectangles
+
+    @property
+    def corners(self) -> np.ndarray:
+        """
+        The (6, 4, 4) array of the homogeneous corner coordinates of the glazing,
+        the outside left, right and head jamb walls, the outside stool and the awning.
+        """
+        return self._corners
+
+    @property
+    def inside_corners(self) -> np.ndarray:
+        """
+        The (4, 4, 4) array of the homogeneous corner coordinates of the inside
+        left, right and head jamb walls and the inside stool.
+        """
+        if self._inside_corners is None:
+            self._inside_corners = self._get_inside_corners()
+            self._get_inside_corners = None
+        return self._inside_corners
+
+    @property
+    def has_awning(self) -> bool:
+        """ The value indicates whether the awning rectangle is defined. """
+        return self._has_awning
+
+    @property
+    def obstacles(self) -> Union[DoorAndWindowObstacles, None]:
+        """
+        The obstacles around the door and window. None if no obstacles defined.
+        These are not transformed by `apply_matrix`, they are projected
+        only when they may shade the glazing (see `DoorAndWindowObstacles`).
+        """
+        return self._obstacles
+
+    @property
+    def glazing(self) -> Quadrilateral:
+        """ The rectangle represents the glazing. """
+        return Quadrilateral.from_homogeneous_corners(self._corners[_GLAZING])
+
+    @property
+    def outside_left_jamb_wall(self) -> Quadrilateral:
+        """ The rectangle represents the left outside jamb wall. """
+        return Quadrilateral.from_homogeneous_corners(self._corners[_OUTSIDE_LEFT_JAMB_WALL])
+
+    @property
+    def outside_right_jamb_wall(self) -> Quadrilateral:
+        """ The rectangle represents the right outside jamb wall. """
+        return Quadrilateral.from_homogeneous_corners(self._corners[_OUTSIDE_RIGHT_JAMB_WALL])
+
+    @property
+    def outside_head_jamb_wall(self) -> Quadrilateral:
+        """ The rectangle represents the head outside jamb wall. """
+        return Quadrilateral.from_homogeneous_corners(self._corners[_OUTSIDE_HEAD_JAMB_WALL])
+
+    @property
+    def outside_stool(self) -> Quadrilateral:
+        """ The rectangle represents outside stool. """
+        return Quadrilateral.from_homogeneous_corners(self._corners[_OUTSIDE_STOOL])
+
+    @property
+    def inside_left_jamb_wall(self) -> Quadrilateral:
+        """ The rectangle represents the left inside jamb wall. """
+        return Quadrilateral.from_homogeneous_corners(self.inside_corners[_INSIDE_LEFT_JAMB_WALL])
+
+    @property
+    def inside_right_jamb_wall(self) -> Quadrilateral:
+        """ The rectangle represents the right inside jamb wall. """
+        return Quadrilateral.from_homogeneous_corners(self.inside_corners[_INSIDE_RIGHT_JAMB_WALL])
+
+    @property
+    def inside_head_jamb_wall(self) -> Quadrilateral:
+        """ The rectangle represents the head inside jamb wall. """
+        return Quadrilateral.from_homogeneous_corners(self.inside_corners[_INSIDE_HEAD_JAMB_WALL])
+
+    @property
+    def inside_stool(self) -> Quadrilateral:
+        """ The rectangle represents inside stool. """
+        return Quadrilateral.from_homogeneous_corners(self.inside_corners[_INSIDE_STOOL])
+
+    @property
+    def awning(self) -> Union[Quadrilateral, None]:
+        """ The rectangle represents the awning. None if no awning defined. """
+        if not self._has_awning:
+            return None
+        return Quadrilateral.from_homogeneous_corners(self._corners[_AWNING])
 
     def apply_matrix(self, transformation_matrix: np.ndarray):
         """
         Applies the specified transformation matrix to all the rectangles
         and returns a new instance of DoorAndWindowRectangles with these transformed faces.
 
+        The corners of the glazing, the outside parts and the awning are transformed
+        by a single matrix multiplication. The inside parts are transformed only
+        when any of them is accessed in the returned instance.
+
         Args:
             transformation_matrix
                 The 4x4 transformation matrix to apply to rectangles.
@@ -92,16 +274,38 @@ class DoorAndWindowRectangles:
         Returns:
             The transformed door and window rectangles.
         """
-        return DoorAndWindowRectangles(
-            glazing=self.glazing.apply_matrix(transformation_matrix),
-            outside_left_jamb_wall=self.outside_left_jamb_wall.apply_matrix(transformation_matrix),
-            outside_right_jamb_wall=self.outside_right_jamb_wall.apply_matrix(
-                transformation_matrix),
-            outside_head_jamb_wall=self.outside_head_jamb_wall.apply_matrix(transformation_matrix),
-            outside_stool=self.outside_stool.apply_matrix(transformation_matrix),
-            inside_left_jamb_wall=self.inside_left_jamb_wall.apply_matrix(transformation_matrix),
-            inside_right_jamb_wall=self.inside_right_jamb_wall.apply_matrix(transformation_matrix),
-            inside_head_jamb_wall=self.inside_head_jamb_wall.apply_matrix(transformation_matrix),
-            inside_stool=self.inside_stool.apply_matrix(transformation_matrix),
-            awning=None if self.awning is None else self.awning.apply_matrix(transformation_matrix)
+        return DoorAndWindowRectangles.from_corners(
+            np.matmul(self._corners, transformation_matrix.T),
+            self._has_awning,
+            lambda: np.matmul(self.inside_corners, transformation_matrix.T)
         )
+
+    def apply_matrix_into(
+        self,
+        transformation_matrix: np.ndarray,
+        out: DoorAndWindowRectangles
+    ) -> DoorAndWindowRectangles:
+        """
+        Applies the specified transformation matrix to all the rectangles
+        and writes the result into the specified instance's backing array
+        without allocating a new one.
+
+        The inside parts of `out` are transformed only when any of them is accessed.
+
+        Args:
+            transformation_matrix
+                The 4x4 transformation matrix to apply to rectangles.
+            out
+                The door and window rectangles to overwrite.
+                It must not be this instance.
+
+        Returns:
+            The `out` door and window rectangles.
+        """
+        # pylint: disable=protected-access
+        np.matmul(self._corners, transformation_matrix.T, out=out._corners)
+        out._has_awning = self._has_awning
+        out._inside_corners = None
+        out._get_inside_corners = \
+            lambda: np.matmul(self.inside_corners, transformation_matrix.T)
+        return out
@@ -0,0 +1,105 @@
+""" The module contains the DoorAndWindowShadingTable class. """
+import math
+from typing import Final, Union
+
+import numpy as np
+
+from .door_and_window_local_geometry import DoorAndWindowLocalGeometry
+
+
+# pylint: disable=too-few-public-methods
+class DoorAndWindowShadingTable:
+    """
+    Contains the precomputed sunny glazing area of a door and window
+    over a grid of sun positions in front of it.
+
+    The rows of the grid are the sun azimuths relative to the door and window azimuth,
+    the columns are the sun elevations from 0 to 90 degrees. The horizon is not
+    taken into account, it must be checked separately.
+
+    Attributes:
+        local_geometry:
+            The local geometry the table was calculated for.
+        first_azimuth:
+            The first relative azimuth of the grid.
+        resolution:
+            The distance of the grid points in degrees.
+        sunny_glazing_areas:
+            The (azimuths, elevations) array of the sunny glazing areas at the grid points.
+        error:
+            The largest interpolation error measured at the middle of the grid cells,
+            in percentage of the glazing area.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        local_geometry: DoorAndWindowLocalGeometry,
+        first_azimuth: float,
+        resolution: float,
+        sunny_glazing_areas: np.ndarray,
+        error: float
+    ):
+        """
+        Initialize a new instance of DoorAndWindowShadingTable class.
+
+        Args:
+            local_geometry:
+                The local geometry the table was calculated for.
+            first_azimuth:
+                The first relative azimuth of the grid.
+            resolution:
+                The distance of the grid points in degrees.
+            sunny_glazing_areas:
+                The (azimuths, elevations) array of the sunny glazing areas at the grid points.
+            error:
+                The largest interpolation error measured at the middle of the grid cells,
+                in percentage of the glazing area.
+        """
+        self.local_geometry: Final[DoorAndWindowLocalGeometry] = local_geometry
+        self.first_azimuth: Final[float] = first_azimuth
+        self.resolution: Final[float] = resolution
+        self.sunny_glazing_areas: Final[np.ndarray] = sunny_glazing_areas
+        self.error: Final[float] = error
+
+    def get_sunny_glazing_area(
+        self,
+        relative_azimuth: float,
+        elevation: float
+    ) -> Union[float, None]:
+        """
+        Gets the sunny glazing area at the specified sun position
+        by bilinear interpolation of the grid.
+
+        Args:
+            relative_azimuth:
+                The sun azimuth relative to the door and window azimuth (-180 to 180).
+            elevation:
+                The sun elevation.
+
+        Returns:
+            The interpolated sunny glazing area or None
+            if the sun position is outside of the grid.
+        """
+        (azimuth_count, elevation_count) = self.sunny_glazing_areas.shape
+        azimuth_position = (relative_azimuth - self.first_azimuth) / self.resolution
+        elevation_position = elevation / self.resolution
+        if not (0 <= azimuth_position <= azimuth_count - 1
+                and 0 <= elevation_position <= elevation_count - 1):
+            return None
+
+        azimuth_index = min(math.floor(azimuth_position), azimuth_count - 2)
+        elevation_index = min(math.floor(elevation_position), elevation_count - 2)
+        azimuth_weight = azimuth_position - azimuth_index
+        elevation_weight = elevation_position - elevation_index
+
+        ((lower_lower, lower_upper), (upper_lower, upper_upper)) = self.sunny_glazing_areas[
+            azimuth_index:azimuth_index + 2,
+            elevation_index:elevation_index + 2
+        ].tolist()
+
+        return \
+            (lower_lower * (1 - elevation_weight) + lower_upper * elevation_weight) * \
+            (1 - azimuth_weight) + \
+            (upper_lower * (1 - elevation_weight) + upper_upper * elevation_weight) * \
+            azimuth_weight
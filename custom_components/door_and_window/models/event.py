@@ -1,36 +1,109 @@
 """ The module of event handling. """
 
 
-from typing import Callable
+import inspect
+import weakref
+from typing import Callable, Dict, Tuple, Union
+
+Listener = Union[Callable, weakref.ref]
+
+
+def _create_weak_reference(
+    listener: Callable,
+    callback: Union[Callable[[weakref.ref], None], None] = None
+) -> weakref.ref:
+    # A bound method is created on every attribute access,
+    # so its instance and function have to be referenced instead.
+    if inspect.ismethod(listener):
+        return weakref.WeakMethod(listener, callback)
+    return weakref.ref(listener, callback)
+
+
+# pylint: disable=too-few-public-methods
+class _WeakListener:
+    """ Calls the listener referenced by the specified weak reference if it is alive. """
+
+    __slots__ = ('_reference',)
+
+    def __init__(self, reference: weakref.ref):
+        self._reference = reference
+
+    def __call__(self, *args, **kwargs):
+        listener = self._reference()
+        if listener is not None:
+            listener(*args, **kwargs)
 
 
 class Event:
-    """ Represents an event. """
+    """
+    Represents an event.
+
+    The listeners are kept in an insertion ordered dictionary, so adding and removing
+    a listener takes constant time. A listener is registered only once, adding it
+    again does not change anything.
+
+    The listeners can be added or removed while the event is being invoked.
+    The added listeners are called from the next invocation,
+    the removed ones are not called anymore.
+    """
 
     def __init__(self):
         """ Initialize a new instance of `Event` class."""
-        self.__eventhandlers = []
+        # The functions to call by the listeners or by the weak references
+        # to the weak listeners.
+        self.__eventhandlers: Dict[Listener, Callable] = {}
+        # The listeners to call, it is rebuilt only after the listeners have changed.
+        self.__snapshot: Union[Tuple[Tuple[Listener, Callable], ...], None] = None
 
-    def add_listener(self, listener: Callable):
+    def add_listener(self, listener: Callable, weak: bool = False):
         """
         Adds an event listener to the event.
         The event listener will be called whenever the event invoked.
+
+        Args:
+            listener:
+                The function to call.
+            weak:
+                The value indicates whether the event keeps only a weak reference
+                to the listener. A weak listener is removed when it is garbage collected,
+                so a bound method does not keep its instance alive.
         """
-        self.__eventhandlers.append(listener)
+        if weak:
+            reference = _create_weak_reference(listener, self.__remove_dead_listener)
+            self.__eventhandlers.setdefault(reference, _WeakListener(reference))
+        else:
+            self.__eventhandlers.setdefault(listener, listener)
+        self.__snapshot = None
         return self
 
     def remove_listener(self, handler: Callable):
         """
         Removes an event listener from the event.
+        Removing a listener which is not added does nothing.
         """
-        self.__eventhandlers.remove(handler)
+        if handler not in self.__eventhandlers:
+            try:
+                # A weak reference is equal to another one referring to the same listener.
+                handler = _create_weak_reference(handler)
+            except TypeError:
+                # the handler cannot be weakly referenced, so it is not a weak listener
+                return self
+        self.__eventhandlers.pop(handler, None)
+        self.__snapshot = None
         return self
 
     def __call__(self, *args, **kwargs):
         """
         Invokes the event and calls all the added event listeners.
         """
-        for eventhandler in self.__eventhandlers:
+        snapshot = self.__snapshot
+        if snapshot is None:
+            snapshot = self.__snapshot = tuple(self.__eventhandlers.items())
+
+        for (key, eventhandler) in snapshot:
+            if self.__snapshot is not snapshot and key not in self.__eventhandlers:
+                # removed by a previous listener
+                continue
             eventhandler(*args, **kwargs)
 
     def clear_event_listeners(self):
@@ -38,3 +111,8 @@ class Event:
         Removes all event listeneres.
         """
         self.__eventhandlers.clear()
+        self.__snapshot = None
+
+    def __remove_dead_listener(self, reference: weakref.ref) -> None:
+        self.__eventhandlers.pop(reference, None)
+        self.__snapshot = None
@@ -1,4 +1,5 @@
 """ Module for EventHandler class. """
+from functools import partial
 from typing import Callable
 from .event import Event
 
@@ -7,23 +8,22 @@ class EventHandler:
     def __init__(self):
         self._event = Event()
 
-    def listen(self, callback: Callable[..., None]) -> Callable[[], None]:
+    def listen(self, callback: Callable[..., None], weak: bool = False) -> Callable[[], None]:
         """
         Adds a listener to the event.
 
         Args:
             callback:
                 The function to call whenever the event happens.
+            weak:
+                The value indicates whether only a weak reference is kept to the callback,
+                so it stops listening when the callback is garbage collected.
 
         Returns:
-            The function to stop listening to the event.
+            The function to stop listening to the event. Calling it again does nothing.
         """
-        self._event.add_listener(callback)
-
-        def untrack():
-            self._event.remove_listener(callback)
-
-        return untrack
+        self._event.add_listener(callback, weak)
+        return partial(self._event.remove_listener, callback)
 
     def fire(self, *args, **kwargs) -> None:
         """ Fires the event with the specified arguments. """
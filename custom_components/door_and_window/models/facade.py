@@ -0,0 +1,118 @@
+""" The module contains the Facade class. """
+from typing import Sequence, Tuple, Union
+
+from .horizon_profile import HorizonProfile, normalize_horizon_profile
+from .observable_property import ObservableProperty
+from .obstacle import Obstacle
+
+
+class Facade():
+    """
+    Represents a facade of a building, which holds the horizon profile and the obstacles
+    shared by the door and windows on it.
+
+    The door and windows on a facade face the same direction, so the horizon profile
+    is measured from the left to the right of the facade like the horizon profile
+    of a door and window. It is compiled once for all the door and windows, and
+    the horizon elevation towards the sun is calculated once for a sun position.
+
+    The obstacles are given in the coordinate system of the facade: the origin is
+    the outside wall face on the Z axis, the facade origin (e.g. its left corner
+    as seen from outside) on the X axis and the ground level on the Y axis.
+    The axes are the ones of the door and window (see `Obstacle`). A door and window
+    is placed on the facade by its `facade_position`.
+
+    Attributes:
+        name:
+            The name of the facade.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        horizon_profile: Union[Sequence[float], HorizonProfile, None] = None,
+        obstacles: Sequence[Obstacle] = ()
+    ):
+        """
+        Initialize a new instance of `Facade` class.
+
+        Args:
+            name:
+                The name of the facade.
+            horizon_profile:
+                The elevation values of horizon as seen from the facade,
+                or the compiled horizon profile, e.g. an imported one.
+            obstacles:
+                The obstacles outside the facade which may shade its door and windows.
+        """
+        self.name = name
+        self._horizon_profile = normalize_horizon_profile(horizon_profile)
+        self._obstacles: Tuple[Obstacle, ...] = tuple(obstacles)
+        self._compiled_horizon_profile: Union[HorizonProfile, None] = None
+        # The relative azimuth of the latest horizon elevation lookup and its result.
+        self._horizon_elevation_lookup: Union[Tuple[float, Union[float, None]], None] = None
+
+    def __repr__(self) -> str:
+        return f'Facade({self.name!r})'
+
+    def _invalidate_horizon_profile(self, parameter: str) -> None:
+        # pylint: disable=unused-argument
+        self._compiled_horizon_profile = None
+        self._horizon_elevation_lookup = None
+
+    horizon_profile = ObservableProperty(
+        """
+        The elevation of horizon as seen from the facade. The values are
+        the measured horizon elevation from left to right in equal distances.
+        It is either the list of the values or the compiled `HorizonProfile`.
+        """,
+        _invalidate_horizon_profile,
+        normalize=normalize_horizon_profile
+    )
+    on_horizon_profile_changed = horizon_profile.listener_method()
+
+    obstacles = ObservableProperty(
+        """
+        The obstacles outside the facade which may shade its door and windows,
+        in the coordinate system of the facade.
+        """,
+        normalize=lambda value: tuple(value or ())
+    )
+    on_obstacles_changed = obstacles.listener_method()
+
+    @property
+    def compiled_horizon_profile(self) -> HorizonProfile:
+        """
+        The horizon profile compiled for the horizon elevation lookups,
+        shared by the door and windows on the facade.
+        """
+        if self._compiled_horizon_profile is None:
+            horizon_profile = self.horizon_profile
+            self._compiled_horizon_profile = horizon_profile \
+                if isinstance(horizon_profile, HorizonProfile) \
+                else HorizonProfile(horizon_profile)
+        return self._compiled_horizon_profile
+
+    def get_horizon_elevation_at(self, azimuth: float) -> Union[float, None]:
+        """
+        Gets the horizon elevation at the specified azimuth rounded to 2 decimals.
+
+        The latest lookup is kept, so the door and windows on the facade
+        updated for the same sun position interpolate the horizon profile only once.
+
+        Args:
+            azimuth:
+                The azimuth relative to the facing of the facade between -180 and +180.
+
+        Returns:
+            The horizon elevation, None if the azimuth is behind the facade.
+        """
+        lookup = self._horizon_elevation_lookup
+        if lookup is not None and lookup[0] == azimuth:
+            return lookup[1]
+
+        horizon_elevation = self.compiled_horizon_profile.elevation_at(azimuth)
+        if horizon_elevation is not None:
+            horizon_elevation = round(horizon_elevation, 2)
+        self._horizon_elevation_lookup = (azimuth, horizon_elevation)
+        return horizon_elevation
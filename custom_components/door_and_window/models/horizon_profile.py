@@ -0,0 +1,167 @@
+""" The module contains the HorizonProfile class. """
+from typing import List, Sequence, Union
+
+import numpy as np
+
+
+def normalize_horizon_profile(
+    horizon_profile: Union[Sequence[float], 'HorizonProfile', None]
+) -> Union[List[float], 'HorizonProfile']:
+    """
+    Normalizes a set horizon profile, so the same profile is equal in any form.
+
+    Args:
+        horizon_profile:
+            The elevation values of horizon, the compiled horizon profile or None.
+
+    Returns:
+        The compiled horizon profile as it is, the list of the elevation values otherwise.
+        A missing horizon profile is the flat horizon.
+    """
+    if isinstance(horizon_profile, HorizonProfile):
+        return horizon_profile
+    return list(horizon_profile or [0, 0])
+
+
+class HorizonProfile:
+    """
+    The horizon profile of a door and window compiled for the horizon elevation lookups.
+
+    The elevations are measured from the left to the right of the door and window
+    in equal distances, so the first one belongs to the azimuth -90 and the last one
+    to the azimuth +90 relative to the facing of the door and window.
+    The horizon elevation between them is linearly interpolated.
+
+    A high resolution horizon profile (e.g. an imported one) is kept
+    in a `float32` array, a measured one in a `float` array.
+    """
+
+    def __init__(self, elevations: Union[Sequence[float], np.ndarray]):
+        """
+        Initialize a new instance of `HorizonProfile` class.
+
+        Args:
+            elevations:
+                The horizon elevations measured from the left to the right
+                of the door and window. There are at least two of them.
+                A `float32` array is kept as it is.
+        """
+        if len(elevations) < 2:
+            raise ValueError("The horizon profile must have at least two elevations.")
+
+        if isinstance(elevations, np.ndarray) and elevations.dtype == np.float32:
+            self._elevations = elevations.copy() if elevations.flags.writeable else elevations
+        else:
+            self._elevations = np.array(elevations, dtype=float)
+        self._elevations.setflags(write=False)
+        self._last_index = len(self._elevations) - 1
+        self._resolution = 180 / self._last_index
+        self._min_elevation = float(self._elevations.min())
+        # The azimuths of the measurements relative to the facing of the door and window.
+        self._azimuths: Union[np.ndarray, None] = None
+
+    @classmethod
+    def from_horizon(cls, horizon: np.ndarray, azimuth: float) -> 'HorizonProfile':
+        """
+        Creates the horizon profile of a door and window from the whole horizon around.
+
+        The horizon elevations in front of the door and window are taken
+        with the resolution of the whole horizon. They are interpolated only
+        if the door and window azimuth is between two measurements.
+
+        Args:
+            horizon:
+                The horizon elevations in equal distances around,
+                starting from north (0) clockwise.
+            azimuth:
+                The azimuth of the door and window.
+
+        Returns:
+            The horizon profile of the door and window.
+        """
+        resolution = 360 / len(horizon)
+        count = max(round(180 / resolution), 1) + 1
+        # the positions of the profile measurements in the horizon array
+        step = 180 / (count - 1) / resolution
+        positions = (azimuth - 90) / resolution + np.arange(count) * step
+
+        indices = np.round(positions)
+        if np.allclose(positions, indices, rtol=0, atol=1e-6):
+            elevations = horizon[indices.astype(int) % len(horizon)]
+        else:
+            elevations = np.interp(
+                positions,
+                np.arange(len(horizon)),
+                horizon,
+                period=len(horizon)
+            )
+        return cls(np.asarray(elevations, dtype=np.float32))
+
+    def __len__(self) -> int:
+        return len(self._elevations)
+
+    def __repr__(self) -> str:
+        return f'HorizonProfile({len(self)} elevations ' \
+            f'from {self._min_elevation:g} to {self._elevations.max():g})'
+
+    @property
+    def elevations(self) -> np.ndarray:
+        """ The read-only array of the measured horizon elevations. """
+        return self._elevations
+
+    @property
+    def resolution(self) -> float:
+        """ The degrees between the neighbouring measurements. """
+        return self._resolution
+
+    @property
+    def min_elevation(self) -> float:
+        """
+        The lowest horizon elevation. The horizon hides the sun below it
+        wherever the sun is in front of the door and window.
+        """
+        return self._min_elevation
+
+    def elevation_at(
+        self,
+        azimuth: Union[float, np.ndarray]
+    ) -> Union[float, np.ndarray, None]:
+        """
+        Gets the horizon elevation at the specified azimuth.
+
+        Args:
+            azimuth:
+                The azimuth relative to the facing of the door and window
+                between -180 and +180, or an array of them.
+
+        Returns:
+            The interpolated horizon elevation, None if the azimuth is behind
+            the door and window. For an array of azimuths the array of
+            the horizon elevations, NaN where the azimuth is behind the door and window.
+        """
+        if isinstance(azimuth, np.ndarray):
+            return self._get_elevations_at(azimuth)
+
+        position = azimuth + 90
+        if not 0 <= position <= 180:
+            return None
+
+        resolution = self._resolution
+        elevations = self._elevations
+        index = int(position // resolution)
+        if index == self._last_index:
+            # the sun is barely in front of the door and window
+            return elevations.item(index)
+
+        weight = (position - resolution * index) / resolution
+        return elevations.item(index) * (1 - weight) + elevations.item(index + 1) * weight
+
+    def _get_elevations_at(self, azimuths: np.ndarray) -> np.ndarray:
+        # The same linear interpolation as the scalar one for every azimuth at once.
+        if self._azimuths is None:
+            self._azimuths = np.linspace(-90, 90, len(self._elevations))
+        return np.where(
+            (azimuths >= -90) & (azimuths <= 90),
+            np.interp(azimuths, self._azimuths, self._elevations),
+            np.nan
+        )
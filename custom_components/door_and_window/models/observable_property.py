@@ -0,0 +1,222 @@
+""" Module for ObservableProperty class. """
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Tuple, Union
+
+from .event_handler import EventHandler
+
+# The instance attribute holding the event handlers of the listened events of an object.
+# It is missing until the first listener is added.
+_EVENT_HANDLERS_ATTRIBUTE = '_event_handlers'
+# The instance attribute holding the latest arguments of the events fired
+# while the events of an object are deferred. It is None or missing otherwise.
+_DEFERRED_EVENTS_ATTRIBUTE = '_deferred_events'
+
+_ON_CHANGED_DOC = """
+        Calls the specified function whenever the {name} property has changed.
+
+        Args:
+            callback:
+                The function to call when {name} property has changed.
+            weak:
+                The value indicates whether only a weak reference is kept to the callback.
+
+        Returns:
+            A function to stop calling the callback function
+            when {name} property has changed.
+        """
+
+
+def listen_to_event(
+    instance: object,
+    event: str,
+    callback: Callable[..., None],
+    weak: bool = False
+) -> Callable[[], None]:
+    """
+    Adds a listener to the named event of the specified object.
+    The event handler of the event is created by its first listener.
+
+    Args:
+        instance:
+            The object firing the event.
+        event:
+            The name of the event.
+        callback:
+            The function to call whenever the event happens.
+        weak:
+            The value indicates whether only a weak reference is kept to the callback.
+
+    Returns:
+        The function to stop listening to the event.
+    """
+    event_handlers: Union[Dict[str, EventHandler], None] = \
+        getattr(instance, _EVENT_HANDLERS_ATTRIBUTE, None)
+    if event_handlers is None:
+        event_handlers = {}
+        setattr(instance, _EVENT_HANDLERS_ATTRIBUTE, event_handlers)
+
+    event_handler = event_handlers.get(event)
+    if event_handler is None:
+        event_handler = event_handlers[event] = EventHandler()
+    return event_handler.listen(callback, weak)
+
+
+def fire_event(instance: object, event: str, *args) -> None:
+    """
+    Fires the named event of the specified object.
+    It does nothing if the event has never been listened to.
+    While the events of the object are deferred (see `defer_events`),
+    only the arguments are kept.
+
+    Args:
+        instance:
+            The object firing the event.
+        event:
+            The name of the event.
+        args:
+            The arguments to pass to the listeners.
+    """
+    event_handlers: Union[Dict[str, EventHandler], None] = \
+        getattr(instance, _EVENT_HANDLERS_ATTRIBUTE, None)
+    if event_handlers is not None:
+        event_handler = event_handlers.get(event)
+        if event_handler is not None:
+            deferred_events: Union[Dict[str, Tuple], None] = \
+                getattr(instance, _DEFERRED_EVENTS_ATTRIBUTE, None)
+            if deferred_events is not None:
+                deferred_events[event] = args
+            else:
+                event_handler.fire(*args)
+
+
+@contextmanager
+def defer_events(instance: object) -> Iterator[None]:
+    """
+    Defers the events of the specified object fired in the context.
+    When the context exits, each fired event is fired once
+    with its latest arguments, in the order of their first firing.
+    Deferring the events again in the context does nothing.
+
+    Args:
+        instance:
+            The object firing the events.
+    """
+    if getattr(instance, _DEFERRED_EVENTS_ATTRIBUTE, None) is not None:
+        yield
+        return
+
+    deferred_events: Dict[str, Tuple] = {}
+    setattr(instance, _DEFERRED_EVENTS_ATTRIBUTE, deferred_events)
+    try:
+        yield
+    finally:
+        setattr(instance, _DEFERRED_EVENTS_ATTRIBUTE, None)
+        for (event, args) in deferred_events.items():
+            fire_event(instance, event, *args)
+
+
+def dispose_events(instance: object) -> None:
+    """ Removes all the listeners of all the events of the specified object. """
+    event_handlers: Union[Dict[str, EventHandler], None] = \
+        getattr(instance, _EVENT_HANDLERS_ATTRIBUTE, None)
+    if event_handlers is not None:
+        for event_handler in event_handlers.values():
+            event_handler.dispose()
+        setattr(instance, _EVENT_HANDLERS_ATTRIBUTE, None)
+
+
+class ObservableProperty:
+    """
+    Descriptor of a property which fires its change event whenever its value changes.
+
+    The value is kept in the `_<name>` attribute of the instance. The owner class
+    declares the `on_<name>_changed(callback, weak=False)` method by `listener_method`,
+    so the listener methods are visible to the linters:
+
+        width = ObservableProperty('The width.')
+        on_width_changed = width.listener_method()
+
+    The listeners are stored by `listen_to_event`, so an instance
+    nobody listens to does not allocate anything for its events.
+
+    The owner of a read-only property sets the `_<name>` attribute
+    and fires the change event by `fire_event` itself.
+    """
+
+    def __init__(
+        self,
+        doc: str,
+        on_changed: Union[Callable[[Any, str], None], None] = None,
+        read_only: bool = False,
+        normalize: Union[Callable[[Any], Any], None] = None
+    ):
+        """
+        Initialize a new instance of ObservableProperty class.
+
+        Args:
+            doc:
+                The documentation of the property.
+            on_changed:
+                The function to call with the instance and the name of the property
+                after the change event is fired.
+            read_only:
+                The value indicates whether setting the property is refused.
+            normalize:
+                The function to convert a set value to the value to keep.
+        """
+        self.__doc__ = doc
+        self._on_changed = on_changed
+        self._read_only = read_only
+        self._normalize = normalize
+        self._name: Union[str, None] = None
+        self._attribute: Union[str, None] = None
+        self._listener_method: Union[Callable[..., Callable[[], None]], None] = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+        self._attribute = '_' + name
+
+        # The listener method is created in the class body before the name is known.
+        if self._listener_method is not None:
+            method_name = f'on_{name}_changed'
+            self._listener_method.__name__ = method_name
+            self._listener_method.__qualname__ = f'{owner.__qualname__}.{method_name}'
+            self._listener_method.__doc__ = _ON_CHANGED_DOC.format(name=name)
+
+    def listener_method(self) -> Callable[..., Callable[[], None]]:
+        """
+        Creates the `on_<name>_changed(callback, weak=False)` method of the property
+        to declare in the owner class.
+
+        Returns:
+            The method which calls the callback function whenever the property has changed
+            and returns a function to stop calling it.
+        """
+        def on_changed(
+            instance: Any,
+            callback: Callable[[Any], None],
+            weak: bool = False
+        ) -> Callable[[], None]:
+            """ Calls the specified function whenever the property has changed. """
+            return listen_to_event(instance, self._name, callback, weak)
+
+        self._listener_method = on_changed
+        return on_changed
+
+    def __get__(self, instance: Any, owner: Union[type, None] = None) -> Any:
+        if instance is None:
+            return self
+        return getattr(instance, self._attribute)
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        if self._read_only:
+            raise AttributeError(f"can't set attribute '{self._name}'")
+
+        # Normalizing first, so setting the same value in another form is not a change.
+        if self._normalize is not None:
+            value = self._normalize(value)
+        if value != getattr(instance, self._attribute):
+            setattr(instance, self._attribute, value)
+            fire_event(instance, self._name, value)
+            if self._on_changed is not None:
+                self._on_changed(instance, self._name)
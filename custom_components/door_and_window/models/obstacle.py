@@ -0,0 +1,128 @@
+""" The module contains the Obstacle class. """
+from __future__ import annotations
+
+from typing import Sequence, Tuple
+
+import numpy as np
+
+
+class Obstacle:
+    """
+    Represents a convex 3D obstacle outside the door and window which may shade the glazing,
+    e.g. a neighbouring building, a balcony or a chimney.
+
+    The obstacle is given by its vertices in the coordinate system of the door and window
+    (see `DoorAndWindowToRectanglesConverter`): the origin is the outer surface
+    of the glazing on the Z axis, the center of the glazing on the X axis
+    and the ground level on the Y axis. The Y axis is positive to up,
+    the X axis is positive to right as seen from outside and
+    the Z axis is positive to inside, so the obstacles in front of the wall
+    have negative Z coordinates.
+
+    The shadow of the obstacle is the convex hull of its vertices seen from the sun,
+    so a concave obstacle has to be declared as more convex ones.
+    """
+
+    __slots__ = ('_vertices',)
+
+    def __init__(self, vertices: Sequence[Sequence[float]]):
+        """
+        Initialize a new instance of `Obstacle` class.
+
+        Args:
+            vertices:
+                The (x, y, z) coordinates of the vertices of the convex obstacle
+                in the coordinate system of the door and window. There are at least three.
+        """
+        self._vertices = np.array(vertices, dtype=float)
+        if self._vertices.ndim != 2 or self._vertices.shape[1] != 3 \
+                or len(self._vertices) < 3:
+            raise ValueError("The obstacle must have at least three (x, y, z) vertices.")
+        if not np.all(np.isfinite(self._vertices)):
+            raise ValueError("The obstacle vertices must be finite.")
+        self._vertices.setflags(write=False)
+
+    @classmethod
+    def quad(
+        cls,
+        corner_1: Sequence[float],
+        corner_2: Sequence[float],
+        corner_3: Sequence[float],
+        corner_4: Sequence[float]
+    ) -> Obstacle:
+        """
+        Creates a flat quadrilateral obstacle, e.g. a fence or a wall.
+
+        Args:
+            corner_1:
+                The (x, y, z) coordinates of the 1st corner.
+            corner_2:
+                The (x, y, z) coordinates of the 2nd corner.
+            corner_3:
+                The (x, y, z) coordinates of the 3rd corner.
+            corner_4:
+                The (x, y, z) coordinates of the 4th corner.
+
+        Returns:
+            The quadrilateral obstacle.
+        """
+        return cls([corner_1, corner_2, corner_3, corner_4])
+
+    @classmethod
+    def prism(
+        cls,
+        footprint: Sequence[Tuple[float, float]],
+        bottom: float,
+        top: float
+    ) -> Obstacle:
+        """
+        Creates a vertical prism obstacle, e.g. a building or a chimney.
+
+        Args:
+            footprint:
+                The (x, z) coordinates of the vertices of the convex footprint.
+            bottom:
+                The height of the bottom of the prism.
+            top:
+                The height of the top of the prism.
+
+        Returns:
+            The prism obstacle.
+        """
+        return cls(
+            [(x, bottom, z) for (x, z) in footprint] + [(x, top, z) for (x, z) in footprint]
+        )
+
+    def __repr__(self) -> str:
+        return f'Obstacle({len(self._vertices)} vertices)'
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Obstacle):
+            return NotImplemented
+        return np.array_equal(self._vertices, other._vertices)
+
+    def __hash__(self) -> int:
+        return hash(self._vertices.tobytes())
+
+    @property
+    def vertices(self) -> np.ndarray:
+        """ The read-only (n, 3) array of the vertices. """
+        return self._vertices
+
+    def translate(self, x: float, y: float, z: float) -> Obstacle:
+        """
+        Creates the same obstacle moved by the specified distances,
+        e.g. to another coordinate system.
+
+        Args:
+            x:
+                The distance on the X axis.
+            y:
+                The distance on the Y axis.
+            z:
+                The distance on the Z axis.
+
+        Returns:
+            The moved obstacle.
+        """
+        return Obstacle(self._vertices + (x, y, z))
@@ -1,11 +1,20 @@
 """ The module contains Quadrilateral  class. """
+from __future__ import annotations
+
 from typing import Any, List
 
 import numpy as np
 
 
 class Quadrilateral():
-    """ Represents an immutable quadrilateral (4 sided shape) in the 3D space."""
+    """
+    Represents an immutable quadrilateral (4 sided shape) in the 3D space.
+
+    The corners are stored in a single (4, 4) array of homogeneous coordinates
+    and the corner properties are views of its rows.
+    """
+
+    __slots__ = ('_corners',)
 
     def __init__(
         self,
@@ -27,52 +36,84 @@ class Quadrilateral():
             corner_4:
                 the coordinates of the 4th corner [x, y, z]
         """
-        self._corner_1: np.ndarray = np.append(corner_1, [1])
-        self._corner_2: np.ndarray = np.append(corner_2, [1])
-        self._corner_3: np.ndarray = np.append(corner_3, [1])
-        self._corner_4: np.ndarray = np.append(corner_4, [1])
+        self._corners: np.ndarray = np.ones((4, 4))
+        self._corners[:, :3] = (corner_1, corner_2, corner_3, corner_4)
+
+    @classmethod
+    def from_homogeneous_corners(cls, corners: np.ndarray) -> Quadrilateral:
+        """
+        Creates a `Quadrilateral` instance backed by the specified array.
+        The array is not copied.
+
+        Args:
+            corners:
+                The (4, 4) array of the homogeneous corner coordinates [x, y, z, 1].
+
+        Returns:
+            The quadrilateral backed by the specified array.
+        """
+        quadrilateral = cls.__new__(cls)
+        # pylint: disable=protected-access
+        quadrilateral._corners = corners
+        return quadrilateral
+
+    @property
+    def corners(self) -> np.ndarray:
+        """ The (4, 4) array of the homogeneous corner coordinates. """
+        return self._corners
 
     @property
     def corner_1(self) -> np.ndarray:
         """ The coordinates of the 1st corner. """
-        return self._corner_1
+        return self._corners[0]
 
     @property
     def corner_2(self) -> np.ndarray:
         """ The coordinates of the 2nd corner. """
-        return self._corner_2
+        return self._corners[1]
 
     @property
     def corner_3(self) -> np.ndarray:
         """ The coordinates of the 3rd corner. """
-        return self._corner_3
+        return self._corners[2]
 
     @property
     def corner_4(self) -> np.ndarray:
         """ The coordinates of the 4th corner. """
-        return self._corner_4
+        return self._corners[3]
 
     def __str__(self):
         """ Gets the string representation of the instance. """
-        return f"[\n{self.corner_1}\n{self._corner_2}\n{self._corner_3}\n{self._corner_4}\n]"
+        return f"[\n{self.corner_1}\n{self.corner_2}\n{self.corner_3}\n{self.corner_4}\n]"
 
-    def apply_matrix(self, matrix: np.ndarray):
+    def apply_matrix(self, matrix: np.ndarray) -> Quadrilateral:
         """
         Applies the specified transformation matrix to the
         corner points of the quadrilateral and returns a new `Quadrilateral` instance.
         """
-        return Quadrilateral(
-            matrix.dot(self.corner_1)[:3],
-            matrix.dot(self.corner_2)[:3],
-            matrix.dot(self.corner_3)[:3],
-            matrix.dot(self.corner_4)[:3]
-        )
+        return Quadrilateral.from_homogeneous_corners(np.matmul(self._corners, matrix.T))
+
+    def apply_matrix_into(self, matrix: np.ndarray, out: Quadrilateral) -> Quadrilateral:
+        """
+        Applies the specified transformation matrix to the corner points
+        of the quadrilateral and writes the result into the specified quadrilateral's
+        backing array without allocating a new one.
+
+        Args:
+            matrix:
+                The 4x4 transformation matrix to apply.
+            out:
+                The quadrilateral to overwrite. It must not be this quadrilateral.
+
+        Returns:
+            The `out` quadrilateral.
+        """
+        # pylint: disable=protected-access
+        np.matmul(self._corners, matrix.T, out=out._corners)
+        return out
 
     def __eq__(self, other: Any):
         """Overrides the default implementation"""
         if isinstance(other, Quadrilateral):
-            return (self.corner_1 == other.corner_1).all() and \
-                    (self.corner_2 == other.corner_2).all() and \
-                    (self.corner_3 == other.corner_3).all() and \
-                    (self.corner_4 == other.corner_4).all()
+            return np.array_equal(self._corners, other._corners)
         return False
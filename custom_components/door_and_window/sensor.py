@@ -6,6 +6,7 @@ from typing import Callable, List, Optional, Union
 from homeassistant.components.sensor import (SensorEntity,
                                              SensorEntityDescription)
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import HomeAssistantType, StateType
@@ -14,6 +15,8 @@ from .const import DOMAIN, TYPE_WINDOW
 from .coordinator import Coordinator
 from .data_store import DataStore
 from .models.door_and_window import DoorAndWindow
+from .models.door_and_window_light_state import (LIGHT_STATE_PROPERTIES,
+                                                 DoorAndWindowLightState)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -195,14 +198,33 @@ class DoorAndWindowSensor(SensorEntity):
         }
 
     async def async_added_to_hass(self) -> None:
+        key = self.entity_description.key
+
+        if key in LIGHT_STATE_PROPERTIES:
+            # The light state is written once per update
+            # together with the other sensors of the door and window.
+            # The door and window does not keep a removed entity alive.
+            self._track_change_dispose = self._door_and_window.on_update_completed(
+                self._update_light_state, weak=True)
+            return
+
         def update_native_value(value):
             self._attr_native_value = value
             self.async_schedule_update_ha_state()
 
-        on_change = getattr(self._door_and_window, f"on_{self.entity_description.key}_changed")
+        on_change = getattr(self._door_and_window, f"on_{key}_changed")
 
         self._track_change_dispose = on_change(update_native_value)
 
+    # The door and windows are updated in the event loop: the sun and the horizon profile
+    # changes are callbacks, the configuration changes and the shading table are async.
+    @callback
+    def _update_light_state(self, light_state: DoorAndWindowLightState) -> None:
+        key = self.entity_description.key
+        if key in light_state.changed:
+            self._attr_native_value = getattr(light_state, key)
+            self.async_write_ha_state()
+
     async def async_will_remove_from_hass(self) -> None:
         if self._track_change_dispose is not None:
             self._track_change_dispose()
@@ -0,0 +1,120 @@
+""" The module for sun tracker. """
+import logging
+from typing import Any, Callable, List, Tuple, Union
+
+from homeassistant.core import State, callback
+from homeassistant.helpers.event import async_track_state_change
+from homeassistant.helpers.typing import HomeAssistantType
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SunTracker():
+    """
+    Responsible for tracking the sun position for all coordinators of the integration.
+
+    The sun entity is tracked by a single subscription while there is any listener:
+    it is subscribed when the first listener is added and unsubscribed when
+    the last one is removed. The position is parsed once for a sun change
+    and the changes of the other attributes of the sun entity are skipped,
+    then the position is passed to every listener in the order they were added.
+    """
+
+    def __init__(self, hass: HomeAssistantType, sun_entity_id: str):
+        """
+        Initialize a new instance of `SunTracker` class.
+
+        Args:
+            hass:
+                The Home Assistant instance.
+            sun_entity_id:
+                The entity id of the sun entity.
+        """
+        self._hass = hass
+        self._sun_entity_id = sun_entity_id
+        self._listeners: List[Callable[[float, float], None]] = []
+        self._track_sun_entity_dispose: Union[Callable[[], None], None] = None
+        # The raw attributes of the latest sun state and the sun position parsed from them.
+        self._sun_attributes: Union[Tuple[Any, Any], None] = None
+        self._sun_position: Union[Tuple[float, float], None] = None
+
+    @property
+    def sun_position(self) -> Union[Tuple[float, float], None]:
+        """
+        The latest (azimuth, elevation) of the sun,
+        None if it is unknown or the sun is not tracked.
+        """
+        return self._sun_position
+
+    def add_listener(self, listener: Callable[[float, float], None]) -> Callable[[], None]:
+        """
+        Calls the specified function with the sun azimuth and elevation
+        whenever the sun has moved.
+
+        The first listener starts the tracking of the sun entity.
+        The current sun position is not passed to the listener,
+        it is available from `sun_position`.
+
+        Args:
+            listener:
+                The function to call when the sun has moved.
+
+        Returns:
+            A function to stop calling the callback function,
+            the tracking of the sun entity stops with the last listener.
+        """
+        self._listeners.append(listener)
+        if self._track_sun_entity_dispose is None:
+            self._track_sun_entity_dispose = async_track_state_change(
+                self._hass,
+                self._sun_entity_id,
+                self._sun_entity_changed
+            )
+            self._set_sun_state(self._hass.states.get(self._sun_entity_id))
+
+        def remove_listener() -> None:
+            if listener not in self._listeners:
+                return
+            self._listeners.remove(listener)
+            if not self._listeners:
+                self._stop_tracking()
+
+        return remove_listener
+
+    def _stop_tracking(self) -> None:
+        if self._track_sun_entity_dispose:
+            self._track_sun_entity_dispose()
+            self._track_sun_entity_dispose = None
+        self._sun_attributes = None
+        self._sun_position = None
+
+    def _set_sun_state(self, state: Union[State, None]) -> bool:
+        # Parses the sun position from the state, returns whether it has changed.
+        if state is None:
+            return False
+
+        # The sun entity changes also when only its other attributes change,
+        # e.g. the next rising, these are skipped without parsing the position.
+        sun_attributes = (state.attributes.get('azimuth'), state.attributes.get('elevation'))
+        if sun_attributes == self._sun_attributes or None in sun_attributes:
+            return False
+        self._sun_attributes = sun_attributes
+        self._sun_position = (float(sun_attributes[0]), float(sun_attributes[1]))
+        return True
+
+    # It runs in the event loop, so the listeners may call the async_* methods of Home Assistant.
+    # pylint: disable=unused-argument
+    @callback
+    def _sun_entity_changed(self, entity_id: str, old_state: State, new_state: State):
+        if not self._set_sun_state(new_state):
+            return
+
+        # A listener may remove itself or another one, e.g. by unloading its config entry.
+        for listener in list(self._listeners):
+            if listener not in self._listeners:
+                continue
+            try:
+                listener(*self._sun_position)
+            except Exception:  # pylint: disable=broad-except
+                # a failing door and window should not stop the updates of the others
+                _LOGGER.exception("Error while updating to the sun position %s", self._sun_position)
@@ -0,0 +1,61 @@
+"""
+Benchmark of the event listener management.
+
+It simulates the listener churn of reloading the entities of a large installation:
+every entity stops listening and starts listening again while the other ones keep listening.
+
+Run from the `custom_components` folder:
+
+    python -m door_and_window.tests.benchmarks.benchmark_events
+"""
+import random
+import timeit
+from typing import Callable, List
+
+from ...models.event_handler import EventHandler
+
+
+def benchmark_events(listener_count: int = 2000, number: int = 5) -> None:
+    """
+    Prints the average time of a reload of a listener and of firing an event.
+
+    Args:
+        listener_count:
+            The number of listeners of an event.
+        number:
+            The number of times to reload all the listeners.
+    """
+    event_handler = EventHandler()
+
+    def create_listener() -> Callable[[int], None]:
+        def listener(_: int) -> None:
+            pass
+        return listener
+
+    listeners = [create_listener() for _ in range(listener_count)]
+    stop_listenings: List[Callable[[], None]] = [
+        event_handler.listen(listener) for listener in listeners
+    ]
+
+    # The entities are reloaded in a different arbitrary order every time.
+    randomizer = random.Random(0)
+    orders = []
+    for _ in range(number * 5):
+        orders.append(list(range(listener_count)))
+        randomizer.shuffle(orders[-1])
+    orders_iterator = iter(orders)
+
+    def reload_listeners():
+        for index in next(orders_iterator):
+            stop_listenings[index]()
+            stop_listenings[index] = event_handler.listen(listeners[index])
+
+    reload_time = min(timeit.repeat(reload_listeners, number=number)) / number / listener_count
+    print(f"reload of 1 of {listener_count} listeners: {reload_time * 1e6:.2f} µs")
+
+    fire_time = min(timeit.repeat(lambda: event_handler.fire(1), number=number)) / number
+    print(f"firing to {listener_count} listeners: {fire_time * 1e6:.1f} µs")
+
+
+if __name__ == '__main__':
+    benchmark_events()
@@ -0,0 +1,80 @@
+"""
+Benchmark of updating the geometry of a door and window after one of its parameters changed.
+
+It simulates an awning cover moving through its positions while the sun stands still,
+and a change of the frame thickness which does not affect the sunny glazing area.
+
+Run from the `custom_components` folder:
+
+    python -m door_and_window.tests.benchmarks.benchmark_geometry_invalidation
+"""
+import itertools
+import timeit
+
+from ...const import LIGHT_ENGINE_CLOSED_FORM, LIGHT_ENGINE_CONVEX_CLIPPING
+from ...models.awning import Awning
+from ...models.door_and_window import DoorAndWindow
+
+# The sun position at which the awning shades a part of the glazing.
+SUN_POSITION = (190, 60)
+
+
+def _create_door_and_window(light_engine: str) -> DoorAndWindow:
+    door_and_window = DoorAndWindow(
+        'window',
+        'benchmark window',
+        None,
+        None,
+        1000,
+        1400,
+        90,
+        89,
+        150,
+        200,
+        900,
+        180,
+        90,
+        [0, 0],
+        None,
+        light_engine=light_engine
+    )
+    # The awning is replaced the same way as by a config entry update.
+    door_and_window.awning = Awning(1400, 100, 800, -100, 100, 300, 50, 70)
+    return door_and_window
+
+
+def benchmark_geometry_invalidation(number: int = 2000) -> None:
+    """
+    Prints the average time of an update after the awning cover has moved
+    and after the frame thickness has changed for each light calculation engine.
+
+    Args:
+        number:
+            The number of updates to measure.
+    """
+    for light_engine in [LIGHT_ENGINE_CONVEX_CLIPPING, LIGHT_ENGINE_CLOSED_FORM]:
+        door_and_window = _create_door_and_window(light_engine)
+        cover_positions = itertools.cycle(range(0, 101, 10))
+        frame_thicknesses = itertools.cycle([90, 91])
+
+        def move_awning(door_and_window=door_and_window, cover_positions=cover_positions):
+            door_and_window.awning.cover_position = next(cover_positions)
+            door_and_window.update(*SUN_POSITION)
+
+        def change_frame_thickness(
+            door_and_window=door_and_window,
+            frame_thicknesses=frame_thicknesses
+        ):
+            door_and_window.frame_thickness = next(frame_thicknesses)
+            door_and_window.update(*SUN_POSITION)
+
+        for (name, run) in [
+            ('awning move', move_awning),
+            ('frame thickness change', change_frame_thickness)
+        ]:
+            run_time = min(timeit.repeat(run, number=number, repeat=9)) / number
+            print(f"{light_engine} update after {name}: {run_time * 1e6:.1f} µs")
+
+
+if __name__ == '__main__':
+    benchmark_geometry_invalidation()
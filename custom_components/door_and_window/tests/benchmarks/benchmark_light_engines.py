@@ -0,0 +1,93 @@
+"""
+Benchmark of the light calculation engines.
+
+Run from the `custom_components` folder:
+
+    python -m door_and_window.tests.benchmarks.benchmark_light_engines
+"""
+import timeit
+
+from ...const import (LIGHT_ENGINE_CLOSED_FORM, LIGHT_ENGINE_CONVEX_CLIPPING,
+                      LIGHT_ENGINE_SHAPELY)
+from ...converters.door_and_window_local_geometry_to_light_information_converter import \
+    DoorAndWindowLocalGeometryToLightInformationConverter
+from ...converters.door_and_window_rectangles_to_light_information_converter import \
+    DoorAndWindowRectanglesToLightInformationConverter
+from ...converters.door_and_window_to_local_geometry_converter import \
+    DoorAndWindowToLocalGeometryConverter
+from ...converters.door_and_window_to_rectangles_converter import \
+    DoorAndWindowToRectanglesConverter
+from ...models.awning import Awning
+from ...models.door_and_window import DoorAndWindow
+
+# The sun positions in front of a south facing window.
+SUN_POSITIONS = [
+    (azimuth, elevation)
+    for azimuth in range(95, 265, 10)
+    for elevation in range(5, 65, 10)
+]
+
+
+def benchmark_light_engines(number: int = 20) -> None:
+    """
+    Prints the average time of a light calculation per sun position
+    for each light calculation engine.
+
+    Args:
+        number:
+            The number of times to evaluate all the sun positions.
+    """
+    door_and_window = DoorAndWindow(
+        'window',
+        'benchmark window',
+        None,
+        None,
+        1000,
+        1400,
+        90,
+        89,
+        150,
+        200,
+        900,
+        180,
+        90,
+        [0, 0],
+        Awning(1400, 100, 800, -100, 100, 300, 50, 70)
+    )
+    door_and_window_rectangles = DoorAndWindowToRectanglesConverter().convert(door_and_window)
+    converter = DoorAndWindowRectanglesToLightInformationConverter()
+
+    timings = {}
+    for engine in [LIGHT_ENGINE_SHAPELY, LIGHT_ENGINE_CONVEX_CLIPPING]:
+        def run(engine=engine):
+            for (azimuth, elevation) in SUN_POSITIONS:
+                _ = converter.convert(
+                    door_and_window_rectangles, 0, 180, 90, azimuth, elevation, engine=engine
+                ).sunny_glazing_area
+
+        timings[engine] = timeit.timeit(run, number=number) / number / len(SUN_POSITIONS)
+        print(f"{engine}: {timings[engine] * 1e6:.1f} µs per update")
+
+    local_geometry = DoorAndWindowToLocalGeometryConverter().convert(door_and_window)
+    local_geometry_converter = DoorAndWindowLocalGeometryToLightInformationConverter()
+
+    def run_closed_form():
+        for (azimuth, elevation) in SUN_POSITIONS:
+            _ = local_geometry_converter.convert(
+                local_geometry, 0, azimuth, elevation
+            ).sunny_glazing_area
+
+    timings[LIGHT_ENGINE_CLOSED_FORM] = \
+        timeit.timeit(run_closed_form, number=number) / number / len(SUN_POSITIONS)
+    print(f"{LIGHT_ENGINE_CLOSED_FORM}: "
+          f"{timings[LIGHT_ENGINE_CLOSED_FORM] * 1e6:.1f} µs per update")
+
+    for engine in [LIGHT_ENGINE_CONVEX_CLIPPING, LIGHT_ENGINE_CLOSED_FORM]:
+        print(
+            f"{engine} speedup: "
+            f"{timings[LIGHT_ENGINE_SHAPELY] / timings[engine]:.2f}x"
+        )
+
+
+if __name__ == '__main__':
+    benchmark_light_engines()
@@ -0,0 +1,122 @@
+"""
+Benchmark of the memory used by the geometry of the door and windows.
+
+Run from the `custom_components` folder:
+
+    python -m door_and_window.tests.benchmarks.benchmark_memory
+"""
+import gc
+import tracemalloc
+from typing import Callable, List
+
+from ...const import LIGHT_ENGINE_CONVEX_CLIPPING, LIGHT_ENGINE_SHAPELY
+from ...converters.door_and_window_to_rectangles_converter import \
+    DoorAndWindowToRectanglesConverter
+from ...models.awning import Awning
+from ...models.door_and_window import DoorAndWindow
+from ...models.quadrilateral import Quadrilateral
+
+# The sun positions in front of a south facing window.
+SUN_POSITIONS = [
+    (azimuth, elevation)
+    for azimuth in range(95, 265, 10)
+    for elevation in range(5, 65, 10)
+]
+
+
+def _create_door_and_window(light_engine: str) -> DoorAndWindow:
+    return DoorAndWindow(
+        'window',
+        'benchmark window',
+        None,
+        None,
+        1000,
+        1400,
+        90,
+        89,
+        150,
+        200,
+        900,
+        180,
+        90,
+        [0, 0],
+        Awning(1400, 100, 800, -100, 100, 300, 50, 70),
+        light_engine=light_engine
+    )
+
+
+def _get_retained_bytes(create: Callable[[], object], count: int) -> float:
+    """ Gets the average memory retained by an object returned by `create`. """
+    gc.collect()
+    tracemalloc.start()
+    objects: List[object] = [create() for _ in range(count)]
+    (retained, _) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return retained / count
+
+
+def _get_peak_bytes(run: Callable[[], None], count: int) -> float:
+    """ Gets the average peak of the temporary memory allocated by a call of `run`. """
+    run()
+    gc.collect()
+    peak_total = 0
+    tracemalloc.start()
+    for _ in range(count):
+        tracemalloc.reset_peak()
+        (start, _) = tracemalloc.get_traced_memory()
+        run()
+        (_, peak) = tracemalloc.get_traced_memory()
+        peak_total += peak - start
+    tracemalloc.stop()
+    return peak_total / count
+
+
+def benchmark_memory(count: int = 300) -> None:
+    """
+    Prints the memory retained by a quadrilateral, by a door and window and by its rectangles,
+    and the peak of the temporary memory allocated by an update.
+
+    Args:
+        count:
+            The number of instances to measure.
+    """
+    def create_quadrilateral() -> Quadrilateral:
+        return Quadrilateral([0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0])
+
+    print(
+        "quadrilateral: "
+        f"{_get_retained_bytes(create_quadrilateral, count):.0f} bytes retained"
+    )
+
+    def create_door_and_window() -> DoorAndWindow:
+        return _create_door_and_window(LIGHT_ENGINE_CONVEX_CLIPPING)
+
+    print(
+        "door and window: "
+        f"{_get_retained_bytes(create_door_and_window, count):.0f} bytes retained"
+    )
+
+    door_and_window = _create_door_and_window(LIGHT_ENGINE_CONVEX_CLIPPING)
+    converter = DoorAndWindowToRectanglesConverter()
+    print(
+        "door and window rectangles: "
+        f"{_get_retained_bytes(lambda: converter.convert(door_and_window), count):.0f} "
+        "bytes retained"
+    )
+
+    for light_engine in [LIGHT_ENGINE_SHAPELY, LIGHT_ENGINE_CONVEX_CLIPPING]:
+        door_and_window = _create_door_and_window(light_engine)
+        sun_positions = iter(SUN_POSITIONS * count)
+
+        def run(door_and_window=door_and_window, sun_positions=sun_positions):
+            door_and_window.update(*next(sun_positions))
+
+        print(
+            f"{light_engine} update: "
+            f"{_get_peak_bytes(run, count):.0f} bytes peak temporary allocation"
+        )
+
+
+if __name__ == '__main__':
+    benchmark_memory()
@@ -0,0 +1,133 @@
+"""
+Benchmark of the light calculation with many obstacles.
+
+Run from the `custom_components` folder:
+
+    python -m door_and_window.tests.benchmarks.benchmark_obstacles
+"""
+import timeit
+from typing import List
+
+import numpy as np
+
+from ...const import LIGHT_ENGINE_CONVEX_CLIPPING
+from ...converters.convex_polygon_clipping import get_convex_hull
+from ...converters.door_and_window_rectangles_to_light_information_converter import \
+    DoorAndWindowRectanglesToLightInformationConverter
+from ...converters.door_and_window_to_rectangles_converter import \
+    DoorAndWindowToRectanglesConverter
+from ...models.door_and_window import DoorAndWindow
+from ...models.obstacle import Obstacle
+from ...transformers.door_and_window_seen_from_sun_transformer import \
+    DoorAndWindowRectanglesSeenFromSunTransformer
+
+# The sun positions in front of a south facing window.
+SUN_POSITIONS = [
+    (azimuth, elevation)
+    for azimuth in range(95, 265, 10)
+    for elevation in range(5, 65, 10)
+]
+
+
+def create_obstacles(count: int, seed: int = 0) -> List[Obstacle]:
+    """
+    Creates box shaped obstacles scattered in front of the window, like a neighbourhood.
+
+    Args:
+        count:
+            The number of the obstacles.
+        seed:
+            The seed of the random positions.
+
+    Returns:
+        The obstacles.
+    """
+    random = np.random.default_rng(seed)
+    obstacles = []
+    for _ in range(count):
+        (left, front) = (random.uniform(-50000, 50000), random.uniform(-60000, -3000))
+        (width, depth) = random.uniform(2000, 8000, 2)
+        obstacles.append(Obstacle.prism(
+            [
+                (left, front),
+                (left + width, front),
+                (left + width, front - depth),
+                (left, front - depth)
+            ],
+            0,
+            random.uniform(3000, 15000)
+        ))
+    return obstacles
+
+
+def benchmark_obstacles(number: int = 5) -> None:
+    """
+    Prints the average time of a light calculation per sun position
+    with more and more obstacles, with and without the spatial index.
+
+    Args:
+        number:
+            The number of times to evaluate all the sun positions.
+    """
+    converter = DoorAndWindowRectanglesToLightInformationConverter()
+
+    for count in [0, 10, 100, 500]:
+        door_and_window = DoorAndWindow(
+            'window',
+            'benchmark window',
+            None,
+            None,
+            1000,
+            1400,
+            90,
+            89,
+            150,
+            200,
+            900,
+            180,
+            90,
+            [0, 0],
+            None,
+            obstacles=create_obstacles(count)
+        )
+        door_and_window_rectangles = DoorAndWindowToRectanglesConverter().convert(door_and_window)
+
+        def run(door_and_window_rectangles=door_and_window_rectangles):
+            for (azimuth, elevation) in SUN_POSITIONS:
+                _ = converter.convert(
+                    door_and_window_rectangles,
+                    0,
+                    180,
+                    90,
+                    azimuth,
+                    elevation,
+                    engine=LIGHT_ENGINE_CONVEX_CLIPPING
+                ).sunny_glazing_area
+
+        timing = timeit.timeit(run, number=number) / number / len(SUN_POSITIONS)
+        print(f"{count} obstacles: {timing * 1e6:.1f} µs per update")
+
+        obstacles = door_and_window_rectangles.obstacles
+        if obstacles is None:
+            continue
+
+        # The projection of every obstacle which the spatial index saves.
+        def run_without_index(obstacles=obstacles):
+            for (azimuth, elevation) in SUN_POSITIONS:
+                projected_vertices = np.matmul(
+                    obstacles.vertices,
+                    DoorAndWindowRectanglesSeenFromSunTransformer.get_sun_view_matrix(
+                        azimuth, elevation)[:2].T
+                ).tolist()
+                for start in range(0, len(projected_vertices), 8):
+                    get_convex_hull(
+                        [tuple(vertex) for vertex in projected_vertices[start:start + 8]])
+
+        timing_without_index = \
+            timeit.timeit(run_without_index, number=number) / number / len(SUN_POSITIONS)
+        print(f"{count} obstacles projecting all: "
+              f"{timing_without_index * 1e6:.1f} µs per update")
+
+
+if __name__ == '__main__':
+    benchmark_obstacles()
@@ -0,0 +1,119 @@
+""" Tests for convex polygon clipping functions. """
+import math
+
+import numpy as np
+from shapely.geometry import Polygon, box
+
+from ...converters.convex_polygon_clipping import (clip_convex_polygons,
+                                                   get_area, get_areas,
+                                                   get_convex_hull,
+                                                   get_signed_area,
+                                                   split_convex_polygon,
+                                                   subtract_convex_polygon,
+                                                   to_counter_clockwise)
+
+SQUARE = [(0.0, 0.0), (10.0, 0.0), (10.0, 10.0), (0.0, 10.0)]
+
+
+def test_get_signed_area():
+    """ Tests if the signed area depends on the orientation of the vertices. """
+    assert math.isclose(get_signed_area(SQUARE), 100)
+    assert math.isclose(get_signed_area(list(reversed(SQUARE))), -100)
+
+
+def test_to_counter_clockwise():
+    """ Tests if the vertices are reordered and degenerate polygons are dropped. """
+    assert get_signed_area(to_counter_clockwise(list(reversed(SQUARE)))) > 0
+    assert not to_counter_clockwise([(0.0, 0.0), (10.0, 0.0), (10.0, 0.0), (0.0, 0.0)])
+
+
+def test_get_convex_hull():
+    """ Tests if the inner and the collinear points are dropped from the hull. """
+    points = [(5.0, 5.0), (10.0, 10.0), (0.0, 10.0), (5.0, 0.0), (0.0, 0.0), (10.0, 0.0)]
+
+    hull = get_convex_hull(points)
+
+    assert sorted(hull) == sorted(SQUARE)
+    assert math.isclose(get_signed_area(hull), 100)
+    assert not get_convex_hull([(0.0, 0.0), (5.0, 5.0), (10.0, 10.0), (5.0, 5.0)])
+
+
+def test_split_convex_polygon():
+    """ Tests if the polygon is split into the left and the right parts of the line. """
+    (left, right) = split_convex_polygon(SQUARE, (4.0, 0.0), (4.0, 10.0))
+
+    assert math.isclose(abs(get_signed_area(left)), 40)
+    assert math.isclose(abs(get_signed_area(right)), 60)
+
+
+def test_subtract_convex_polygon_without_overlap():
+    """ Tests if the polygon is kept intact if the subtrahend does not overlap it. """
+    result = subtract_convex_polygon(
+        [SQUARE],
+        [(20.0, 0.0), (30.0, 0.0), (30.0, 10.0), (20.0, 10.0)]
+    )
+
+    assert math.isclose(get_area(result), 100)
+
+
+def test_subtract_convex_polygon_covering():
+    """ Tests if nothing remains if the subtrahend covers the polygon. """
+    result = subtract_convex_polygon(
+        [SQUARE],
+        [(-1.0, -1.0), (11.0, -1.0), (11.0, 11.0), (-1.0, 11.0)]
+    )
+
+    assert not result
+
+
+def test_subtract_convex_polygon_is_same_as_shapely_difference():
+    """ Tests if the subtraction results the same area as shapely difference. """
+    subtrahends = [
+        [(5.0, -5.0), (15.0, 5.0), (5.0, 15.0), (-5.0, 5.0)],
+        [(2.0, 2.0), (2.0, 8.0), (8.0, 8.0), (8.0, 2.0)],
+        [(-3.0, 4.0), (6.0, 1.0), (7.0, 3.0)],
+    ]
+
+    polygons = [SQUARE]
+    shapely_polygon = Polygon(SQUARE)
+    for subtrahend in subtrahends:
+        polygons = subtract_convex_polygon(polygons, subtrahend)
+        shapely_polygon = shapely_polygon.difference(Polygon(subtrahend))
+
+        assert math.isclose(get_area(polygons), shapely_polygon.area)
+
+
+def test_get_areas():
+    """ Tests if the repeated vertices do not change the area. """
+    polygons = np.array([
+        SQUARE,
+        [(0.0, 0.0), (10.0, 0.0), (10.0, 0.0), (0.0, 10.0)],
+        [(0.0, 0.0), (0.0, 0.0), (0.0, 0.0), (0.0, 0.0)],
+    ])
+
+    np.testing.assert_allclose(get_areas(polygons), [100, 50, 0])
+
+
+def test_clip_convex_polygons_is_same_as_shapely_intersection():
+    """ Tests if clipping by half-planes results the same area as shapely intersection. """
+    polygons = np.array([
+        [(5.0, -5.0), (15.0, 5.0), (5.0, 15.0), (-5.0, 5.0)],
+        [(2.0, 2.0), (2.0, 8.0), (8.0, 8.0), (8.0, 2.0)],
+        [(-3.0, 4.0), (6.0, 1.0), (7.0, 3.0), (7.0, 3.0)],
+        [(20.0, 20.0), (30.0, 20.0), (30.0, 30.0), (20.0, 30.0)],
+    ])
+    (left, bottom, right, top) = (np.array([0.0, 3.0, -10.0, 0.0]), 0.0, 10.0, 10.0)
+
+    clipped = clip_convex_polygons(polygons, (-1, 0), -left)
+    clipped = clip_convex_polygons(clipped, (1, 0), right)
+    clipped = clip_convex_polygons(clipped, (0, -1), -bottom)
+    clipped = clip_convex_polygons(clipped, (0, 1), top)
+
+    assert clipped.shape == (4, 8, 2)
+    np.testing.assert_allclose(
+        get_areas(clipped),
+        [
+            Polygon(polygon).intersection(box(left[index], bottom, right, top)).area
+            for (index, polygon) in enumerate(polygons.tolist())
+        ]
+    )
@@ -0,0 +1,109 @@
+""" Tests for DoorAndWindowLocalGeometryToLightInformationConverter class. """
+import math
+
+import pytest
+
+from ...const import LIGHT_ENGINE_CONVEX_CLIPPING
+from ...converters.door_and_window_local_geometry_to_light_information_converter import \
+    DoorAndWindowLocalGeometryToLightInformationConverter
+from ...converters.door_and_window_rectangles_to_light_information_converter import \
+    DoorAndWindowRectanglesToLightInformationConverter
+from ...converters.door_and_window_to_local_geometry_converter import \
+    DoorAndWindowToLocalGeometryConverter
+from ...converters.door_and_window_to_rectangles_converter import \
+    DoorAndWindowToRectanglesConverter
+from ...models.awning import Awning
+from ...models.door_and_window import DoorAndWindow
+
+
+def get_door_and_window(tilt: float = 90, awning: Awning = None) -> DoorAndWindow:
+    """ Returns the test door and window """
+    return DoorAndWindow(
+        'window',
+        'my window',
+        'manufacturer',
+        'model',
+        1000,
+        1400,
+        90,
+        89,
+        150,
+        200,
+        900,
+        120,
+        tilt,
+        [0, 0],
+        awning
+    )
+
+
+def test_if_sun_below_horizon():
+    """ Tests if the sunny glazing area is empty if sun is below horizon. """
+    local_geometry = DoorAndWindowToLocalGeometryConverter().convert(get_door_and_window())
+
+    light_info = DoorAndWindowLocalGeometryToLightInformationConverter().convert(
+        local_geometry, 30, 120, 20)
+
+    assert light_info.sunny_glazing_area == 0
+    assert light_info.sunny_glazing_area_polygon.area == 0
+
+
+def test_if_sun_is_behind_door_and_window():
+    """ Tests if the sunny glazing area is empty if sun is behind the door and window. """
+    local_geometry = DoorAndWindowToLocalGeometryConverter().convert(get_door_and_window())
+
+    light_info = DoorAndWindowLocalGeometryToLightInformationConverter().convert(
+        local_geometry, 0, 300, 45)
+
+    assert light_info.angle_of_incidence >= 90
+    assert light_info.sunny_glazing_area == 0
+
+
+def test_if_sun_is_in_front_of_door_and_window():
+    """ Tests if the whole glazing is sunny if sun is in front of the window. """
+    local_geometry = DoorAndWindowToLocalGeometryConverter().convert(get_door_and_window())
+
+    light_info = DoorAndWindowLocalGeometryToLightInformationConverter().convert(
+        local_geometry, 0, 120, 0)
+
+    assert math.isclose(light_info.angle_of_incidence, 0)
+    assert math.isclose(light_info.sunny_glazing_area, (1000 - 89*2) * (1400 - 89*2))
+
+
+@pytest.mark.parametrize('tilt', [90, 60, 30, 10])
+@pytest.mark.parametrize('awning', [
+    None,
+    Awning(1400, 100, 800, -100, 100, 300, 50, 70),
+    Awning(1200, 300, 300, 150, 0, -200, 0, 100)
+])
+def test_closed_form_is_same_as_convex_clipping(tilt: float, awning: Awning):
+    """
+    Tests if the closed-form calculation results the same light information
+    as the convex clipping engine for various sun positions.
+    """
+    door_and_window = get_door_and_window(tilt, awning)
+    door_and_window_rectangles = DoorAndWindowToRectanglesConverter().convert(door_and_window)
+    local_geometry = DoorAndWindowToLocalGeometryConverter().convert(door_and_window)
+    converter = DoorAndWindowLocalGeometryToLightInformationConverter()
+    rectangles_converter = DoorAndWindowRectanglesToLightInformationConverter()
+
+    for solar_azimuth in range(30, 220, 7):
+        for solar_elevation in range(0, 90, 6):
+            expected = rectangles_converter.convert(
+                door_and_window_rectangles,
+                0,
+                120,
+                tilt,
+                solar_azimuth,
+                solar_elevation,
+                engine=LIGHT_ENGINE_CONVEX_CLIPPING
+            )
+            actual = converter.convert(local_geometry, 0, solar_azimuth, solar_elevation)
+
+            assert actual.angle_of_incidence == expected.angle_of_incidence
+            assert math.isclose(
+                actual.sunny_glazing_area,
+                expected.sunny_glazing_area,
+                rel_tol=1e-6,
+                abs_tol=1e-3
+            ), f'Sunny glazing area must be the same at ({solar_azimuth}, {solar_elevation})'
@@ -0,0 +1,74 @@
+""" Tests for DoorAndWindowLocalGeometryToShadingTableConverter class. """
+import math
+import random
+
+import pytest
+
+from ...converters.door_and_window_local_geometry_to_light_information_converter import \
+    DoorAndWindowLocalGeometryToLightInformationConverter
+from ...converters.door_and_window_local_geometry_to_shading_table_converter import \
+    DoorAndWindowLocalGeometryToShadingTableConverter
+from ...converters.door_and_window_to_local_geometry_converter import \
+    DoorAndWindowToLocalGeometryConverter
+from ...models.awning import Awning
+from ...models.door_and_window import DoorAndWindow
+
+
+def get_door_and_window(tilt: float) -> DoorAndWindow:
+    """ Returns the test door and window """
+    return DoorAndWindow(
+        'window',
+        'my window',
+        'manufacturer',
+        'model',
+        1000,
+        1400,
+        90,
+        89,
+        150,
+        200,
+        900,
+        120,
+        tilt,
+        [0, 0],
+        Awning(1400, 100, 800, -100, 100, 300, 50, 70)
+    )
+
+
+@pytest.mark.parametrize('tilt', [90, 30])
+def test_shading_table_is_within_error_bound(tilt: float):
+    """
+    Tests if the interpolated sunny glazing area is close to
+    the calculated one at random sun positions.
+    """
+    local_geometry = DoorAndWindowToLocalGeometryConverter().convert(get_door_and_window(tilt))
+    shading_table = DoorAndWindowLocalGeometryToShadingTableConverter().convert(
+        local_geometry, 120, tilt, 2, 1)
+    converter = DoorAndWindowLocalGeometryToLightInformationConverter()
+    glazing_area = (1000 - 89*2) * (1400 - 89*2)
+
+    assert shading_table.error <= 1
+    assert shading_table.local_geometry is local_geometry
+    assert shading_table.sunny_glazing_areas.shape[0] == \
+        round((180 if tilt == 90 else 360) / shading_table.resolution) + 1
+
+    random.seed(0)
+    for _ in range(500):
+        relative_azimuth = random.uniform(-89, 89)
+        elevation = random.uniform(0, 90)
+        expected = converter.convert(local_geometry, None, 120 + relative_azimuth, elevation)
+        actual = shading_table.get_sunny_glazing_area(relative_azimuth, elevation)
+
+        # the error is measured at the middle of the cells,
+        # elsewhere it may be a bit larger
+        assert math.isclose(
+            actual, expected.sunny_glazing_area, abs_tol=glazing_area * 1.5 / 100)
+
+
+def test_shading_table_resolution_is_refined():
+    """ Tests if the resolution is refined until the error bound or the minimum is reached. """
+    local_geometry = DoorAndWindowToLocalGeometryConverter().convert(get_door_and_window(90))
+    converter = DoorAndWindowLocalGeometryToShadingTableConverter()
+
+    assert converter.convert(local_geometry, 120, 90, 5, 100).resolution == 5
+    assert converter.convert(local_geometry, 120, 90, 5, 0, min_resolution=1.25).resolution == 1.25
@@ -1,7 +1,20 @@
 """ Tests for DoorAndWindowRectanglesToLightInformationConverter class. """
+import math
+
+import pytest
+
+from ...const import LIGHT_ENGINE_CONVEX_CLIPPING, LIGHT_ENGINE_SHAPELY
+from ...converters.door_and_window_to_rectangles_converter import \
+    DoorAndWindowToRectanglesConverter
 from ...converters.door_and_window_rectangles_to_light_information_converter import \
     DoorAndWindowRectanglesToLightInformationConverter
+from ...converters.shadow_caster_culling import (
+    ShadowCasterCullingStatistics, get_shadow_caster_culling_statistics,
+    reset_shadow_caster_culling_statistics)
+from ...models.awning import Awning
+from ...models.door_and_window import DoorAndWindow
 from ...models.door_and_window_rectangles import DoorAndWindowRectangles
+from ...models.obstacle import Obstacle
 from ...models.quadrilateral import Quadrilateral
 
 
@@ -111,3 +124,190 @@ def test_if_sun_is_in_front_of_door_and_window_and_awning_covers_sun():
     light_info = converter.convert(door_and_window_rectangles, 0, 0, 90, 0, 80)
 
     assert light_info.sunny_glazing_area_polygon.area == 0
+
+
+def test_convex_clipping_engine_if_sun_is_in_front_of_door_and_window_and_awning_covers_sun():
+    """
+    Tests if the convex clipping engine results empty sunny glazing area
+    if sun is in front of the window but it is fully covered by awning.
+    """
+    converter = DoorAndWindowRectanglesToLightInformationConverter()
+    door_and_window_rectangles = get_door_and_window_rectangles()
+
+    light_info = converter.convert(
+        door_and_window_rectangles, 0, 0, 90, 0, 80, engine=LIGHT_ENGINE_CONVEX_CLIPPING)
+
+    assert light_info.sunny_glazing_area == 0
+    assert light_info.sunny_glazing_area_polygon.area == 0
+
+
+@pytest.mark.parametrize('tilt', [90, 60, 30])
+@pytest.mark.parametrize('has_awning', [False, True])
+def test_convex_clipping_engine_is_same_as_shapely_engine(tilt: float, has_awning: bool):
+    """
+    Tests if the convex clipping engine calculates the same sunny glazing area
+    as the shapely engine for various sun positions.
+    """
+    door_and_window = DoorAndWindow(
+        'window',
+        'my window',
+        'manufacturer',
+        'model',
+        1000,
+        1400,
+        90,
+        89,
+        150,
+        200,
+        900,
+        120,
+        tilt,
+        [0, 0],
+        Awning(1400, 100, 800, -100, 100, 300, 50, 70) if has_awning else None
+    )
+    door_and_window_rectangles = DoorAndWindowToRectanglesConverter().convert(door_and_window)
+    converter = DoorAndWindowRectanglesToLightInformationConverter()
+
+    for solar_azimuth in range(30, 220, 7):
+        for solar_elevation in range(0, 90, 6):
+            arguments = (door_and_window_rectangles, 0, 120, tilt, solar_azimuth, solar_elevation)
+            shapely_light_info = converter.convert(*arguments, engine=LIGHT_ENGINE_SHAPELY)
+            convex_clipping_light_info = converter.convert(
+                *arguments, engine=LIGHT_ENGINE_CONVEX_CLIPPING)
+
+            assert math.isclose(
+                shapely_light_info.sunny_glazing_area,
+                convex_clipping_light_info.sunny_glazing_area,
+                rel_tol=1e-6,
+                abs_tol=1e-3
+            ), f'Sunny glazing area must be the same at ({solar_azimuth}, {solar_elevation})'
+            assert math.isclose(
+                shapely_light_info.sunny_glazing_area_polygon.area,
+                convex_clipping_light_info.sunny_glazing_area_polygon.area,
+                rel_tol=1e-6,
+                abs_tol=1e-3
+            )
+
+
+@pytest.mark.parametrize('engine', [LIGHT_ENGINE_SHAPELY, LIGHT_ENGINE_CONVEX_CLIPPING])
+def test_inside_rectangles_are_not_calculated(engine: str):
+    """
+    Tests if the inside rectangles are not calculated
+    during the light information calculation.
+    """
+    def get_inside_corners():
+        assert False, 'inside corners must not be calculated'
+
+    door_and_window_rectangles = get_door_and_window_rectangles()
+    door_and_window_rectangles = DoorAndWindowRectangles.from_corners(
+        door_and_window_rectangles.corners,
+        door_and_window_rectangles.has_awning,
+        get_inside_corners
+    )
+
+    light_info = DoorAndWindowRectanglesToLightInformationConverter().convert(
+        door_and_window_rectangles, 0, 0, 90, 0, 45, engine=engine)
+
+    assert light_info.sunny_glazing_area > 0
+
+
+@pytest.mark.parametrize('engine', [LIGHT_ENGINE_SHAPELY, LIGHT_ENGINE_CONVEX_CLIPPING])
+def test_shadow_casters_are_culled_if_sun_is_perpendicular(engine: str):
+    """
+    Tests if the glazing is fully sunny without any polygon operation
+    if the sun is perpendicular to the door and window.
+    """
+    converter = DoorAndWindowRectanglesToLightInformationConverter()
+    door_and_window_rectangles = get_door_and_window_rectangles()
+    reset_shadow_caster_culling_statistics()
+
+    light_info = converter.convert(door_and_window_rectangles, 0, 0, 90, 0, 0, engine=engine)
+
+    assert math.isclose(light_info.sunny_glazing_area, 822 * 1322)
+    assert get_shadow_caster_culling_statistics() == \
+        ShadowCasterCullingStatistics(fully_sunny=1, fully_shaded=0, clipped=0, culled=5)
+
+
+@pytest.mark.parametrize('engine', [LIGHT_ENGINE_SHAPELY, LIGHT_ENGINE_CONVEX_CLIPPING])
+def test_glazing_is_fully_shaded_if_awning_contains_it(engine: str):
+    """ Tests if the calculation is short-circuited if the awning shades the whole glazing. """
+    converter = DoorAndWindowRectanglesToLightInformationConverter()
+    corners = get_door_and_window_rectangles().corners.copy()
+    # a deep awning right above the glazing
+    corners[5] = [
+        [-500, 2400, 0, 1],
+        [500, 2400, 0, 1],
+        [500, 2400, -1000, 1],
+        [-500, 2400, -1000, 1]
+    ]
+    door_and_window_rectangles = DoorAndWindowRectangles.from_corners(
+        corners, True, lambda: None)
+    reset_shadow_caster_culling_statistics()
+
+    light_info = converter.convert(door_and_window_rectangles, 0, 0, 90, 0, 80, engine=engine)
+
+    assert light_info.sunny_glazing_area == 0
+    assert get_shadow_caster_culling_statistics().fully_shaded == 1
+
+
+@pytest.mark.parametrize('engine', [LIGHT_ENGINE_SHAPELY, LIGHT_ENGINE_CONVEX_CLIPPING])
+def test_obstacles_shade_glazing(engine: str):
+    """ Tests if the obstacles are subtracted like the other shadow casters. """
+    # a wall 1 m in front of the left half of the south facing window
+    door_and_window = DoorAndWindow(
+        'window',
+        'my window',
+        'manufacturer',
+        'model',
+        1000,
+        1400,
+        90,
+        89,
+        150,
+        200,
+        900,
+        180,
+        90,
+        [0, 0],
+        None,
+        obstacles=[
+            Obstacle.quad((-2000, 0, -1000), (0, 0, -1000), (0, 5000, -1000), (-2000, 5000, -1000))
+        ]
+    )
+    door_and_window_rectangles = DoorAndWindowToRectanglesConverter().convert(door_and_window)
+    converter = DoorAndWindowRectanglesToLightInformationConverter()
+
+    def get_sunny_glazing_area(solar_azimuth: float, solar_elevation: float) -> float:
+        return converter.convert(
+            door_and_window_rectangles,
+            0,
+            180,
+            90,
+            solar_azimuth,
+            solar_elevation,
+            engine=engine
+        ).sunny_glazing_area
+
+    # the sun is perpendicular, the left half of the glazing is shaded
+    assert math.isclose(get_sunny_glazing_area(180, 0), 411 * 1222)
+    # the sun is behind the wall as seen from the glazing
+    assert get_sunny_glazing_area(230, 20) == 0
+
+    reset_shadow_caster_culling_statistics()
+    sunny_glazing_area = get_sunny_glazing_area(120, 0)
+
+    # the wall is not even projected if the sun is on the other side
+    assert get_shadow_caster_culling_statistics().culled == 4
+    door_and_window.obstacles = []
+    assert math.isclose(
+        sunny_glazing_area,
+        converter.convert(
+            DoorAndWindowToRectanglesConverter().convert(door_and_window),
+            0,
+            180,
+            90,
+            120,
+            0,
+            engine=engine
+        ).sunny_glazing_area
+    )
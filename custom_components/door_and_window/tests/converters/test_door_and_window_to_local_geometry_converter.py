@@ -0,0 +1,150 @@
+""" Tests for door and window to local geometry converter. """
+import math
+
+import numpy as np
+import pytest
+
+from ...converters.door_and_window_to_local_geometry_converter import \
+    DoorAndWindowToLocalGeometryConverter
+from ...converters.door_and_window_to_rectangles_converter import \
+    DoorAndWindowToRectanglesConverter
+from ...models.awning import Awning
+from ...models.door_and_window import DoorAndWindow
+from ...models.quadrilateral import Quadrilateral
+
+
+def get_door_and_window(azimuth: float, tilt: float) -> DoorAndWindow:
+    """ Returns the test door and window """
+    return DoorAndWindow(
+        "Window",
+        "My window",
+        "Manufacturer",
+        "Model",
+        1000,
+        1500,
+        90,
+        89,
+        100,
+        200,
+        900,
+        azimuth,
+        tilt,
+        [0, 0],
+        Awning(1000, 1200, 1200, 0, 100, 0, 150, 100)
+    )
+
+
+def get_corners(quadrilateral: Quadrilateral):
+    """ Returns the corners of the specified quadrilateral """
+    return [
+        quadrilateral.corner_1,
+        quadrilateral.corner_2,
+        quadrilateral.corner_3,
+        quadrilateral.corner_4
+    ]
+
+
+def test_door_and_window_to_local_geometry_converter():
+    """ Tests the local geometry of a window looking to north. """
+    local_geometry = DoorAndWindowToLocalGeometryConverter().convert(get_door_and_window(0, 90))
+
+    assert local_geometry.glazing == (-411, 989, 411, 2311)
+    assert local_geometry.opening == (-500, 900, 500, 2400)
+    assert local_geometry.outside_depth == 100
+    np.testing.assert_allclose(local_geometry.normal, (1, 0, 0), atol=1e-9)
+    assert len(local_geometry.awning) == 4
+
+
+@pytest.mark.parametrize('azimuth', [0, 120, 250])
+@pytest.mark.parametrize('tilt', [90, 45, 10])
+def test_local_geometry_is_same_as_rectangles(azimuth: float, tilt: float):
+    """
+    Tests if the local geometry transformed back to the world coordinate system
+    is the same as the door and window rectangles.
+    """
+    door_and_window = get_door_and_window(azimuth, tilt)
+    local_geometry = DoorAndWindowToLocalGeometryConverter().convert(door_and_window)
+    rectangles = DoorAndWindowToRectanglesConverter().convert(door_and_window)
+    local_to_world = np.array(local_geometry.world_to_local).T
+
+    (left, bottom, right, top) = local_geometry.glazing
+    np.testing.assert_allclose(
+        np.matmul(np.array([
+            [left, bottom, 0],
+            [right, bottom, 0],
+            [right, top, 0],
+            [left, top, 0]
+        ]), local_to_world.T),
+        [corner[:3] for corner in get_corners(rectangles.glazing)],
+        atol=1e-6
+    )
+    np.testing.assert_allclose(
+        np.matmul(np.array(local_geometry.awning), local_to_world.T),
+        [corner[:3] for corner in get_corners(rectangles.awning)],
+        atol=1e-6
+    )
+    assert math.isclose(np.linalg.norm(local_geometry.normal), 1)
+
+
+@pytest.mark.parametrize(('prop', 'value'), [
+    ('width', 1200),
+    ('height', 1000),
+    ('frame_face_thickness', 50),
+    ('outside_depth', 300),
+    ('parapet_wall_height', 600),
+    ('azimuth', 120),
+    ('tilt', 45),
+    ('awning', None)
+])
+def test_door_and_window_to_local_geometry_converter_update(prop: str, value):
+    """
+    Tests if updating the local geometry after a property change
+    gives the same geometry as converting the changed door and window.
+    """
+    converter = DoorAndWindowToLocalGeometryConverter()
+    door_and_window = get_door_and_window(30, 70)
+    local_geometry = converter.convert(door_and_window)
+
+    setattr(door_and_window, prop, value)
+    updated_local_geometry = converter.update(door_and_window, local_geometry, {prop})
+    expected = converter.convert(door_and_window)
+
+    assert updated_local_geometry is not local_geometry
+    np.testing.assert_allclose(updated_local_geometry.world_to_local, expected.world_to_local)
+    np.testing.assert_allclose(updated_local_geometry.normal, expected.normal)
+    assert updated_local_geometry.glazing == expected.glazing
+    assert updated_local_geometry.opening == expected.opening
+    assert updated_local_geometry.outside_depth == expected.outside_depth
+    if expected.awning is None:
+        assert updated_local_geometry.awning is None
+    else:
+        np.testing.assert_allclose(updated_local_geometry.awning, expected.awning, atol=1e-9)
+
+
+def test_door_and_window_to_local_geometry_converter_update_awning_depth():
+    """ Tests if updating the local geometry after the awning moved recalculates the awning. """
+    converter = DoorAndWindowToLocalGeometryConverter()
+    door_and_window = get_door_and_window(30, 70)
+    local_geometry = converter.convert(door_and_window)
+
+    door_and_window.awning.cover_position = 30
+    updated_local_geometry = converter.update(door_and_window, local_geometry, {'awning'})
+
+    assert updated_local_geometry.world_to_local is local_geometry.world_to_local
+    np.testing.assert_allclose(
+        updated_local_geometry.awning,
+        converter.convert(door_and_window).awning,
+        atol=1e-9
+    )
+
+
+@pytest.mark.parametrize('prop', ['frame_thickness', 'inside_depth'])
+def test_door_and_window_to_local_geometry_converter_update_inside(prop: str):
+    """ Tests if the local geometry is kept when only the inside parts change. """
+    converter = DoorAndWindowToLocalGeometryConverter()
+    door_and_window = get_door_and_window(30, 70)
+    local_geometry = converter.convert(door_and_window)
+
+    setattr(door_and_window, prop, 10)
+
+    assert converter.update(door_and_window, local_geometry, {prop}) is local_geometry
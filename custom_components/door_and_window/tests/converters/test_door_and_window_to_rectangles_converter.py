@@ -1,8 +1,12 @@
 """ Tests for door and window to rectangle converter. """
+import numpy as np
+import pytest
+
 from ...converters.door_and_window_to_rectangles_converter import \
     DoorAndWindowToRectanglesConverter
 from ...models.awning import Awning
 from ...models.door_and_window import DoorAndWindow
+from ...models.obstacle import Obstacle
 from ...models.quadrilateral import Quadrilateral
 from ..utils import assert_quadrilaterals_are_close
 
@@ -417,3 +421,135 @@ def test_door_and_window_to_rectangles_converter_with_0_tilt():
     )
 
     assert rectangles.awning is None
+
+
+@pytest.mark.parametrize(('prop', 'value'), [
+    ('width', 1200),
+    ('height', 1000),
+    ('frame_thickness', 70),
+    ('frame_face_thickness', 50),
+    ('outside_depth', 300),
+    ('inside_depth', 100),
+    ('parapet_wall_height', 600),
+    ('azimuth', 120),
+    ('tilt', 45),
+    ('awning', None)
+])
+def test_door_and_window_to_rectangles_converter_update(prop: str, value):
+    """
+    Tests if updating the rectangles after a property change
+    gives the same rectangles as converting the changed door and window.
+    """
+    converter = DoorAndWindowToRectanglesConverter()
+    door_and_window = DoorAndWindow(
+        "Window",
+        "My window",
+        "Manufacturer",
+        "Model",
+        1000,
+        1500,
+        90,
+        89,
+        100,
+        200,
+        900,
+        0,
+        90,
+        [0, 0],
+        Awning(1000, 1200, 1200, 0, 100, 0, 150, 100)
+    )
+    rectangles = converter.convert(door_and_window)
+    corners = rectangles.corners.copy()
+
+    setattr(door_and_window, prop, value)
+    updated_rectangles = converter.update(door_and_window, rectangles, {prop})
+    expected = converter.convert(door_and_window)
+
+    np.testing.assert_allclose(updated_rectangles.corners, expected.corners, atol=1e-9)
+    np.testing.assert_allclose(
+        updated_rectangles.inside_corners,
+        expected.inside_corners,
+        atol=1e-9
+    )
+    assert updated_rectangles.has_awning == expected.has_awning
+    # the earlier rectangles are not modified
+    np.testing.assert_array_equal(rectangles.corners, corners)
+
+
+def test_door_and_window_to_rectangles_converter_update_awning_depth():
+    """ Tests if updating the rectangles after the awning moved recalculates only the awning. """
+    converter = DoorAndWindowToRectanglesConverter()
+    door_and_window = DoorAndWindow(
+        "Window",
+        "My window",
+        "Manufacturer",
+        "Model",
+        1000,
+        1500,
+        90,
+        89,
+        100,
+        200,
+        900,
+        30,
+        70,
+        [0, 0],
+        Awning(1000, 100, 1200, 0, 100, 0, 150, 100)
+    )
+    rectangles = converter.convert(door_and_window)
+
+    door_and_window.awning.cover_position = 30
+    updated_rectangles = converter.update(door_and_window, rectangles, {'awning'})
+
+    np.testing.assert_allclose(
+        updated_rectangles.corners,
+        converter.convert(door_and_window).corners,
+        atol=1e-9
+    )
+    np.testing.assert_array_equal(updated_rectangles.corners[:5], rectangles.corners[:5])
+
+
+def test_door_and_window_to_rectangles_converter_update_obstacles():
+    """
+    Tests if the obstacles are transformed with the rectangles and indexed again
+    only if they or the glazing have changed.
+    """
+    converter = DoorAndWindowToRectanglesConverter()
+    door_and_window = DoorAndWindow(
+        "Window",
+        "My window",
+        "Manufacturer",
+        "Model",
+        1000,
+        1500,
+        90,
+        89,
+        100,
+        200,
+        900,
+        90,
+        90,
+        [0, 0],
+        None,
+        obstacles=[Obstacle.quad((0, 0, -1000), (0, 0, -2000), (0, 3000, -2000), (0, 3000, -1000))]
+    )
+    rectangles = converter.convert(door_and_window)
+
+    # the window is heading to east, which is the negative X of the rectangles
+    np.testing.assert_allclose(
+        rectangles.obstacles.vertices,
+        [[-1000, 0, 0, 1], [-2000, 0, 0, 1], [-2000, 3000, 0, 1], [-1000, 3000, 0, 1]],
+        atol=1e-9
+    )
+
+    door_and_window.outside_depth = 300
+    updated_rectangles = converter.update(door_and_window, rectangles, {'outside_depth'})
+    assert updated_rectangles.obstacles is rectangles.obstacles
+
+    door_and_window.width = 1200
+    updated_rectangles = converter.update(door_and_window, rectangles, {'width'})
+    assert updated_rectangles.obstacles is not rectangles.obstacles
+
+    door_and_window.obstacles = None
+    updated_rectangles = converter.update(door_and_window, rectangles, {'obstacles'})
+    assert updated_rectangles.obstacles is None
@@ -0,0 +1,53 @@
+""" Test module for `HorizonFileToHorizonConverter` class. """
+import numpy as np
+import pytest
+
+from ...converters.horizon_file_to_horizon_converter import \
+    HorizonFileToHorizonConverter
+
+PVGIS_HORIZON = """Latitude (decimal degrees):\t47.500
+Longitude (decimal degrees):\t19.040
+Horizon data from DEM
+A\tH_hor\tA_sun(w)\tH_sun(w)\tA_sun(s)\tH_sun(s)
+-180.0\t4.0\t-180.0\t0.0\t-180.0\t0.0
+-90.0\t2.0\t-120.0\t0.0\t-120.0\t18.0
+0.0\t8.0\t0.0\t19.0\t0.0\t66.0
+90.0\t6.0\t120.0\t0.0\t120.0\t18.0
+180.0\t4.0\t180.0\t0.0\t180.0\t0.0
+
+A: Azimuth (0 = S, 90 = W, -90 = E) (degree)
+H_hor: Horizon height (degree)
+"""
+
+
+def test_convert_pvgis_horizon():
+    """ Tests if the PVGIS azimuths measured from south are turned to north. """
+    horizon = HorizonFileToHorizonConverter().convert(PVGIS_HORIZON)
+
+    assert horizon.dtype == np.float32
+    # north, east, south, west
+    assert horizon.tolist() == [4, 2, 8, 6]
+
+
+def test_convert_csv_horizon():
+    """ Tests if the azimuth and elevation rows are resampled to equal distances. """
+    horizon = HorizonFileToHorizonConverter().convert(
+        "azimuth,elevation\n0,10\n90,20\n135,30\n270,0\n")
+
+    assert len(horizon) == 8
+    assert horizon.tolist() == pytest.approx([10, 15, 20, 30, 20, 10, 0, 5])
+
+
+def test_convert_elevation_list():
+    """ Tests if a list of the elevations in equal distances is kept. """
+    converter = HorizonFileToHorizonConverter()
+
+    assert converter.convert("1\n2\n3\n4\n").tolist() == [1, 2, 3, 4]
+    assert converter.convert("1.5; 2; 3").tolist() == [1.5, 2, 3]
+
+
+@pytest.mark.parametrize('content', ['', 'not a horizon', '5', '0,95\n90,0\n', '1\n' * 3601])
+def test_convert_invalid_horizon(content: str):
+    """ Tests if an invalid horizon is refused. """
+    with pytest.raises(ValueError):
+        HorizonFileToHorizonConverter().convert(content)
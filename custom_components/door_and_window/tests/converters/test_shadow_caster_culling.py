@@ -0,0 +1,62 @@
+""" Tests for shadow caster culling functions. """
+from ...converters.shadow_caster_culling import (
+    ShadowCasterCullingStatistics, cull_shadow_casters,
+    get_shadow_caster_culling_statistics,
+    reset_shadow_caster_culling_statistics)
+
+GLAZING = [(0.0, 0.0), (10.0, 0.0), (10.0, 10.0), (0.0, 10.0)]
+
+
+def test_cull_shadow_casters_outside_bounding_box():
+    """ Tests if the shadow casters outside or touching the glazing are dropped. """
+    reset_shadow_caster_culling_statistics()
+
+    overlapping = cull_shadow_casters(GLAZING, [
+        [(10.0, 0.0), (12.0, 0.0), (12.0, 10.0), (10.0, 10.0)],
+        [(-5.0, 11.0), (15.0, 11.0), (15.0, 12.0), (-5.0, 12.0)]
+    ])
+
+    assert overlapping == []
+    assert get_shadow_caster_culling_statistics() == \
+        ShadowCasterCullingStatistics(fully_sunny=1, fully_shaded=0, clipped=0, culled=2)
+
+
+def test_cull_shadow_casters_without_area():
+    """ Tests if the shadow casters seen edge-on are dropped. """
+    reset_shadow_caster_culling_statistics()
+
+    overlapping = cull_shadow_casters(GLAZING, [
+        [(5.0, -1.0), (5.0, 11.0), (5.0, 11.0), (5.0, -1.0)],
+        [(2.0, 2.0), (4.0, 2.0), (4.0, 4.0), (2.0, 4.0)]
+    ])
+
+    assert overlapping == [1]
+    assert get_shadow_caster_culling_statistics() == \
+        ShadowCasterCullingStatistics(fully_sunny=0, fully_shaded=0, clipped=1, culled=1)
+
+
+def test_cull_shadow_casters_containing_glazing():
+    """ Tests if the glazing is fully shaded if a shadow caster contains it. """
+    reset_shadow_caster_culling_statistics()
+
+    overlapping = cull_shadow_casters(GLAZING, [
+        [(2.0, 2.0), (4.0, 2.0), (4.0, 4.0), (2.0, 4.0)],
+        # a clockwise diamond around the glazing
+        [(5.0, -6.0), (-6.0, 5.0), (5.0, 16.0), (16.0, 5.0)]
+    ])
+
+    assert overlapping is None
+    assert get_shadow_caster_culling_statistics() == \
+        ShadowCasterCullingStatistics(fully_sunny=0, fully_shaded=1, clipped=0, culled=1)
+
+
+def test_cull_shadow_casters_overlapping_bounding_box_only():
+    """
+    Tests if a shadow caster which bounding box overlaps the glazing
+    is kept even if it does not contain the glazing.
+    """
+    overlapping = cull_shadow_casters(GLAZING, [
+        [(5.0, -4.0), (-4.0, 5.0), (5.0, 14.0), (14.0, 5.0)]
+    ])
+
+    assert overlapping == [0]
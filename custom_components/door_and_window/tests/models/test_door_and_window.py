@@ -1,12 +1,19 @@
-# pylint: disable=missing-function-docstring
+# pylint: disable=missing-function-docstring, too-many-lines
 """Test module for `DoorAndWindow` class."""
 import math
 from typing import Any
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 from shapely.geometry import Polygon
 
+from ...const import (LIGHT_ENGINE_CLOSED_FORM, LIGHT_ENGINE_CONVEX_CLIPPING,
+                      LIGHT_ENGINE_TABLE)
+from ...converters.door_and_window_local_geometry_to_light_information_converter import \
+    DoorAndWindowLocalGeometryToLightInformationConverter
+from ...converters.door_and_window_local_geometry_to_shading_table_converter import \
+    DoorAndWindowLocalGeometryToShadingTableConverter
 from ...converters.door_and_window_rectangles_to_light_information_converter import \
     DoorAndWindowRectanglesToLightInformationConverter
 from ...converters.door_and_window_to_rectangles_converter import \
@@ -15,6 +22,12 @@ from ...models.awning import Awning
 from ...models.door_and_window import DoorAndWindow
 from ...models.door_and_window_light_information import \
     DoorAndWindowLightInformation
+from ...models.door_and_window_light_state import DoorAndWindowLightState
+from ...models.door_and_window_output_thresholds import \
+    DoorAndWindowOutputThresholds
+from ...models.facade import Facade
+from ...models.horizon_profile import HorizonProfile
+from ...models.obstacle import Obstacle
 
 
 @pytest.mark.parametrize('prop', [
@@ -316,3 +329,700 @@ def test_if_rectangles_updated(prop: str):
 
             # rectangle converting should be called after updating (and no property changed)
             assert convert_mock.call_count == 2
+
+
+def test_closed_form_light_engine():
+    door_and_window_args = (
+        'window',
+        'my window',
+        'manufacturer',
+        'model',
+        900,
+        1200,
+        90,
+        89,
+        100,
+        200,
+        900,
+        150,
+        90,
+        [0, 0],
+    )
+    closed_form = DoorAndWindow(
+        *door_and_window_args,
+        Awning(1000, 1200, 1200, 0, 100, 0, 150, 100),
+        light_engine=LIGHT_ENGINE_CLOSED_FORM
+    )
+    convex_clipping = DoorAndWindow(
+        *door_and_window_args,
+        Awning(1000, 1200, 1200, 0, 100, 0, 150, 100),
+        light_engine=LIGHT_ENGINE_CONVEX_CLIPPING
+    )
+
+    for (sun_azimuth, sun_elevation) in [(90, 10), (150, 20), (170, 45), (220, 5), (330, 10)]:
+        closed_form.update(sun_azimuth, sun_elevation)
+        convex_clipping.update(sun_azimuth, sun_elevation)
+
+        assert closed_form.angle_of_incidence == convex_clipping.angle_of_incidence
+        assert math.isclose(
+            closed_form.sunny_glazing_area,
+            convex_clipping.sunny_glazing_area,
+            abs_tol=0.01
+        )
+
+    # the geometry must be recalculated after a property has changed
+    closed_form.width = convex_clipping.width = 1100
+    closed_form.update(150, 20)
+    convex_clipping.update(150, 20)
+    assert math.isclose(
+        closed_form.sunny_glazing_area,
+        convex_clipping.sunny_glazing_area,
+        abs_tol=0.01
+    )
+
+
+@pytest.mark.parametrize('tilt', [90, 45])
+@pytest.mark.parametrize('has_awning', [False, True])
+def test_get_light_information_batch(tilt: float, has_awning: bool):
+    door_and_window = DoorAndWindow(
+        'window',
+        'my window',
+        'manufacturer',
+        'model',
+        1000,
+        1400,
+        90,
+        89,
+        150,
+        200,
+        900,
+        120,
+        tilt,
+        [10, 5, 20, 0],
+        Awning(1400, 100, 800, -100, 100, 300, 50, 70) if has_awning else None
+    )
+    # the sun positions in front of the door and window
+    (sun_azimuths, sun_elevations) = np.meshgrid(np.arange(35, 210, 7), np.arange(0, 90, 6))
+    sun_azimuths = sun_azimuths.ravel()
+    sun_elevations = sun_elevations.ravel()
+
+    fired = []
+    door_and_window.on_sunny_glazing_area_changed(fired.append)
+    batch = door_and_window.get_light_information_batch(sun_azimuths, sun_elevations)
+
+    # the state of the door and window must not be changed
+    assert not fired
+    assert door_and_window.sunny_glazing_area is None
+    assert len(batch.sunny_glazing_area) == len(sun_azimuths)
+
+    for (index, (sun_azimuth, sun_elevation)) in enumerate(zip(sun_azimuths, sun_elevations)):
+        door_and_window.update(sun_azimuth, sun_elevation)
+
+        assert batch.angle_of_incidence[index] == door_and_window.angle_of_incidence
+        assert batch.horizon_elevation_at_sun_azimuth[index] == \
+            door_and_window.horizon_elevation_at_sun_azimuth
+        assert math.isclose(
+            batch.sunny_glazing_area[index],
+            door_and_window.sunny_glazing_area,
+            abs_tol=0.02
+        )
+        assert math.isclose(
+            batch.sunny_glazing_area_percentage[index],
+            door_and_window.sunny_glazing_area_percentage,
+            abs_tol=0.02
+        )
+        assert batch.glazing_has_direct_sunlight[index] == \
+            door_and_window.glazing_has_direct_sunlight
+
+
+@pytest.mark.parametrize('light_engine', [LIGHT_ENGINE_CLOSED_FORM, LIGHT_ENGINE_TABLE])
+def test_obstacles_replace_local_geometry_engines(light_engine: str):
+    door_and_window_args = (
+        'window',
+        'my window',
+        'manufacturer',
+        'model',
+        1000,
+        1400,
+        90,
+        89,
+        150,
+        200,
+        900,
+        160,
+        90,
+        [0, 0],
+        Awning(1000, 1200, 1200, 0, 100, 0, 150, 100)
+    )
+    door_and_window = DoorAndWindow(*door_and_window_args, light_engine=light_engine)
+    convex_clipping = DoorAndWindow(
+        *door_and_window_args,
+        light_engine=LIGHT_ENGINE_CONVEX_CLIPPING,
+        obstacles=[
+            # a neighbouring building and a tree
+            Obstacle.prism([(-3000, -4000), (0, -4000), (0, -9000), (-3000, -9000)], 0, 6000),
+            Obstacle.prism([(1000, -3000), (2000, -3000), (1500, -4000)], 2000, 5000)
+        ]
+    )
+    geometry_version = door_and_window.geometry_version
+
+    door_and_window.obstacles = list(convex_clipping.obstacles)
+
+    assert door_and_window.obstacles == convex_clipping.obstacles
+    assert door_and_window.geometry_version > geometry_version
+
+    sun_positions = [
+        (azimuth, elevation) for azimuth in range(80, 260, 15) for elevation in (5, 30)
+    ]
+    batch = door_and_window.get_light_information_batch(*zip(*sun_positions))
+    shaded_count = 0
+    for (index, (sun_azimuth, sun_elevation)) in enumerate(sun_positions):
+        door_and_window.update(sun_azimuth, sun_elevation)
+        convex_clipping.update(sun_azimuth, sun_elevation)
+
+        assert door_and_window.sunny_glazing_area == convex_clipping.sunny_glazing_area
+        assert math.isclose(
+            batch.sunny_glazing_area[index],
+            convex_clipping.sunny_glazing_area,
+            abs_tol=0.02
+        )
+        assert batch.glazing_has_direct_sunlight[index] == \
+            convex_clipping.glazing_has_direct_sunlight
+        shaded_count += convex_clipping.sunny_glazing_area == 0
+
+    assert 0 < shaded_count < len(sun_positions)
+
+    # without obstacles the light engine is used again
+    door_and_window.obstacles = None
+    with patch.object(
+        DoorAndWindowRectanglesToLightInformationConverter,
+        'convert'
+    ) as convert_mock:
+        door_and_window.update(160, 30)
+
+    assert door_and_window.obstacles == ()
+    convert_mock.assert_not_called()
+
+
+def test_get_light_information_batch_if_sun_is_behind():
+    door_and_window = DoorAndWindow(
+        'window',
+        'my window',
+        'manufacturer',
+        'model',
+        900,
+        1200,
+        90,
+        89,
+        100,
+        200,
+        900,
+        0,  # heading to north
+        90,
+        [0, 0],
+        None
+    )
+
+    batch = door_and_window.get_light_information_batch([180, 0], [10, 0])
+
+    assert np.isnan(batch.horizon_elevation_at_sun_azimuth[0])
+    assert batch.horizon_elevation_at_sun_azimuth[1] == 0
+    np.testing.assert_allclose(batch.sunny_glazing_area, [0, (900 - 89*2) * (1200 - 89*2)])
+    np.testing.assert_allclose(batch.sunny_glazing_area_percentage, [0, 100])
+    assert batch.glazing_has_direct_sunlight.tolist() == [False, True]
+
+
+def test_table_light_engine():
+    def create_door_and_window(light_engine: str):
+        return DoorAndWindow(
+            'window',
+            'my window',
+            'manufacturer',
+            'model',
+            900,
+            1200,
+            90,
+            89,
+            100,
+            200,
+            900,
+            150,
+            90,
+            [10, 0],
+            Awning(1000, 1200, 1200, 0, 100, 0, 150, 100),
+            light_engine=light_engine,
+            shading_table_resolution=2,
+            shading_table_error_bound=1
+        )
+    door_and_window = create_door_and_window(LIGHT_ENGINE_TABLE)
+    expected = create_door_and_window(LIGHT_ENGINE_CONVEX_CLIPPING)
+    builders = []
+    door_and_window.on_shading_table_rebuild_requested(builders.append)
+
+    # the closed form is used until the table is built, the table is requested only once
+    door_and_window.update(150, 20)
+    door_and_window.update(151, 20)
+    expected.update(151, 20)
+    assert len(builders) == 1
+    assert math.isclose(
+        door_and_window.sunny_glazing_area,
+        expected.sunny_glazing_area,
+        abs_tol=0.01
+    )
+
+    door_and_window.shading_table = builders[0]()
+    assert door_and_window.shading_table is not None
+
+    with patch.object(
+        DoorAndWindowLocalGeometryToLightInformationConverter,
+        'convert'
+    ) as convert_mock:
+        for (sun_azimuth, sun_elevation) in [(100, 20), (150, 35), (200, 5), (330, 10)]:
+            door_and_window.update(sun_azimuth, sun_elevation)
+            expected.update(sun_azimuth, sun_elevation)
+
+            assert door_and_window.horizon_elevation_at_sun_azimuth == \
+                expected.horizon_elevation_at_sun_azimuth
+            assert door_and_window.angle_of_incidence == expected.angle_of_incidence
+            assert math.isclose(
+                door_and_window.sunny_glazing_area_percentage,
+                expected.sunny_glazing_area_percentage,
+                abs_tol=1.5
+            )
+        convert_mock.assert_not_called()
+
+    # the table becomes outdated when the geometry changes
+    stale_builder = builders[0]
+    door_and_window.width = 1000
+    door_and_window.update(150, 20)
+    assert len(builders) == 2
+
+    door_and_window.shading_table = stale_builder()
+    assert door_and_window.shading_table is None
+
+
+def test_shading_table_out_of_error_bound_is_not_used():
+    """ Tests if the closed form is used if the shading table is out of the error bound. """
+    door_and_window = DoorAndWindow(
+        'window', 'my window', 'manufacturer', 'model',
+        900, 1200, 90, 89, 100, 200, 900, 150, 90, [0, 0],
+        Awning(1000, 1200, 1200, 0, 100, 0, 150, 100),
+        light_engine=LIGHT_ENGINE_TABLE,
+        shading_table_resolution=5,
+        shading_table_error_bound=0.1
+    )
+    builders = []
+    door_and_window.on_shading_table_rebuild_requested(builders.append)
+    door_and_window.update(150, 20)
+
+    # the error bound is not reached by the smallest resolution
+    door_and_window.shading_table = DoorAndWindowLocalGeometryToShadingTableConverter().convert(
+        door_and_window.local_geometry, 150, 90, 5, 0.1, min_resolution=5)
+    assert door_and_window.shading_table.error > 0.1
+
+    with patch.object(
+        DoorAndWindowLocalGeometryToLightInformationConverter,
+        'convert',
+        wraps=DoorAndWindowLocalGeometryToLightInformationConverter().convert
+    ) as convert_mock:
+        door_and_window.update(151, 20)
+        convert_mock.assert_called_once()
+    # the table is not requested again for the same geometry
+    assert len(builders) == 1
+
+
+def test_update_completed():
+    """
+    Tests if the update completed event is fired once per update
+    with the snapshot of the changed properties.
+    """
+    door_and_window = DoorAndWindow(
+        'window',
+        'my window',
+        'manufacturer',
+        'model',
+        900,
+        1200,
+        90,
+        89,
+        100,
+        200,
+        900,
+        0,  # heading to north
+        90,
+        [0, 0],
+        None
+    )
+    light_states = []
+    door_and_window.on_update_completed(light_states.append)
+
+    door_and_window.update(180, 10)  # sun is behind the window
+    door_and_window.update(180, 10)  # nothing changed
+    door_and_window.update(0, 10)  # sun is in front of the window
+
+    assert len(light_states) == 2
+    assert light_states[0].changed == frozenset({
+        'angle_of_incidence',
+        'sunny_glazing_area',
+        'sunny_glazing_area_percentage',
+        'glazing_has_direct_sunlight'
+    })
+    assert light_states[0].horizon_elevation_at_sun_azimuth is None
+    assert light_states[0].glazing_has_direct_sunlight is False
+    assert light_states[1].changed == frozenset({
+        'horizon_elevation_at_sun_azimuth',
+        'angle_of_incidence',
+        'sunny_glazing_area',
+        'sunny_glazing_area_percentage',
+        'glazing_has_direct_sunlight'
+    })
+    assert light_states[1].glazing_has_direct_sunlight is True
+    assert light_states[1].sunny_glazing_area == door_and_window.sunny_glazing_area
+    assert door_and_window.light_state == light_states[1]._replace(changed=frozenset())
+
+    with pytest.raises(AttributeError):
+        light_states[1].angle_of_incidence = 0
+
+
+def test_output_thresholds():
+    """
+    Tests if the changes smaller than the dead-bands are not published
+    but the meaningful transitions are.
+    """
+    door_and_window = DoorAndWindow(
+        'window', 'my window', 'manufacturer', 'model',
+        1000, 1000, 90, 0, 100, 200, 900, 0, 90, [0, 0], None,
+        output_thresholds=DoorAndWindowOutputThresholds(
+            horizon_elevation_at_sun_azimuth=1,
+            angle_of_incidence=2,
+            sunny_glazing_area=1000,
+            sunny_glazing_area_percentage=1
+        )
+    )
+    light_states = []
+    door_and_window.on_update_completed(light_states.append)
+
+    door_and_window.set_light_information(10, 30, 500000)
+    door_and_window.set_light_information(10.5, 31, 500500)  # within the dead-bands
+
+    assert len(light_states) == 1
+    assert door_and_window.light_state == \
+        DoorAndWindowLightState(10, 30, 500000, 50, True, frozenset())
+
+    door_and_window.set_light_information(11, 32, 510000)
+
+    assert light_states[-1].changed == frozenset({
+        'horizon_elevation_at_sun_azimuth',
+        'angle_of_incidence',
+        'sunny_glazing_area',
+        'sunny_glazing_area_percentage'
+    })
+    assert door_and_window.sunny_glazing_area_percentage == 51
+
+    # getting fully shaded and the sun getting behind are always published
+    door_and_window.set_light_information(11, 89.5, 0)
+    assert door_and_window.sunny_glazing_area == 0
+    assert not door_and_window.glazing_has_direct_sunlight
+    door_and_window.set_light_information(None, 90.5, 0)
+    assert door_and_window.angle_of_incidence == 90.5
+    assert door_and_window.horizon_elevation_at_sun_azimuth is None
+
+    # the sunny glazing area is published where the direct sunlight switches
+    door_and_window.set_light_information(None, 90.5, 0.01)
+    assert door_and_window.sunny_glazing_area == 0
+    assert not door_and_window.glazing_has_direct_sunlight
+    door_and_window.set_light_information(None, 90.5, 0.02)
+    assert door_and_window.sunny_glazing_area == 0.02
+    assert door_and_window.glazing_has_direct_sunlight
+
+    # getting fully sunny is always published
+    door_and_window.set_light_information(11, 30, 999500)
+    door_and_window.set_light_information(11, 30, 1000000)
+    assert door_and_window.sunny_glazing_area_percentage == 100
+
+
+def test_glazing_has_direct_sunlight_hysteresis():
+    """ Tests if the direct sunlight is switched on above the hysteresis only. """
+    door_and_window = DoorAndWindow(
+        'window', 'my window', 'manufacturer', 'model',
+        1000, 1000, 90, 0, 100, 200, 900, 0, 90, [0, 0], None,
+        output_thresholds=DoorAndWindowOutputThresholds(
+            glazing_has_direct_sunlight_hysteresis=100
+        )
+    )
+
+    door_and_window.set_light_information(0, 30, 50)
+    assert not door_and_window.glazing_has_direct_sunlight
+
+    door_and_window.set_light_information(0, 30, 150)
+    assert door_and_window.glazing_has_direct_sunlight
+
+    door_and_window.set_light_information(0, 30, 50)
+    assert door_and_window.glazing_has_direct_sunlight
+
+    door_and_window.set_light_information(0, 30, 0)
+    assert not door_and_window.glazing_has_direct_sunlight
+
+
+@pytest.mark.parametrize('light_engine', [LIGHT_ENGINE_CONVEX_CLIPPING, LIGHT_ENGINE_CLOSED_FORM])
+def test_geometry_updated_after_awning_moved(light_engine: str):
+    """ Tests if moving the awning passed to the constructor changes the sunny glazing area. """
+    door_and_window = DoorAndWindow(
+        'window', 'my window', 'manufacturer', 'model',
+        1000, 1400, 90, 89, 150, 200, 900, 180, 90, [0, 0],
+        Awning(1400, 100, 800, -100, 100, 300, 50, 0),
+        light_engine=light_engine
+    )
+    sunny_glazing_areas = []
+    for cover_position in [0, 50, 100, 0]:
+        door_and_window.awning.cover_position = cover_position
+        door_and_window.update(190, 60)
+        sunny_glazing_areas.append(door_and_window.sunny_glazing_area_percentage)
+
+    assert sunny_glazing_areas == [42.2, 18.85, 0, 42.2]
+
+
+def test_shading_table_kept_after_inside_change():
+    """ Tests if the shading table is kept when only the inside parts change. """
+    door_and_window = DoorAndWindow(
+        'window', 'my window', 'manufacturer', 'model',
+        900, 1200, 90, 89, 100, 200, 900, 150, 90, [0, 0], None,
+        light_engine=LIGHT_ENGINE_TABLE,
+        shading_table_resolution=5,
+        shading_table_error_bound=5
+    )
+    builders = []
+    door_and_window.on_shading_table_rebuild_requested(builders.append)
+    door_and_window.update(150, 20)
+    door_and_window.shading_table = builders[0]()
+    local_geometry = door_and_window.local_geometry
+
+    door_and_window.frame_thickness = 50
+    door_and_window.inside_depth = 300
+
+    assert door_and_window.local_geometry is local_geometry
+    assert door_and_window.shading_table is not None
+
+    door_and_window.frame_face_thickness = 50
+
+    assert door_and_window.local_geometry is not local_geometry
+    assert door_and_window.shading_table is None
+
+
+def test_batch_update():
+    """ Tests if the changes of a batch update are published once and rebuild the geometry once. """
+    door_and_window = DoorAndWindow(
+        'window', 'my window', 'manufacturer', 'model',
+        900, 1200, 90, 89, 100, 200, 900, 150, 90, [0, 0], None
+    )
+    door_and_window.update(150, 20)
+    changes = []
+    for prop in ['width', 'height', 'tilt', 'awning']:
+        getattr(door_and_window, f'on_{prop}_changed')(
+            lambda value, prop=prop: changes.append((prop, value))
+        )
+    light_states = []
+    door_and_window.on_update_completed(light_states.append)
+
+    with patch.object(
+        DoorAndWindowToRectanglesConverter,
+        'update',
+        wraps=DoorAndWindowToRectanglesConverter().update
+    ) as update_mock:
+        with door_and_window.batch_update():
+            door_and_window.width = 1000
+            door_and_window.width = 1100
+            door_and_window.height = 1300
+            door_and_window.tilt = 90
+            assert not changes
+
+        assert changes == [('width', 1100), ('height', 1300)]
+
+        door_and_window.update(150, 20)
+
+        update_mock.assert_called_once()
+        assert len(light_states) == 1
+
+
+def test_update_skipped_for_same_inputs():
+    """ Tests if an update with the same inputs as the previous one returns immediately. """
+    door_and_window = DoorAndWindow(
+        'window', 'my window', 'manufacturer', 'model',
+        900, 1200, 90, 89, 100, 200, 900, 150, 90, [0, 0], None
+    )
+    version = door_and_window.geometry_version
+
+    with patch.object(
+        DoorAndWindowRectanglesToLightInformationConverter,
+        'convert',
+        wraps=DoorAndWindowRectanglesToLightInformationConverter().convert
+    ) as convert_mock:
+        door_and_window.update(150, 20)
+        door_and_window.update(150, 20)
+        door_and_window.update(510, 20)
+        assert convert_mock.call_count == 1
+        assert door_and_window.skipped_update_count == 2
+
+        # the geometry, the horizon profile and the thresholds are inputs of the update
+        door_and_window.width = 1000
+        assert door_and_window.geometry_version > version
+        door_and_window.update(150, 20)
+        door_and_window.horizon_profile = [10, 0]
+        door_and_window.update(150, 20)
+        door_and_window.output_thresholds = DoorAndWindowOutputThresholds(sunny_glazing_area=1)
+        door_and_window.update(150, 20)
+        assert convert_mock.call_count == 4
+
+        # the light state set by another one is not the result of the previous update
+        door_and_window.set_light_information(None, 90, 0)
+        door_and_window.update(150, 20)
+        assert convert_mock.call_count == 5
+        assert door_and_window.sunny_glazing_area > 0
+        assert door_and_window.skipped_update_count == 2
+
+
+@pytest.mark.parametrize('tilt', [90, 45])
+def test_is_sun_in_view(tilt: float):
+    """
+    Tests if the sun is out of view only at the positions
+    where the door and window has no sunny glazing area.
+    """
+    door_and_window = DoorAndWindow(
+        'window', 'my window', 'manufacturer', 'model',
+        900, 1200, 90, 89, 100, 200, 900, 180, tilt, [5, 10, 20], None,
+        light_engine=LIGHT_ENGINE_CLOSED_FORM
+    )
+
+    assert door_and_window.is_sun_in_view(180, 30)
+    # at night
+    assert not door_and_window.is_sun_in_view(0, -30)
+    # behind the door and window
+    assert not door_and_window.is_sun_in_view(20, 30)
+    # lower than the lowest horizon profile value
+    assert not door_and_window.is_sun_in_view(180, 4)
+
+    for sun_azimuth in range(0, 360, 15):
+        for sun_elevation in range(-30, 90, 3):
+            if not door_and_window.is_sun_in_view(sun_azimuth, sun_elevation):
+                door_and_window.update(sun_azimuth, sun_elevation)
+                assert door_and_window.sunny_glazing_area == 0, \
+                    f'{sun_azimuth}, {sun_elevation}'
+
+
+def test_compiled_horizon_profile():
+    """ Tests if the horizon profile is compiled again only after it has changed. """
+    door_and_window = DoorAndWindow(
+        'window', 'my window', 'manufacturer', 'model',
+        900, 1200, 90, 89, 100, 200, 900, 180, 90, [0, 10, 0], None
+    )
+    compiled_horizon_profile = door_and_window.compiled_horizon_profile
+
+    door_and_window.width = 1000
+    assert door_and_window.compiled_horizon_profile is compiled_horizon_profile
+    assert compiled_horizon_profile.elevations.tolist() == [0, 10, 0]
+
+    door_and_window.horizon_profile = None
+    assert door_and_window.compiled_horizon_profile.elevations.tolist() == [0, 0]
+    door_and_window.update(180, 30)
+    assert door_and_window.horizon_elevation_at_sun_azimuth == 0
+
+
+def test_facade():
+    facade = Facade('south', [30, 30])
+    door_and_window_args = (
+        'window',
+        'my window',
+        'manufacturer',
+        'model',
+        1000,
+        1400,
+        90,
+        89,
+        150,
+        200,
+        900,
+        180,
+        90,
+        [0, 0],
+        None
+    )
+    left = DoorAndWindow(*door_and_window_args, facade=facade, facade_position=1000)
+    right = DoorAndWindow(*door_and_window_args, facade=facade, facade_position=4000)
+
+    # the horizon elevation is looked up once for the door and windows on the facade
+    with patch.object(
+        HorizonProfile,
+        'elevation_at',
+        autospec=True,
+        side_effect=HorizonProfile.elevation_at
+    ) as elevation_at_mock:
+        left.update(180, 20)
+        right.update(180, 20)
+        assert elevation_at_mock.call_count == 1
+    assert left.compiled_horizon_profile is right.compiled_horizon_profile
+    assert left.horizon_elevation_at_sun_azimuth == right.horizon_elevation_at_sun_azimuth == 30
+    assert left.sunny_glazing_area == right.sunny_glazing_area == 0
+
+    geometry_version = left.geometry_version
+    facade.horizon_profile = [0, 0]
+    assert left.geometry_version > geometry_version
+    left.update(180, 20)
+    assert left.sunny_glazing_area > 0
+
+    # the obstacles of the facade are moved to the door and window by its position
+    # and by its outside depth
+    geometry_version = left.geometry_version
+    facade.obstacles = [
+        Obstacle.prism([(0, -1000), (2000, -1000), (2000, -3000), (0, -3000)], 0, 5000)
+    ]
+    assert left.geometry_version > geometry_version
+    assert left.has_obstacles and right.has_obstacles
+    on_its_own = DoorAndWindow(
+        *door_and_window_args,
+        light_engine=LIGHT_ENGINE_CLOSED_FORM,
+        obstacles=[
+            Obstacle.prism(
+                [(-1000, -1150), (1000, -1150), (1000, -3150), (-1000, -3150)], 0, 5000)
+        ]
+    )
+    sunny_glazing_areas = []
+    for (sun_azimuth, sun_elevation) in [(120, 20), (150, 20), (180, 20), (210, 20), (180, 60)]:
+        left.update(sun_azimuth, sun_elevation)
+        on_its_own.update(sun_azimuth, sun_elevation)
+        assert left.sunny_glazing_area == on_its_own.sunny_glazing_area
+        sunny_glazing_areas.append(left.sunny_glazing_area)
+    assert 0 < sunny_glazing_areas.count(0) < len(sunny_glazing_areas)
+    left.update(180, 20)
+    right.update(180, 20)
+    assert left.sunny_glazing_area == 0
+    assert right.sunny_glazing_area > 0
+
+    # the door and window uses its own horizon profile and obstacles without the facade
+    facades = []
+    left.on_facade_changed(facades.append)
+    left.facade = None
+    assert facades == [None]
+    assert not left.has_obstacles
+    geometry_version = left.geometry_version
+    facade.horizon_profile = [10, 10]
+    assert left.geometry_version == geometry_version
+    left.update(180, 20)
+    assert left.horizon_elevation_at_sun_azimuth == 0
+
+
+def test_same_value_in_another_form_is_not_a_change():
+    door_and_window = DoorAndWindow(
+        'window', 'my window', None, None, 1000, 1400, 90, 89, 150, 200, 900, 180, 90, None, None)
+    changes = []
+    door_and_window.on_horizon_profile_changed(changes.append)
+    door_and_window.on_obstacles_changed(changes.append)
+    geometry_version = door_and_window.geometry_version
+
+    door_and_window.horizon_profile = (0, 0)
+    door_and_window.horizon_profile = None
+    door_and_window.obstacles = None
+    door_and_window.obstacles = []
+
+    assert door_and_window.horizon_profile == [0, 0]
+    assert door_and_window.geometry_version == geometry_version
+    assert not changes
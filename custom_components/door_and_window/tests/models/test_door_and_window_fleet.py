@@ -0,0 +1,257 @@
+# pylint: disable=missing-function-docstring
+"""Test module for `DoorAndWindowFleet` class."""
+import math
+from unittest.mock import patch
+
+from ...const import (LIGHT_ENGINE_CLOSED_FORM, LIGHT_ENGINE_CONVEX_CLIPPING,
+                      LIGHT_ENGINE_TABLE)
+from ...converters.door_and_window_local_geometry_to_light_information_batch_converter import \
+    DoorAndWindowLocalGeometryToLightInformationBatchConverter
+from ...models.awning import Awning
+from ...models.door_and_window import DoorAndWindow
+from ...models.door_and_window_fleet import DoorAndWindowFleet
+from ...models.door_and_window_local_geometry_stack import \
+    DoorAndWindowLocalGeometryStack
+from ...models.facade import Facade
+from ...models.obstacle import Obstacle
+
+
+def create_door_and_windows(light_engine=LIGHT_ENGINE_CLOSED_FORM):
+    return [
+        DoorAndWindow(
+            'window',
+            f'window {azimuth} {tilt}',
+            'manufacturer',
+            'model',
+            1000,
+            1400,
+            90,
+            89,
+            150,
+            200,
+            900,
+            azimuth,
+            tilt,
+            horizon_profile,
+            awning,
+            light_engine=light_engine
+        )
+        for (azimuth, tilt, horizon_profile, awning) in [
+            (0, 90, [0, 0], None),
+            (120, 90, [10, 5, 20, 0], Awning(1400, 100, 800, -100, 100, 300, 50, 70)),
+            (200, 45, [3, 4, 5], None),
+            (300, 30, [0, 10], Awning(1200, 300, 300, 150, 0, -200, 0, 100)),
+        ]
+    ]
+
+
+def update_while_in_view(door_and_window, suspended, sun_azimuth, sun_elevation):
+    """
+    Updates the door and window like the fleet does: only once while the sun is out of its view.
+    """
+    if door_and_window.is_sun_in_view(sun_azimuth, sun_elevation):
+        suspended.discard(door_and_window)
+    elif door_and_window in suspended:
+        return
+    else:
+        suspended.add(door_and_window)
+    door_and_window.update(sun_azimuth, sun_elevation)
+
+
+def test_fleet_is_same_as_update():
+    door_and_windows = create_door_and_windows()
+    expected_door_and_windows = create_door_and_windows()
+    fleet = DoorAndWindowFleet()
+    suspended = set()
+    for door_and_window in door_and_windows:
+        fleet.add(door_and_window)
+
+    for sun_azimuth in range(0, 360, 17):
+        for sun_elevation in range(-5, 90, 13):
+            fleet.update(sun_azimuth, sun_elevation)
+
+            for (door_and_window, expected) in zip(door_and_windows, expected_door_and_windows):
+                update_while_in_view(expected, suspended, sun_azimuth, sun_elevation)
+
+                assert door_and_window.horizon_elevation_at_sun_azimuth == \
+                    expected.horizon_elevation_at_sun_azimuth
+                assert door_and_window.angle_of_incidence == expected.angle_of_incidence
+                assert math.isclose(
+                    door_and_window.sunny_glazing_area,
+                    expected.sunny_glazing_area,
+                    abs_tol=0.02
+                )
+                assert door_and_window.glazing_has_direct_sunlight == \
+                    expected.glazing_has_direct_sunlight
+
+
+def test_fleet_fires_change_events():
+    (door_and_window, *_) = create_door_and_windows()
+    fleet = DoorAndWindowFleet()
+    fleet.add(door_and_window)
+    sunny_glazing_areas = []
+    door_and_window.on_sunny_glazing_area_changed(sunny_glazing_areas.append)
+
+    fleet.update(0, 0)
+    fleet.update(0, 0)  # the same sun position should be skipped
+    fleet.update(180, 10)
+
+    assert sunny_glazing_areas == [(1000 - 89*2) * (1400 - 89*2), 0]
+
+
+def test_fleet_skips_door_and_window_out_of_view():
+    (door_and_window, *_) = create_door_and_windows()
+    fleet = DoorAndWindowFleet()
+    fleet.add(door_and_window)
+
+    with patch.object(
+        door_and_window,
+        'set_light_information',
+        wraps=door_and_window.set_light_information
+    ) as set_light_information_mock:
+        # the sun is behind the door and window facing north, then in front of it
+        for sun_azimuth in [150, 180, 210, 240, 20]:
+            fleet.update(sun_azimuth, 10)
+
+    # updated only when the sun has left and when it has returned to its view
+    (left, returned) = set_light_information_mock.call_args_list
+    assert left.args[1] > 90
+    assert returned.args[1] < 90
+    assert door_and_window.sunny_glazing_area > 0
+
+
+def test_fleet_restacks_geometry_only_if_changed():
+    door_and_windows = create_door_and_windows()
+    fleet = DoorAndWindowFleet()
+    for door_and_window in door_and_windows:
+        fleet.add(door_and_window)
+
+    with patch.object(
+        DoorAndWindowLocalGeometryStack,
+        '__init__',
+        autospec=True,
+        side_effect=DoorAndWindowLocalGeometryStack.__init__
+    ) as stack_mock:
+        fleet.update(100, 10)
+        fleet.update(101, 10)
+        assert stack_mock.call_count == 1
+
+        door_and_windows[1].width = 1200
+        fleet.update(102, 10)
+        assert stack_mock.call_count == 2
+
+        fleet.remove(door_and_windows[0])
+        fleet.update(103, 10)
+        assert stack_mock.call_count == 3
+
+    assert fleet.door_and_windows == door_and_windows[1:]
+
+
+def test_fleet_updates_added_door_and_window():
+    (door_and_window, other_door_and_window, *_) = create_door_and_windows()
+    fleet = DoorAndWindowFleet()
+    fleet.add(door_and_window)
+    fleet.update(0, 0)
+
+    fleet.add(other_door_and_window)
+    with patch.object(
+        DoorAndWindowLocalGeometryToLightInformationBatchConverter,
+        'convert'
+    ) as convert_mock, patch.object(
+        door_and_window,
+        'update'
+    ) as update_mock:
+        fleet.update(0, 0)
+
+    # only the added door and window is updated, on its own
+    assert other_door_and_window.angle_of_incidence is not None
+    convert_mock.assert_not_called()
+    update_mock.assert_not_called()
+
+
+def test_fleet_updates_door_and_window_with_obstacles_one_by_one():
+    door_and_windows = create_door_and_windows()
+    expected_door_and_windows = create_door_and_windows()
+    # a neighbouring building in front of the window heading to east
+    obstacles = [Obstacle.prism([(-3000, -4000), (0, -4000), (0, -9000), (-3000, -9000)], 0, 6000)]
+    door_and_windows[1].obstacles = expected_door_and_windows[1].obstacles = obstacles
+    fleet = DoorAndWindowFleet()
+    suspended = set()
+    for door_and_window in door_and_windows:
+        fleet.add(door_and_window)
+
+    with patch.object(
+        DoorAndWindowLocalGeometryStack,
+        '__init__',
+        autospec=True,
+        side_effect=DoorAndWindowLocalGeometryStack.__init__
+    ) as stack_mock:
+        for sun_azimuth in range(40, 200, 20):
+            fleet.update(sun_azimuth, 10)
+
+            for (door_and_window, expected) in zip(door_and_windows, expected_door_and_windows):
+                update_while_in_view(expected, suspended, sun_azimuth, 10)
+
+                assert door_and_window.angle_of_incidence == expected.angle_of_incidence
+                assert math.isclose(
+                    door_and_window.sunny_glazing_area,
+                    expected.sunny_glazing_area,
+                    abs_tol=0.02
+                )
+
+    # the door and window with obstacles is not stacked
+    assert stack_mock.call_count == 1
+    assert len(stack_mock.call_args.args[1]) == 3
+
+
+def test_fleet_updates_other_light_engines_one_by_one():
+    door_and_windows = create_door_and_windows()
+    expected_door_and_windows = create_door_and_windows()
+    for (door_and_window, expected, light_engine) in zip(
+        door_and_windows[:2],
+        expected_door_and_windows,
+        [LIGHT_ENGINE_CONVEX_CLIPPING, LIGHT_ENGINE_TABLE]
+    ):
+        door_and_window.light_engine = expected.light_engine = light_engine
+    fleet = DoorAndWindowFleet()
+    suspended = set()
+    for door_and_window in door_and_windows:
+        fleet.add(door_and_window)
+
+    with patch.object(
+        DoorAndWindowLocalGeometryStack,
+        '__init__',
+        autospec=True,
+        side_effect=DoorAndWindowLocalGeometryStack.__init__
+    ) as stack_mock:
+        for sun_azimuth in range(40, 200, 20):
+            fleet.update(sun_azimuth, 10)
+
+            for (door_and_window, expected) in zip(door_and_windows, expected_door_and_windows):
+                update_while_in_view(expected, suspended, sun_azimuth, 10)
+
+                assert door_and_window.angle_of_incidence == expected.angle_of_incidence
+                assert door_and_window.sunny_glazing_area == expected.sunny_glazing_area
+
+    # only the closed-form door and windows are stacked
+    assert stack_mock.call_count == 1
+    assert len(stack_mock.call_args.args[1]) == 2
+
+
+def test_fleet_shares_horizon_profile_of_facade():
+    facade = Facade('south', [10, 20, 30, 40])
+    door_and_windows = create_door_and_windows()
+    for door_and_window in door_and_windows[:2]:
+        door_and_window.azimuth = 180
+        door_and_window.facade = facade
+    fleet = DoorAndWindowFleet()
+    for door_and_window in door_and_windows:
+        fleet.add(door_and_window)
+
+    fleet.update(200, 10)
+
+    # a row of the horizon profile table for the facade and for the other door and windows
+    assert len(fleet._horizon_profile_table) == 3  # pylint: disable=protected-access
+    assert door_and_windows[0].horizon_elevation_at_sun_azimuth == \
+        door_and_windows[1].horizon_elevation_at_sun_azimuth == \
+        facade.get_horizon_elevation_at(20)
@@ -0,0 +1,123 @@
+""" Test module for `DoorAndWindowObstacles` class. """
+import numpy as np
+import pytest
+
+from ...converters.door_and_window_to_rectangles_converter import \
+    DoorAndWindowToRectanglesConverter
+from ...models.door_and_window import DoorAndWindow
+from ...models.door_and_window_obstacles import (DoorAndWindowObstacles,
+                                                 get_sun_directions)
+from ...models.obstacle import Obstacle
+from ...transformers.door_and_window_seen_from_sun_transformer import \
+    DoorAndWindowRectanglesSeenFromSunTransformer
+
+
+def create_door_and_window(obstacles, azimuth: float = 200, tilt: float = 90):
+    """ Creates the test door and window. """
+    return DoorAndWindow(
+        'window',
+        'my window',
+        'manufacturer',
+        'model',
+        1000,
+        1400,
+        90,
+        89,
+        150,
+        200,
+        900,
+        azimuth,
+        tilt,
+        [0, 0],
+        None,
+        obstacles=obstacles
+    )
+
+
+def create_obstacles(count: int):
+    """ Creates box shaped obstacles scattered in front of the door and window. """
+    random = np.random.default_rng(1)
+    return [
+        Obstacle.prism(
+            [
+                (left, front),
+                (left + width, front),
+                (left + width, front - depth),
+                (left, front - depth)
+            ],
+            0,
+            height
+        )
+        for (left, front, width, depth, height) in zip(
+            random.uniform(-20000, 20000, count),
+            random.uniform(-30000, -500, count),
+            random.uniform(500, 5000, count),
+            random.uniform(500, 5000, count),
+            random.uniform(1000, 15000, count)
+        )
+    ]
+
+
+def test_sun_directions_are_seen_from_sun():
+    """ Tests if the sun directions are the ones the sun view looks from. """
+    for solar_azimuth in range(0, 360, 17):
+        for solar_elevation in (-10, 0, 33, 89):
+            sun_view_matrix = DoorAndWindowRectanglesSeenFromSunTransformer.get_sun_view_matrix(
+                solar_azimuth, solar_elevation)
+
+            assert np.allclose(
+                get_sun_directions(solar_azimuth, solar_elevation),
+                -sun_view_matrix[2, :3]
+            )
+
+
+@pytest.mark.parametrize('tilt', [90, 45])
+def test_index_finds_same_obstacles_as_testing_all(tilt: float):
+    """ Tests if the spatial index finds the same obstacles as testing each of them. """
+    rectangles = DoorAndWindowToRectanglesConverter().convert(
+        create_door_and_window(create_obstacles(200), tilt=tilt))
+    obstacles: DoorAndWindowObstacles = rectangles.obstacles
+    # pylint: disable=protected-access
+    (axes, cos_half_angles) = (obstacles._axes, obstacles._cos_half_angles)
+
+    candidate_count = 0
+    for solar_azimuth in np.arange(0, 360, 3.7):
+        for solar_elevation in np.arange(-10, 90, 3.3):
+            expected = np.flatnonzero(
+                np.matmul(axes, get_sun_directions(solar_azimuth, solar_elevation))
+                >= cos_half_angles
+            )
+
+            candidate_indices = obstacles.get_candidate_indices(solar_azimuth, solar_elevation)
+
+            assert np.array_equal(candidate_indices, expected)
+            candidate_count += len(candidate_indices)
+
+    assert len(obstacles) == 200
+    assert candidate_count < 0.2 * 200 * 98 * 31
+
+
+def test_obstacle_is_candidate_only_towards_it():
+    """ Tests if an obstacle is found only when the sun is behind it as seen from the glazing. """
+    # a chimney in front of the south facing window, 10 m away and 20 m high
+    rectangles = DoorAndWindowToRectanglesConverter().convert(create_door_and_window(
+        [Obstacle.prism([(-500, -10000), (500, -10000), (500, -11000), (-500, -11000)], 0, 20000)],
+        azimuth=180
+    ))
+
+    assert list(rectangles.obstacles.get_candidate_indices(180, 45)) == [0]
+    assert rectangles.obstacles.get_candidate_indices(180, 70).size == 0
+    assert rectangles.obstacles.get_candidate_indices(120, 45).size == 0
+    assert rectangles.obstacles.get_candidate_indices(0, 45).size == 0
+
+
+def test_obstacle_touching_glazing_is_never_culled():
+    """ Tests if an obstacle seen both above and below from the glazing is always a candidate. """
+    # a shelf at the middle of the glazing
+    rectangles = DoorAndWindowToRectanglesConverter().convert(create_door_and_window(
+        [Obstacle.quad(
+            (-5000, 1600, 0), (5000, 1600, 0), (5000, 1600, -3000), (-5000, 1600, -3000))]
+    ))
+
+    assert list(rectangles.obstacles.get_candidate_indices(0, 45)) == [0]
+    assert list(rectangles.obstacles.get_candidate_indices(200, 10)) == [0]
@@ -171,3 +171,100 @@ def test_apply_matrix():
         [9 + translate_x, 10 + translate_y, 15 + translate_z],
         [9 + translate_x, 4 + translate_y, 5 + translate_z]
     )
+
+
+def test_attributes_are_views_of_corners():
+    """ Tests if the attributes share the memory of the corners arrays. """
+    door_and_window_rectangles = DoorAndWindowRectangles.from_corners(
+        np.arange(6 * 4 * 4, dtype=float).reshape((6, 4, 4)),
+        True,
+        lambda: np.arange(4 * 4 * 4, dtype=float).reshape((4, 4, 4))
+    )
+
+    assert door_and_window_rectangles.corners.shape == (6, 4, 4)
+    assert np.shares_memory(
+        door_and_window_rectangles.glazing.corner_1,
+        door_and_window_rectangles.corners
+    )
+    assert np.shares_memory(
+        door_and_window_rectangles.awning.corner_4,
+        door_and_window_rectangles.corners
+    )
+    assert np.shares_memory(
+        door_and_window_rectangles.inside_stool.corner_1,
+        door_and_window_rectangles.inside_corners
+    )
+    assert (door_and_window_rectangles.outside_stool.corner_2 == [68, 69, 70, 71]).all()
+    assert (door_and_window_rectangles.inside_head_jamb_wall.corner_1 == [32, 33, 34, 35]).all()
+
+
+def test_inside_corners_are_calculated_on_demand():
+    """
+    Tests if the inside corners are not calculated or transformed
+    until any of the inside rectangles is accessed.
+    """
+    inside_corners_calculation_count = 0
+
+    def get_inside_corners():
+        nonlocal inside_corners_calculation_count
+        inside_corners_calculation_count += 1
+        return np.ones((4, 4, 4))
+
+    door_and_window_rectangles = DoorAndWindowRectangles.from_corners(
+        np.ones((6, 4, 4)),
+        False,
+        get_inside_corners
+    )
+
+    translated_door_and_window_rectangles = door_and_window_rectangles.apply_matrix(
+        np.identity(4) * 2
+    )
+    _ = translated_door_and_window_rectangles.glazing
+    _ = translated_door_and_window_rectangles.outside_stool
+
+    assert inside_corners_calculation_count == 0, \
+        'inside corners must not be calculated if no inside rectangle is accessed'
+
+    assert (translated_door_and_window_rectangles.inside_stool.corner_1 == [2, 2, 2, 2]).all()
+    _ = translated_door_and_window_rectangles.inside_left_jamb_wall
+
+    assert inside_corners_calculation_count == 1, \
+        'inside corners must be calculated only once'
+
+
+def test_apply_matrix_without_awning():
+    """ Tests if the awning remains None after applying a matrix. """
+    door_and_window_rectangles = DoorAndWindowRectangles(
+        *[Quadrilateral([i, 0, 0], [i, 1, 0], [i, 1, 1], [i, 0, 1]) for i in range(9)],
+        awning=None
+    )
+
+    translated_door_and_window_rectangles = door_and_window_rectangles.apply_matrix(
+        np.identity(4)
+    )
+
+    assert translated_door_and_window_rectangles.awning is None
+    assert translated_door_and_window_rectangles.inside_stool == \
+        Quadrilateral([8, 0, 0], [8, 1, 0], [8, 1, 1], [8, 0, 1])
+
+
+def test_apply_matrix_into():
+    """ Tests if the result is written into the backing array of the specified instance. """
+    door_and_window_rectangles = DoorAndWindowRectangles.from_corners(
+        np.ones((6, 4, 4)),
+        True,
+        lambda: np.ones((4, 4, 4))
+    )
+    out_corners = np.zeros((6, 4, 4))
+    out = DoorAndWindowRectangles.from_corners(out_corners, False, lambda: np.zeros((4, 4, 4)))
+
+    translated_door_and_window_rectangles = door_and_window_rectangles.apply_matrix_into(
+        np.identity(4) * 2,
+        out
+    )
+
+    assert translated_door_and_window_rectangles is out
+    assert out.corners is out_corners
+    assert (out_corners == 2).all()
+    assert out.has_awning
+    assert (out.inside_stool.corner_1 == [2, 2, 2, 2]).all()
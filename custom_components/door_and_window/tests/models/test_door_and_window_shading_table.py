@@ -0,0 +1,47 @@
+# pylint: disable=missing-function-docstring
+"""Test module for `DoorAndWindowShadingTable` class."""
+import math
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from ...models.door_and_window_shading_table import DoorAndWindowShadingTable
+
+
+def create_shading_table():
+    # relative azimuths: -90, 0, 90; elevations: 0, 90
+    return DoorAndWindowShadingTable(
+        MagicMock(),
+        -90,
+        90,
+        np.array([
+            [0, 10],
+            [100, 200],
+            [0, 40],
+        ], dtype=np.float32),
+        0
+    )
+
+
+def test_get_sunny_glazing_area_at_grid_points():
+    shading_table = create_shading_table()
+
+    assert math.isclose(shading_table.get_sunny_glazing_area(-90, 0), 0)
+    assert shading_table.get_sunny_glazing_area(0, 90) == 200
+    assert shading_table.get_sunny_glazing_area(90, 90) == 40
+
+
+def test_get_sunny_glazing_area_interpolates():
+    shading_table = create_shading_table()
+
+    assert math.isclose(shading_table.get_sunny_glazing_area(-45, 0), 50)
+    assert math.isclose(shading_table.get_sunny_glazing_area(0, 45), 150)
+    assert math.isclose(shading_table.get_sunny_glazing_area(45, 45), (150 + 20) / 2)
+
+
+def test_get_sunny_glazing_area_outside_of_grid():
+    shading_table = create_shading_table()
+
+    assert shading_table.get_sunny_glazing_area(-91, 10) is None
+    assert shading_table.get_sunny_glazing_area(10, -1) is None
+    assert shading_table.get_sunny_glazing_area(10, 91) is None
@@ -1,4 +1,7 @@
 """ Test module for Event class. """
+import gc
+import weakref
+
 from ...models.event import Event
 
 
@@ -55,3 +58,95 @@ def test_event_clear_event_listeners():
     event()
     assert event_fired_counter == 2, \
         "event must not be registered in event listener if event listeners were cleared"
+
+
+def test_event_listener_added_twice():
+    """ Tests if a listener added twice is registered only once. """
+    event = Event()
+    calls = []
+
+    event.add_listener(calls.append)
+    event.add_listener(calls.append)
+    event(1)
+    event.remove_listener(calls.append)
+    event(2)
+
+    assert calls == [1]
+
+
+def test_event_remove_not_added_listener():
+    """ Tests if removing a listener which is not added does nothing. """
+    event = Event()
+
+    event.remove_listener(print)
+    event.remove_listener(lambda: None)
+
+
+def test_event_weak_listener():
+    """ Tests if a weak listener is removed when it is garbage collected. """
+    class Listener:  # pylint: disable=too-few-public-methods
+        """ Counts the calls. """
+        def __init__(self):
+            self.counter = 0
+
+        def listen(self):
+            """ The listener method. """
+            self.counter += 1
+
+    event = Event()
+    listener = Listener()
+    weak_listener = weakref.ref(listener)
+    event.add_listener(listener.listen, weak=True)
+
+    event()
+    assert listener.counter == 1
+
+    del listener
+    gc.collect()
+    assert weak_listener() is None, 'the event must not keep the listener alive'
+
+    event()
+
+
+def test_event_remove_weak_listener():
+    """ Tests if a weak listener can be removed by the listener itself. """
+    event = Event()
+    calls = []
+
+    def listener():
+        calls.append(1)
+
+    event.add_listener(listener, weak=True)
+    event.remove_listener(listener)
+    event()
+
+    assert not calls
+
+
+def test_event_mutation_while_firing():
+    """
+    Tests if the listeners removed while the event is being invoked are not called anymore
+    and the added ones are called from the next invocation.
+    """
+    event = Event()
+    calls = []
+
+    def first():
+        calls.append('first')
+        event.remove_listener(second)
+        event.add_listener(third)
+
+    def second():
+        calls.append('second')
+
+    def third():
+        calls.append('third')
+
+    event.add_listener(first)
+    event.add_listener(second)
+
+    event()
+    assert calls == ['first']
+
+    event()
+    assert calls == ['first', 'first', 'third']
@@ -35,3 +35,16 @@ def test_event_handler_class():
     event_handler.fire(event_args)
 
     assert counter == 2, 'callback should not be called after not listening anymore'
+
+
+def test_event_handler_stop_listening_twice():
+    """ Tests if stopping listening again does nothing. """
+    event_handler = EventHandler()
+    calls = []
+
+    stop_listen = event_handler.listen(calls.append)
+    stop_listen()
+    stop_listen()
+    event_handler.fire(1)
+
+    assert not calls
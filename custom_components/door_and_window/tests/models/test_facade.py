@@ -0,0 +1,68 @@
+""" Test module for `Facade` class. """
+from unittest.mock import patch
+
+from ...models.facade import Facade
+from ...models.horizon_profile import HorizonProfile
+from ...models.obstacle import Obstacle
+
+
+def test_compiled_horizon_profile():
+    """
+    Tests if the horizon profile is compiled once until it changes
+    and a compiled horizon profile is used as it is.
+    """
+    facade = Facade('south', [10, 20, 30])
+
+    compiled_horizon_profile = facade.compiled_horizon_profile
+    assert facade.compiled_horizon_profile is compiled_horizon_profile
+    assert facade.get_horizon_elevation_at(0) == 20
+
+    facade.horizon_profile = [0, 10]
+    assert facade.compiled_horizon_profile is not compiled_horizon_profile
+    assert facade.get_horizon_elevation_at(0) == 5
+
+    horizon_profile = HorizonProfile([1, 2, 3])
+    facade.horizon_profile = horizon_profile
+    assert facade.compiled_horizon_profile is horizon_profile
+
+    facade.horizon_profile = None
+    assert facade.horizon_profile == [0, 0]
+
+
+def test_horizon_elevation_lookup():
+    """
+    Tests if the horizon elevation is interpolated only once for the same azimuth.
+    """
+    facade = Facade('south', [10, 20.123, 30])
+
+    with patch.object(
+        HorizonProfile,
+        'elevation_at',
+        autospec=True,
+        side_effect=HorizonProfile.elevation_at
+    ) as elevation_at_mock:
+        assert facade.get_horizon_elevation_at(0) == 20.12
+        assert facade.get_horizon_elevation_at(0) == 20.12
+        assert elevation_at_mock.call_count == 1
+
+        assert facade.get_horizon_elevation_at(120) is None
+        assert facade.get_horizon_elevation_at(120) is None
+        assert elevation_at_mock.call_count == 2
+
+        # the lookup is repeated after the horizon profile has changed
+        facade.horizon_profile = [10, 30, 30]
+        assert facade.get_horizon_elevation_at(120) is None
+        assert elevation_at_mock.call_count == 3
+
+
+def test_obstacles():
+    """ Tests if the obstacles are kept as a tuple and their changes are published. """
+    obstacle = Obstacle.prism([(0, -1000), (500, -1000), (500, -2000)], 0, 3000)
+    facade = Facade('south')
+    changes = []
+    facade.on_obstacles_changed(changes.append)
+
+    facade.obstacles = [obstacle]
+    facade.obstacles = None
+
+    assert changes == [(obstacle,), ()]
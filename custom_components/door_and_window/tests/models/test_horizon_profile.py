@@ -0,0 +1,70 @@
+""" Test module for `HorizonProfile` class. """
+import numpy as np
+import pytest
+
+from ...models.horizon_profile import HorizonProfile
+
+
+def test_horizon_profile_elevation_at():
+    """ Tests the interpolation of the horizon elevation at an azimuth. """
+    horizon_profile = HorizonProfile([10, 20, 0])
+
+    assert horizon_profile.elevation_at(-90) == 10
+    assert horizon_profile.elevation_at(-45) == 15
+    assert horizon_profile.elevation_at(0) == 20
+    assert horizon_profile.elevation_at(45) == 10
+    assert horizon_profile.elevation_at(90) == 0
+    # behind the door and window
+    assert horizon_profile.elevation_at(90.5) is None
+    assert horizon_profile.elevation_at(-180) is None
+
+
+def test_horizon_profile_elevation_at_array():
+    """ Tests if the vectorised interpolation is the same as the scalar one. """
+    horizon_profile = HorizonProfile([3, 8.5, 1, 12, 4])
+    azimuths = np.linspace(-180, 180, 721)
+
+    elevations = horizon_profile.elevation_at(azimuths)
+
+    assert elevations.shape == azimuths.shape
+    for (azimuth, elevation) in zip(azimuths.tolist(), elevations.tolist()):
+        expected = horizon_profile.elevation_at(azimuth)
+        if expected is None:
+            assert np.isnan(elevation), azimuth
+        else:
+            assert elevation == pytest.approx(expected), azimuth
+
+
+def test_horizon_profile_properties():
+    """ Tests the compiled values of the horizon profile. """
+    horizon_profile = HorizonProfile([3, 8.5, 1, 12, 4])
+
+    assert len(horizon_profile) == 5
+    assert horizon_profile.resolution == 45
+    assert horizon_profile.min_elevation == 1
+    assert horizon_profile.elevations.tolist() == [3, 8.5, 1, 12, 4]
+    with pytest.raises(ValueError):
+        horizon_profile.elevations[0] = 0
+
+    with pytest.raises(ValueError):
+        HorizonProfile([1])
+
+
+def test_horizon_profile_from_horizon():
+    """ Tests if the horizon in front of the door and window is taken from the horizon. """
+    # one elevation in each degree from north clockwise
+    horizon = np.arange(360, dtype=np.float32) / 10
+
+    horizon_profile = HorizonProfile.from_horizon(horizon, 180)
+
+    assert horizon_profile.elevations.dtype == np.float32
+    assert len(horizon_profile) == 181
+    assert horizon_profile.elevation_at(-90) == pytest.approx(9)
+    assert horizon_profile.elevation_at(0.5) == pytest.approx(18.05)
+    assert horizon_profile.elevation_at(90) == pytest.approx(27)
+
+    # around north and between the measurements
+    horizon_profile = HorizonProfile.from_horizon(horizon, 10.5)
+
+    assert horizon_profile.elevation_at(-90) == pytest.approx(28.05)
+    assert horizon_profile.elevation_at(0) == pytest.approx(1.05)
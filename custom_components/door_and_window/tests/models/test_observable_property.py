@@ -0,0 +1,144 @@
+""" Test module for `ObservableProperty` class. """
+import pytest
+
+from ...models.observable_property import (ObservableProperty, defer_events,
+                                           dispose_events, fire_event,
+                                           listen_to_event)
+
+
+# pylint: disable=too-few-public-methods
+class _Observed:
+    """ The owner of the observable properties under test. """
+
+    def __init__(self):
+        self._size = 1
+        self._profile = [1, 2]
+        self._result = None
+        self.changed_names = []
+
+    def _spoil(self, name: str) -> None:
+        self.changed_names.append(name)
+
+    size = ObservableProperty(""" The size. """, _spoil)
+    on_size_changed = size.listener_method()
+
+    profile = ObservableProperty(""" The profile. """, normalize=lambda value: value or [0, 0])
+    on_profile_changed = profile.listener_method()
+
+    result = ObservableProperty(""" The result. """, read_only=True)
+    on_result_changed = result.listener_method()
+
+
+def test_observable_property_events_are_allocated_by_first_listener():
+    """ Test that the event handlers are created only when the first listener is added. """
+    observed = _Observed()
+
+    observed.size = 2
+    fire_event(observed, 'result', 1)
+
+    assert getattr(observed, '_event_handlers', None) is None
+
+    changes = []
+    observed.on_size_changed(changes.append)
+
+    assert list(getattr(observed, '_event_handlers')) == ['size']
+
+
+def test_observable_property_changed():
+    """ Test the generated change listener method of an observable property. """
+    observed = _Observed()
+    changes = []
+
+    stop_listening = observed.on_size_changed(changes.append)
+    observed.size = 2
+    observed.size = 2
+    stop_listening()
+    observed.size = 3
+
+    assert changes == [2]
+    assert observed.size == 3
+    assert observed.changed_names == ['size', 'size']
+    assert _Observed.on_size_changed.__name__ == 'on_size_changed'
+    assert 'size property has changed' in _Observed.on_size_changed.__doc__
+    assert _Observed.size.__doc__ == """ The size. """
+
+
+def test_observable_property_normalize():
+    """ Test that the normalized value is kept and fired. """
+    observed = _Observed()
+    changes = []
+    observed.on_profile_changed(changes.append)
+
+    observed.profile = None
+    # the same value as the normalized one is not a change
+    observed.profile = []
+    observed.profile = [0, 0]
+
+    assert observed.profile == [0, 0]
+    assert changes == [[0, 0]]
+
+
+def test_observable_property_read_only():
+    """ Test that a read-only property is set and fired by its owner only. """
+    observed = _Observed()
+    changes = []
+    observed.on_result_changed(changes.append)
+
+    with pytest.raises(AttributeError):
+        observed.result = 1
+
+    # pylint: disable=protected-access
+    observed._result = 2
+    fire_event(observed, 'result', 2)
+
+    assert observed.result == 2
+    assert changes == [2]
+
+
+def test_dispose_events():
+    """ Test that disposing the events removes all the listeners. """
+    observed = _Observed()
+    changes = []
+    listen_to_event(observed, 'size', changes.append)
+    listen_to_event(observed, 'other', changes.append, weak=True)
+
+    dispose_events(observed)
+    observed.size = 2
+    fire_event(observed, 'other', 1)
+
+    assert not changes
+
+
+def test_defer_events():
+    """ Test that the deferred events are fired once with their latest arguments. """
+    observed = _Observed()
+    changes = []
+    observed.on_size_changed(lambda size: changes.append(('size', size)))
+    observed.on_profile_changed(lambda profile: changes.append(('profile', profile)))
+
+    with defer_events(observed):
+        observed.size = 2
+        observed.profile = [3, 4]
+        with defer_events(observed):
+            observed.size = 5
+        assert not changes
+
+    assert changes == [('size', 5), ('profile', [3, 4])]
+
+    observed.size = 6
+
+    assert changes[-1] == ('size', 6)
+
+
+def test_defer_events_fires_after_exception():
+    """ Test that the deferred events are fired even if the context fails. """
+    observed = _Observed()
+    changes = []
+    observed.on_size_changed(changes.append)
+
+    with pytest.raises(ValueError):
+        with defer_events(observed):
+            observed.size = 2
+            raise ValueError()
+
+    assert changes == [2]
@@ -0,0 +1,48 @@
+""" Test module for `Obstacle` class. """
+import numpy as np
+import pytest
+
+from ...models.obstacle import Obstacle
+
+
+def test_prism():
+    """ Tests if the prism has the footprint vertices at the bottom and at the top. """
+    obstacle = Obstacle.prism([(0, -1000), (500, -1000), (500, -2000)], 100, 3000)
+
+    assert np.array_equal(obstacle.vertices, [
+        [0, 100, -1000],
+        [500, 100, -1000],
+        [500, 100, -2000],
+        [0, 3000, -1000],
+        [500, 3000, -1000],
+        [500, 3000, -2000]
+    ])
+    assert not obstacle.vertices.flags.writeable
+
+
+def test_quad():
+    """ Tests if the quad is the same as the obstacle of its corners. """
+    corners = [(0, 0, -1000), (1000, 0, -1000), (1000, 2000, -1000), (0, 2000, -1000)]
+
+    assert Obstacle.quad(*corners) == Obstacle(corners)
+    assert hash(Obstacle.quad(*corners)) == hash(Obstacle(corners))
+    assert Obstacle.quad(*corners) != Obstacle(corners[:3])
+
+
+@pytest.mark.parametrize('vertices', [
+    [(0, 0, 0), (1, 1, 1)],
+    [(0, 0), (1, 0), (1, 1)],
+    [(0, 0, 0), (1, 0, 0), (1, 1, float('nan'))]
+])
+def test_invalid_obstacle(vertices):
+    """ Tests if an obstacle requires at least three finite 3D vertices. """
+    with pytest.raises(ValueError):
+        Obstacle(vertices)
+
+
+def test_translate():
+    """ Tests if the translated obstacle has every vertex moved. """
+    obstacle = Obstacle.quad((0, 0, -1000), (1000, 0, -1000), (1000, 2000, -1000), (0, 2000, -1000))
+
+    assert obstacle.translate(-500, 0, 150) == Obstacle.quad(
+        (-500, 0, -850), (500, 0, -850), (500, 2000, -850), (-500, 2000, -850))
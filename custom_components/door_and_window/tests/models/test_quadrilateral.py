@@ -58,3 +58,50 @@ def test_equality():
     quadrilateral_1 = Quadrilateral([0, 0, 0], [1, 2, 3], [4, 5, 6], [7, 8, 9])
     quadrilateral_2 = Quadrilateral([0, 0, 0], [1, 2, 3], [4, 5, 6], [7, 8, 9])
     assert quadrilateral_1 == quadrilateral_2
+
+
+def test_corners_are_views_of_single_array():
+    """ Tests if the corners share the memory of the single backing array. """
+    quadrilateral = Quadrilateral([0, 0, 0], [1, 2, 3], [4, 5, 6], [7, 8, 9])
+
+    assert quadrilateral.corners.shape == (4, 4)
+    assert np.shares_memory(quadrilateral.corner_3, quadrilateral.corners)
+    assert not hasattr(quadrilateral, '__dict__')
+
+
+def test_from_homogeneous_corners_does_not_copy():
+    """ Tests if the specified array backs the created quadrilateral. """
+    corners = np.arange(16, dtype=float).reshape((4, 4))
+
+    quadrilateral = Quadrilateral.from_homogeneous_corners(corners)
+
+    assert quadrilateral.corners is corners
+    assert (quadrilateral.corner_2 == [4, 5, 6, 7]).all()
+
+
+def test_apply_matrix_into():
+    """ Tests if the result is written into the backing array of the specified quadrilateral. """
+    quadrilateral = Quadrilateral([0, 0, 0], [10, 0, 0], [10, 10, 0], [0, 10, 0])
+    out_corners = np.zeros((4, 4))
+    out = Quadrilateral.from_homogeneous_corners(out_corners)
+    translate_matrix = np.array([
+        [1., 0., 0., 3.],
+        [0., 1., 0., 4.],
+        [0., 0., 1., -2.],
+        [0., 0., 0., 1.]
+    ])
+
+    translated = quadrilateral.apply_matrix_into(translate_matrix, out)
+
+    assert translated is out
+    assert out.corners is out_corners
+    assert translated == quadrilateral.apply_matrix(translate_matrix)
+    assert np.isclose(translated.corner_3, [13, 14, -2, 1]).all()
+
+
+def test_inequality():
+    """ Tests the inequality of quadrilaterals. """
+    quadrilateral_1 = Quadrilateral([0, 0, 0], [1, 2, 3], [4, 5, 6], [7, 8, 9])
+    quadrilateral_2 = Quadrilateral([0, 0, 0], [1, 2, 3], [4, 5, 6], [7, 8, 10])
+    assert quadrilateral_1 != quadrilateral_2
+    assert quadrilateral_1 != 'quadrilateral'
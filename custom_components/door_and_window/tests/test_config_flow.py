@@ -0,0 +1,84 @@
+""" The module of config flow tests. """
+import asyncio
+from unittest.mock import MagicMock
+
+from ..config_flow import (WindowAndDoorDeviceConfigFlow,
+                           get_facade_config_entries, replace_horizon_profile)
+
+
+def create_hass():
+    """
+    Creates a Home Assistant mock with two door and windows on the south facade
+    and one on its own.
+    """
+    hass = MagicMock()
+    hass.config_entries.async_entries.return_value = [
+        MagicMock(entry_id='first', data={
+            'azimuth': 180,
+            'facade': 'south',
+            'horizon_profile_type': 'file',
+            'horizon_profile_file': 'www/horizon.csv',
+            'horizon_id': 'south horizon'
+        }),
+        MagicMock(entry_id='second', data={'azimuth': 180, 'facade': 'south'}),
+        MagicMock(entry_id='alone', data={'azimuth': 180, 'facade': ''})
+    ]
+    return hass
+
+
+def test_get_facade_config_entries():
+    """ Tests if the config entries of the other door and windows on the facade are found. """
+    hass = create_hass()
+
+    assert [entry.entry_id for entry in get_facade_config_entries(hass, 'south')] == \
+        ['first', 'second']
+    assert [entry.entry_id for entry in get_facade_config_entries(hass, 'south', 'first')] == \
+        ['second']
+    assert not get_facade_config_entries(hass, 'north')
+    assert not get_facade_config_entries(hass, '')
+
+
+def test_replace_horizon_profile():
+    """ Tests if only the horizon profile settings are taken from the facade. """
+    data = {
+        'azimuth': 180,
+        'facade': 'south',
+        'horizon_profile_type': 'static',
+        'horizon_profile': [0, 10],
+        'horizon_profile_number_of_measurements': 2
+    }
+    facade_data = {
+        'azimuth': 180,
+        'facade': 'south',
+        'width': 1000,
+        'horizon_profile_type': 'dynamic',
+        'horizon_profile_entity': 'sensor.horizon'
+    }
+
+    assert replace_horizon_profile(data, facade_data) == {
+        'azimuth': 180,
+        'facade': 'south',
+        'horizon_profile_type': 'dynamic',
+        'horizon_profile_entity': 'sensor.horizon'
+    }
+
+
+def test_config_flow_facing_on_facade():
+    """
+    Tests if a door and window added to a facade takes the horizon profile of the facade
+    and it is rejected if it faces another way than the facade.
+    """
+    flow = WindowAndDoorDeviceConfigFlow()
+    flow.hass = create_hass()
+    flow.data = {'name': 'new window'}
+
+    result = asyncio.run(flow.async_step_facing(
+        {'tilt': 90, 'azimuth': 170, 'facade': 'south', 'facade_position': 0}))
+    assert result['step_id'] == 'facing'
+    assert result['errors'] == {'base': 'facade_azimuth_conflict'}
+
+    result = asyncio.run(flow.async_step_facing(
+        {'tilt': 90, 'azimuth': 180, 'facade': 'south', 'facade_position': 0}))
+    assert result['step_id'] == 'has_awning'
+    assert flow.data['horizon_profile_type'] == 'file'
+    assert flow.data['horizon_id'] == 'south horizon'
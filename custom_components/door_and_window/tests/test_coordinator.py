@@ -1,10 +1,17 @@
 """ The module of coordinator tests. """
-from unittest.mock import ANY, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, call, patch
 
+import pytest
+from homeassistant.core import HassJob, HassJobType
+
+from ..const import LIGHT_ENGINE_CLOSED_FORM
 from ..coordinator import Coordinator
+from ..models.door_and_window import DoorAndWindow
+from ..models.door_and_window_fleet import DoorAndWindowFleet
+from ..sun_tracker import SunTracker
 
 
-@patch('door_and_window.coordinator.async_track_state_change', return_value=lambda: None)
+@patch('door_and_window.sun_tracker.async_track_state_change', return_value=lambda: None)
 def test_coordinator_init(async_track_state_change_mock):
     """
     Tests if the coordinator starts to listening
@@ -13,7 +20,7 @@ def test_coordinator_init(async_track_state_change_mock):
 
     door_and_window_mock = MagicMock()
     hass = MagicMock()
-    coordinator = Coordinator(hass, door_and_window_mock, "sun.sun")
+    coordinator = Coordinator(hass, door_and_window_mock, SunTracker(hass, "sun.sun"))
 
     # should track sun's position
     async_track_state_change_mock.assert_called_once_with(hass, "sun.sun", ANY)
@@ -21,7 +28,7 @@ def test_coordinator_init(async_track_state_change_mock):
     coordinator.dispose()
 
 
-@patch('door_and_window.coordinator.async_track_state_change', return_value=lambda: None)
+@patch('door_and_window.sun_tracker.async_track_state_change', return_value=lambda: None)
 # pylint: disable=unused-argument
 def test_coordinator_dispose(async_track_state_change_mock):
     """
@@ -30,7 +37,324 @@ def test_coordinator_dispose(async_track_state_change_mock):
     """
     door_and_window_mock = MagicMock()
     hass = MagicMock()
-    coordinator = Coordinator(hass, door_and_window_mock, "sun.sun")
+    coordinator = Coordinator(hass, door_and_window_mock, SunTracker(hass, "sun.sun"))
 
     coordinator.dispose()
     door_and_window_mock.dispose.assert_called_once()
+
+
+@patch('door_and_window.sun_tracker.async_track_state_change', return_value=lambda: None)
+# pylint: disable=unused-argument
+def test_coordinator_with_fleet(async_track_state_change_mock):
+    """
+    Tests if the coordinator registers the door and window in the fleet,
+    forwards the sun position changes to the fleet and unregisters on disposing.
+    """
+    door_and_window_mock = MagicMock()
+    fleet_mock = MagicMock()
+    hass = MagicMock()
+    hass.states.get.return_value = MagicMock(attributes={'azimuth': 120, 'elevation': 30})
+
+    coordinator = Coordinator(hass, door_and_window_mock, SunTracker(hass, "sun.sun"), fleet_mock)
+
+    fleet_mock.add.assert_called_once_with(door_and_window_mock, sun_position_dead_band=0)
+    fleet_mock.update.assert_called_once_with(120.0, 30.0)
+    door_and_window_mock.update.assert_not_called()
+
+    coordinator.dispose()
+    fleet_mock.remove.assert_called_once_with(door_and_window_mock)
+
+
+@patch('door_and_window.sun_tracker.async_track_state_change', return_value=lambda: None)
+# pylint: disable=unused-argument
+def test_coordinator_rebuilds_shading_table_in_background(async_track_state_change_mock):
+    """
+    Tests if the coordinator builds the requested shading table
+    by an executor job and warns if it is out of the error bound.
+    """
+    door_and_window_mock = MagicMock(shading_table_error_bound=1)
+    hass = MagicMock()
+    Coordinator(hass, door_and_window_mock, SunTracker(hass, "sun.sun"))
+
+    door_and_window_mock.on_shading_table_rebuild_requested.assert_called_once()
+    (rebuild_requested,) = door_and_window_mock.on_shading_table_rebuild_requested.call_args[0]
+
+    for (error, warned) in [(0.5, False), (3, True)]:
+        build_shading_table = MagicMock()
+        rebuild_requested(build_shading_table)
+
+        (rebuild,) = hass.add_job.call_args[0]
+        shading_table = MagicMock(error=error)
+        hass.async_add_executor_job = AsyncMock(return_value=shading_table)
+        with patch('door_and_window.coordinator._LOGGER') as logger_mock:
+            with pytest.raises(StopIteration):
+                rebuild.send(None)
+
+        hass.async_add_executor_job.assert_called_once_with(build_shading_table)
+        assert door_and_window_mock.shading_table is shading_table
+        assert logger_mock.warning.called == warned
+
+    assert hass.add_job.call_count == 2
+
+
+@patch('door_and_window.sun_tracker.async_track_state_change', return_value=lambda: None)
+# pylint: disable=unused-argument
+def test_coordinator_refresh(async_track_state_change_mock):
+    """
+    Tests if refreshing updates the door and window itself
+    at the current sun position, even if it is in a fleet.
+    """
+    door_and_window_mock = MagicMock()
+    fleet_mock = MagicMock()
+    hass = MagicMock()
+    hass.states.get.return_value = MagicMock(attributes={'azimuth': 120, 'elevation': 30})
+    coordinator = Coordinator(hass, door_and_window_mock, SunTracker(hass, "sun.sun"), fleet_mock)
+
+    coordinator.refresh()
+
+    door_and_window_mock.update.assert_called_once_with(120.0, 30.0)
+    fleet_mock.update.assert_called_once()
+
+    coordinator.dispose()
+
+
+@patch('door_and_window.sun_tracker.async_track_state_change', return_value=lambda: None)
+# pylint: disable=unused-argument
+def test_coordinator_skips_irrelevant_sun_changes(async_track_state_change_mock):
+    """
+    Tests if the coordinator updates the door and window only
+    when the sun has moved by the dead-band since the previous update.
+    """
+    door_and_window_mock = MagicMock()
+    hass = MagicMock()
+    hass.states.get.return_value = None
+    coordinator = Coordinator(
+        hass,
+        door_and_window_mock,
+        SunTracker(hass, "sun.sun"),
+        sun_position_dead_band=0.5
+    )
+    (_, _, sun_entity_changed) = async_track_state_change_mock.call_args[0]
+
+    for attributes in [
+        {'azimuth': 120, 'elevation': 30, 'next_rising': 1},
+        # another attribute has changed
+        {'azimuth': 120, 'elevation': 30, 'next_rising': 2},
+        # the sun has moved less than the dead-band
+        {'azimuth': 120.3, 'elevation': 30.2},
+        {'azimuth': 120.6, 'elevation': 30.1},
+        # the sun entity is unavailable
+        {},
+        {'azimuth': 120.6, 'elevation': 30.7}
+    ]:
+        sun_entity_changed("sun.sun", None, MagicMock(attributes=attributes))
+    sun_entity_changed("sun.sun", None, None)
+
+    assert door_and_window_mock.update.call_args_list == [
+        call(120.0, 30.0),
+        call(120.6, 30.1),
+        call(120.6, 30.7)
+    ]
+
+    coordinator.dispose()
+
+
+@patch('door_and_window.sun_tracker.async_track_state_change', return_value=lambda: None)
+# pylint: disable=unused-argument
+def test_coordinators_apply_own_dead_band_in_fleet(async_track_state_change_mock):
+    """
+    Tests if the door and windows in a fleet are updated by their own dead band,
+    even if the fleet is updated by the coordinator of another door and window.
+    """
+    door_and_windows = [
+        DoorAndWindow(
+            'window',
+            f'window {index}',
+            'manufacturer',
+            'model',
+            1000,
+            1400,
+            90,
+            89,
+            150,
+            200,
+            900,
+            180,
+            90,
+            [0, 0],
+            None,
+            light_engine=LIGHT_ENGINE_CLOSED_FORM
+        )
+        for index in range(2)
+    ]
+    updates = ([], [])
+    for (door_and_window, door_and_window_updates) in zip(door_and_windows, updates):
+        door_and_window.on_angle_of_incidence_changed(door_and_window_updates.append)
+    fleet = DoorAndWindowFleet()
+    hass = MagicMock()
+    hass.states.get.return_value = None
+    sun_tracker = SunTracker(hass, "sun.sun")
+    coordinators = [
+        Coordinator(hass, door_and_window, sun_tracker, fleet, sun_position_dead_band=dead_band)
+        for (door_and_window, dead_band) in zip(door_and_windows, [0, 1])
+    ]
+    (_, _, sun_entity_changed) = async_track_state_change_mock.call_args[0]
+
+    for elevation in [30, 30.4, 30.8, 31.2, 31.6, 32.0, 32.4]:
+        sun_entity_changed(
+            "sun.sun",
+            None,
+            MagicMock(attributes={'azimuth': 180, 'elevation': elevation})
+        )
+
+    assert len(updates[0]) == 7
+    # the sun has moved at least 1 degree at 31.2 since 30 and at 32.4 since 31.2
+    assert len(updates[1]) == 3
+
+    # the dead band can be changed
+    coordinators[1].sun_position_dead_band = 0
+    sun_entity_changed("sun.sun", None, MagicMock(attributes={'azimuth': 180, 'elevation': 32.6}))
+    assert len(updates[0]) == 8
+    assert len(updates[1]) == 4
+
+    for coordinator in coordinators:
+        coordinator.dispose()
+
+
+@patch('door_and_window.sun_tracker.async_track_state_change', return_value=lambda: None)
+# pylint: disable=unused-argument
+def test_coordinator_suspended_while_sun_out_of_view(async_track_state_change_mock):
+    """
+    Tests if the coordinator updates the door and window only once
+    while the sun is out of its view, and leaves it to the fleet if there is one.
+    """
+    door_and_window_mock = MagicMock()
+    door_and_window_mock.is_sun_in_view.side_effect = \
+        lambda sun_azimuth, sun_elevation: sun_elevation > 0
+    fleet_mock = MagicMock()
+    hass = MagicMock()
+    hass.states.get.return_value = None
+    coordinator = Coordinator(hass, door_and_window_mock, SunTracker(hass, "sun.sun"))
+    fleet_coordinator = Coordinator(hass, MagicMock(), SunTracker(hass, "sun.sun"), fleet_mock)
+    sun_entity_changed_callbacks = [
+        sun_entity_changed for (_, _, sun_entity_changed) in
+        (call_args[0] for call_args in async_track_state_change_mock.call_args_list)
+    ]
+
+    sun_positions = [(250, 2), (260, -1), (270, -5), (90, -1), (100, 3)]
+    for (azimuth, elevation) in sun_positions:
+        for sun_entity_changed in sun_entity_changed_callbacks:
+            sun_entity_changed(
+                "sun.sun",
+                None,
+                MagicMock(attributes={'azimuth': azimuth, 'elevation': elevation})
+            )
+
+    # the door and window is updated once when the sun leaves its view
+    assert door_and_window_mock.update.call_args_list == \
+        [call(250.0, 2.0), call(260.0, -1.0), call(100.0, 3.0)]
+    # the fleet checks the view of its door and windows
+    fleet_coordinator.door_and_window.is_sun_in_view.assert_not_called()
+    assert fleet_mock.update.call_args_list == \
+        [call(float(azimuth), float(elevation)) for (azimuth, elevation) in sun_positions]
+
+    coordinator.dispose()
+    fleet_coordinator.dispose()
+
+
+@patch('door_and_window.sun_tracker.async_track_state_change')
+@patch('door_and_window.coordinator.async_call_later')
+@patch('door_and_window.coordinator.async_track_state_change')
+def test_coordinator_dynamic_horizon_profile(
+    async_track_state_change_mock,
+    async_call_later_mock,
+    sun_async_track_state_change_mock
+):
+    """
+    Tests if the coordinator sets the horizon profile from the attribute
+    of the horizon profile entity only when it has changed, at most once in a cooldown.
+    """
+    door_and_window_mock = MagicMock(horizon_profile=[0, 0], facade=None)
+    hass = MagicMock()
+    hass.states.get.side_effect = lambda entity_id: \
+        MagicMock(attributes={'horizon_profile': [10, 20]}) \
+        if entity_id == "sensor.horizon" else None
+
+    coordinator = Coordinator(
+        hass,
+        door_and_window_mock,
+        SunTracker(hass, "sun.sun"),
+        horizon_profile_entity_id="sensor.horizon"
+    )
+    assert async_track_state_change_mock.call_args_list[0] == call(
+        hass, "sensor.horizon", ANY)
+    (_, _, horizon_profile_entity_changed) = async_track_state_change_mock.call_args_list[0][0]
+
+    # the current horizon profile is applied at once
+    assert door_and_window_mock.horizon_profile == [10.0, 20.0]
+    assert async_call_later_mock.call_count == 1
+
+    # the changes are handled in the event loop
+    assert HassJob(horizon_profile_entity_changed).job_type == HassJobType.Callback
+    assert HassJob(async_call_later_mock.call_args[0][2]).job_type == HassJobType.Callback
+
+    # the attribute has not changed
+    horizon_profile_entity_changed(
+        "sensor.horizon", None, MagicMock(attributes={'horizon_profile': [10, 20], 'other': 1}))
+    # the changes are applied together at the end of the cooldown
+    for horizon_profile in ['5, 15', [6, 16, 26]]:
+        horizon_profile_entity_changed(
+            "sensor.horizon", None, MagicMock(attributes={'horizon_profile': horizon_profile}))
+    assert door_and_window_mock.horizon_profile == [10.0, 20.0]
+    assert async_call_later_mock.call_count == 1
+
+    (_, _, cooldown_finished) = async_call_later_mock.call_args[0]
+    cooldown_finished(None)
+    assert door_and_window_mock.horizon_profile == [6.0, 16.0, 26.0]
+    assert async_call_later_mock.call_count == 2
+
+    # an invalid horizon profile is not applied
+    (_, _, cooldown_finished) = async_call_later_mock.call_args[0]
+    cooldown_finished(None)
+    horizon_profile_entity_changed(
+        "sensor.horizon", None, MagicMock(attributes={'horizon_profile': 'unknown'}))
+    assert door_and_window_mock.horizon_profile == [6.0, 16.0, 26.0]
+    assert async_call_later_mock.call_count == 3
+
+    coordinator.dispose()
+    async_call_later_mock.return_value.assert_called_once()
+    async_track_state_change_mock.return_value.assert_called_once()
+    sun_async_track_state_change_mock.return_value.assert_called_once()
+
+
+@patch('door_and_window.sun_tracker.async_track_state_change')
+@patch('door_and_window.coordinator.async_call_later')
+@patch('door_and_window.coordinator.async_track_state_change')
+# pylint: disable=unused-argument
+def test_coordinator_dynamic_horizon_profile_of_facade(
+    async_track_state_change_mock,
+    async_call_later_mock,
+    sun_async_track_state_change_mock
+):
+    """
+    Tests if the coordinator sets the horizon profile of the facade
+    when the door and window is on a facade.
+    """
+    door_and_window_mock = MagicMock(horizon_profile=[0, 0])
+    door_and_window_mock.facade.horizon_profile = [0, 0]
+    hass = MagicMock()
+    hass.states.get.side_effect = lambda entity_id: \
+        MagicMock(attributes={'horizon_profile': [10, 20]}) \
+        if entity_id == "sensor.horizon" else None
+
+    coordinator = Coordinator(
+        hass,
+        door_and_window_mock,
+        SunTracker(hass, "sun.sun"),
+        horizon_profile_entity_id="sensor.horizon"
+    )
+
+    assert door_and_window_mock.facade.horizon_profile == [10.0, 20.0]
+    assert door_and_window_mock.horizon_profile == [0, 0]
+
+    coordinator.dispose()
@@ -0,0 +1,83 @@
+""" The module of horizon profile store tests. """
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+
+from ..horizon_profile_store import (HorizonProfileStore,
+                                     async_remove_unused_horizons,
+                                     get_horizon_profile_store)
+
+
+@patch('door_and_window.horizon_profile_store.Store')
+def test_horizon_profile_store(store_mock):
+    """
+    Tests if the horizons are stored once in binary form
+    and loaded lazily as float32 arrays.
+    """
+    store_mock.return_value.async_load = AsyncMock(return_value=None)
+    store_mock.return_value.async_save = AsyncMock()
+    horizon_profile_store = HorizonProfileStore(MagicMock())
+    horizon = np.array([1.5, 2, 3, 4])
+
+    async def add_horizons():
+        return (
+            await horizon_profile_store.async_add_horizon(horizon),
+            await horizon_profile_store.async_add_horizon(horizon)
+        )
+
+    (horizon_id, same_horizon_id) = asyncio.run(add_horizons())
+
+    assert horizon_id == same_horizon_id
+    store_mock.return_value.async_save.assert_called_once()
+    (saved_data,) = store_mock.return_value.async_save.call_args[0]
+    assert list(saved_data['horizons']) == [horizon_id]
+    assert isinstance(saved_data['horizons'][horizon_id], str)
+
+    # the stored horizons are read when a horizon is requested first
+    horizon_profile_store = HorizonProfileStore(MagicMock())
+    store_mock.return_value.async_load = AsyncMock(return_value=saved_data)
+
+    loaded_horizon = asyncio.run(horizon_profile_store.async_get_horizon(horizon_id))
+
+    assert loaded_horizon.dtype == np.float32
+    assert loaded_horizon.tolist() == [1.5, 2, 3, 4]
+    assert asyncio.run(horizon_profile_store.async_get_horizon(horizon_id)) is loaded_horizon
+    assert asyncio.run(horizon_profile_store.async_get_horizon('missing')) is None
+    store_mock.return_value.async_load.assert_called_once()
+
+    asyncio.run(horizon_profile_store.async_remove_unused_horizons([]))
+
+    assert asyncio.run(horizon_profile_store.async_get_horizon(horizon_id)) is None
+
+
+@patch('door_and_window.horizon_profile_store.Store')
+def test_get_horizon_profile_store(store_mock):
+    """ Tests if the horizon profile store is created once for the Home Assistant instance. """
+    hass = MagicMock(data={})
+
+    assert get_horizon_profile_store(hass) is get_horizon_profile_store(hass)
+    store_mock.assert_called_once()
+
+
+@patch('door_and_window.horizon_profile_store.get_horizon_profile_store')
+def test_async_remove_unused_horizons(get_horizon_profile_store_mock):
+    """
+    Tests if the horizons used by the config entries are kept,
+    except the one of the removed config entry.
+    """
+    get_horizon_profile_store_mock.return_value.async_remove_unused_horizons = AsyncMock()
+    hass = MagicMock()
+    hass.config_entries.async_entries.return_value = [
+        MagicMock(entry_id='imported', data={'horizon_id': 'new horizon'}),
+        MagicMock(entry_id='static', data={}),
+        MagicMock(entry_id='removed', data={'horizon_id': 'removed horizon'})
+    ]
+    remove_unused_horizons = \
+        get_horizon_profile_store_mock.return_value.async_remove_unused_horizons
+
+    asyncio.run(async_remove_unused_horizons(hass))
+    assert list(remove_unused_horizons.call_args[0][0]) == ['new horizon', 'removed horizon']
+
+    asyncio.run(async_remove_unused_horizons(hass, 'removed'))
+    assert list(remove_unused_horizons.call_args[0][0]) == ['new horizon']
@@ -0,0 +1,98 @@
+""" The module of sun tracker tests. """
+from unittest.mock import ANY, MagicMock, call, patch
+
+from homeassistant.core import HassJob, HassJobType
+
+from ..sun_tracker import SunTracker
+
+
+@patch('door_and_window.sun_tracker.async_track_state_change')
+def test_sun_tracker_tracks_while_there_are_listeners(async_track_state_change_mock):
+    """
+    Tests if the sun entity is tracked from the first listener until the last one is removed.
+    """
+    hass = MagicMock()
+    hass.states.get.return_value = MagicMock(attributes={'azimuth': 120, 'elevation': 30})
+    sun_tracker = SunTracker(hass, "sun.sun")
+    assert sun_tracker.sun_position is None
+
+    remove_first = sun_tracker.add_listener(MagicMock())
+    remove_second = sun_tracker.add_listener(MagicMock())
+
+    async_track_state_change_mock.assert_called_once_with(hass, "sun.sun", ANY)
+    assert sun_tracker.sun_position == (120.0, 30.0)
+
+    remove_first()
+    remove_first()
+    async_track_state_change_mock.return_value.assert_not_called()
+    remove_second()
+    async_track_state_change_mock.return_value.assert_called_once()
+    assert sun_tracker.sun_position is None
+
+    # the next listener starts the tracking again
+    remove_third = sun_tracker.add_listener(MagicMock())
+    assert async_track_state_change_mock.call_count == 2
+    remove_third()
+
+
+@patch('door_and_window.sun_tracker.async_track_state_change')
+def test_sun_tracker_fans_out_sun_position(async_track_state_change_mock):
+    """
+    Tests if a sun change is parsed once and passed to every listener,
+    and the changes of the other sun attributes are skipped.
+    """
+    hass = MagicMock()
+    hass.states.get.return_value = None
+    sun_tracker = SunTracker(hass, "sun.sun")
+    listeners = [MagicMock(), MagicMock(side_effect=ValueError), MagicMock()]
+    for listener in listeners:
+        sun_tracker.add_listener(listener)
+    (_, _, sun_entity_changed) = async_track_state_change_mock.call_args[0]
+
+    for attributes in [
+        {'azimuth': 120, 'elevation': 30, 'next_rising': 1},
+        # another attribute has changed
+        {'azimuth': 120, 'elevation': 30, 'next_rising': 2},
+        # the sun entity is unavailable
+        {},
+        {'azimuth': '120.5', 'elevation': '30.5'}
+    ]:
+        sun_entity_changed("sun.sun", None, MagicMock(attributes=attributes))
+    sun_entity_changed("sun.sun", None, None)
+
+    # a failing listener does not stop the others
+    for listener in listeners:
+        assert listener.call_args_list == [call(120.0, 30.0), call(120.5, 30.5)]
+
+
+@patch('door_and_window.sun_tracker.async_track_state_change')
+def test_sun_tracker_listener_removed_during_fan_out(async_track_state_change_mock):
+    """
+    Tests if a listener removed by another listener is not called any more.
+    """
+    hass = MagicMock()
+    hass.states.get.return_value = None
+    sun_tracker = SunTracker(hass, "sun.sun")
+    second = MagicMock()
+    sun_tracker.add_listener(lambda sun_azimuth, sun_elevation: remove_second())
+    remove_second = sun_tracker.add_listener(second)
+    (_, _, sun_entity_changed) = async_track_state_change_mock.call_args[0]
+
+    sun_entity_changed("sun.sun", None, MagicMock(attributes={'azimuth': 120, 'elevation': 30}))
+
+    second.assert_not_called()
+
+
+@patch('door_and_window.sun_tracker.async_track_state_change')
+def test_sun_tracker_handles_sun_changes_in_event_loop(async_track_state_change_mock):
+    """
+    Tests if the sun changes are handled in the event loop instead of the executor,
+    so the listeners can update the entities.
+    """
+    hass = MagicMock()
+    hass.states.get.return_value = None
+    sun_tracker = SunTracker(hass, "sun.sun")
+    sun_tracker.add_listener(MagicMock())
+    (_, _, sun_entity_changed) = async_track_state_change_mock.call_args[0]
+
+    assert HassJob(sun_entity_changed).job_type == HassJobType.Callback
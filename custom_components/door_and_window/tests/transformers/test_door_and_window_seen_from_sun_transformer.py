@@ -2,8 +2,8 @@
 from ...tests.utils import assert_quadrilaterals_are_close
 from ...models.quadrilateral import Quadrilateral
 from ...models.door_and_window_rectangles import DoorAndWindowRectangles
-from ...transformers.door_and_window_seen_from_sun_transformer import \
-    DoorAndWindowRectanglesSeenFromSunTransformer
+from ...transformers.door_and_window_seen_from_sun_transformer import (
+    SUN_VIEW_MATRIX_CACHE_SIZE, DoorAndWindowRectanglesSeenFromSunTransformer)
 
 
 def test_door_and_window_seen_from_sun_transformer_if_sun_is_in_front():
@@ -162,3 +162,36 @@ def test_door_and_window_seen_from_sun_transformer_if_sun_is_on_the_side():
         Quadrilateral([-2, 1, 9], [-5, 4, 3], [-8, 7, 6], [-11, 10, 9]),
         'Awning '
     )
+
+
+def test_sun_view_matrix_is_cached():
+    """
+    Tests if the sun-view matrix is built once per sun position
+    and shared by all the transformer instances.
+    """
+    DoorAndWindowRectanglesSeenFromSunTransformer.clear_sun_view_matrix_cache()
+
+    matrix = DoorAndWindowRectanglesSeenFromSunTransformer().get_sun_view_matrix(120, 30)
+    same_matrix = DoorAndWindowRectanglesSeenFromSunTransformer().get_sun_view_matrix(120, 30)
+    other_matrix = DoorAndWindowRectanglesSeenFromSunTransformer().get_sun_view_matrix(121, 30)
+
+    assert matrix is same_matrix
+    assert matrix is not other_matrix
+    assert not matrix.flags.writeable
+
+    cache_info = DoorAndWindowRectanglesSeenFromSunTransformer.get_sun_view_matrix_cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.misses == 2
+    assert cache_info.currsize == 2
+
+
+def test_sun_view_matrix_cache_is_bounded():
+    """ Tests if the sun-view matrix cache does not grow over its maximum size. """
+    DoorAndWindowRectanglesSeenFromSunTransformer.clear_sun_view_matrix_cache()
+
+    for solar_azimuth in range(SUN_VIEW_MATRIX_CACHE_SIZE * 2):
+        DoorAndWindowRectanglesSeenFromSunTransformer.get_sun_view_matrix(solar_azimuth, 10)
+
+    cache_info = DoorAndWindowRectanglesSeenFromSunTransformer.get_sun_view_matrix_cache_info()
+    assert cache_info.currsize == SUN_VIEW_MATRIX_CACHE_SIZE
+    assert cache_info.maxsize == SUN_VIEW_MATRIX_CACHE_SIZE
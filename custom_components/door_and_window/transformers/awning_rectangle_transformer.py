@@ -1,26 +1,68 @@
 """ Module for AwningToRectangleTransformer class. """
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from ..models.quadrilateral import Quadrilateral
 from .coordinate_transformations import CoordinateTransformations
 
 if TYPE_CHECKING:
     from ..models.door_and_window import DoorAndWindow
 
+# The number of door and window geometries the awning transformation matrices are cached for.
+AWNING_MATRIX_CACHE_SIZE = 64
+
+
+# pylint: disable=too-many-locals
+@lru_cache(maxsize=AWNING_MATRIX_CACHE_SIZE)
+def _get_awning_matrix(
+    azimuth: float,
+    tilt: float,
+    height: float,
+    parapet_wall_height: float,
+    outside_depth: float
+) -> np.ndarray:
+    transformations = CoordinateTransformations()
+
+    # The initial origin coordinates of the awning
+    # pylint: disable=invalid-name
+    z = outside_depth
+    # pylint: disable=invalid-name
+    y = height
+
+    (sin, cos) = transformations.get_sin_cos(90 - tilt)
+    # The initial origin rotated to:
+    rotated_z = cos*z - sin*y
+    rotated_y = sin*z + cos*y
+
+    # The translation required for awning
+    delta_z = z - rotated_z
+    delta_y = y - rotated_y
+
+    rotation_matrix = transformations.get_rotation_matrix_y(azimuth)
+    translate_matrix = transformations.get_translation_matrix(
+        0,
+        height + parapet_wall_height - delta_y,
+        delta_z - outside_depth
+    )
+    transformation_matrix = rotation_matrix.dot(translate_matrix)
+    # The matrix is shared by all the callers, nobody may change it.
+    transformation_matrix.setflags(write=False)
+    return transformation_matrix
+
+
 # pylint: disable=too-few-public-methods
 class AwningRectangleTransformer():
     """
     Responsible for transforming the rectangle of an awning into the
     coordinate space of the door and window.
-    """
 
-    def __init__(self):
-        """
-        Initialize a new instance of AwningRectangleTransformer class.
-        """
-        self._transformations = CoordinateTransformations()
+    The transformation matrices are cached by the door and window geometry
+    and shared by all the instances.
+    """
 
     def transform(
         self,
@@ -41,28 +83,12 @@ class AwningRectangleTransformer():
             The modified rectangle which coordinates are relative
             to the specified DoorAndWindow instance coordinates.
         """
-
-        # The initial origin coordinates of the awning
-        # pylint: disable=invalid-name
-        z = door_and_window.outside_depth
-        # pylint: disable=invalid-name
-        y = door_and_window.height
-
-        (sin, cos) = self._transformations.get_sin_cos(90 - door_and_window.tilt)
-
-        # The initial origin rotated to:
-        rotated_z = cos*z - sin*y
-        rotated_y = sin*z + cos*y
-
-        # The translation required for awning
-        delta_z = z - rotated_z
-        delta_y = y - rotated_y
-
-        rotation_matrix = self._transformations.get_rotation_matrix_y(door_and_window.azimuth)
-        translate_matrix = self._transformations.get_translation_matrix(
-            0,
-            door_and_window.height + door_and_window.parapet_wall_height - delta_y,
-            delta_z - door_and_window.outside_depth
-        )
-
-        return awning_rectangle.apply_matrix(rotation_matrix.dot(translate_matrix))
+        # An awning moves much more often than the door and window,
+        # so the matrix is cached by the dimensions and the facing of the door and window.
+        return awning_rectangle.apply_matrix(_get_awning_matrix(
+            door_and_window.azimuth,
+            door_and_window.tilt,
+            door_and_window.height,
+            door_and_window.parapet_wall_height,
+            door_and_window.outside_depth
+        ))
@@ -1,21 +1,54 @@
 """ Module for DoorAndWindowRectanglesSeenFromSunTransformer class. """
+from functools import lru_cache
+from typing import NamedTuple, Union
+
+import numpy as np
+
 from ..models.door_and_window_rectangles import DoorAndWindowRectangles
 from .coordinate_transformations import CoordinateTransformations
 
+# The number of sun positions the sun-view matrices are cached for.
+# Every door and window receives the same sun position, so only
+# the latest few positions are needed.
+SUN_VIEW_MATRIX_CACHE_SIZE = 32
+
+
+class SunViewMatrixCacheInfo(NamedTuple):
+    """ The statistics of the sun-view matrix cache. """
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+@lru_cache(maxsize=SUN_VIEW_MATRIX_CACHE_SIZE)
+def _get_sun_view_matrix(solar_azimuth: float, solar_elevation: float) -> np.ndarray:
+    transformations = CoordinateTransformations()
+
+    rotation_matrix_x = transformations.get_rotation_matrix_x(-solar_elevation)
+    rotation_matrix_y = transformations.get_rotation_matrix_y(-solar_azimuth)
+
+    transformation_matrix = rotation_matrix_x.dot(rotation_matrix_y)
+    # The matrix is shared by all the callers, nobody may change it.
+    transformation_matrix.setflags(write=False)
+    return transformation_matrix
+
 
 # pylint: disable=too-few-public-methods
 class DoorAndWindowRectanglesSeenFromSunTransformer():
-    """ Responsible for transforming door and window rectangles as seen from the sun's position """
+    """
+    Responsible for transforming door and window rectangles as seen from the sun's position
 
-    def __init__(self):
-        """ Initialize a new instance of `DoorAndWindowRectanglesSeenFromSunTransformer` class. """
-        self._transformations = CoordinateTransformations()
+    The transformation matrices are cached by sun position and shared
+    by all the instances.
+    """
 
     def transform(
             self,
             door_and_window_rectangles: DoorAndWindowRectangles,
             solar_azimuth: float,
-            solar_elevation: float
+            solar_elevation: float,
+            out: Union[DoorAndWindowRectangles, None] = None
     ) -> DoorAndWindowRectangles:
         """
         Transforms the specified DoorAndWindowRectangles instance
@@ -28,18 +61,51 @@ class DoorAndWindowRectanglesSeenFromSunTransformer():
                 The sun azimuth.
             solar_elevation:
                 The sun elevation.
+            out:
+                The DoorAndWindowRectangles instance to overwrite with the result
+                instead of allocating a new one. None to return a new instance.
 
         Returns:
             The transformed DoorAndWindowRectangles instance
             as it would be seen from the specified sun position.
         """
+        sun_view_matrix = self.get_sun_view_matrix(solar_azimuth, solar_elevation)
+        if out is not None:
+            return door_and_window_rectangles.apply_matrix_into(sun_view_matrix, out)
+        return door_and_window_rectangles.apply_matrix(sun_view_matrix)
 
-        x_rotation = -solar_elevation
-        y_rotation = -solar_azimuth
+    @classmethod
+    def get_sun_view_matrix(cls, solar_azimuth: float, solar_elevation: float) -> np.ndarray:
+        """
+        Gets the transformation matrix which transforms a coordinate
+        as it would be seen from the specified sun position.
 
-        rotation_matrix_x = self._transformations.get_rotation_matrix_x(x_rotation)
-        rotation_matrix_y = self._transformations.get_rotation_matrix_y(y_rotation)
+        Args:
+            solar_azimuth:
+                The sun azimuth.
+            solar_elevation:
+                The sun elevation.
+
+        Returns:
+            The read-only transformation matrix.
+        """
+        return _get_sun_view_matrix(float(solar_azimuth), float(solar_elevation))
 
-        transformation_matrix = rotation_matrix_x.dot(rotation_matrix_y)
+    @classmethod
+    def get_sun_view_matrix_cache_info(cls) -> SunViewMatrixCacheInfo:
+        """
+        Gets the hits, misses, maximum size and current size
+        of the sun-view matrix cache.
+
+        Returns:
+            The statistics of the sun-view matrix cache.
+        """
+        # pylint: disable=no-value-for-parameter
+        return SunViewMatrixCacheInfo(*_get_sun_view_matrix.cache_info())
 
-        return door_and_window_rectangles.apply_matrix(transformation_matrix)
+    @classmethod
+    def clear_sun_view_matrix_cache(cls) -> None:
+        """
+        Removes all the matrices from the sun-view matrix cache and resets its statistics.
+        """
+        _get_sun_view_matrix.cache_clear()
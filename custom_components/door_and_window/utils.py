@@ -1,6 +1,8 @@
 """ The module for utility functions """
 import math
 
+import numpy as np
+
 
 def normalize_angle(angle: float) -> float:
     """
@@ -16,3 +18,50 @@ def normalize_angle(angle: float) -> float:
     angle = angle - math.floor(angle / 360) * 360
     angle = round(angle if angle < 180 else angle - 360, 2)
     return angle
+
+
+def normalize_angles(angles: np.ndarray) -> np.ndarray:
+    """
+    Converts each of the angles to be between -180 and +180 degrees.
+    It is the vectorised version of `normalize_angle`.
+
+    Args:
+        angles:
+            The angles to covert
+
+    Returns:
+        The angles represented between -180 and +180 degrees.
+    """
+    angles = angles - np.floor(angles / 360) * 360
+    return np.round(np.where(angles < 180, angles, angles - 360), 2)
+
+
+def get_angular_distance(
+    azimuth_1: float,
+    elevation_1: float,
+    azimuth_2: float,
+    elevation_2: float
+) -> float:
+    """
+    Gets the angle between two directions given by their azimuth and elevation.
+
+    Args:
+        azimuth_1:
+            The azimuth of the first direction.
+        elevation_1:
+            The elevation of the first direction.
+        azimuth_2:
+            The azimuth of the second direction.
+        elevation_2:
+            The elevation of the second direction.
+
+    Returns:
+        The angle between the directions in degrees.
+    """
+    elevation_1 = math.radians(elevation_1)
+    elevation_2 = math.radians(elevation_2)
+    # The haversine formula is accurate for the small angles as well.
+    haversine = math.sin((elevation_2 - elevation_1) / 2) ** 2 + \
+        math.cos(elevation_1) * math.cos(elevation_2) * \
+        math.sin(math.radians(azimuth_2 - azimuth_1) / 2) ** 2
+    return math.degrees(2 * math.asin(min(1.0, math.sqrt(haversine))))